@@ -0,0 +1,100 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time to list the files of a folder of images (as ``from_folders`` does).
+
+The folder is scanned with the serial ``os.walk`` of previous versions, with the parallel scan of ``make_dataset``,
+and with ``make_dataset`` reusing the manifest of a previous scan. By default, a synthetic tree of empty files is
+created in a temporary folder, pass ``--folder`` to scan an existing folder instead (e.g. on a network file system,
+where the parallel scan helps the most).
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from flash.core.data.utilities.loading import IMG_EXTENSIONS, NP_EXTENSIONS
+from flash.core.data.utilities.paths import has_file_allowed_extension, list_subdirs, make_dataset
+
+
+def walk_dataset(directory: str, extensions):
+    files, targets = [], []
+    for target_class in list_subdirs(directory):
+        for root, _, fnames in sorted(os.walk(os.path.join(directory, target_class), followlinks=True)):
+            for fname in sorted(fnames):
+                path = os.path.join(root, fname)
+                if has_file_allowed_extension(path, extensions):
+                    files.append(path)
+                    targets.append(target_class)
+    return files, targets
+
+
+def make_tree(root: str, num_classes: int, num_subdirs: int, num_files: int):
+    for target_class in range(num_classes):
+        for subdir in range(num_subdirs):
+            folder = os.path.join(root, f"class_{target_class}", f"part_{subdir}")
+            os.makedirs(folder)
+            for i in range(num_files):
+                open(os.path.join(folder, f"image_{i}.jpg"), "w").close()
+    # Manifests aren't written for folders which changed in the last seconds
+    for path, _, _ in os.walk(root):
+        os.utime(path, (time.time() - 60, time.time() - 60))
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--folder", default=None)
+    parser.add_argument("--num_classes", type=int, default=100)
+    parser.add_argument("--num_subdirs", type=int, default=10)
+    parser.add_argument("--num_files", type=int, default=100)
+    parser.add_argument("--num_threads", type=int, default=None)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    folder = args.folder
+    if folder is None:
+        folder = os.path.join(tmp_dir, "data")
+        make_tree(folder, args.num_classes, args.num_subdirs, args.num_files)
+    cache_dir = os.path.join(tmp_dir, "cache")
+    extensions = IMG_EXTENSIONS + NP_EXTENSIONS
+
+    try:
+        expected, walk_time = timed(walk_dataset, folder, extensions)
+        scanned, scan_time = timed(make_dataset, folder, extensions, num_threads=args.num_threads, use_cache=False)
+        assert scanned == expected
+        _, cold_time = timed(make_dataset, folder, extensions, num_threads=args.num_threads, cache_dir=cache_dir)
+        cached, warm_time = timed(make_dataset, folder, extensions, num_threads=args.num_threads, cache_dir=cache_dir)
+        assert cached == expected
+
+        print(f"{len(expected[0])} files")
+        print(f"{'method':>28}{'time (s)':>12}{'speedup':>10}")
+        for name, duration in (
+            ("os.walk", walk_time),
+            ("parallel scan", scan_time),
+            ("parallel scan + manifest", cold_time),
+            ("manifest", warm_time),
+        ):
+            print(f"{name:>28}{duration:>12.3f}{walk_time / duration:>9.1f}x")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the number of samples per second going through ``Input._call_load_sample`` (without any decoding).
+
+The samples of an image, a tabular, and a text input are loaded with the per-sample copy and key conversion of previous
+versions, with the current ``Input`` (from ``dict`` samples with ``DataKeys`` or string keys), and with the current
+``Input`` from ``Sample`` records.
+"""
+import argparse
+import time
+from enum import Enum
+
+import numpy as np
+
+from flash.core.data.io.input import DataKeys, Input, Sample
+from flash.core.utilities.stages import RunningStage
+
+
+class FormatTargetMixin:
+    def load_sample(self, sample):
+        sample[DataKeys.TARGET] = int(sample[DataKeys.TARGET])
+        return sample
+
+
+class LegacyInput(FormatTargetMixin, Input):
+    """Loads the samples in the same way as flash <= 0.8.1 did."""
+
+    def _call_load_sample(self, sample):
+        sample_output = self.load_sample(dict(sample.items()) if isinstance(sample, dict) else sample)
+        if isinstance(sample_output, dict):
+            output_dict = {}
+            for key, val in sample_output.items():
+                if isinstance(key, Enum) and hasattr(key, "value"):
+                    output_dict[key.value] = val
+                else:
+                    output_dict[key] = val
+            return output_dict
+        return sample_output
+
+
+class NewInput(FormatTargetMixin, Input):
+    pass
+
+
+def data_keys_dict(**kwargs):
+    return {getattr(DataKeys, key.upper()): value for key, value in kwargs.items()}
+
+
+SAMPLES = {
+    # A file path and a class index
+    "image": lambda i, cls: cls(input=f"images/{i}.jpg", target=i % 10),
+    # Categorical and numerical arrays and a class index
+    "tabular": lambda i, cls: cls(input=(np.zeros(4, dtype=np.int64), np.zeros(8, dtype=np.float32)), target=i % 2),
+    # A string and a class index
+    "text": lambda i, cls: cls(input=f"some text number {i}", target=i % 3),
+}
+
+
+def samples_per_second(input: Input, num_samples: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for index in range(num_samples):
+            input[index]
+        best = min(best, time.perf_counter() - start)
+    return num_samples / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_samples", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'input':>10}{'method':>22}{'samples/s':>14}{'speedup':>10}")
+    for name, make_sample in SAMPLES.items():
+        def make_samples(cls):
+            return [make_sample(i, cls) for i in range(args.num_samples)]
+
+        inputs = {
+            "before": LegacyInput(RunningStage.TRAINING, make_samples(data_keys_dict)),
+            "DataKeys dict": NewInput(RunningStage.TRAINING, make_samples(data_keys_dict)),
+            "string keys dict": NewInput(RunningStage.TRAINING, make_samples(dict)),
+            "Sample": NewInput(RunningStage.TRAINING, make_samples(Sample)),
+        }
+        rates = {method: samples_per_second(input, args.num_samples, args.repeats) for method, input in inputs.items()}
+        for method, rate in rates.items():
+            print(f"{name:>10}{method:>22}{rate:>14,.0f}{rate / rates['before']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
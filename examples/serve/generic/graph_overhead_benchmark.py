@@ -0,0 +1,84 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-request overhead of running the task graph of a flash serve endpoint.
+
+The components only add one to an integer, so the time per request is (almost) all graph overhead. Each composition
+is a chain of ``n`` components, timed with the generic ``get`` over the task graph and with the compiled execution
+plan which the HTTP endpoints use.
+"""
+import timeit
+
+import torch
+
+from flash.core.serve import Composition, Endpoint, ModelComponent, expose
+from flash.core.serve.dag.task import get
+from flash.core.serve.execution import build_composition
+from flash.core.serve.types.base import BaseType
+
+
+class Integer(BaseType):
+    def deserialize(self, value: int) -> int:
+        return value
+
+    def serialize(self, value: int) -> int:
+        return value
+
+
+class Increment(ModelComponent):
+    def __init__(self, model):
+        self.model = model
+
+    @expose(inputs={"x": Integer()}, outputs={"y": Integer()})
+    def increment(self, x):
+        return x + 1
+
+
+def build_chain(num_components: int):
+    components = [Increment(torch.nn.Identity()) for _ in range(num_components)]
+    for source, target in zip(components, components[1:]):
+        source.outputs.y >> target.inputs.x  # skipcq: PYL-W0104
+
+    endpoint = Endpoint(
+        route="/increment",
+        inputs={"x": components[0].inputs.x},
+        outputs={"y": components[-1].outputs.y},
+    )
+    kwargs = {f"comp_{i}": component for i, component in enumerate(components)}
+    composition = Composition(**kwargs, endpoint=endpoint)
+    return build_composition(
+        endpoint_protocol=composition.endpoint_protocols["endpoint"],
+        components=composition.components,
+        connections=composition.connections,
+    )
+
+
+def main(number: int = 10_000):
+    print(f"{'components':>10}{'tasks':>8}{'steps':>8}{'get (us)':>12}{'plan (us)':>12}{'speedup':>10}")
+    for num_components in (1, 2, 4, 8, 16):
+        dsk = build_chain(num_components)
+        payload = {"x": {"value": 0}}
+        assert dsk.plan(payload) == get(dsk.dsk, dsk.get_keys, cache=dict(payload), sortkeys=dsk.sortkeys)
+
+        get_time = timeit.timeit(
+            lambda: get(dsk.dsk, dsk.get_keys, cache=dict(payload), sortkeys=dsk.sortkeys), number=number
+        )
+        plan_time = timeit.timeit(lambda: dsk.plan(payload), number=number)
+        print(
+            f"{num_components:>10}{len(dsk.dsk):>8}{len(dsk.plan):>8}{get_time / number * 1e6:>12.2f}"
+            f"{plan_time / number * 1e6:>12.2f}{get_time / plan_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the number of training clips per second loaded from a set of videos.
+
+The clips are loaded with the ``LabeledVideoDataset`` of PyTorchVideo (as ``VideoClassificationData`` does by
+default), with the ``CachedLabeledVideoDataset`` cutting several clips out of each decoded span, and with the frame
+cache (the first epoch extracts the frames, the following epochs read them through a memory map). By default, a few
+synthetic videos are written to a temporary folder, pass ``--files`` to use existing videos instead.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import torch
+from pytorchvideo.data.clip_sampling import make_clip_sampler
+from pytorchvideo.data.labeled_video_dataset import LabeledVideoDataset
+from pytorchvideo.data.labeled_video_paths import LabeledVideoPaths
+from torchvision import io
+
+from flash.video.classification.decoding import CachedLabeledVideoDataset, VideoCache
+
+
+def make_videos(folder: str, num_videos: int, num_frames: int, fps: int, height: int, width: int):
+    files = []
+    for i in range(num_videos):
+        path = os.path.join(folder, f"video_{i}.mp4")
+        io.write_video(path, torch.randint(255, (num_frames, height, width, 3), dtype=torch.uint8), fps)
+        files.append(path)
+    return files
+
+
+def clips_per_second(dataset, epochs: int):
+    num_clips = 0
+    start = time.perf_counter()
+    for _ in range(epochs):
+        num_clips += sum(1 for _ in dataset)
+    return num_clips / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", nargs="+", default=None)
+    parser.add_argument("--num_videos", type=int, default=8)
+    parser.add_argument("--num_frames", type=int, default=300)
+    parser.add_argument("--clip_duration", type=float, default=2)
+    parser.add_argument("--clips_per_decode", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    files = args.files
+    if files is None:
+        files = make_videos(tmp_dir, args.num_videos, args.num_frames, fps=30, height=240, width=320)
+    paths = LabeledVideoPaths([(path, 0) for path in files])
+    sampler = make_clip_sampler("random", args.clip_duration)
+    frame_cache = VideoCache(frame_cache=True, frame_cache_dir=os.path.join(tmp_dir, "frames"))
+
+    try:
+        results = [
+            ("LabeledVideoDataset", LabeledVideoDataset(paths, sampler, decode_audio=False)),
+            ("VideoCache", CachedLabeledVideoDataset(paths, sampler)),
+            (
+                f"VideoCache, {args.clips_per_decode} clips per decode",
+                CachedLabeledVideoDataset(paths, sampler, clips_per_decode=args.clips_per_decode),
+            ),
+        ]
+        # The first epoch with the frame cache extracts the frames, the following epochs only read them
+        frame_cache_dataset = CachedLabeledVideoDataset(paths, sampler, video_cache=frame_cache)
+        results += [("frame cache (extraction)", frame_cache_dataset), ("frame cache", frame_cache_dataset)]
+
+        print(f"{'loader':>40}{'clips / s':>12}")
+        for name, dataset in results:
+            epochs = 1 if name == "frame cache (extraction)" else args.epochs
+            print(f"{name:>40}{clips_per_second(dataset, epochs):>12.1f}")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
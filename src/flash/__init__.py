@@ -13,20 +13,29 @@
 # limitations under the License.
 """Root package info."""
 import os
+from typing import TYPE_CHECKING
 
 from flash.__about__ import *  # noqa: F401 F403
-from flash.core.utilities.imports import _TORCH_AVAILABLE
+from flash.core.utilities.imports import _TORCH_AVAILABLE, lazy_attributes
 
 if _TORCH_AVAILABLE:
-    from flash.core.data.callback import FlashCallback
-    from flash.core.data.data_module import DataModule
-    from flash.core.data.io.input import DataKeys, Input
-    from flash.core.data.io.input_transform import InputTransform
-    from flash.core.data.io.output import Output
-    from flash.core.data.io.output_transform import OutputTransform
-    from flash.core.model import Task
-    from flash.core.trainer import Trainer
-    from flash.core.utilities.stages import RunningStage
+    # The core classes are only imported when first accessed (e.g. ``flash.Trainer``), so that ``import flash``
+    # doesn't import PyTorch Lightning
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "FlashCallback": "flash.core.data.callback",
+            "DataModule": "flash.core.data.data_module",
+            "DataKeys": "flash.core.data.io.input",
+            "Input": "flash.core.data.io.input",
+            "InputTransform": "flash.core.data.io.input_transform",
+            "Output": "flash.core.data.io.output",
+            "OutputTransform": "flash.core.data.io.output_transform",
+            "Task": "flash.core.model",
+            "Trainer": "flash.core.trainer",
+            "RunningStage": "flash.core.utilities.stages",
+        },
+    )
 
     _PACKAGE_ROOT = os.path.dirname(__file__)
     ASSETS_ROOT = os.path.join(_PACKAGE_ROOT, "assets")
@@ -50,3 +59,14 @@ if _TORCH_AVAILABLE:
         "Task",
         "Trainer",
     ]
+
+if TYPE_CHECKING:
+    from flash.core.data.callback import FlashCallback  # noqa: F401
+    from flash.core.data.data_module import DataModule  # noqa: F401
+    from flash.core.data.io.input import DataKeys, Input  # noqa: F401
+    from flash.core.data.io.input_transform import InputTransform  # noqa: F401
+    from flash.core.data.io.output import Output  # noqa: F401
+    from flash.core.data.io.output_transform import OutputTransform  # noqa: F401
+    from flash.core.model import Task  # noqa: F401
+    from flash.core.trainer import Trainer  # noqa: F401
+    from flash.core.utilities.stages import RunningStage  # noqa: F401
@@ -13,12 +13,55 @@
 # limitations under the License.
 import functools
 import importlib
+from typing import List, Optional
 from unittest.mock import patch
 
 import click
 
 
-@click.group(no_args_is_help=True)
+# The CLI module of each task, by command name
+tasks = {
+    "audio_classification": "flash.audio.classification",
+    "speech_recognition": "flash.audio.speech_recognition",
+    "graph_classification": "flash.graph.classification",
+    "image_classification": "flash.image.classification",
+    "object_detection": "flash.image.detection",
+    "face_detection": "flash.image.face_detection",
+    "instance_segmentation": "flash.image.instance_segmentation",
+    "keypoint_detection": "flash.image.keypoint_detection",
+    "semantic_segmentation": "flash.image.segmentation",
+    "style_transfer": "flash.image.style_transfer",
+    "pointcloud_detection": "flash.pointcloud.detection",
+    "pointcloud_segmentation": "flash.pointcloud.segmentation",
+    "tabular_classification": "flash.tabular.classification",
+    "tabular_regression": "flash.tabular.regression",
+    "tabular_forecasting": "flash.tabular.forecasting",
+    "text_classification": "flash.text.classification",
+    "question_answering": "flash.text.question_answering",
+    "summarization": "flash.text.seq2seq.summarization",
+    "translation": "flash.text.seq2seq.translation",
+    "video_classification": "flash.video.classification",
+}
+
+
+class LazyGroup(click.Group):
+    """A ``click.Group`` which only imports the CLI module of a task when its command is run (listing the commands
+    imports all of them to hide the tasks whose dependencies aren't installed)."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(name for name in tasks if self.get_command(ctx, name) is not None)
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        if name not in self.commands and name in tasks:
+            try:
+                task = importlib.import_module(f"{tasks[name]}.cli")
+            except ImportError:
+                return None
+            register_command(task.__dict__[name])
+        return self.commands.get(name)
+
+
+@click.group(cls=LazyGroup, no_args_is_help=True)
 def main():
     """The Lightning-Flash zero-code command line utility."""
 
@@ -38,38 +81,5 @@ def register_command(command):
             command()
 
 
-tasks = [
-    "flash.audio.classification",
-    "flash.audio.speech_recognition",
-    "flash.graph.classification",
-    "flash.image.classification",
-    "flash.image.detection",
-    "flash.image.face_detection",
-    "flash.image.instance_segmentation",
-    "flash.image.keypoint_detection",
-    "flash.image.segmentation",
-    "flash.image.style_transfer",
-    "flash.pointcloud.detection",
-    "flash.pointcloud.segmentation",
-    "flash.tabular.classification",
-    "flash.tabular.regression",
-    "flash.tabular.forecasting",
-    "flash.text.classification",
-    "flash.text.question_answering",
-    "flash.text.seq2seq.summarization",
-    "flash.text.seq2seq.translation",
-    "flash.video.classification",
-]
-
-for task in tasks:
-    try:
-        task = importlib.import_module(f"{task}.cli")
-
-        for command in task.__all__:
-            command = task.__dict__[command]
-            register_command(command)
-    except ImportError:
-        pass
-
 if __name__ == "__main__":
     main()
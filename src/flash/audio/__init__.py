@@ -1,2 +1,24 @@
-from flash.audio.classification import AudioClassificationData, AudioClassificationInputTransform  # noqa: F401
-from flash.audio.speech_recognition import SpeechRecognition, SpeechRecognitionData  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AudioClassificationData": "flash.audio.classification",
+        "AudioClassificationInputTransform": "flash.audio.classification",
+        "SpeechRecognition": "flash.audio.speech_recognition",
+        "SpeechRecognitionData": "flash.audio.speech_recognition",
+    },
+)
+
+__all__ = [
+    "AudioClassificationData",
+    "AudioClassificationInputTransform",
+    "SpeechRecognition",
+    "SpeechRecognitionData",
+]
+
+if TYPE_CHECKING:
+    from flash.audio.classification import AudioClassificationData, AudioClassificationInputTransform  # noqa: F401
+    from flash.audio.speech_recognition import SpeechRecognition, SpeechRecognitionData  # noqa: F401
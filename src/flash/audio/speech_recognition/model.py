@@ -27,7 +27,7 @@ from flash.core.data.io.input_transform import InputTransform
 from flash.core.data.io.output import Output
 from flash.core.model import Task
 from flash.core.registry import FlashRegistry
-from flash.core.serve import Composition
+from flash.core.serve import Composition, PredictionCache, ServeExecutor
 from flash.core.utilities.imports import _TOPIC_AUDIO_AVAILABLE, requires
 from flash.core.utilities.types import INPUT_TRANSFORM_TYPE, LR_SCHEDULER_TYPE, OPTIMIZER_TYPE
 
@@ -108,5 +108,23 @@ class SpeechRecognition(Task):
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(
+            host,
+            port,
+            sanity_check,
+            input_cls,
+            transform,
+            transform_kwargs,
+            output,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=executor,
+            num_replicas=num_replicas,
+            cache=cache,
+        )
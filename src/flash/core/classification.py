@@ -13,6 +13,7 @@
 # limitations under the License.
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
 
+import numpy as np
 import torch
 import torch.nn.functional as F
 from pytorch_lightning.utilities import rank_zero_warn
@@ -20,6 +21,7 @@ from torch import Tensor
 from torchmetrics import Accuracy, F1Score, Metric
 
 from flash.core.adapter import AdapterTask
+from flash.core.data.batch import _is_list_like_excluding_str
 from flash.core.data.io.input import DataKeys
 from flash.core.data.io.output import Output
 from flash.core.model import Task
@@ -156,6 +158,20 @@ class PredsClassificationOutput(ClassificationOutput):
             sample = torch.tensor(sample)
         return sample
 
+    @staticmethod
+    def _batch_preds(batch: Any) -> Optional[Tensor]:
+        """Get the ``(batch_size, num_classes)`` tensor of predictions from a batch, or ``None`` if the batch can't
+        be transformed as a whole (in which case its samples are transformed one at a time)."""
+        if isinstance(batch, Mapping):
+            if DataKeys.PREDS not in batch or any(not _is_list_like_excluding_str(value) for value in batch.values()):
+                return None
+            if len({len(value) for value in batch.values()}) > 1:
+                return None
+            batch = batch[DataKeys.PREDS]
+        if isinstance(batch, Tensor) and batch.ndim == 2:
+            return batch
+        return None
+
 
 @CLASSIFICATION_OUTPUTS(name="logits")
 class LogitsOutput(PredsClassificationOutput):
@@ -164,6 +180,12 @@ class LogitsOutput(PredsClassificationOutput):
     def transform(self, sample: Any) -> Any:
         return super().transform(sample).tolist()
 
+    def transform_batch(self, batch: Any) -> List[Any]:
+        preds = self._batch_preds(batch)
+        if preds is None:
+            return super().transform_batch(batch)
+        return preds.tolist()
+
 
 @CLASSIFICATION_OUTPUTS(name="probabilities")
 class ProbabilitiesOutput(PredsClassificationOutput):
@@ -175,6 +197,14 @@ class ProbabilitiesOutput(PredsClassificationOutput):
             return torch.sigmoid(sample).tolist()
         return torch.softmax(sample, -1).tolist()
 
+    def transform_batch(self, batch: Any) -> List[Any]:
+        preds = self._batch_preds(batch)
+        if preds is None:
+            return super().transform_batch(batch)
+        if self.multi_label:
+            return torch.sigmoid(preds).tolist()
+        return torch.softmax(preds, -1).tolist()
+
 
 @CLASSIFICATION_OUTPUTS(name="classes")
 class ClassesOutput(PredsClassificationOutput):
@@ -202,6 +232,22 @@ class ClassesOutput(PredsClassificationOutput):
             return result
         return torch.argmax(sample, -1).tolist()
 
+    def _batch_classes(self, preds: Tensor) -> Union[Tensor, List[Tensor]]:
+        """The class of each sample, or (if ``multi_label``) a tensor with the classes of each sample."""
+        if self.multi_label:
+            rows, classes = (preds.sigmoid() > self.threshold).nonzero(as_tuple=True)
+            return list(classes.split(torch.bincount(rows, minlength=len(preds)).tolist()))
+        return torch.argmax(preds, -1)
+
+    def transform_batch(self, batch: Any) -> List[Any]:
+        preds = self._batch_preds(batch)
+        if preds is None:
+            return super().transform_batch(batch)
+        classes = self._batch_classes(preds)
+        if self.multi_label:
+            return [sample_classes.tolist() for sample_classes in classes]
+        return classes.tolist()
+
 
 @CLASSIFICATION_OUTPUTS(name="labels")
 class LabelsOutput(ClassesOutput):
@@ -232,6 +278,17 @@ class LabelsOutput(ClassesOutput):
         rank_zero_warn("No labels were provided, this output will act as a Classes output.", category=UserWarning)
         return classes
 
+    def transform_batch(self, batch: Any) -> List[Any]:
+        preds = self._batch_preds(batch)
+        if preds is None or self._labels is None:
+            return super().transform_batch(batch)
+        # Map the classes to labels by indexing an array of the labels
+        labels = np.asarray(self._labels, dtype=object)
+        classes = self._batch_classes(preds)
+        if self.multi_label:
+            return [labels[sample_classes.cpu().numpy()].tolist() for sample_classes in classes]
+        return labels[classes.cpu().numpy()].tolist()
+
 
 @CLASSIFICATION_OUTPUTS(name="fiftyone", providers=_FIFTYONE)
 class FiftyOneLabelsOutput(ClassificationOutput):
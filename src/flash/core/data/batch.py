@@ -31,13 +31,16 @@ class _ServeInputProcessor(nn.Module):
         self.serve_input = serve_input
         self.collate_fn = collate_fn
 
-    def forward(self, sample: str):
+    def load(self, sample: str) -> List[Any]:
+        """Load the request ``sample`` into a list of samples without collating them."""
         sample = self.serve_input._call_load_sample(sample)
         if not isinstance(sample, list):
             sample = [sample]
-        sample = self.collate_fn(sample)
         return sample
 
+    def forward(self, sample: str):
+        return self.collate_fn(self.load(sample))
+
 
 def _is_list_like_excluding_str(x):
     return _is_list_like(x) and str(x) != x
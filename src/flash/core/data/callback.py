@@ -21,6 +21,9 @@ class FlashCallback(Callback):
         trainer = Trainer(callbacks=[MyCustomCallback()])
     """
 
+    def on_load_sample(self, sample: Any, running_stage: RunningStage) -> None:
+        """Called once a sample has been loaded using ``load_sample``."""
+
     def on_per_sample_transform(self, sample: Tensor, running_stage: RunningStage) -> None:
         """Called once ``per_sample_transform`` has been applied to a sample."""
 
@@ -31,7 +31,10 @@ from flash.core.data.io.input_transform import (
     create_or_configure_input_transform,
     create_worker_input_transform_processor,
 )
+from flash.core.data.io.sample_cache import SampleCache, SampleCacheType, create_sample_cache
+from flash.core.data.profiler import DataPipelineProfiler
 from flash.core.data.splits import SplitDataset
+from flash.core.data.utilities.sampling import resolve_sampling
 from flash.core.data.utils import _STAGES_PREFIX
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
 from flash.core.utilities.stages import RunningStage
@@ -73,6 +76,14 @@ class DataModule(pl.LightningDataModule):
         num_workers: The number of workers to use for parallelized loading.
         sampler: A sampler following the :class:`~torch.utils.data.sampler.Sampler` type.
             Will be passed to the DataLoader for the training dataset. Defaults to None.
+        sample_cache: Optionally cache the output of the ``load_sample`` hooks so that samples are only decoded once.
+            Either ``"memory"`` (a per-process LRU cache), ``"disk"`` (a memory-mapped on-disk cache shared between
+            DataLoader workers and runs), or a :class:`~flash.core.data.io.sample_cache.SampleCache` instance.
+            Only applies to map-style inputs whose ``load_sample`` hook is deterministic.
+        cache_max_bytes: The maximum size of the ``sample_cache`` in bytes. Least recently used samples are evicted
+            once the limit is reached. If ``None``, the cache is unbounded.
+        cache_dir: The folder to use for the ``"disk"`` sample cache. Defaults to ``$FLASH_CACHE_DIR`` or a folder in
+            the system temporary directory.
 
     Examples
     ________
@@ -123,6 +134,9 @@ class DataModule(pl.LightningDataModule):
         sampler: Optional[Union[Callable, Sampler, Type[Sampler]]] = None,
         pin_memory: bool = True,
         persistent_workers: bool = False,
+        sample_cache: Optional[Union[str, SampleCacheType, SampleCache]] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         if not batch_size:
             raise TypeError("The `batch_size` should be provided to the DataModule on instantiation.")
@@ -147,7 +161,13 @@ class DataModule(pl.LightningDataModule):
         if self._train_input and (val_split is not None and not self._val_input):
             self._train_input, self._val_input = self._split_train_val(self._train_input, val_split)
 
+        self.sample_cache = create_sample_cache(sample_cache, cache_max_bytes=cache_max_bytes, cache_dir=cache_dir)
+        if self.sample_cache is not None:
+            for input in (self._train_input, self._val_input, self._test_input, self._predict_input):
+                self._attach_sample_cache(input, self.sample_cache)
+
         self._data_fetcher: Optional[BaseDataFetcher] = data_fetcher or self.configure_data_fetcher()
+        self._profiler: Optional[DataPipelineProfiler] = None
 
         self._on_after_batch_transfer_fns = None
 
@@ -193,6 +213,35 @@ class DataModule(pl.LightningDataModule):
         """This property returns the prediction dataset."""
         return self._predict_input
 
+    @staticmethod
+    def _unwrap_input(input: Optional[Dataset]) -> Optional[Dataset]:
+        # Split datasets wrap the underlying ``Input`` which is the one calling ``load_sample``
+        if isinstance(input, SplitDataset):
+            return input.dataset
+        return input
+
+    @classmethod
+    def _attach_sample_cache(cls, input: Optional[Dataset], sample_cache: SampleCache) -> None:
+        input = cls._unwrap_input(input)
+        if isinstance(input, Input) and input:
+            input.sample_cache = sample_cache
+            # The key is computed once here rather than in every DataLoader worker
+            input._sample_cache_key()
+
+    def attach_profiler(self, profiler: Optional[DataPipelineProfiler]) -> None:
+        """Attach a :class:`~flash.core.data.profiler.DataPipelineProfiler` to the inputs and transforms of this
+        ``DataModule``. This is called automatically by the profiler when it is given to the ``Trainer``.
+
+        Args:
+            profiler: The profiler to attach or ``None`` to detach the current profiler.
+        """
+        self._profiler = profiler
+        for input in (self._train_input, self._val_input, self._test_input, self._predict_input):
+            input = self._unwrap_input(input)
+            if isinstance(input, (Input, IterableInput)):
+                input.profiler = profiler
+        self._on_after_batch_transfer_fns = None
+
     #####################################
     # METHODS PERTAINING TO DATALOADERS #
     #####################################
@@ -207,6 +256,8 @@ class DataModule(pl.LightningDataModule):
 
         if input_transform is not None:
             input_transform.callbacks = [self.data_fetcher]
+            if self._profiler is not None:
+                input_transform.callbacks.append(self._profiler)
         return input_transform
 
     def _train_dataloader(self) -> DataLoader:
@@ -243,12 +294,11 @@ class DataModule(pl.LightningDataModule):
         else:
             dataloader = DataLoader(
                 train_ds,
-                batch_size=self.batch_size,
-                shuffle=shuffle,
-                sampler=sampler,
                 num_workers=self.num_workers,
                 pin_memory=self.pin_memory,
-                drop_last=drop_last,
+                **resolve_sampling(
+                    train_ds, self.batch_size, shuffle=shuffle, sampler=sampler, drop_last=drop_last
+                ),
                 collate_fn=create_worker_input_transform_processor(RunningStage.TRAINING, input_transform),
                 persistent_workers=self.persistent_workers,
             )
@@ -276,7 +326,7 @@ class DataModule(pl.LightningDataModule):
         else:
             dataloader = DataLoader(
                 val_ds,
-                batch_size=self.batch_size,
+                **resolve_sampling(val_ds, self.batch_size),
                 num_workers=self.num_workers,
                 pin_memory=self.pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.VALIDATING, input_transform),
@@ -306,7 +356,7 @@ class DataModule(pl.LightningDataModule):
         else:
             dataloader = DataLoader(
                 test_ds,
-                batch_size=self.batch_size,
+                **resolve_sampling(test_ds, self.batch_size),
                 num_workers=self.num_workers,
                 pin_memory=self.pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.TESTING, input_transform),
@@ -341,7 +391,7 @@ class DataModule(pl.LightningDataModule):
         else:
             dataloader = DataLoader(
                 predict_ds,
-                batch_size=batch_size,
+                **resolve_sampling(predict_ds, batch_size),
                 num_workers=self.num_workers,
                 pin_memory=self.pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.PREDICTING, input_transform),
@@ -376,6 +426,11 @@ class DataModule(pl.LightningDataModule):
             else:
                 self._on_after_batch_transfer_fns[stage] = None
 
+    def on_before_batch_transfer(self, batch: Any, dataloader_idx: int) -> Any:
+        if self._profiler is not None:
+            self._profiler.on_before_batch_transfer()
+        return batch
+
     def on_after_batch_transfer(self, batch: Any, dataloader_idx: int) -> Any:
         if getattr(self, "trainer", None) is None:
             return batch
@@ -385,6 +440,11 @@ class DataModule(pl.LightningDataModule):
 
         stage = self.trainer.state.stage
 
+        if self._profiler is not None:
+            self._profiler.on_after_batch_transfer(
+                stage if stage != RunningStage.SANITY_CHECKING else RunningStage.VALIDATING
+            )
+
         transform = self._on_after_batch_transfer_fns[stage]
 
         if transform:
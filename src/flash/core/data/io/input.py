@@ -13,12 +13,17 @@
 # limitations under the License.
 import functools
 import os
+import uuid
+from collections.abc import MutableMapping
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
+from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.enums import LightningEnum
 from torch.utils.data import Dataset
 
+import flash
+from flash.core.data.io.sample_cache import _MISSING, SampleCache, _file_stamp, _fingerprint
 from flash.core.data.properties import Properties
 from flash.core.data.utils import _STAGES_PREFIX
 from flash.core.utilities.stages import RunningStage
@@ -35,7 +40,12 @@ else:
 
 
 def _deepcopy_dict(nested_dict: Any) -> Any:
-    """Utility to deepcopy a nested dict."""
+    """Utility to shallow copy a sample dict so that ``load_sample`` can modify it inplace.
+
+    Samples which are not dicts (e.g. tuples, strings, or read-only ``MappingProxyType`` objects) are returned as is.
+    """
+    if type(nested_dict) is dict or isinstance(nested_dict, Sample):
+        return nested_dict.copy()
     if not isinstance(nested_dict, Dict):
         return nested_dict
     return dict(nested_dict.items())
@@ -77,6 +87,118 @@ class DataKeys(LightningEnum):
         return hash(self.value)
 
 
+def _enum_value(key: Any) -> Any:
+    if isinstance(key, Enum) and hasattr(key, "value"):
+        return key.value
+    return key
+
+
+_UNSET = object()
+
+# Maps each of the ``DataKeys`` (or their string values) to the corresponding ``Sample`` slot
+_SAMPLE_SLOTS = {key.value: key.value for key in DataKeys}
+
+
+class Sample(MutableMapping):
+    """The ``Sample`` is a compact record for a single sample which can be returned from ``load_data`` or
+    ``load_sample`` in place of a ``dict``. The ``DataKeys`` are stored in ``__slots__`` (rather than in a hash table)
+    and any other keys are kept in a small overflow dict. It behaves as a mutable mapping with string keys, so it is
+    understood by :class:`~flash.core.data.transforms.ApplyToKeys` and
+    :func:`~flash.core.data.utilities.collate.default_collate` (which collates it to a ``Sample`` with recent versions
+    of PyTorch, or to a ``dict`` with older versions).
+
+    Example::
+
+        sample = Sample(input=image_path, target=label)
+        sample[DataKeys.INPUT]  # image_path
+    """
+
+    __slots__ = tuple(_SAMPLE_SLOTS.values()) + ("_extra",)
+
+    def __init__(
+        self,
+        *,
+        input: Any = _UNSET,
+        preds: Any = _UNSET,
+        target: Any = _UNSET,
+        metadata: Any = _UNSET,
+        **extra: Any,
+    ):
+        # The arguments are keyword only so that, with the versions of PyTorch which rebuild mappings with
+        # ``type(sample)(dict)``, ``default_collate`` falls back to a ``dict`` for the collated batch
+        self.input = input
+        self.preds = preds
+        self.target = target
+        self.metadata = metadata
+        self._extra = extra or None
+
+    @staticmethod
+    def _key(key: Any) -> Any:
+        return key.value if isinstance(key, Enum) else key
+
+    def __getitem__(self, key: Any) -> Any:
+        slot = _SAMPLE_SLOTS.get(key)
+        if slot is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[self._key(key)]
+        value = getattr(self, slot)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        slot = _SAMPLE_SLOTS.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[self._key(key)] = value
+        else:
+            setattr(self, slot, value)
+
+    def __delitem__(self, key: Any) -> None:
+        slot = _SAMPLE_SLOTS.get(key)
+        if slot is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[self._key(key)]
+        elif getattr(self, slot) is _UNSET:
+            raise KeyError(key)
+        else:
+            setattr(self, slot, _UNSET)
+
+    def __iter__(self):
+        yield from self._present_slots()
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> "Sample":
+        sample = Sample.__new__(Sample)
+        for slot in _SAMPLE_SLOTS.values():
+            setattr(sample, slot, getattr(self, slot))
+        sample._extra = None if self._extra is None else self._extra.copy()
+        return sample
+
+    def __getstate__(self):
+        # The ``_UNSET`` sentinel can't be pickled (it would not be the same object once loaded)
+        return {"_extra": self._extra, **{slot: getattr(self, slot) for slot in self._present_slots()}}
+
+    def __setstate__(self, state):
+        for slot in _SAMPLE_SLOTS.values():
+            setattr(self, slot, _UNSET)
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def _present_slots(self):
+        return (slot for slot in _SAMPLE_SLOTS.values() if getattr(self, slot) is not _UNSET)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+
 class BaseDataFormat(LightningEnum):
     """The base class for creating ``data_format`` for :class:`~flash.core.data.io.input.Input`."""
 
@@ -162,6 +284,17 @@ class InputBase(Properties, metaclass=_InputMeta):
         **kwargs: Any additional keyword arguments to pass to the ``load_data`` hook.
     """
 
+    #: An optional :class:`~flash.core.data.io.sample_cache.SampleCache` used to store the output of ``load_sample``.
+    #: This is usually attached by the :class:`~flash.core.data.data_module.DataModule`.
+    sample_cache: Optional[SampleCache] = None
+
+    #: An optional :class:`~flash.core.data.profiler.DataPipelineProfiler` used to time the ``load_sample`` hook.
+    profiler: Optional["flash.core.data.profiler.DataPipelineProfiler"] = None
+
+    #: A version which is part of the ``fingerprint``. Increase it to invalidate the samples stored in a persistent
+    #: ``sample_cache`` when the loading logic changes outside of the ``load_sample`` and ``load_batch`` hooks.
+    sample_cache_version: int = 0
+
     def __init__(self, running_stage: RunningStage, *args: Any, **kwargs: Any) -> None:
         super().__init__(running_stage=running_stage)
 
@@ -169,20 +302,79 @@ class InputBase(Properties, metaclass=_InputMeta):
         if len(args) >= 1 and args[0] is not None:
             self.data = getattr(self, f"{_STAGES_PREFIX[running_stage]}_load_data")(*args, **kwargs)
 
+    @staticmethod
+    def _to_string_keys(sample_output: Any) -> Any:
+        # Change DataKeys Enum to strings, the dict is only rebuilt if it contains keys which aren't plain strings.
+        # ``DataKeys`` hash and compare in Python, so their value is read directly rather than looked up.
+        if isinstance(sample_output, dict):
+            for key in sample_output:
+                if type(key) is not str:
+                    break
+            else:
+                return sample_output
+            return {
+                key._value_ if type(key) is DataKeys else key if type(key) is str else _enum_value(key): val
+                for key, val in sample_output.items()
+            }
+        return sample_output
+
     def _call_load_sample(self, sample: Any) -> Any:
         # Deepcopy the sample to avoid leaks with complex data structures
         sample_output = getattr(self, f"{_STAGES_PREFIX[self.running_stage]}_load_sample")(_deepcopy_dict(sample))
+        return self._to_string_keys(sample_output)
 
-        # Change DataKeys Enum to strings
-        if isinstance(sample_output, dict):
-            output_dict = {}
-            for key, val in sample_output.items():
-                if isinstance(key, Enum) and hasattr(key, "value"):
-                    output_dict[key.value] = val
-                else:
-                    output_dict[key] = val
-            return output_dict
-        return sample_output
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """A digest identifying this input (its type, running stage, parameters, ``load_sample`` and ``load_batch``
+        code, version, and data) which is used to key the entries of the ``sample_cache``, or ``None`` if the data or
+        the parameters hold objects which can't be fingerprinted reliably.
+
+        The parameters are the public attributes of the input (e.g. set from the arguments of ``load_data``).
+        """
+        if "_cached_fingerprint" not in self.__dict__:
+            prefix = _STAGES_PREFIX.get(self.running_stage, "")
+            hooks = [
+                getattr(type(self), name, None)
+                for name in ("load_sample", f"{prefix}_load_sample", "load_batch", f"{prefix}_load_batch")
+            ]
+            parameters = {
+                key: value
+                for key, value in vars(self).items()
+                if not key.startswith("_") and key not in ("data", "data_iter", "sample_cache", "profiler")
+            }
+            self._cached_fingerprint = _fingerprint(
+                flash.__version__,
+                self.sample_cache_version,
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                str(self.running_stage),
+                [hook.__code__ for hook in hooks if hasattr(hook, "__code__")],
+                parameters,
+                self.data,
+            )
+        return self._cached_fingerprint
+
+    def _sample_stamp(self, sample: Any) -> Optional[Tuple]:
+        # Only the persistent caches check that the files of the sample haven't changed since it was stored
+        return _file_stamp(sample) if self.sample_cache.persistent else None
+
+    def _sample_cache_key(self) -> Optional[str]:
+        """The key of the entries of this input in the ``sample_cache``, ``None`` if its samples can't be cached."""
+        persistent = self.sample_cache.persistent
+        cached = self.__dict__.get("_cache_key", None)
+        if cached is None or cached[0] != persistent:
+            key = self.fingerprint
+            if key is None and persistent:
+                rank_zero_warn(
+                    f"The data of the `{type(self).__name__}` can't be fingerprinted, so its samples won't be stored "
+                    "in the persistent sample cache (where they could be read back for other data). Use the memory "
+                    "cache instead.",
+                    category=UserWarning,
+                )
+            elif key is None:
+                # The in-memory entries don't outlive the process, so a random key can't collide with other data
+                key = f"input-{uuid.uuid4().hex}"
+            cached = self._cache_key = (persistent, key)
+        return cached[1]
 
     @staticmethod
     def load_data(*args: Any, **kwargs: Any) -> Union[Sequence, Iterable]:
@@ -283,8 +475,109 @@ class InputBase(Properties, metaclass=_InputMeta):
 
 
 class Input(InputBase, Dataset):
-    def __getitem__(self, index: int) -> Any:
-        return self._call_load_sample(self.data[index])
+    def _call_load_batch(self, indices: List[int]) -> List[Any]:
+        samples = getattr(self, f"{_STAGES_PREFIX[self.running_stage]}_load_batch")(indices)
+        return [self._to_string_keys(sample) for sample in samples]
+
+    @property
+    def supports_load_batch(self) -> bool:
+        """Whether this input overrides the ``load_batch`` hook (or the ``load_batch`` hook for the current stage).
+
+        If ``True``, the :class:`~flash.core.data.data_module.DataModule` will fetch whole batches of indices at once
+        with a :class:`~torch.utils.data.BatchSampler`.
+        """
+        stage_hook = f"{_STAGES_PREFIX.get(self.running_stage)}_load_batch"
+        if not hasattr(Input, stage_hook):
+            return False
+        return getattr(type(self), stage_hook) is not getattr(Input, stage_hook) or (
+            type(self).load_batch is not Input.load_batch
+        )
+
+    def load_batch(self, indices: List[int]) -> List[Any]:
+        """The ``load_batch`` hook is called with a list of indices when the dataset is accessed by a batch sampler
+        and should return the list of corresponding samples (the outputs of ``load_sample``). Override this hook when
+        the data can be gathered with a single vectorized call (e.g. fancy-indexing of an array or a HuggingFace
+        ``Dataset``).
+
+        Args:
+            indices: The indices of the samples to load.
+        """
+        load_sample = getattr(self, f"{_STAGES_PREFIX[self.running_stage]}_load_sample")
+        return [load_sample(_deepcopy_dict(self.data[index])) for index in indices]
+
+    def train_load_batch(self, indices: List[int]) -> List[Any]:
+        """Override the ``train_load_batch`` hook with batch loading logic that is only required during training.
+
+        Args:
+            indices: The indices of the samples to load.
+        """
+        return self.load_batch(indices)
+
+    def val_load_batch(self, indices: List[int]) -> List[Any]:
+        """Override the ``val_load_batch`` hook with batch loading logic that is only required during validating.
+
+        Args:
+            indices: The indices of the samples to load.
+        """
+        return self.load_batch(indices)
+
+    def test_load_batch(self, indices: List[int]) -> List[Any]:
+        """Override the ``test_load_batch`` hook with batch loading logic that is only required during testing.
+
+        Args:
+            indices: The indices of the samples to load.
+        """
+        return self.load_batch(indices)
+
+    def predict_load_batch(self, indices: List[int]) -> List[Any]:
+        """Override the ``predict_load_batch`` hook with batch loading logic that is only required during
+        predicting.
+
+        Args:
+            indices: The indices of the samples to load.
+        """
+        return self.load_batch(indices)
+
+    def _getitems(self, indices: List[int]) -> List[Any]:
+        fingerprint = None if self.sample_cache is None else self._sample_cache_key()
+        if fingerprint is None:
+            return self._call_load_batch(indices)
+
+        stamps = [self._sample_stamp(self.data[index]) for index in indices]
+        samples = [
+            self.sample_cache.get((fingerprint, index), _MISSING, stamp=stamp) for index, stamp in zip(indices, stamps)
+        ]
+        missing = [i for i, sample in enumerate(samples) if sample is _MISSING]
+        if missing:
+            loaded = self._call_load_batch([indices[i] for i in missing])
+            for i, sample in zip(missing, loaded):
+                samples[i] = sample
+                self.sample_cache.put((fingerprint, indices[i]), sample, stamp=stamps[i])
+        return samples
+
+    def __getitem__(self, index: Union[int, List[int]]) -> Any:
+        if self.profiler is not None:
+            with self.profiler.time("load_sample", self.running_stage):
+                return self._getitem(index)
+        return self._getitem(index)
+
+    def _getitem(self, index: Union[int, List[int]]) -> Any:
+        # A list of indices is given when the dataset is sampled with a ``BatchSampler``
+        if isinstance(index, list):
+            return self._getitems(index)
+
+        fingerprint = None if self.sample_cache is None else self._sample_cache_key()
+        if fingerprint is None:
+            return self._call_load_sample(self.data[index])
+
+        key = (fingerprint, index)
+        data = self.data[index]
+        stamp = self._sample_stamp(data)
+        sample = self.sample_cache.get(key, _MISSING, stamp=stamp)
+        if sample is _MISSING:
+            sample = self._call_load_sample(data)
+            self.sample_cache.put(key, sample, stamp=stamp)
+        return sample
 
     def __len__(self) -> int:
         return len(self.data) if self.data is not None else 0
@@ -296,6 +589,10 @@ class IterableInput(InputBase, IterableDataset, metaclass=_IterableInputMeta):
         return self
 
     def __next__(self) -> Any:
+        if self.profiler is not None:
+            sample = next(self.data_iter)
+            with self.profiler.time("load_sample", self.running_stage):
+                return self._call_load_sample(sample)
         return self._call_load_sample(next(self.data_iter))
 
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import inspect
+from contextlib import nullcontext
 from dataclasses import dataclass
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
@@ -20,6 +21,7 @@ from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.enums import LightningEnum
 
 from flash.core.data.callback import ControlFlow
+from flash.core.data.profiler import DataPipelineProfiler
 from flash.core.data.utilities.collate import default_collate
 from flash.core.data.utils import _STAGES_PREFIX
 from flash.core.utilities.stages import RunningStage
@@ -767,6 +769,14 @@ class _InputTransformProcessor:
         self.apply_per_sample_transform = apply_per_sample_transform
         self.stage = stage
         self.on_device = on_device
+        self.profiler = next(
+            (cb for cb in self.input_transform.callbacks or [] if isinstance(cb, DataPipelineProfiler)), None
+        )
+
+    def _profile(self, name: str):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.time(f"{name}_on_device" if self.on_device else name, self.stage)
 
     def __call__(self, samples: Sequence[Any]) -> Any:
         if not self.on_device:
@@ -776,7 +786,8 @@ class _InputTransformProcessor:
         if self.apply_per_sample_transform:
             list_samples = [samples] if not isinstance(samples, list) else samples
 
-            transformed_samples = [self.per_sample_transform(sample, self.stage) for sample in list_samples]
+            with self._profile("per_sample_transform"):
+                transformed_samples = [self.per_sample_transform(sample, self.stage) for sample in list_samples]
 
             for sample in transformed_samples:
                 if self.on_device:
@@ -784,16 +795,21 @@ class _InputTransformProcessor:
                 else:
                     self.callback.on_per_sample_transform(sample, self.stage)
 
-            collated_samples = self.collate_fn(transformed_samples, self.stage)
+            with self._profile("collate"):
+                collated_samples = self.collate_fn(transformed_samples, self.stage)
             self.callback.on_collate(collated_samples, self.stage)
         else:
             collated_samples = samples
 
-        transformed_collated_samples = self.per_batch_transform(collated_samples, self.stage)
+        with self._profile("per_batch_transform"):
+            transformed_collated_samples = self.per_batch_transform(collated_samples, self.stage)
         if self.on_device:
             self.callback.on_per_batch_transform_on_device(transformed_collated_samples, self.stage)
         else:
             self.callback.on_per_batch_transform(transformed_collated_samples, self.stage)
+
+        if self.profiler is not None:
+            self.profiler.flush()
         return transformed_collated_samples
 
     def __str__(self) -> str:
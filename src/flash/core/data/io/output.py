@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import abstractmethod
-from typing import Any
+from typing import Any, List
 
 import flash
+from flash.core.data.batch import default_uncollate
 from flash.core.data.properties import Properties
 
 
@@ -40,5 +41,22 @@ class Output(Properties):
         """
         return sample
 
+    def transform_batch(self, batch: Any) -> List[Any]:
+        """Convert a whole batch (the output of the :meth:`.OutputTransform.per_batch_transform`) into a list of
+        outputs, one for each sample. Override this with a vectorized implementation (e.g. operating on the whole
+        tensor of predictions) to avoid transforming the samples one at a time. The default uncollates the batch and
+        calls the output on each sample.
+
+        .. note:: When overriding ``transform`` of an output which implements ``transform_batch``, override
+            ``transform_batch`` too.
+
+        Args:
+            batch: The batch of outputs from the :class:`.OutputTransform`.
+
+        Returns:
+            The list of converted outputs.
+        """
+        return [self(sample) for sample in default_uncollate(batch)]
+
     def __call__(self, sample: Any) -> Any:
         return self.transform(sample)
@@ -0,0 +1,242 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sinks which write the predictions to files as they are produced, rather than keeping them in memory.
+
+Each process writes its own files (``<prefix>-rank<rank>-<index>.<extension>``), so predicting with several processes
+(e.g. with DDP) doesn't need any communication between them. A new file is started every ``max_rows_per_file``
+predictions.
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import fsspec
+import numpy as np
+
+from flash.core.utilities.imports import _PYARROW_AVAILABLE
+
+if _PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+
+def _to_json(value: Any) -> Any:
+    # NumPy / torch scalars and arrays can't be written to JSON
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _to_python(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_python(item) for item in value]
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+class PredictionSink:
+    """Base class for the sinks which write predictions to a directory. Override ``open_file``, ``write_rows``, and
+    ``close_file`` to write to a new format.
+
+    Args:
+        output_dir: The directory to write the predictions to (local or remote through ``fsspec``).
+        max_rows_per_file: The number of predictions after which a new file is started.
+        prefix: The prefix of the files.
+    """
+
+    extension: str = ""
+
+    def __init__(self, output_dir: str, max_rows_per_file: int = 100_000, prefix: str = "predictions"):
+        if max_rows_per_file < 1:
+            raise ValueError(f"`max_rows_per_file` should be a positive integer. Found {max_rows_per_file}.")
+        self.output_dir = str(output_dir)
+        self.max_rows_per_file = max_rows_per_file
+        self.prefix = prefix
+        self.rank = 0
+
+        self.fs, _ = fsspec.core.url_to_fs(self.output_dir)
+        self.fs.makedirs(self.output_dir, exist_ok=True)
+
+        self.files: List[str] = []
+        self._path: Optional[str] = None
+        self._num_rows = 0
+
+    def open_file(self, path: str) -> None:
+        """Start a new file."""
+        raise NotImplementedError
+
+    def write_rows(self, rows: List[Any]) -> None:
+        """Write predictions to the current file."""
+        raise NotImplementedError
+
+    def close_file(self) -> None:
+        """Finish the current file."""
+        raise NotImplementedError
+
+    def write(self, predictions: List[Any]) -> None:
+        """Append a batch of predictions (one entry per sample), starting new files as needed.
+
+        Args:
+            predictions: The predictions to write (a list, or an array with a row per prediction).
+        """
+        if not isinstance(predictions, np.ndarray):
+            predictions = list(predictions)
+        while len(predictions):
+            if self._path is None:
+                name = f"{self.prefix}-rank{self.rank:03d}-{len(self.files):05d}.{self.extension}"
+                self._path = os.path.join(self.output_dir, name)
+                self._num_rows = 0
+                self.open_file(self._path)
+            rows = predictions[: self.max_rows_per_file - self._num_rows]
+            predictions = predictions[len(rows) :]
+            self.write_rows(rows)
+            self._num_rows += len(rows)
+            if self._num_rows >= self.max_rows_per_file:
+                self._finish_file()
+
+    def _finish_file(self) -> None:
+        self.close_file()
+        self.files.append(self._path)
+        self._path = None
+
+    def close(self) -> List[str]:
+        """Finish the last file. Returns the files written by this process."""
+        if self._path is not None:
+            self._finish_file()
+        return self.files
+
+    def __enter__(self) -> "PredictionSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JSONLinesSink(PredictionSink):
+    """A :class:`~flash.core.data.io.prediction_sink.PredictionSink` which writes each prediction as a line of JSON.
+    Predictions are written as soon as they are received.
+
+    Examples
+    ________
+
+    .. doctest::
+
+        >>> with JSONLinesSink("predictions", max_rows_per_file=2) as sink:
+        ...     sink.write([{"label": "cat"}, {"label": "dog"}, {"label": "cat"}])
+        >>> sink.files
+        ['predictions/predictions-rank000-00000.jsonl', 'predictions/predictions-rank000-00001.jsonl']
+
+    .. testcleanup::
+
+        >>> import shutil
+        >>> shutil.rmtree("predictions")
+    """
+
+    extension = "jsonl"
+
+    def open_file(self, path: str) -> None:
+        self._file = self.fs.open(path, "w")
+
+    def write_rows(self, rows: List[Any]) -> None:
+        self._file.write("".join(json.dumps(row, default=_to_json) + "\n" for row in rows))
+
+    def close_file(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(PredictionSink):
+    """A :class:`~flash.core.data.io.prediction_sink.PredictionSink` which writes the predictions to parquet files
+    (requires ``pyarrow``). Dictionary predictions are written with a column per key, other predictions are written to
+    a ``prediction`` column. The predictions are buffered and written as row groups of ``row_group_size`` rows.
+
+    Args:
+        output_dir: The directory to write the predictions to (local or remote through ``fsspec``).
+        max_rows_per_file: The number of predictions after which a new file is started.
+        prefix: The prefix of the files.
+        row_group_size: The number of predictions in each row group.
+    """
+
+    extension = "parquet"
+
+    def __init__(
+        self,
+        output_dir: str,
+        max_rows_per_file: int = 1_000_000,
+        prefix: str = "predictions",
+        row_group_size: int = 10_000,
+    ):
+        if not _PYARROW_AVAILABLE:
+            raise ModuleNotFoundError(
+                "Writing parquet files requires `pyarrow`. Install it with `pip install pyarrow`."
+            )
+        super().__init__(output_dir, max_rows_per_file=max_rows_per_file, prefix=prefix)
+        self.row_group_size = row_group_size
+        self._rows: List[Any] = []
+
+    def open_file(self, path: str) -> None:
+        self._file = self.fs.open(path, "wb")
+        self._writer = None
+
+    def _write_row_group(self) -> None:
+        rows = [_to_python(row) for row in self._rows]
+        if not isinstance(rows[0], dict):
+            rows = [{"prediction": row} for row in rows]
+        columns: Dict[str, List[Any]] = {key: [row.get(key, None) for row in rows] for key in rows[0]}
+        if self._writer is None:
+            table = pa.Table.from_pydict(columns)
+            self._writer = pq.ParquetWriter(self._file, table.schema)
+        else:
+            table = pa.Table.from_pydict(columns, schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def write_rows(self, rows: List[Any]) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+
+    def close_file(self) -> None:
+        if self._rows:
+            self._write_row_group()
+        self._writer.close()
+        self._file.close()
+
+
+class NumpySink(PredictionSink):
+    """A :class:`~flash.core.data.io.prediction_sink.PredictionSink` which writes the predictions (tensors or arrays
+    of the same shape) to NPY files, each holding an array with a row per prediction. The predictions of a file are
+    kept in memory until the file is complete, so ``max_rows_per_file`` bounds the memory used.
+    """
+
+    extension = "npy"
+
+    def open_file(self, path: str) -> None:
+        self._rows: List[np.ndarray] = []
+
+    def write(self, predictions: List[Any]) -> None:
+        rows = []
+        for prediction in predictions:
+            if isinstance(prediction, dict):
+                raise ValueError("The `NumpySink` can only write tensors or arrays, use a `JSONLinesSink` instead.")
+            rows.append(prediction.detach().cpu().numpy() if hasattr(prediction, "detach") else np.asarray(prediction))
+        super().write(rows)
+
+    def write_rows(self, rows: List[np.ndarray]) -> None:
+        self._rows.extend(rows)
+
+    def close_file(self) -> None:
+        with self.fs.open(self._path, "wb") as f:
+            np.save(f, np.stack(self._rows))
+        self._rows = []
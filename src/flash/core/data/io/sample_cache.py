@@ -0,0 +1,378 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import dataclasses
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+import types
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import torch
+from pytorch_lightning.utilities.enums import LightningEnum
+
+_MISSING = object()
+
+
+class SampleCacheType(LightningEnum):
+    """The ``SampleCacheType`` enum contains the kinds of sample cache supported by the
+    :class:`~flash.core.data.data_module.DataModule`."""
+
+    MEMORY = "memory"
+    DISK = "disk"
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+class _NoFingerprint(Exception):
+    """Raised when a part of the data has no stable fingerprint."""
+
+
+def _file_stat(path: str) -> Optional[os.stat_result]:
+    if not path or len(path) > 4096 or "\0" in path:
+        return None
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _file_stamp(part: Any) -> Tuple:
+    """The size and modification time of the files referenced (by path) in a single sample of data.
+
+    Only the paths of the given sample are checked, so that the files are looked up when their sample is loaded rather
+    than all at once when the data is fingerprinted.
+    """
+    if isinstance(part, str):
+        stat = _file_stat(part)
+        return () if stat is None else ((part, stat.st_size, stat.st_mtime_ns),)
+    if isinstance(part, (list, tuple)):
+        return tuple(stamp for item in part for stamp in _file_stamp(item))
+    if isinstance(part, Mapping):
+        return tuple(stamp for value in part.values() for stamp in _file_stamp(value))
+    return ()
+
+
+def _update_fingerprint(hasher: "hashlib._Hash", part: Any) -> None:
+    if part is None or part is Ellipsis or isinstance(part, (bool, int, float, complex, Enum)):
+        hasher.update(f"{type(part).__name__}:{part!r};".encode())
+    elif isinstance(part, str):
+        hasher.update(f"str:{len(part)}:{part};".encode("utf-8", "surrogatepass"))
+    elif isinstance(part, bytes):
+        hasher.update(f"bytes:{len(part)}:".encode())
+        hasher.update(part)
+    elif isinstance(part, (list, tuple)):
+        hasher.update(f"{type(part).__name__}:{len(part)}[".encode())
+        for item in part:
+            _update_fingerprint(hasher, item)
+        hasher.update(b"]")
+    elif isinstance(part, dict):
+        hasher.update(f"dict:{len(part)}{{".encode())
+        for key, value in part.items():
+            _update_fingerprint(hasher, key)
+            _update_fingerprint(hasher, value)
+        hasher.update(b"}")
+    elif isinstance(part, (set, frozenset)):
+        # The iteration order of sets changes between processes, so the items are hashed in a stable order
+        hasher.update(f"{type(part).__name__}:{len(part)}{{".encode())
+        for item in sorted(part, key=repr):
+            _update_fingerprint(hasher, item)
+        hasher.update(b"}")
+    elif dataclasses.is_dataclass(part) and not isinstance(part, type):
+        hasher.update(f"{type(part).__module__}.{type(part).__qualname__}:".encode())
+        _update_fingerprint(hasher, {field.name: getattr(part, field.name) for field in dataclasses.fields(part)})
+    elif isinstance(part, (types.FunctionType, types.MethodType)):
+        _update_fingerprint(hasher, part.__code__)
+    elif isinstance(part, types.CodeType):
+        # Functions are identified by their code (their bytecode, constants, and the names they refer to)
+        hasher.update(f"code:{part.co_name}:{len(part.co_code)}:".encode())
+        hasher.update(part.co_code)
+        _update_fingerprint(hasher, part.co_consts)
+        _update_fingerprint(hasher, part.co_names)
+    elif isinstance(part, torch.Tensor):
+        _update_fingerprint(hasher, part.detach().cpu().numpy())
+    elif isinstance(part, np.ndarray):
+        if part.dtype == object:
+            hasher.update(f"ndarray:object:{part.shape}".encode())
+            _update_fingerprint(hasher, part.ravel().tolist())
+        else:
+            hasher.update(f"ndarray:{part.dtype.str}:{part.shape}".encode())
+            hasher.update(np.ascontiguousarray(part).data)
+    elif isinstance(part, np.generic):
+        _update_fingerprint(hasher, part.item())
+    elif type(part).__name__ in ("DataFrame", "Series") and type(part).__module__.startswith("pandas"):
+        import pandas as pd
+
+        hasher.update(f"{type(part).__name__}:{part.shape}:".encode())
+        _update_fingerprint(hasher, list(part.columns) if hasattr(part, "columns") else part.name)
+        _update_fingerprint(hasher, pd.util.hash_pandas_object(part, index=True).to_numpy())
+    else:
+        raise _NoFingerprint(type(part).__qualname__)
+
+
+def _fingerprint(*parts: Any) -> Optional[str]:
+    """Compute a stable hex digest from the given parts, or ``None`` if one of them can't be fingerprinted.
+
+    Built-in values, arrays, tensors, data frames, and dataclasses are hashed by value and functions by their code.
+    Strings are hashed as they are, even if they are paths to files (use ``_file_stamp`` to check the files of each
+    sample). Other objects can't be compared between processes or runs, so they have no fingerprint.
+    """
+    hasher = hashlib.sha1()
+    try:
+        for part in parts:
+            _update_fingerprint(hasher, part)
+    except _NoFingerprint:
+        return None
+    return hasher.hexdigest()
+
+
+class SampleCache:
+    """The ``SampleCache`` is the base class for caches of loaded samples. Entries are stored by a ``(fingerprint,
+    index)`` key, where the fingerprint identifies the :class:`~flash.core.data.io.input.Input` (its type, running
+    stage, parameters, ``load_sample`` code, and data) and the index identifies the sample.
+
+    Persistent caches also store a ``stamp`` with each entry (the size and modification time of the files of the
+    sample), and only return the entries which were stored with the same ``stamp``.
+
+    Args:
+        max_bytes: The maximum number of bytes to hold in the cache. Least recently used entries are evicted once the
+            limit is exceeded. If ``None``, the cache is unbounded.
+    """
+
+    #: Whether the entries outlive the process (and so can be read by other inputs with the same fingerprint).
+    persistent: bool = False
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"`cache_max_bytes` should be a positive integer. Found {max_bytes}.")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, int], default: Any = None, stamp: Optional[Tuple] = None) -> Any:
+        raise NotImplementedError
+
+    def put(self, key: Tuple[str, int], value: Any, stamp: Optional[Tuple] = None) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __getstate__(self):
+        # Counters are per-process, don't send them to the workers.
+        state = self.__dict__.copy()
+        state["hits"] = 0
+        state["misses"] = 0
+        return state
+
+
+class MemorySampleCache(SampleCache):
+    """The ``MemorySampleCache`` keeps pickled samples in an in-process LRU ``OrderedDict``. Each DataLoader worker
+    holds its own copy so this is most useful with ``persistent_workers=True`` or ``num_workers=0``.
+
+    Args:
+        max_bytes: The maximum number of (pickled) bytes to hold in the cache.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        super().__init__(max_bytes=max_bytes)
+        self._entries: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int], default: Any = None, stamp: Optional[Tuple] = None) -> Any:
+        with self._lock:
+            payload = self._entries.get(key, None)
+            if payload is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key: Tuple[str, int], value: Any, stamp: Optional[Tuple] = None) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._num_bytes -= len(previous)
+            self._entries[key] = payload
+            self._num_bytes += len(payload)
+            while self.max_bytes is not None and self._num_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._num_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class DiskSampleCache(SampleCache):
+    """The ``DiskSampleCache`` stores each sample as a pickle file under ``cache_dir``. Files are read back through a
+    read-only memory map so the page cache is shared between DataLoader workers (and between runs). Least recently
+    used entries (by file modification time, which is refreshed on every hit) are evicted once ``max_bytes`` is
+    exceeded.
+
+    Args:
+        cache_dir: The directory to store the cache in. Defaults to ``$FLASH_CACHE_DIR`` or a ``flash_sample_cache``
+            folder in the system temporary directory.
+        max_bytes: The maximum number of bytes to hold on disk.
+    """
+
+    persistent = True
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        super().__init__(max_bytes=max_bytes)
+        if cache_dir is None:
+            cache_dir = os.environ.get("FLASH_CACHE_DIR", os.path.join(tempfile.gettempdir(), "flash_sample_cache"))
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Approximate number of bytes written by this process since the last eviction pass
+        self._pending_bytes = 0
+
+    def _path(self, key: Tuple[str, int]) -> str:
+        fingerprint, index = key
+        return os.path.join(self.cache_dir, fingerprint, f"{index}.pkl")
+
+    def get(self, key: Tuple[str, int], default: Any = None, stamp: Optional[Tuple] = None) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                entry_stamp, value = pickle.loads(buffer)
+        except (OSError, ValueError, TypeError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return default
+        # The files of the sample have changed since it was stored
+        if entry_stamp != stamp:
+            self.misses += 1
+            return default
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: Tuple[str, int], value: Any, stamp: Optional[Tuple] = None) -> None:
+        payload = pickle.dumps((stamp, value), protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file and rename so that concurrent workers never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        if self.max_bytes is not None:
+            self._pending_bytes += len(payload)
+            # Only scan the cache folder once we may have written a noticeable fraction of the budget
+            if self._pending_bytes > self.max_bytes // 16:
+                self._pending_bytes = 0
+                self._evict()
+
+    def _entries(self):
+        entries = []
+        for fingerprint_dir in os.scandir(self.cache_dir):
+            if not fingerprint_dir.is_dir():
+                continue
+            for entry in os.scandir(fingerprint_dir.path):
+                if entry.name.endswith(".pkl"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        num_bytes = sum(size for _, size, _ in entries)
+        if num_bytes <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            num_bytes -= size
+            if num_bytes <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+def create_sample_cache(
+    sample_cache: Optional[Union[str, SampleCacheType, SampleCache]],
+    cache_max_bytes: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> Optional[SampleCache]:
+    """Create a :class:`~flash.core.data.io.sample_cache.SampleCache` from the ``sample_cache`` argument given to the
+    :class:`~flash.core.data.data_module.DataModule`.
+
+    Args:
+        sample_cache: One of ``"memory"``, ``"disk"``, a ``SampleCache`` instance, or ``None`` to disable caching.
+        cache_max_bytes: The maximum number of bytes to keep in the cache.
+        cache_dir: The folder to use for the ``"disk"`` cache.
+
+    Returns:
+        The ``SampleCache`` or ``None``.
+    """
+    if sample_cache is None or isinstance(sample_cache, SampleCache):
+        return sample_cache
+
+    try:
+        sample_cache = SampleCacheType(sample_cache)
+    except ValueError:
+        raise ValueError(
+            f"The `sample_cache` should be one of {[t.value for t in SampleCacheType]} or a `SampleCache`. "
+            f"Found {sample_cache}."
+        )
+
+    if sample_cache == SampleCacheType.MEMORY:
+        return MemorySampleCache(max_bytes=cache_max_bytes)
+    return DiskSampleCache(cache_dir=cache_dir, max_bytes=cache_max_bytes)
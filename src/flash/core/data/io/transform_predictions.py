@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+from typing import Any, List, Optional, Sequence
 
 import pytorch_lightning as pl
 from pytorch_lightning import Callback
+from pytorch_lightning.callbacks import BasePredictionWriter
 
 from flash.core.data.io.output import Output
 from flash.core.data.io.output_transform import OutputTransform
+from flash.core.data.io.prediction_sink import PredictionSink
 
 
 class TransformPredictions(Callback):
@@ -36,6 +39,19 @@ class TransformPredictions(Callback):
         self.output_transform = output_transform
         self.output = output
 
+        # Unless the output transform changes how batches are split into samples, the output transforms whole batches
+        output_transform_type = type(output_transform)
+        self.transform_batches = hasattr(output, "transform_batch") and all(
+            getattr(output_transform_type, name) is getattr(OutputTransform, name)
+            for name in ("__call__", "uncollate", "per_sample_transform")
+        )
+
+    def transform(self, predictions: Any) -> List[Any]:
+        """Apply the output transform and the output to a batch of predictions. Returns a list of outputs."""
+        if self.transform_batches:
+            return self.output.transform_batch(self.output_transform.per_batch_transform(predictions))
+        return [self.output(prediction) for prediction in self.output_transform(predictions)]
+
     def on_predict_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
         predict_step = pl_module.predict_step
 
@@ -43,11 +59,45 @@ class TransformPredictions(Callback):
         def wrapper(*args, **kwargs):
             predictions = predict_step(*args, **kwargs)
             if predictions is not None:
-                predictions = self.output_transform(predictions)
-                predictions = [self.output(prediction) for prediction in predictions]
+                predictions = self.transform(predictions)
             return predictions
 
         pl_module.predict_step = wrapper
 
     def on_predict_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
         pl_module.predict_step = pl_module.predict_step.__wrapped__
+
+
+class WritePredictions(BasePredictionWriter):
+    """``WritePredictions`` is a :class:`~pytorch_lightning.callbacks.BasePredictionWriter` which writes the
+    (transformed) predictions of each batch to a :class:`~flash.core.data.io.prediction_sink.PredictionSink` as soon
+    as they are produced. Each process writes its own files.
+
+    Args:
+        sink: The :class:`~flash.core.data.io.prediction_sink.PredictionSink` to write to.
+    """
+
+    def __init__(self, sink: PredictionSink):
+        super().__init__(write_interval="batch")
+
+        self.sink = sink
+        self.files: List[str] = []
+
+    def on_predict_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self.sink.rank = trainer.global_rank
+
+    def write_on_batch_end(
+        self,
+        trainer: "pl.Trainer",
+        pl_module: "pl.LightningModule",
+        prediction: Any,
+        batch_indices: Optional[Sequence[int]],
+        batch: Any,
+        batch_idx: int,
+        dataloader_idx: int,
+    ) -> None:
+        if prediction is not None:
+            self.sink.write(prediction)
+
+    def on_predict_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self.files = self.sink.close()
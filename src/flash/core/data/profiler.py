@@ -0,0 +1,289 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import queue
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytorch_lightning as pl
+from pytorch_lightning.utilities import rank_zero_info
+from torch.utils.data import get_worker_info
+
+from flash.core.data.callback import FlashCallback
+from flash.core.data.utils import _STAGES_PREFIX
+from flash.core.utilities.stages import RunningStage
+
+# Log-spaced histogram bin edges from 1 microsecond to 100 seconds
+_BIN_EDGES = np.logspace(-6, 2, 81)
+
+_MAIN_PROCESS = "main"
+
+
+class _Histogram:
+    """A fixed size, log-spaced histogram of durations (in seconds)."""
+
+    def __init__(self):
+        self.counts = np.zeros(len(_BIN_EDGES) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        self.counts[np.searchsorted(_BIN_EDGES, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def merge(self, other: "_Histogram") -> None:
+        self.counts += other.counts
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Returns an estimate of the ``q`` quantile given by the upper edge of the bin which contains it."""
+        if self.count == 0:
+            return 0.0
+        index = int(np.searchsorted(np.cumsum(self.counts), q * self.count))
+        return float(min(_BIN_EDGES[min(index, len(_BIN_EDGES) - 1)], self.max))
+
+
+class DataPipelineProfiler(FlashCallback):
+    """The ``DataPipelineProfiler`` records wall-time histograms for each stage of the Flash data pipeline
+    (``load_sample``, ``per_sample_transform``, ``collate``, ``per_batch_transform``, the host to device transfer, and
+    the on-device transforms), for each running stage and DataLoader worker. It also measures the time that the
+    training loop spends waiting for data (the time between the end of a training step and the start of the next one)
+    against the time spent in the training step itself.
+
+    Timings from DataLoader workers are sent back to the main process through a queue and are merged at the start of
+    every train, validation, test, and predict batch. Summaries are written to the Lightning logger at the end of each
+    training epoch.
+
+    Example::
+
+        from flash import Trainer
+        from flash.core.data.profiler import DataPipelineProfiler
+
+        profiler = DataPipelineProfiler()
+        trainer = Trainer(callbacks=[profiler])
+        trainer.fit(model, datamodule=datamodule)
+        print(profiler.summary())
+
+    Args:
+        log_summary: If ``True``, the summary metrics are written to the Lightning logger at the end of each training
+            epoch.
+        verbose: If ``True``, the summary table will be printed when the trainer finishes.
+    """
+
+    def __init__(self, log_summary: bool = True, verbose: bool = False):
+        self.log_summary = log_summary
+        self.verbose = verbose
+
+        self.histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self.step_time = _Histogram()
+        self.stall_time = _Histogram()
+
+        self._buffer: List[Tuple[str, str, str, float]] = []
+        self._queue = multiprocessing.Queue()
+        self._batch_end_time: Optional[float] = None
+        self._batch_start_time: Optional[float] = None
+        self._transfer_start_time: Optional[float] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # A queue can only be sent to a child process when it is spawned (e.g. for the DataLoader workers)
+        if multiprocessing.context.get_spawning_popen() is None:
+            state["_queue"] = None
+        return state
+
+    #############
+    # RECORDING #
+    #############
+
+    def record(self, name: str, duration: float, running_stage: RunningStage) -> None:
+        """Record that the ``name`` stage of the data pipeline took ``duration`` seconds.
+
+        Args:
+            name: The name of the data pipeline stage (e.g. ``"load_sample"``).
+            duration: The duration in seconds.
+            running_stage: The running stage for which the data is being processed.
+        """
+        worker_info = get_worker_info()
+        worker = _MAIN_PROCESS if worker_info is None else str(worker_info.id)
+        record = (_STAGES_PREFIX[running_stage], name, worker, duration)
+        if worker_info is None:
+            self._add(*record)
+        else:
+            self._buffer.append(record)
+
+    @contextmanager
+    def time(self, name: str, running_stage: RunningStage):
+        """Context manager which records the time taken by the enclosed block as the ``name`` stage."""
+        start = time.perf_counter()
+        yield
+        self.record(name, time.perf_counter() - start, running_stage)
+
+    def flush(self) -> None:
+        """Send any timings buffered in a DataLoader worker to the main process."""
+        if self._buffer and self._queue is not None:
+            self._queue.put(self._buffer)
+        self._buffer = []
+
+    def _add(self, stage: str, name: str, worker: str, duration: float) -> None:
+        key = (stage, name, worker)
+        histogram = self.histograms.get(key, None)
+        if histogram is None:
+            histogram = self.histograms[key] = _Histogram()
+        histogram.add(duration)
+
+    def _drain(self) -> None:
+        if self._queue is None:
+            return
+        while True:
+            try:
+                records = self._queue.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            for record in records:
+                self._add(*record)
+
+    def reset(self) -> None:
+        self._drain()
+        self.histograms = {}
+        self.step_time = _Histogram()
+        self.stall_time = _Histogram()
+
+    ##################
+    # BATCH TRANSFER #
+    ##################
+
+    def on_before_batch_transfer(self) -> None:
+        self._transfer_start_time = time.perf_counter()
+
+    def on_after_batch_transfer(self, running_stage: RunningStage) -> None:
+        if self._transfer_start_time is not None:
+            self.record("host_to_device", time.perf_counter() - self._transfer_start_time, running_stage)
+            self._transfer_start_time = None
+
+    ###################
+    # LIGHTNING HOOKS #
+    ###################
+
+    def setup(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", stage: Optional[str] = None) -> None:
+        datamodule = getattr(trainer, "datamodule", None)
+        if datamodule is not None and hasattr(datamodule, "attach_profiler"):
+            datamodule.attach_profiler(self)
+
+    def on_train_epoch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._batch_end_time = time.perf_counter()
+
+    def on_train_batch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs) -> None:
+        self._batch_start_time = time.perf_counter()
+        if self._batch_end_time is not None:
+            self.stall_time.add(self._batch_start_time - self._batch_end_time)
+        self._drain()
+
+    def on_train_batch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs) -> None:
+        self._batch_end_time = time.perf_counter()
+        if self._batch_start_time is not None:
+            self.step_time.add(self._batch_end_time - self._batch_start_time)
+
+    def on_train_epoch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._batch_end_time = None
+        self._drain()
+        if self.log_summary and trainer.logger is not None:
+            trainer.logger.log_metrics(self.metrics(), step=trainer.global_step)
+
+    def on_validation_batch_start(
+        self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs
+    ) -> None:
+        self._drain()
+
+    def on_test_batch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs) -> None:
+        self._drain()
+
+    def on_predict_batch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs) -> None:
+        self._drain()
+
+    def on_validation_epoch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._drain()
+
+    def on_test_epoch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._drain()
+
+    def on_predict_epoch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *args, **kwargs) -> None:
+        self._drain()
+
+    def teardown(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", stage: Optional[str] = None) -> None:
+        self._drain()
+        if self.verbose:
+            rank_zero_info(self.summary())
+
+    ###########
+    # SUMMARY #
+    ###########
+
+    def _merged(self) -> Dict[Tuple[str, str], _Histogram]:
+        merged = {}
+        for (stage, name, _), histogram in self.histograms.items():
+            merged.setdefault((stage, name), _Histogram()).merge(histogram)
+        return merged
+
+    @property
+    def stall_fraction(self) -> float:
+        """The fraction of the training time spent waiting for data."""
+        total = self.stall_time.total + self.step_time.total
+        return self.stall_time.total / total if total > 0 else 0.0
+
+    def metrics(self) -> Dict[str, float]:
+        """Returns a flat dictionary of summary metrics (mean and 95th percentile times in milliseconds)."""
+        metrics = {}
+        for (stage, name), histogram in self._merged().items():
+            metrics[f"data_pipeline/{stage}/{name}_mean_ms"] = histogram.mean * 1000
+            metrics[f"data_pipeline/{stage}/{name}_p95_ms"] = histogram.quantile(0.95) * 1000
+        if self.step_time.count:
+            metrics["data_pipeline/train/step_mean_ms"] = self.step_time.mean * 1000
+            metrics["data_pipeline/train/stall_mean_ms"] = self.stall_time.mean * 1000
+            metrics["data_pipeline/train/stall_fraction"] = self.stall_fraction
+        return metrics
+
+    def summary(self) -> str:
+        """Returns a table summarizing the recorded timings for each stage and worker."""
+        self._drain()
+        header = f"{'stage':<10}{'hook':<34}{'worker':<8}{'count':>10}{'mean (ms)':>12}{'p50 (ms)':>12}"
+        header += f"{'p95 (ms)':>12}{'total (s)':>12}"
+        lines = [header, "-" * len(header)]
+
+        def _line(stage: str, name: str, worker: str, histogram: _Histogram) -> str:
+            return (
+                f"{stage:<10}{name:<34}{worker:<8}{histogram.count:>10}{histogram.mean * 1000:>12.3f}"
+                f"{histogram.quantile(0.5) * 1000:>12.3f}{histogram.quantile(0.95) * 1000:>12.3f}"
+                f"{histogram.total:>12.3f}"
+            )
+
+        for (stage, name, worker), histogram in sorted(self.histograms.items()):
+            lines.append(_line(stage, name, worker, histogram))
+
+        if self.step_time.count:
+            lines.append("-" * len(header))
+            lines.append(_line("train", "step", _MAIN_PROCESS, self.step_time))
+            lines.append(_line("train", "data_stall", _MAIN_PROCESS, self.stall_time))
+            lines.append(f"Data stall fraction: {self.stall_fraction:.1%}")
+        return "\n".join(lines)
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 import numpy as np
 from torch.utils.data import Dataset
@@ -53,7 +53,9 @@ class SplitDataset(Properties, Dataset):
             return getattr(self.dataset, key)
         raise AttributeError
 
-    def __getitem__(self, index: int) -> Any:
+    def __getitem__(self, index: Union[int, List[int]]) -> Any:
+        if isinstance(index, list):
+            return self.dataset[[self.indices[i] for i in index]]
         return self.dataset[self.indices[index]]
 
     def __len__(self) -> int:
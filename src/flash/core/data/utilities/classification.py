@@ -13,7 +13,9 @@
 # limitations under the License.
 from dataclasses import dataclass
 from functools import reduce
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union, cast
+from itertools import chain
+from numbers import Number
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
 
 import numpy as np
 import torch
@@ -46,6 +48,29 @@ def _strip(x: str) -> str:
     return x.strip(", ")
 
 
+def _as_array(x: Union[Sequence, Tensor, np.ndarray]) -> np.ndarray:
+    if torch.is_tensor(x):
+        return x.cpu().numpy()
+    return np.asarray(x)
+
+
+def _multi_hot(indices: np.ndarray, lengths: np.ndarray, num_classes: int) -> np.ndarray:
+    """Build the ``(len(lengths), num_classes)`` multi-hot matrix from the concatenated class indices of each row."""
+    result = np.zeros((len(lengths), num_classes), dtype=np.int64)
+    result[np.repeat(np.arange(len(lengths)), lengths), indices] = 1
+    return result
+
+
+def _format_unique(formatter: "TargetFormatter", targets: Sequence[Any]) -> Optional[np.ndarray]:
+    """Format each unique target once and gather the results, or return ``None`` if the targets aren't hashable."""
+    try:
+        index = {target: i for i, target in enumerate(dict.fromkeys(targets))}
+    except TypeError:
+        return None
+    formatted = np.asarray([formatter.format(target) for target in index])
+    return formatted[np.fromiter(map(index.__getitem__, targets), dtype=np.int64, count=len(targets))]
+
+
 @dataclass
 class TargetFormatter:
     """A ``TargetFormatter`` is used to convert targets of a given type to a standard format required by the loss
@@ -87,6 +112,18 @@ class TargetFormatter:
     def format(self, target: Any) -> Any:
         raise NotImplementedError
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        """Format many targets at once (e.g. a whole column of a data frame). Sub-classes override this with a
+        vectorized implementation, the default calls ``format`` for each target.
+
+        Args:
+            targets: The targets to format.
+
+        Returns:
+            An array with the formatted targets (one row per target).
+        """
+        return np.asarray([self.format(target) for target in _as_list(targets)])
+
 
 @dataclass
 class SingleNumericTargetFormatter(TargetFormatter):
@@ -118,6 +155,15 @@ class SingleNumericTargetFormatter(TargetFormatter):
             result = result[0]
         return result
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        try:
+            array = _as_array(targets)
+        except ValueError:
+            return super().format_batch(targets)
+        if array.dtype == object or array.ndim > 2:
+            return super().format_batch(targets)
+        return array.reshape(len(array), -1)[:, 0] if array.ndim == 2 else array
+
 
 @dataclass
 class SingleLabelTargetFormatter(TargetFormatter):
@@ -147,6 +193,10 @@ class SingleLabelTargetFormatter(TargetFormatter):
     def format(self, target: Any) -> Any:
         return self.label_to_idx[_strip(target[0] if _is_list_like(target) and not isinstance(target, str) else target)]
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        result = _format_unique(self, targets)
+        return result if result is not None else super().format_batch(targets)
+
 
 @dataclass
 class SingleBinaryTargetFormatter(TargetFormatter):
@@ -176,6 +226,16 @@ class SingleBinaryTargetFormatter(TargetFormatter):
                 return idx
         return 0
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        try:
+            array = _as_array(targets)
+        except ValueError:
+            return super().format_batch(targets)
+        if array.dtype == object or array.ndim != 2:
+            return super().format_batch(targets)
+        # ``argmax`` gives the first index of a one (or zero if there isn't one)
+        return np.argmax(array == 1, axis=1)
+
 
 @dataclass
 class MultiNumericTargetFormatter(TargetFormatter):
@@ -205,6 +265,16 @@ class MultiNumericTargetFormatter(TargetFormatter):
             result[idx] = 1
         return result
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        if torch.is_tensor(targets) or isinstance(targets, np.ndarray):
+            array = _as_array(targets)
+            if array.ndim != 2:
+                return super().format_batch(targets)
+            return _multi_hot(array.reshape(-1), np.full(len(array), array.shape[1]), self.num_classes)
+        lengths = np.fromiter(map(len, targets), dtype=np.int64, count=len(targets))
+        indices = np.fromiter(chain.from_iterable(targets), dtype=np.int64, count=int(lengths.sum()))
+        return _multi_hot(indices, lengths, self.num_classes)
+
 
 @dataclass
 class MultiLabelTargetFormatter(SingleLabelTargetFormatter):
@@ -234,6 +304,18 @@ class MultiLabelTargetFormatter(SingleLabelTargetFormatter):
             result[idx] = 1
         return result
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        # Delimited strings (and tuples) are formatted once per unique target
+        result = _format_unique(self, targets)
+        if result is not None:
+            return result
+        # Lists of labels are formatted once per unique label
+        lengths = np.fromiter(map(len, targets), dtype=np.int64, count=len(targets))
+        tokens = list(chain.from_iterable(targets))
+        index = {token: SingleLabelTargetFormatter.format(self, token) for token in dict.fromkeys(tokens)}
+        indices = np.fromiter(map(index.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        return _multi_hot(indices, lengths, self.num_classes)
+
 
 @dataclass
 class CommaDelimitedMultiLabelTargetFormatter(MultiLabelTargetFormatter):
@@ -250,6 +332,10 @@ class CommaDelimitedMultiLabelTargetFormatter(MultiLabelTargetFormatter):
         [0, 1, 1]
         >>> formatter("bird")
         [1, 0, 0]
+        >>> formatter.format_batch(["cat,dog", "bird", "cat,dog"])
+        array([[0, 1, 1],
+               [1, 0, 0],
+               [0, 1, 1]])
     """
 
     multi_label: ClassVar[Optional[bool]] = True
@@ -310,6 +396,9 @@ class MultiBinaryTargetFormatter(TargetFormatter):
     def format(self, target: Any) -> Any:
         return _as_list(target)
 
+    def format_batch(self, targets: Union[Sequence[Any], Tensor, np.ndarray]) -> np.ndarray:
+        return _as_array(targets)
+
 
 @dataclass
 class MultiSoftTargetFormatter(MultiBinaryTargetFormatter):
@@ -402,6 +491,129 @@ def _resolve_target_formatter(a: Type[TargetFormatter], b: Type[TargetFormatter]
     )
 
 
+# The formatter types of numeric targets, indexed by the codes given by ``_get_numeric_formatter_types``
+_NUMERIC_FORMATTER_TYPES: List[Type[TargetFormatter]] = [
+    SingleNumericTargetFormatter,
+    SingleBinaryTargetFormatter,
+    MultiBinaryTargetFormatter,
+    MultiSoftTargetFormatter,
+    MultiNumericTargetFormatter,
+]
+
+
+def _get_numeric_formatter_types(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Vectorized ``_get_target_formatter_type`` for numeric targets, given the concatenated ``values`` of all the
+    targets and the length of each target. Returns the index in ``_NUMERIC_FORMATTER_TYPES`` of each target type."""
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    def count(mask: np.ndarray) -> np.ndarray:
+        if lengths.min() == lengths.max():
+            return mask.reshape(len(lengths), -1).sum(1)
+        totals = np.concatenate([[0], np.cumsum(mask, dtype=np.int64)])
+        return totals[ends] - totals[starts]
+
+    ones = count(values == 1)
+    binary = ones + count(values == 0) == lengths
+    codes = np.where(binary, np.where(ones == 1, 1, 2), 3 if values.dtype.kind == "f" else 4)
+    codes[lengths <= 1] = 0
+    return codes
+
+
+def _reduce_formatter_types(codes: np.ndarray, types: List[Type[TargetFormatter]]) -> Type[TargetFormatter]:
+    """Equivalent to ``reduce(_resolve_target_formatter, [types[code] for code in codes])``. The reduction only
+    changes at targets which the current type doesn't absorb (at most a few times) so each of them is found with a
+    single bulk comparison."""
+    current, position = types[codes[0]], 0
+    while True:
+        absorbed = [i for i, t in enumerate(types) if t is current or current in _RESOLUTION_MAPPING.get(t, [])]
+        changes = ~np.isin(codes[position:], absorbed)
+        if not changes.any():
+            return current
+        position += int(np.argmax(changes))
+        current = _resolve_target_formatter(current, types[codes[position]])
+
+
+def _infer_numeric_targets(
+    values: np.ndarray, lengths: np.ndarray
+) -> Tuple[Type[TargetFormatter], Optional[List[Any]], int]:
+    target_formatter_type = _reduce_formatter_types(
+        _get_numeric_formatter_types(values, lengths), _NUMERIC_FORMATTER_TYPES
+    )
+    if target_formatter_type.numeric:
+        return target_formatter_type, None, values.max().item() + 1
+    return target_formatter_type, None, int(lengths[0])
+
+
+def _infer_targets(
+    targets: Union[Sequence[Any], Tensor, np.ndarray]
+) -> Optional[Tuple[Type[TargetFormatter], Optional[List[Any]], Optional[int]]]:
+    """Infer the ``TargetFormatter`` type, ``labels``, and ``num_classes`` of the targets in bulk, rather than one
+    target at a time. The layout of the targets (an array, strings, lists of strings, numbers, or lists of numbers)
+    is sampled from the first target and then validated over all of the targets at once. Strings are only split and
+    stripped once per unique string.
+
+    Returns:
+        The inferred type, ``labels``, and ``num_classes``, or ``None`` if the targets don't have one of the supported
+        layouts (in which case they should be inferred one target at a time).
+    """
+    if torch.is_tensor(targets) or isinstance(targets, np.ndarray):
+        array = _as_array(targets)
+        if array.dtype.kind not in "biuf" or array.ndim not in (1, 2) or array.size == 0:
+            return None
+        if array.ndim == 1:
+            return SingleNumericTargetFormatter, None, array.max().item() + 1
+        return _infer_numeric_targets(array.reshape(-1), np.full(len(array), array.shape[1]))
+
+    if len(targets) == 0:
+        return None
+    first = next(iter(targets))
+    container_types = set(map(type, targets))
+
+    if isinstance(first, str):
+        try:
+            unique_targets = list(dict.fromkeys(targets))
+        except TypeError:
+            return None
+        if not all(isinstance(target, str) for target in unique_targets):
+            return None
+        target_formatter_type = reduce(
+            _resolve_target_formatter, dict.fromkeys(map(_get_target_formatter_type, unique_targets))
+        )
+        if target_formatter_type is CommaDelimitedMultiLabelTargetFormatter:
+            tokens = chain.from_iterable(target.split(",") for target in unique_targets)
+        elif target_formatter_type is SpaceDelimitedTargetFormatter:
+            tokens = chain.from_iterable(target.split(" ") for target in unique_targets)
+        else:
+            tokens = unique_targets
+        return target_formatter_type, list(sorted_alphanumeric(set(map(_strip, tokens)))), None
+
+    if isinstance(first, Number):
+        if not all(issubclass(t, Number) for t in container_types):
+            return None
+        return SingleNumericTargetFormatter, None, max(targets) + 1
+
+    if not container_types <= {list, tuple} or len(first) == 0:
+        return None
+    lengths = np.fromiter(map(len, targets), dtype=np.int64, count=len(targets))
+    values = list(chain.from_iterable(targets))
+
+    if isinstance(first[0], str):
+        try:
+            tokens = list(dict.fromkeys(values))
+        except TypeError:
+            return None
+        if lengths.min() == 0 or not all(isinstance(token, str) for token in tokens):
+            return None
+        return MultiLabelTargetFormatter, list(sorted_alphanumeric(set(map(_strip, tokens)))), None
+
+    # Mixed int and float values could be different types per target, so they are inferred one target at a time
+    value_types = set(map(type, values))
+    if len(value_types) != 1 or not value_types <= {int, float, bool}:
+        return None
+    return _infer_numeric_targets(np.asarray(values), lengths)
+
+
 def _get_target_details(
     targets: List[Any],
     target_formatter_type: Type[TargetFormatter],
@@ -479,12 +691,19 @@ def get_target_formatter(
     Returns:
         The target formatter to use when formatting targets.
     """
-    targets = _as_list(targets)
-    target_formatter_type: Type[TargetFormatter] = reduce(
-        _resolve_target_formatter, [_get_target_formatter_type(target) for target in targets]
-    )
+    inferred = _infer_targets(targets)
+    if inferred is not None:
+        target_formatter_type, inferred_labels, inferred_num_classes = inferred
+    else:
+        targets = _as_list(targets)
+        target_formatter_type = reduce(
+            _resolve_target_formatter, [_get_target_formatter_type(target) for target in targets]
+        )
     if labels is None and num_classes is None:
-        labels, num_classes = _get_target_details(targets, target_formatter_type)
+        if inferred is not None:
+            labels, num_classes = inferred_labels, inferred_num_classes
+        else:
+            labels, num_classes = _get_target_details(targets, target_formatter_type)
         if add_background:
             labels = ["background"] + labels if labels is not None else labels
             num_classes = num_classes + 1 if num_classes is not None else num_classes
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
-from typing import Any, Callable, List, Mapping
+from typing import Any, Callable, List, Mapping, MutableMapping
 
 from torch.utils.data._utils.collate import default_collate as torch_default_collate
 
@@ -29,7 +29,8 @@ def _wrap_collate(collate: Callable, batch: List[Any]) -> Any:
 
     collated_batch = collate(batch)
 
-    if metadata and isinstance(collated_batch, dict):
+    # Recent versions of PyTorch keep the mapping type (e.g. a ``Sample``) when collating
+    if metadata and isinstance(collated_batch, MutableMapping):
         collated_batch[DataKeys.METADATA] = metadata
     return collated_batch
 
@@ -15,8 +15,9 @@ import copy
 import glob
 import re
 from functools import partial
+from io import BytesIO
 from os import PathLike
-from typing import Union
+from typing import Iterator, Optional, Tuple, Union
 from urllib.parse import parse_qs, quote, urlencode, urlparse
 
 import fsspec
@@ -25,11 +26,23 @@ import pandas as pd
 import torch
 
 from flash.core.data.utilities.paths import has_file_allowed_extension
-from flash.core.utilities.imports import _TOPIC_AUDIO_AVAILABLE, _TORCHVISION_AVAILABLE, Image
+from flash.core.utilities.imports import (
+    _PYARROW_AVAILABLE,
+    _TOPIC_AUDIO_AVAILABLE,
+    _TORCHVISION_AVAILABLE,
+    _TORCHVISION_GREATER_EQUAL_0_9,
+    Image,
+)
+
+if _PYARROW_AVAILABLE:
+    import pyarrow.parquet as pq
 
 if _TOPIC_AUDIO_AVAILABLE:
     from torchaudio.transforms import Spectrogram
 
+if _TORCHVISION_GREATER_EQUAL_0_9:
+    from torchvision.io import ImageReadMode, decode_image
+
 if _TORCHVISION_AVAILABLE:
     from torchvision.datasets.folder import IMG_EXTENSIONS
 else:
@@ -63,19 +76,43 @@ CSV_EXTENSIONS = (".csv", ".txt")
 
 TSV_EXTENSIONS = (".tsv",)
 
+PARQUET_EXTENSIONS = (".parquet", ".pq")
 
-def _load_image_from_image(file):
+
+def _load_image_from_image(file, draft_size: Optional[Tuple[int, int]] = None):
     img = Image.open(file)
+    if draft_size is not None:
+        # Let the JPEG decoder downscale (by 1/2, 1/4, or 1/8) while decoding, keeping at least ``draft_size``
+        img.draft("RGB", (draft_size[1], draft_size[0]))
     img.load()
 
     img = img.convert("RGB")
     return img
 
 
-def _load_image_from_numpy(file):
+def _load_image_from_numpy(file, draft_size: Optional[Tuple[int, int]] = None):
     return Image.fromarray(np.load(file).astype("uint8")).convert("RGB")
 
 
+def _load_image_tensor_from_image(file, draft_size: Optional[Tuple[int, int]] = None):
+    if draft_size is None and _TORCHVISION_GREATER_EQUAL_0_9:
+        data = file.read()
+        try:
+            return decode_image(torch.from_numpy(np.frombuffer(data, dtype=np.uint8).copy()), ImageReadMode.RGB)
+        except RuntimeError:
+            # torchvision only decodes JPEG and PNG images, other formats are decoded with PIL
+            file = BytesIO(data)
+    img = _load_image_from_image(file, draft_size=draft_size)
+    return torch.from_numpy(np.array(img)).permute(2, 0, 1)
+
+
+def _load_image_tensor_from_numpy(file, draft_size: Optional[Tuple[int, int]] = None):
+    array = np.load(file).astype("uint8")
+    if array.ndim == 2:
+        array = np.stack([array] * 3, axis=-1)
+    return torch.from_numpy(array).permute(2, 0, 1)
+
+
 def _load_spectrogram_from_image(file):
     img = _load_image_from_image(file)
     return np.array(img).astype("float32")
@@ -111,12 +148,33 @@ def _load_data_frame_from_tsv(file, encoding: str):
     return pd.read_csv(file, sep="\t", encoding=encoding)
 
 
+def _load_data_frame_chunks_from_csv(file, encoding: str, chunk_size: int):
+    yield from pd.read_csv(file, encoding=encoding, chunksize=chunk_size)
+
+
+def _load_data_frame_chunks_from_tsv(file, encoding: str, chunk_size: int):
+    yield from pd.read_csv(file, sep="\t", encoding=encoding, chunksize=chunk_size)
+
+
+def _load_data_frame_chunks_from_parquet(file, encoding: str, chunk_size: int):
+    if not _PYARROW_AVAILABLE:
+        raise ModuleNotFoundError("Reading parquet files requires `pyarrow`. Install it with `pip install pyarrow`.")
+    for record_batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size):
+        yield record_batch.to_pandas()
+
+
 _image_loaders = {
     IMG_EXTENSIONS: _load_image_from_image,
     NP_EXTENSIONS: _load_image_from_numpy,
 }
 
 
+_image_tensor_loaders = {
+    IMG_EXTENSIONS: _load_image_tensor_from_image,
+    NP_EXTENSIONS: _load_image_tensor_from_numpy,
+}
+
+
 _spectrogram_loaders = {
     IMG_EXTENSIONS: _load_spectrogram_from_image,
     NP_EXTENSIONS: _load_spectrogram_from_numpy,
@@ -135,6 +193,13 @@ _data_frame_loaders = {
 }
 
 
+_data_frame_chunk_loaders = {
+    CSV_EXTENSIONS: _load_data_frame_chunks_from_csv,
+    TSV_EXTENSIONS: _load_data_frame_chunks_from_tsv,
+    PARQUET_EXTENSIONS: _load_data_frame_chunks_from_parquet,
+}
+
+
 def _get_loader(file_path: str, loaders):
     for extensions, loader in loaders.items():
         if has_file_allowed_extension(file_path, extensions):
@@ -171,13 +236,53 @@ def load(file_path: str, loaders):
         return loader(file)
 
 
-def load_image(file_path: str):
+def load_image(file_path: str, draft_size: Optional[Tuple[int, int]] = None):
     """Load an image from a file.
 
     Args:
         file_path: The image file to load.
+        draft_size: Optionally, the ``(height, width)`` the image will be resized to. JPEG images are then decoded at
+            a reduced scale which is still at least this size, which is much faster for large images.
+    """
+    loaders = {extensions: partial(loader, draft_size=draft_size) for extensions, loader in _image_loaders.items()}
+    return load(file_path, loaders)
+
+
+def load_image_tensor(file_path: str, draft_size: Optional[Tuple[int, int]] = None) -> torch.Tensor:
+    """Load an image from a file as a ``uint8`` tensor of shape ``(3, height, width)``, without going through PIL
+    when possible (JPEG and PNG images are decoded with ``torchvision.io``).
+
+    Args:
+        file_path: The image file to load.
+        draft_size: Optionally, the ``(height, width)`` the image will be resized to. JPEG images are then decoded at
+            a reduced scale which is still at least this size, which is much faster for large images.
     """
-    return load(file_path, _image_loaders)
+    loaders = {
+        extensions: partial(loader, draft_size=draft_size) for extensions, loader in _image_tensor_loaders.items()
+    }
+    return load(file_path, loaders)
+
+
+def load_image_bytes(
+    data: bytes,
+    name: Optional[str] = None,
+    decode: str = "pil",
+    draft_size: Optional[Tuple[int, int]] = None,
+):
+    """Load an image from the content of an image or ``.npy`` file (e.g. a record of a packed data set).
+
+    Args:
+        data: The content of the file.
+        name: The name of the file, ``.npy`` files are loaded with NumPy and other files are decoded as images.
+        decode: Either ``"pil"`` to return a PIL image or ``"tensor"`` to return a ``uint8`` tensor of shape
+            ``(3, height, width)``.
+        draft_size: Optionally, the ``(height, width)`` the image will be resized to. JPEG images are then decoded at
+            a reduced scale which is still at least this size.
+    """
+    loaders = _image_tensor_loaders if decode == "tensor" else _image_loaders
+    if name is not None and has_file_allowed_extension(name, NP_EXTENSIONS):
+        return loaders[NP_EXTENSIONS](BytesIO(data), draft_size=draft_size)
+    return loaders[IMG_EXTENSIONS](BytesIO(data), draft_size=draft_size)
 
 
 def load_spectrogram(file_path: str, sampling_rate: int = 16000, n_fft: int = 400):
@@ -215,3 +320,17 @@ def load_data_frame(file_path: str, encoding: str = "utf-8"):
     """
     loaders = {extensions: partial(loader, encoding=encoding) for extensions, loader in _data_frame_loaders.items()}
     return load(file_path, loaders)
+
+
+def load_data_frame_chunks(file_path: str, encoding: str = "utf-8", chunk_size: int = 100_000) -> Iterator:
+    """Lazily load a data frame from a CSV, TSV, or parquet file as an iterator of smaller data frames with at most
+    ``chunk_size`` rows each, so that the whole file never has to be held in memory at once.
+
+    Args:
+        file_path: The file to load.
+        encoding: The encoding to use when reading CSV / TSV files.
+        chunk_size: The maximum number of rows in each chunk.
+    """
+    loader = _get_loader(file_path, _data_frame_chunk_loaders)
+    with fsspec.open(escape_file_path(file_path)) as file:
+        yield from loader(file, encoding=encoding, chunk_size=chunk_size)
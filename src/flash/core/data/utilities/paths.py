@@ -11,8 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import json
 import os
-from typing import Any, Callable, List, Optional, Tuple, Union, cast
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pytorch_lightning.utilities import rank_zero_warn
 
@@ -36,15 +41,128 @@ def has_file_allowed_extension(filename: PATH_TYPE, extensions: Tuple[str, ...])
     return str(filename).lower().endswith(extensions)
 
 
+def _scan_directory(path: str) -> Tuple[int, List[str], List[str]]:
+    """List a single directory, returns its ``mtime`` (in nanoseconds), its file names, and its subdirectories."""
+    file_names, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # ``is_dir`` follows symbolic links, like ``os.walk(followlinks=True)``
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                else:
+                    file_names.append(entry.name)
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        # Unreadable directories are skipped, as with ``os.walk``
+        return -1, [], []
+    return mtime, file_names, subdirs
+
+
+def scan_directories(
+    directories: List[str],
+    extensions: Optional[Tuple[str, ...]] = None,
+    num_threads: Optional[int] = None,
+) -> List[Dict[str, Tuple[int, List[str]]]]:
+    """Recursively list the given directories in parallel, with a pool of threads over the subdirectories.
+
+    Args:
+        directories: The directories to scan.
+        extensions: Optionally, only list the files with one of these (lowercase) extensions.
+        num_threads: The number of threads to use. Defaults to ``min(32, os.cpu_count() + 4)``.
+
+    Returns:
+        For each of the given directories, a dict mapping it and each of its subdirectories to their ``mtime`` (in
+        nanoseconds) and the sorted names of their files.
+    """
+    results: List[Dict[str, Tuple[int, List[str]]]] = [{} for _ in directories]
+    with ThreadPoolExecutor(num_threads) as executor:
+        pending = {}
+        for index, directory in enumerate(directories):
+            pending[executor.submit(_scan_directory, directory)] = (index, directory)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, path = pending.pop(future)
+                mtime, file_names, subdirs = future.result()
+                if extensions is not None:
+                    file_names = [name for name in file_names if name.lower().endswith(extensions)]
+                results[index][path] = (mtime, sorted(file_names))
+                for subdir in subdirs:
+                    pending[executor.submit(_scan_directory, subdir)] = (index, subdir)
+    return results
+
+
+def _scan_cache_path(directory: str, extensions: Tuple[str, ...], cache_dir: Optional[str]) -> str:
+    if cache_dir is None:
+        # A per-user folder, so that other users can't plant manifests (as they could in the temporary directory)
+        user_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.environ.get("FLASH_CACHE_DIR", os.path.join(user_cache, "flash", "scan"))
+    key = hashlib.sha256(json.dumps([os.path.abspath(directory), list(extensions)]).encode()).hexdigest()
+    return os.path.join(cache_dir, f"scan-{key}.json")
+
+
+def _load_scan_manifest(path: str, directory: str, num_threads: Optional[int]) -> Optional[List[Any]]:
+    """Load a manifest of a previous scan, or return ``None`` if there is none or any of its directories changed."""
+    try:
+        # Only trust the manifests written by the current user
+        if hasattr(os, "getuid") and os.stat(path).st_uid != os.getuid():
+            return None
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    def mtime(relative_dir: str) -> int:
+        try:
+            return os.stat(os.path.join(directory, relative_dir)).st_mtime_ns
+        except OSError:
+            return -1
+
+    # Adding or removing a file or a folder changes the ``mtime`` of its parent directory
+    relative_dirs = [""] + [entry[0] for _, entries in manifest["classes"] for entry in entries]
+    expected = [manifest["mtime"]] + [entry[1] for _, entries in manifest["classes"] for entry in entries]
+    with ThreadPoolExecutor(num_threads) as executor:
+        if list(executor.map(mtime, relative_dirs)) != expected:
+            return None
+    return manifest["classes"]
+
+
+def _write_scan_manifest(path: str, directory: str, classes: List[Any]) -> None:
+    manifest = {"version": 1, "mtime": os.stat(directory).st_mtime_ns, "classes": classes}
+    # The ``mtime`` has a coarse resolution, so folders which changed in the last seconds may change again without
+    # their ``mtime`` changing (as with git's "racily clean" entries). Don't write a manifest which could get stale.
+    recent = time.time_ns() - 2 * 10**9
+    if manifest["mtime"] > recent or any(entry[1] > recent for _, entries in classes for entry in entries):
+        return
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # Write to a temporary file and rename so that concurrent processes never read a partial manifest
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        rank_zero_warn(f"Couldn't write the manifest of the files in {directory} to {path}: {e}")
+
+
 # Adapted from torchvision:
 # https://github.com/pytorch/vision/blob/master/torchvision/datasets/folder.py#L48
 def make_dataset(
     directory: PATH_TYPE,
     extensions: Optional[Tuple[str, ...]] = None,
     is_valid_file: Optional[Callable[[str], bool]] = None,
+    num_threads: Optional[int] = None,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None,
 ) -> Tuple[List[PATH_TYPE], Optional[List[PATH_TYPE]]]:
     """Generates a list of samples of a form (path_to_sample, class).
 
+    The class folders are scanned in parallel (see :func:`~flash.core.data.utilities.paths.scan_directories`). When
+    ``extensions`` are given, the result of the scan is saved to a manifest file so that later runs (and the other
+    processes of a distributed run) don't scan the folders again. The manifest is only used if none of the folders
+    changed since it was written (their ``mtime`` is the same).
+
     Args:
         directory (str): root dataset directory
         extensions (optional): A list of allowed extensions.
@@ -53,6 +171,10 @@ def make_dataset(
             and checks if the file is a valid file
             (used to check of corrupt files) both extensions and
             is_valid_file should not be passed. Defaults to None.
+        num_threads (optional): The number of threads used to scan the folders.
+        use_cache (optional): Whether to save and reuse a manifest of the files (only when ``extensions`` are given).
+        cache_dir (optional): The folder to write the manifests to. Defaults to ``$FLASH_CACHE_DIR`` or the
+            ``flash/scan`` folder of the user cache (``$XDG_CACHE_HOME`` or ``~/.cache``), created with mode 0700.
 
     Raises:
         ValueError: In case ``extensions`` and ``is_valid_file`` are None or both are not None.
@@ -66,26 +188,51 @@ def make_dataset(
     both_something = extensions is not None and is_valid_file is not None
     if both_none or both_something:
         raise ValueError("Both extensions and is_valid_file cannot be None or not None at the same time")
-    if extensions is not None:
 
-        def is_valid_file(x: str) -> bool:
-            return has_file_allowed_extension(x, cast(Tuple[str, ...], extensions))
-
-    is_valid_file = cast(Callable[[str], bool], is_valid_file)
     subdirs = list_subdirs(directory)
-    if len(subdirs) > 0:
-        for target_class in subdirs:
-            target_dir = os.path.join(directory, target_class)
-            if not os.path.isdir(target_dir):
-                continue
-            for root, _, fnames in sorted(os.walk(target_dir, followlinks=True)):
-                for fname in sorted(fnames):
-                    path = os.path.join(root, fname)
-                    if is_valid_file(path):
-                        files.append(path)
-                        targets.append(target_class)
+    if len(subdirs) == 0:
+        return list_valid_files(directory), None
+
+    classes = None
+    if extensions is not None:
+        extensions = tuple(extensions)
+        cache_path = _scan_cache_path(directory, extensions, cache_dir) if use_cache else None
+        if cache_path is not None:
+            classes = _load_scan_manifest(cache_path, directory, num_threads)
+
+        if classes is None:
+            target_dirs = [os.path.join(directory, target_class) for target_class in subdirs]
+            scans = scan_directories(target_dirs, extensions, num_threads=num_threads)
+            classes = [
+                [
+                    target_class,
+                    [
+                        [os.path.relpath(root, directory), mtime, file_names]
+                        for root, (mtime, file_names) in sorted(scan.items())
+                    ],
+                ]
+                for target_class, scan in zip(subdirs, scans)
+            ]
+            if cache_path is not None:
+                _write_scan_manifest(cache_path, directory, classes)
+
+        for target_class, entries in classes:
+            for relative_dir, _, file_names in entries:
+                # Same as ``os.path.join(root, name)``, but much faster for millions of files
+                prefix = os.path.join(directory, relative_dir, "")
+                files.extend([prefix + name for name in file_names])
+                targets.extend([target_class] * len(file_names))
         return files, targets
-    return list_valid_files(directory), None
+
+    target_dirs = [os.path.join(directory, target_class) for target_class in subdirs]
+    for target_class, scan in zip(subdirs, scan_directories(target_dirs, num_threads=num_threads)):
+        for root, (_, file_names) in sorted(scan.items()):
+            for name in file_names:
+                path = os.path.join(root, name)
+                if is_valid_file(path):
+                    files.append(path)
+                    targets.append(target_class)
+    return files, targets
 
 
 def isdir(path: Any) -> bool:
@@ -163,16 +310,15 @@ def filter_valid_files(
             f"The number of files ({len(files)}) and the number of items in any additional lists must be the same."
         )
 
-    filtered = list(
-        filter(lambda sample: has_file_allowed_extension(sample[0], valid_extensions), zip(files, *additional_lists))
-    )
-
-    filtered_files = [f[0] for f in filtered]
-
-    invalid = [f for f in files if f not in filtered_files]
+    filtered, invalid = [], []
+    for sample in zip(files, *additional_lists):
+        if has_file_allowed_extension(sample[0], valid_extensions):
+            filtered.append(sample)
+        else:
+            invalid.append(sample[0])
 
     if invalid:
-        invalid_extensions = list({"." + f.split(".")[-1] for f in invalid})
+        invalid_extensions = list({"." + str(f).split(".")[-1] for f in invalid})
         rank_zero_warn(
             f"Found invalid file extensions: {', '.join(invalid_extensions)}. "
             "Files with these extensions will be ignored. "
@@ -182,4 +328,4 @@ def filter_valid_files(
     if additional_lists:
         return tuple(zip(*filtered))
 
-    return filtered_files
+    return [f[0] for f in filtered]
@@ -0,0 +1,303 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A sharded record format which packs many small files (e.g. encoded images) into a few large files.
+
+A records directory contains an ``index.json`` file listing the shards and, for each shard:
+
+*  ``<shard>.rec``: the records (the raw bytes of each file), back to back
+*  ``<shard>.idx``: the ``(offset, length)`` of each record, as an ``int64`` NPY array
+*  ``<shard>.json``: the ``names`` and ``targets`` of the records
+
+The records of a shard are read either through a memory map (local files) or sequentially, so reading a data set
+costs a handful of opens and large reads instead of one open per file.
+"""
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import fsspec
+import numpy as np
+from fsspec.utils import infer_storage_options
+
+from flash.core.data.utilities.loading import is_local_path
+from flash.core.data.utilities.sampling import shard_info, shard_ranges
+
+RECORDS_INDEX = "index.json"
+RECORDS_FORMAT = "flash-records"
+RECORDS_VERSION = 1
+
+
+def _to_json(target: Any) -> Any:
+    # NumPy / torch scalars and arrays can't be written to JSON
+    return target.tolist() if hasattr(target, "tolist") else target
+
+
+class RecordWriter:
+    """Write records to shards of about ``max_shard_size`` bytes.
+
+    Args:
+        output_dir: The directory to write the shards and the index to (local or remote through ``fsspec``).
+        max_shard_size: The size (in bytes) after which a new shard is started.
+        prefix: The prefix of the shard files.
+
+    Examples
+    ________
+
+    .. doctest::
+
+        >>> with RecordWriter("records") as writer:
+        ...     writer.write(b"abc", target="cat", name="a.png")
+        ...     writer.write(b"de", target="dog", name="b.png")
+        >>> records = Records("records")
+        >>> len(records), records.targets
+        (2, ['cat', 'dog'])
+
+    .. testcleanup::
+
+        >>> import shutil
+        >>> shutil.rmtree("records")
+    """
+
+    def __init__(self, output_dir: str, max_shard_size: int = 256 * 2**20, prefix: str = "shard"):
+        if max_shard_size < 1:
+            raise ValueError(f"`max_shard_size` should be a positive integer. Found {max_shard_size}.")
+        self.output_dir = str(output_dir)
+        self.max_shard_size = max_shard_size
+        self.prefix = prefix
+
+        self.fs, _ = fsspec.core.url_to_fs(self.output_dir)
+        self.fs.makedirs(self.output_dir, exist_ok=True)
+
+        self.shards: List[Dict[str, Any]] = []
+        self._file = None
+        self._offsets: List[Tuple[int, int]] = []
+        self._names: List[Optional[str]] = []
+        self._targets: List[Any] = []
+        self._num_bytes = 0
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.output_dir, name)
+
+    def _open_shard(self) -> None:
+        self._name = f"{self.prefix}-{len(self.shards):05d}"
+        self._file = self.fs.open(self._path(f"{self._name}.rec"), "wb")
+        self._offsets, self._names, self._targets = [], [], []
+        self._num_bytes = 0
+
+    def _close_shard(self) -> None:
+        self._file.close()
+        self._file = None
+        with self.fs.open(self._path(f"{self._name}.idx"), "wb") as f:
+            np.save(f, np.asarray(self._offsets, dtype=np.int64).reshape(-1, 2))
+        with self.fs.open(self._path(f"{self._name}.json"), "w") as f:
+            json.dump({"names": self._names, "targets": self._targets}, f)
+        self.shards.append({"name": self._name, "num_records": len(self._offsets), "num_bytes": self._num_bytes})
+
+    def write(self, data: bytes, target: Any = None, name: Optional[str] = None) -> None:
+        """Append a record.
+
+        Args:
+            data: The content of the record (e.g. the bytes of an encoded image).
+            target: An optional (JSON serializable) target for the record.
+            name: An optional name for the record (e.g. the path of the original file). Its extension is used to
+                decode the record.
+        """
+        if self._file is None:
+            self._open_shard()
+        self._file.write(data)
+        self._offsets.append((self._num_bytes, len(data)))
+        self._names.append(name)
+        self._targets.append(_to_json(target))
+        self._num_bytes += len(data)
+        if self._num_bytes >= self.max_shard_size:
+            self._close_shard()
+
+    def close(self) -> Dict[str, Any]:
+        """Finish the last shard and write the index of the records. Returns the index."""
+        if self._file is not None:
+            self._close_shard()
+        index = {
+            "format": RECORDS_FORMAT,
+            "version": RECORDS_VERSION,
+            "num_records": sum(shard["num_records"] for shard in self.shards),
+            "shards": self.shards,
+        }
+        with self.fs.open(self._path(RECORDS_INDEX), "w") as f:
+            json.dump(index, f)
+        return index
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class RecordShard:
+    """A single shard of records, read through a memory map (when ``mmap`` is ``True`` and the shard is a local file)
+    or sequentially."""
+
+    def __init__(self, root: str, name: str, num_records: int, mmap: bool = True):
+        self.path = os.path.join(root, f"{name}.rec")
+        self.index_path = os.path.join(root, f"{name}.idx")
+        self.meta_path = os.path.join(root, f"{name}.json")
+        self.num_records = num_records
+        self.mmap = mmap and is_local_path(self.path)
+
+        self._offsets: Optional[np.ndarray] = None
+        self._meta: Optional[Dict[str, List[Any]]] = None
+        self._data: Optional[np.memmap] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memory maps are opened again in each DataLoader worker
+        state = self.__dict__.copy()
+        state["_data"] = None
+        return state
+
+    def __len__(self) -> int:
+        return self.num_records
+
+    @property
+    def offsets(self) -> np.ndarray:
+        if self._offsets is None:
+            with fsspec.open(self.index_path, "rb") as f:
+                self._offsets = np.load(f)
+        return self._offsets
+
+    @property
+    def meta(self) -> Dict[str, List[Any]]:
+        if self._meta is None:
+            with fsspec.open(self.meta_path, "r") as f:
+                self._meta = json.load(f)
+        return self._meta
+
+    def __getitem__(self, index: int) -> bytes:
+        """Read a record through the memory map."""
+        if self._data is None:
+            path = infer_storage_options(self.path)["path"]
+            self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        offset, length = self.offsets[index]
+        return self._data[offset : offset + length].tobytes()
+
+    def read(self, indices: Optional[List[int]] = None) -> Iterator[Tuple[int, bytes]]:
+        """Read the records at ``indices`` (all of them by default), in this order. Without a memory map, records
+        which follow each other are read without seeking so that a whole shard is read in one pass."""
+        if indices is None:
+            indices = range(self.num_records)
+        if self.mmap:
+            for index in indices:
+                yield index, self[index]
+            return
+
+        offsets = self.offsets
+        with fsspec.open(self.path, "rb") as f:
+            position = 0
+            for index in indices:
+                offset, length = offsets[index]
+                if offset != position:
+                    f.seek(offset)
+                yield index, f.read(length)
+                position = offset + length
+
+
+class Records:
+    """The records of a records directory written with the :class:`~flash.core.data.utilities.records.RecordWriter`.
+
+    The records are streamed (through ``iter_records``), so ``Records`` deliberately doesn't define ``__len__`` (an
+    :class:`~flash.core.data.io.input.IterableInput` can't load sized data). Use ``num_records`` instead.
+
+    Args:
+        root: The records directory.
+        mmap: Whether to read local shards through a memory map. Otherwise (and for remote shards), each shard is read
+            sequentially.
+    """
+
+    def __init__(self, root: str, mmap: bool = True):
+        self.root = str(root)
+        with fsspec.open(os.path.join(self.root, RECORDS_INDEX), "r") as f:
+            index = json.load(f)
+        if index.get("format") != RECORDS_FORMAT:
+            raise ValueError(f"{self.root} doesn't contain {RECORDS_FORMAT} records.")
+        if index["version"] > RECORDS_VERSION:
+            raise ValueError(
+                f"The records in {self.root} have version {index['version']} which is newer than the supported version "
+                f"({RECORDS_VERSION}). Please upgrade Flash."
+            )
+        self.shards = [
+            RecordShard(self.root, shard["name"], shard["num_records"], mmap=mmap) for shard in index["shards"]
+        ]
+        self.num_records = index["num_records"]
+
+    @property
+    def targets(self) -> List[Any]:
+        """The targets of all the records (this reads the metadata of every shard)."""
+        return [target for shard in self.shards for target in shard.meta["targets"]]
+
+    def iter_records(
+        self,
+        shuffle: bool = False,
+        seed: int = 0,
+        buffer_size: int = 1000,
+        shard: Optional[Tuple[int, int]] = None,
+        pad: bool = False,
+    ) -> Iterator[Tuple[bytes, Optional[str], Any]]:
+        """Iterate over the ``(data, name, target)`` of the records of the current shard.
+
+        The records are split between the DataLoader workers and DDP processes in contiguous blocks (in the order of
+        the shards), so that each one reads a few shards (or parts of shards) sequentially and gets the same number of
+        records (up to one, or exactly the same with ``pad``).
+
+        Args:
+            shuffle: Whether to shuffle the order of the shards and of the records in each shard.
+            seed: The seed used to shuffle. It should be the same for every worker and process of an epoch so that
+                they split the same shard order.
+            buffer_size: The records of shards which are read sequentially are shuffled in a buffer of this size
+                (the records of memory mapped shards are read in a random order instead).
+            shard: The index of the current shard and the number of shards. Defaults to one shard per DataLoader
+                worker and DDP process.
+            pad: Whether to pad the blocks with records from the start so that they all have exactly the same number
+                of records. This is needed when training with DDP, where a process which runs out of records first
+                would leave the others waiting.
+        """
+        index, num_shards = shard or shard_info()
+        rng = np.random.RandomState(seed)
+
+        shards = list(self.shards)
+        if shuffle:
+            shards = [shards[i] for i in rng.permutation(len(shards))]
+
+        ranges = [
+            (shards[part], first, last)
+            for part, first, last in shard_ranges([shard.num_records for shard in shards], index, num_shards, pad=pad)
+        ]
+
+        buffer = []
+        for record_shard, first, last in ranges:
+            indices = list(range(first, last))
+            if shuffle and record_shard.mmap:
+                indices = [indices[i] for i in rng.permutation(len(indices))]
+            names, targets = record_shard.meta["names"], record_shard.meta["targets"]
+            for i, data in record_shard.read(indices):
+                record = (data, names[i], targets[i])
+                if not shuffle or record_shard.mmap:
+                    yield record
+                elif len(buffer) < buffer_size:
+                    buffer.append(record)
+                else:
+                    j = rng.randint(buffer_size)
+                    yield buffer[j]
+                    buffer[j] = record
+
+        for j in rng.permutation(len(buffer)):
+            yield buffer[j]
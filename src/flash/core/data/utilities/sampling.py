@@ -0,0 +1,114 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from typing import Any, Dict, List, Sequence, Tuple
+
+import torch
+from torch.utils.data import Dataset, get_worker_info
+from torch.utils.data.sampler import BatchSampler, RandomSampler, SequentialSampler
+
+
+def resolve_sampling(dataset: Dataset, batch_size: int, **sampling_kwargs: Any) -> Dict[str, Any]:
+    """Returns the sampling arguments for the ``DataLoader``. If the dataset implements the ``load_batch`` hook, the
+    indices are grouped with a :class:`~torch.utils.data.BatchSampler` so that each batch is loaded with a single call.
+    A ``BatchSampler`` given as the ``sampler`` is used to create the batches directly. Iterable datasets which set
+    ``yields_batches`` form their own batches (e.g. under a memory budget), they are given the ``batch_size`` to aim for
+    and the ``DataLoader`` doesn't batch them again.
+
+    Args:
+        dataset: The dataset to load.
+        batch_size: The batch size.
+        sampling_kwargs: Any of ``shuffle``, ``sampler``, and ``drop_last`` to pass to the ``DataLoader``.
+    """
+    if getattr(dataset, "yields_batches", False):
+        dataset.batch_size = batch_size
+        return {"batch_size": None}
+
+    sampler = sampling_kwargs.get("sampler")
+    if isinstance(sampler, BatchSampler):
+        # The sampler already yields batches of indices (e.g. batches of samples with similar lengths)
+        if getattr(dataset, "supports_load_batch", False):
+            return {"batch_size": None, "sampler": sampler}
+        return {"batch_sampler": sampler}
+
+    if not getattr(dataset, "supports_load_batch", False):
+        return {"batch_size": batch_size, **sampling_kwargs}
+
+    if sampler is None:
+        sampler = RandomSampler(dataset) if sampling_kwargs.get("shuffle", False) else SequentialSampler(dataset)
+    return {"batch_size": None, "sampler": BatchSampler(sampler, batch_size, sampling_kwargs.get("drop_last", False))}
+
+
+def shard_info() -> Tuple[int, int]:
+    """Returns the index of the current shard and the total number of shards, where each DataLoader worker on each
+    (DDP) process is one shard."""
+    rank, world_size = 0, 1
+    if torch.distributed.is_available() and torch.distributed.is_initialized():
+        rank, world_size = torch.distributed.get_rank(), torch.distributed.get_world_size()
+    else:
+        rank, world_size = int(os.environ.get("RANK", 0)), int(os.environ.get("WORLD_SIZE", 1))
+
+    worker_info = get_worker_info()
+    worker_id, num_workers = (0, 1) if worker_info is None else (worker_info.id, worker_info.num_workers)
+    return rank * num_workers + worker_id, world_size * num_workers
+
+
+def epoch_seed() -> int:
+    """Returns a seed which is shared by all the DataLoader workers of an epoch, so that they can shuffle the shards
+    of an iterable dataset in the same order. The seed is drawn from the global torch generator (as the DataLoader
+    does), so it is also shared by the DDP processes when they are seeded with ``seed_everything``."""
+    worker_info = get_worker_info()
+    if worker_info is not None:
+        seed = worker_info.seed - worker_info.id
+    else:
+        seed = int(torch.empty((), dtype=torch.int64).random_().item())
+    return seed % 2**32
+
+
+def shard_ranges(sizes: Sequence[int], shard: int, num_shards: int, pad: bool = False) -> List[Tuple[int, int, int]]:
+    """Split the items of consecutive parts (e.g. the rows of files) into ``num_shards`` contiguous blocks of the same
+    size (up to one item) and return the ``(part, first, last)`` ranges of the items of the current ``shard``.
+
+    Args:
+        sizes: The number of items in each part, in order.
+        shard: The index of the current shard.
+        num_shards: The number of shards.
+        pad: Whether to pad the blocks with items from the start so that they all have exactly the same size (e.g.
+            so that no DDP process runs out of batches before the others when training).
+
+    Example::
+
+        >>> shard_ranges([3, 1, 4], 1, 2)
+        [(2, 0, 4)]
+        >>> shard_ranges([3, 2], 1, 2, pad=True)
+        [(1, 0, 2), (0, 0, 1)]
+    """
+    total = sum(sizes)
+    if pad:
+        block_size = -(-total // num_shards)
+        start, stop = shard * block_size, (shard + 1) * block_size
+    else:
+        start, stop = total * shard // num_shards, total * (shard + 1) // num_shards
+
+    ranges = []
+    # When padding, the last blocks wrap around to the start
+    while start < stop and total:
+        offset = 0
+        for part, size in enumerate(sizes):
+            first, last = max(start - offset, 0), min(stop - offset, size)
+            if first < last:
+                ranges.append((part, first, last))
+            offset += size
+        start, stop = max(start - total, 0), stop - total
+    return ranges
@@ -0,0 +1,2 @@
+from flash.core.embedding_index.index import EmbeddingIndex, FaissIndex, IVFIndex, search_exact  # noqa: F401
+from flash.core.embedding_index.store import EmbeddingSink, EmbeddingStore  # noqa: F401
@@ -0,0 +1,598 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Nearest neighbour search over the embeddings of an :class:`~flash.core.embedding_index.EmbeddingStore` (or of an
+array).
+
+The indexes return the ``scores`` and the ``ids`` of the ``k`` nearest embeddings of each query, nearest first. With
+the ``"cosine"`` and ``"ip"`` (inner product) metrics the scores are similarities (higher is nearer), with the ``"l2"``
+metric they are squared euclidean distances (lower is nearer). When fewer than ``k`` embeddings are found, the ids are
+padded with ``-1``.
+"""
+import contextlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+import flash
+from flash.core.embedding_index.store import _as_embeddings, _check_dtype, _dequantize, _quantize, _to_numpy
+from flash.core.utilities.imports import _FAISS_AVAILABLE, _FASTAPI_AVAILABLE, _UVICORN_AVAILABLE
+
+if _FAISS_AVAILABLE:
+    import faiss
+
+if _FASTAPI_AVAILABLE:
+    from fastapi import FastAPI, Request
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.responses import JSONResponse
+else:
+    FastAPI, Request = object, object
+
+if _UVICORN_AVAILABLE:
+    import uvicorn
+
+INDEX_META = "index.json"
+INDEX_FORMAT = "flash-embedding-index"
+INDEX_VERSION = 1
+
+_METRICS = ("cosine", "ip", "l2")
+
+
+def _check_metric(metric: str) -> str:
+    if metric not in _METRICS:
+        raise ValueError(f"`metric` should be one of {', '.join(_METRICS)}. Found {metric}.")
+    return metric
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _scores(queries: np.ndarray, vectors: np.ndarray, metric: str) -> np.ndarray:
+    """The score of each vector for each query, higher is nearer (negated squared distances for ``"l2"``)."""
+    scores = queries @ vectors.T
+    if metric == "l2":
+        scores *= 2
+        scores -= np.einsum("ij,ij->i", queries, queries)[:, None]
+        scores -= np.einsum("ij,ij->i", vectors, vectors)[None, :]
+    return scores
+
+
+def _top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The (sorted) highest ``k`` scores of each row and their columns, padded with ``-inf`` and ``-1``."""
+    num_rows, num_columns = scores.shape
+    if num_columns > k:
+        columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        columns = np.broadcast_to(np.arange(num_columns), (num_rows, num_columns))
+    top = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-top, axis=1, kind="stable")
+    top, columns = np.take_along_axis(top, order, axis=1), np.take_along_axis(columns, order, axis=1)
+    if num_columns < k:
+        top = np.pad(top, ((0, 0), (0, k - num_columns)), constant_values=-np.inf)
+        columns = np.pad(columns, ((0, 0), (0, k - num_columns)), constant_values=-1)
+    return top, columns
+
+
+def _kmeans(vectors: np.ndarray, num_clusters: int, num_iters: int, metric: str, seed: int) -> np.ndarray:
+    """Lloyd's k-means (spherical for ``"cosine"``), empty clusters are restarted from random vectors."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), num_clusters, replace=False)].copy()
+    for _ in range(num_iters):
+        assignments = _assign(vectors, centroids, metric)
+        order = np.argsort(assignments, kind="stable")
+        clusters, starts, counts = np.unique(assignments[order], return_index=True, return_counts=True)
+        centroids[clusters] = np.add.reduceat(vectors[order], starts, axis=0) / counts[:, None]
+        empty = np.setdiff1d(np.arange(num_clusters), clusters)
+        centroids[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+        if metric == "cosine":
+            centroids = _normalize(centroids)
+    return centroids
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, metric: str, chunk_size: int = 16_384) -> np.ndarray:
+    """The index of the nearest centroid of each vector."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        assignments[start : start + chunk_size] = _scores(chunk, centroids, metric).argmax(axis=1)
+    return assignments
+
+
+class EmbeddingIndex:
+    """Base class for the nearest neighbour indexes. Override ``build``, ``search``, ``_save``, and ``_load``.
+
+    Args:
+        metric: The similarity of the embeddings, either ``"cosine"``, ``"ip"`` (inner product), or ``"l2"`` (squared
+            euclidean distance).
+    """
+
+    index_type: str = ""
+
+    _INDEX_TYPES: Dict[str, Type["EmbeddingIndex"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.index_type:
+            EmbeddingIndex._INDEX_TYPES[cls.index_type] = cls
+
+    def __init__(self, metric: str = "cosine"):
+        self.metric = _check_metric(metric)
+        self.dim: Optional[int] = None
+        self.size = 0
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        return _normalize(vectors) if self.metric == "cosine" else vectors
+
+    def _prepare_queries(self, queries: Any) -> np.ndarray:
+        if self.dim is None:
+            raise RuntimeError("The index is empty, call `build` first.")
+        queries = _to_numpy(queries)
+        if queries.shape[1] != self.dim:
+            raise ValueError(f"The queries should have {self.dim} elements. Found {queries.shape[1]}.")
+        return self._prepare(queries)
+
+    def build(self, vectors: Any) -> "EmbeddingIndex":
+        """Index the embeddings.
+
+        Args:
+            vectors: An :class:`~flash.core.embedding_index.EmbeddingStore`, or an array (or tensor) with a row per
+                embedding. The id of each embedding is its row.
+        """
+        raise NotImplementedError
+
+    def search(self, queries: Any, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` nearest embeddings of each query.
+
+        Args:
+            queries: An array (or tensor) with a row per query.
+            k: The number of embeddings to return for each query.
+
+        Returns:
+            The ``scores`` and the ``ids`` of the nearest embeddings, arrays of shape ``(num_queries, k)``.
+        """
+        raise NotImplementedError
+
+    def _meta(self) -> Dict[str, Any]:
+        return {"metric": self.metric, "dim": self.dim, "size": self.size}
+
+    def _save(self, path: str) -> None:
+        raise NotImplementedError
+
+    def _load(self, path: str, meta: Dict[str, Any], mmap: bool) -> None:
+        raise NotImplementedError
+
+    def save(self, path: str) -> None:
+        """Save the index to the (local) directory ``path``."""
+        os.makedirs(path, exist_ok=True)
+        self._save(path)
+        meta = {"format": INDEX_FORMAT, "version": INDEX_VERSION, "type": self.index_type, **self._meta()}
+        with open(os.path.join(path, INDEX_META), "w") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "EmbeddingIndex":
+        """Load an index saved with ``save`` (of any type when called on the ``EmbeddingIndex``).
+
+        Args:
+            path: The directory the index was saved to.
+            mmap: Whether to read the indexed embeddings through a memory map rather than loading them in memory.
+        """
+        with open(os.path.join(path, INDEX_META)) as f:
+            meta = json.load(f)
+        if meta.get("format") != INDEX_FORMAT:
+            raise ValueError(f"{path} doesn't contain an {INDEX_FORMAT}.")
+        if meta["version"] > INDEX_VERSION:
+            raise ValueError(
+                f"The index in {path} has version {meta['version']} which is newer than the supported version "
+                f"({INDEX_VERSION}). Please upgrade Flash."
+            )
+        if meta.get("type") not in EmbeddingIndex._INDEX_TYPES:
+            raise ValueError(
+                f"{path} contains an index of unknown type {meta.get('type')}. The supported types are: "
+                f"{', '.join(sorted(EmbeddingIndex._INDEX_TYPES))}."
+            )
+        index_cls = EmbeddingIndex._INDEX_TYPES[meta["type"]]
+        if not issubclass(index_cls, cls):
+            raise ValueError(f"{path} contains an index of type {meta['type']}, not a {cls.__name__}.")
+        index = index_cls.__new__(index_cls)
+        index.metric, index.dim, index.size = meta["metric"], meta["dim"], meta["size"]
+        index._load(path, meta, mmap)
+        return index
+
+    def http_app(self, k: int = 10) -> "FastAPI":
+        """Create a ``FastAPI`` app which searches the index on ``POST /search``.
+
+        The requests are JSON objects with the ``queries`` (a list of embeddings) and optionally ``k``. The responses
+        hold the ``ids`` and the ``scores`` of the nearest embeddings of each query.
+
+        Args:
+            k: The number of embeddings to return when the request doesn't give ``k``.
+        """
+        if not _FASTAPI_AVAILABLE:
+            raise ModuleNotFoundError("Serving an index requires `fastapi`. Install it with `pip install fastapi`.")
+        app = FastAPI()
+
+        @app.post("/search")
+        async def search(request: Request) -> JSONResponse:
+            try:
+                payload = await request.json()
+                scores, ids = await run_in_threadpool(self.search, payload["queries"], int(payload.get("k", k)))
+            except (KeyError, TypeError, ValueError, RuntimeError) as e:
+                return JSONResponse({"detail": f"Invalid request: {e}"}, status_code=422)
+            found = ids >= 0
+            return JSONResponse(
+                {
+                    "ids": [row[mask].tolist() for row, mask in zip(ids, found)],
+                    "scores": [row[mask].tolist() for row, mask in zip(scores, found)],
+                }
+            )
+
+        return app
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8000, k: int = 10) -> Optional["FastAPI"]:
+        """Serve the index over HTTP (see ``http_app``).
+
+        Args:
+            host: The IP address to host the index on.
+            port: The port to host on.
+            k: The number of embeddings to return when the request doesn't give ``k``.
+        """
+        from flash.core.serve.server import FLASH_DISABLE_SERVE
+
+        if FLASH_DISABLE_SERVE:
+            return None
+        app = self.http_app(k)
+        if not flash._IS_TESTING:  # pragma: no cover
+            uvicorn.run(app, host=host, port=port)
+        return app
+
+
+class IVFIndex(EmbeddingIndex):
+    """An inverted file index, implemented with NumPy. The embeddings are clustered with k-means into ``num_lists``
+    lists, and each query is only compared with the embeddings of the ``nprobe`` lists with the nearest centroids.
+
+    The embeddings of each list are copied (quantized to ``dtype``) next to each other, so that a query reads a few
+    contiguous ranges. With ``output_dir``, they are written to memory mapped files rather than kept in memory, so an
+    index can be built from (and is about the size of) an ``EmbeddingStore`` larger than memory.
+
+    Args:
+        num_lists: The number of lists (at most the number of embeddings). About ``4 * sqrt(num_embeddings)`` is a good
+            start.
+        nprobe: The number of lists to search for each query. Higher is more accurate and slower.
+        metric: The similarity of the embeddings, either ``"cosine"``, ``"ip"`` (inner product), or ``"l2"`` (squared
+            euclidean distance).
+        dtype: The type to store the indexed embeddings as, either ``"float32"``, ``"float16"``, or ``"int8"``.
+        num_train: The number of embeddings sampled to train the k-means (at least ``num_lists``). By default,
+            ``64 * num_lists``.
+        num_iters: The number of iterations of the k-means.
+        seed: The seed of the k-means.
+
+    Examples
+    ________
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> vectors = np.random.default_rng(0).normal(size=(1000, 16)).astype(np.float32)
+        >>> index = IVFIndex(num_lists=16, nprobe=4).build(vectors)
+        >>> scores, ids = index.search(vectors[:2], k=3)
+        >>> ids[:, 0].tolist()
+        [0, 1]
+    """
+
+    index_type = "ivf"
+
+    def __init__(
+        self,
+        num_lists: int = 1024,
+        nprobe: int = 16,
+        metric: str = "cosine",
+        dtype: str = "float16",
+        num_train: Optional[int] = None,
+        num_iters: int = 20,
+        seed: int = 42,
+    ):
+        super().__init__(metric=metric)
+        if num_lists < 1 or nprobe < 1:
+            raise ValueError(f"`num_lists` and `nprobe` should be positive integers. Found {num_lists} and {nprobe}.")
+        if num_train is not None and num_train < num_lists:
+            raise ValueError(
+                f"`num_train` should be at least `num_lists` to train the k-means. Found {num_train} and {num_lists}."
+            )
+        self.num_lists = num_lists
+        self.nprobe = nprobe
+        self.dtype = _check_dtype(dtype)
+        self.num_train = num_train
+        self.num_iters = num_iters
+        self.seed = seed
+
+        self.centroids: Optional[np.ndarray] = None
+        self.offsets: Optional[np.ndarray] = None
+        self.ids: Optional[np.ndarray] = None
+        self.codes: Optional[np.ndarray] = None
+        self.scales: Optional[np.ndarray] = None
+
+    def _allocate(
+        self, output_dir: Optional[str], name: str, dtype: np.dtype, shape: Tuple[int, ...]
+    ) -> np.ndarray:
+        if output_dir is None or shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.lib.format.open_memmap(os.path.join(output_dir, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+    def build(self, vectors: Any, output_dir: Optional[str] = None, chunk_size: int = 65_536) -> "IVFIndex":
+        """Cluster and index the embeddings. They are read twice, ``chunk_size`` rows at a time: once to assign each
+        embedding to a list and once to copy it to its list.
+
+        Args:
+            vectors: An :class:`~flash.core.embedding_index.EmbeddingStore`, or an array (or tensor) with a row per
+                embedding. The id of each embedding is its row.
+            output_dir: An optional (local) directory to build the index in. The index is then saved there.
+            chunk_size: The number of embeddings to process at a time.
+        """
+        embeddings = _as_embeddings(vectors)
+        size = len(embeddings)
+        if size == 0:
+            raise ValueError("Cannot build an index without embeddings.")
+        self.dim, self.size = embeddings.dim, size
+        num_lists = min(self.num_lists, size)
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+
+        num_train = min(self.num_train or 64 * num_lists, size)
+        rng = np.random.default_rng(self.seed)
+        sample = np.sort(rng.choice(size, num_train, replace=False))
+        train = self._prepare(embeddings.take(sample))
+        self.centroids = _kmeans(train, num_lists, self.num_iters, self.metric, self.seed).astype(np.float32)
+
+        assignments = np.empty(size, dtype=np.int32 if num_lists < 2**31 else np.int64)
+        for start, chunk in embeddings.iter_chunks(chunk_size):
+            assignments[start : start + len(chunk)] = _assign(self._prepare(chunk), self.centroids, self.metric)
+        counts = np.bincount(assignments, minlength=num_lists)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        self.ids = self._allocate(output_dir, "ids", np.dtype(np.int64), (size,))
+        self.codes = self._allocate(output_dir, "codes", np.dtype(self.dtype), (size, self.dim))
+        self.scales = None
+        if self.dtype == "int8":
+            self.scales = self._allocate(output_dir, "scales", np.dtype(np.float32), (size,))
+
+        # Each chunk is sorted by list and copied after the embeddings of the previous chunks in the same lists
+        cursors = self.offsets[:-1].copy()
+        for start, chunk in embeddings.iter_chunks(chunk_size):
+            lists = assignments[start : start + len(chunk)]
+            order = np.argsort(lists, kind="stable")
+            lists = lists[order]
+            chunk_counts = np.bincount(lists, minlength=num_lists)
+            firsts = np.cumsum(chunk_counts) - chunk_counts
+            positions = cursors[lists] + np.arange(len(order)) - firsts[lists]
+            codes, scales = _quantize(self._prepare(chunk[order]), self.dtype)
+            self.codes[positions] = codes
+            self.ids[positions] = start + order
+            if scales is not None:
+                self.scales[positions] = scales
+            cursors += chunk_counts
+
+        if output_dir is not None:
+            self.save(output_dir)
+        return self
+
+    def search(self, queries: Any, k: int = 10, nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` nearest embeddings of each query. The queries which probe the same list are compared with its
+        embeddings together.
+
+        Args:
+            queries: An array (or tensor) with a row per query.
+            k: The number of embeddings to return for each query.
+            nprobe: The number of lists to search for each query. By default, the ``nprobe`` of the index.
+
+        Returns:
+            The ``scores`` and the ``ids`` of the nearest embeddings, arrays of shape ``(num_queries, k)``.
+        """
+        queries = self._prepare_queries(queries)
+        if k < 1:
+            raise ValueError(f"`k` should be a positive integer. Found {k}.")
+        num_queries = len(queries)
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        _, probes = _top_k(_scores(queries, self.centroids, self.metric), nprobe)
+
+        candidate_scores = np.full((num_queries, nprobe, k), -np.inf, dtype=np.float32)
+        candidate_ids = np.full((num_queries, nprobe, k), -1, dtype=np.int64)
+        flat_probes = probes.ravel()
+        order = np.argsort(flat_probes, kind="stable")
+        lists, starts = np.unique(flat_probes[order], return_index=True)
+        for list_index, group in zip(lists, np.split(order, starts[1:])):
+            start, stop = self.offsets[list_index], self.offsets[list_index + 1]
+            if start == stop:
+                continue
+            query_indices, slots = np.divmod(group, nprobe)
+            scales = None if self.scales is None else self.scales[start:stop]
+            vectors = _dequantize(self.codes[start:stop], scales)
+            scores, columns = _top_k(_scores(queries[query_indices], vectors, self.metric), min(k, stop - start))
+            candidate_scores[query_indices, slots, : columns.shape[1]] = scores
+            candidate_ids[query_indices, slots, : columns.shape[1]] = self.ids[start:stop][columns]
+
+        scores, columns = _top_k(candidate_scores.reshape(num_queries, -1), k)
+        ids = np.take_along_axis(candidate_ids.reshape(num_queries, -1), columns, axis=1)
+        ids[~np.isfinite(scores)] = -1
+        return (-scores if self.metric == "l2" else scores), ids
+
+    def _meta(self) -> Dict[str, Any]:
+        return {
+            **super()._meta(),
+            "num_lists": self.num_lists,
+            "nprobe": self.nprobe,
+            "dtype": self.dtype,
+            "num_train": self.num_train,
+            "num_iters": self.num_iters,
+            "seed": self.seed,
+        }
+
+    def _save(self, path: str) -> None:
+        arrays = {"centroids": self.centroids, "offsets": self.offsets, "ids": self.ids, "codes": self.codes}
+        if self.scales is not None:
+            arrays["scales"] = self.scales
+        for name, array in arrays.items():
+            file_path = os.path.join(path, f"{name}.npy")
+            # The arrays built in ``output_dir`` are already there
+            if isinstance(array, np.memmap) and os.path.abspath(array.filename) == os.path.abspath(file_path):
+                array.flush()
+                continue
+            np.save(file_path, array)
+
+    def _load(self, path: str, meta: Dict[str, Any], mmap: bool) -> None:
+        self.num_lists, self.nprobe, self.dtype = meta["num_lists"], meta["nprobe"], meta["dtype"]
+        # Indexes saved before the k-means parameters were saved fall back to the defaults
+        self.num_train, self.num_iters = meta.get("num_train"), meta.get("num_iters", 20)
+        self.seed = meta.get("seed", 42)
+
+        def load(name: str, mmap_mode: Optional[str] = None) -> Optional[np.ndarray]:
+            file_path = os.path.join(path, f"{name}.npy")
+            return np.load(file_path, mmap_mode=mmap_mode) if os.path.exists(file_path) else None
+
+        self.centroids, self.offsets = load("centroids"), load("offsets")
+        mmap_mode = "r" if mmap else None
+        self.ids, self.codes, self.scales = load("ids", mmap_mode), load("codes", mmap_mode), load("scales", mmap_mode)
+
+
+class FaissIndex(EmbeddingIndex):
+    """An index backed by `faiss <https://github.com/facebookresearch/faiss>`_ (requires ``faiss``), created from a
+    faiss ``index_factory`` string, e.g. ``"IVF4096,Flat"``, ``"IVF4096,SQ8"``, or ``"HNSW32"``.
+
+    Args:
+        factory: The faiss index factory string.
+        metric: The similarity of the embeddings, either ``"cosine"``, ``"ip"`` (inner product), or ``"l2"`` (squared
+            euclidean distance).
+        nprobe: The number of lists to search for each query (for the IVF indexes).
+        num_train: The number of embeddings sampled to train the index. By default, all of them (up to 1,000,000).
+        seed: The seed used to sample the training embeddings.
+    """
+
+    index_type = "faiss"
+
+    def __init__(
+        self,
+        factory: str = "IVF1024,Flat",
+        metric: str = "cosine",
+        nprobe: int = 16,
+        num_train: Optional[int] = None,
+        seed: int = 42,
+    ):
+        if not _FAISS_AVAILABLE:
+            raise ModuleNotFoundError(
+                "The `FaissIndex` requires `faiss`. Install it with `pip install faiss-cpu` (or `faiss-gpu`)."
+            )
+        super().__init__(metric=metric)
+        self.factory = factory
+        self.nprobe = nprobe
+        self.num_train = num_train
+        self.seed = seed
+        self.index = None
+
+    def _set_nprobe(self) -> None:
+        if hasattr(faiss, "extract_index_ivf"):
+            # Not all the indexes are IVF indexes
+            with contextlib.suppress(RuntimeError):
+                faiss.extract_index_ivf(self.index).nprobe = self.nprobe
+
+    def build(self, vectors: Any, chunk_size: int = 65_536) -> "FaissIndex":
+        """Train the index (on a sample of the embeddings) and add the embeddings, ``chunk_size`` rows at a time.
+
+        Args:
+            vectors: An :class:`~flash.core.embedding_index.EmbeddingStore`, or an array (or tensor) with a row per
+                embedding. The id of each embedding is its row.
+            chunk_size: The number of embeddings to add at a time.
+        """
+        embeddings = _as_embeddings(vectors)
+        self.dim, self.size = embeddings.dim, len(embeddings)
+        faiss_metric = faiss.METRIC_L2 if self.metric == "l2" else faiss.METRIC_INNER_PRODUCT
+        self.index = faiss.index_factory(self.dim, self.factory, faiss_metric)
+
+        if not self.index.is_trained:
+            num_train = min(self.num_train or 1_000_000, self.size)
+            sample = np.sort(np.random.default_rng(self.seed).choice(self.size, num_train, replace=False))
+            self.index.train(np.ascontiguousarray(self._prepare(embeddings.take(sample)), dtype=np.float32))
+        for _, chunk in embeddings.iter_chunks(chunk_size):
+            self.index.add(np.ascontiguousarray(self._prepare(chunk), dtype=np.float32))
+        self._set_nprobe()
+        return self
+
+    def search(self, queries: Any, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        queries = np.ascontiguousarray(self._prepare_queries(queries), dtype=np.float32)
+        if k < 1:
+            raise ValueError(f"`k` should be a positive integer. Found {k}.")
+        scores, ids = self.index.search(queries, k)
+        return scores, ids.astype(np.int64)
+
+    def _meta(self) -> Dict[str, Any]:
+        return {
+            **super()._meta(),
+            "factory": self.factory,
+            "nprobe": self.nprobe,
+            "num_train": self.num_train,
+            "seed": self.seed,
+        }
+
+    def _save(self, path: str) -> None:
+        faiss.write_index(self.index, os.path.join(path, "index.faiss"))
+
+    def _load(self, path: str, meta: Dict[str, Any], mmap: bool) -> None:
+        if not _FAISS_AVAILABLE:
+            raise ModuleNotFoundError(
+                "The `FaissIndex` requires `faiss`. Install it with `pip install faiss-cpu` (or `faiss-gpu`)."
+            )
+        self.factory, self.nprobe = meta["factory"], meta["nprobe"]
+        self.num_train, self.seed = meta.get("num_train"), meta.get("seed", 42)
+        flags = faiss.IO_FLAG_MMAP if mmap else 0
+        self.index = faiss.read_index(os.path.join(path, "index.faiss"), flags)
+        self._set_nprobe()
+
+
+def search_exact(
+    vectors: Any, queries: Any, k: int = 10, metric: str = "cosine", chunk_size: int = 65_536
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the ``k`` nearest embeddings of each query by comparing it with every embedding (e.g. to measure the
+    recall of an approximate index). The embeddings are read ``chunk_size`` rows at a time.
+
+    Args:
+        vectors: An :class:`~flash.core.embedding_index.EmbeddingStore`, or an array (or tensor) with a row per
+            embedding. The id of each embedding is its row.
+        queries: An array (or tensor) with a row per query.
+        k: The number of embeddings to return for each query.
+        metric: The similarity of the embeddings, either ``"cosine"``, ``"ip"`` (inner product), or ``"l2"`` (squared
+            euclidean distance).
+        chunk_size: The number of embeddings to compare at a time.
+
+    Returns:
+        The ``scores`` and the ``ids`` of the nearest embeddings, arrays of shape ``(num_queries, k)``.
+    """
+    _check_metric(metric)
+    embeddings = _as_embeddings(vectors)
+    queries = _to_numpy(queries)
+    if metric == "cosine":
+        queries = _normalize(queries)
+
+    scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    ids = np.full((len(queries), k), -1, dtype=np.int64)
+    for start, chunk in embeddings.iter_chunks(chunk_size):
+        if metric == "cosine":
+            chunk = _normalize(chunk)
+        chunk_scores, columns = _top_k(_scores(queries, chunk, metric), min(k, len(chunk)))
+        scores, merged = _top_k(np.concatenate([scores, chunk_scores], axis=1), k)
+        ids = np.take_along_axis(np.concatenate([ids, start + columns], axis=1), merged, axis=1)
+    ids[~np.isfinite(scores)] = -1
+    return (-scores if metric == "l2" else scores), ids
@@ -0,0 +1,281 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A compact on-disk store for embeddings, written while predicting and read through memory maps.
+
+An embeddings directory contains, for each shard (``<prefix>-rank<rank>-<index>``):
+
+*  ``<shard>.emb``: the embeddings (as ``float32``, ``float16``, or ``int8``), a row per embedding, back to back
+*  ``<shard>.scales``: the ``float32`` scale of each row (only for ``int8`` embeddings)
+*  ``<shard>.json``: the ``num_rows``, ``dim``, and ``dtype`` of the shard
+
+The ``int8`` embeddings are quantized symmetrically with a scale per row (``embedding ~= codes * scale``), which keeps
+the direction of each embedding to within a fraction of a percent at a quarter of the size.
+"""
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import fsspec
+import numpy as np
+import torch
+from fsspec.utils import infer_storage_options
+
+from flash.core.data.io.prediction_sink import PredictionSink
+from flash.core.data.utilities.loading import is_local_path
+
+EMBEDDINGS_FORMAT = "flash-embeddings"
+EMBEDDINGS_VERSION = 1
+
+_DTYPES = ("float32", "float16", "int8")
+
+
+def _check_dtype(dtype: str) -> str:
+    if dtype not in _DTYPES:
+        raise ValueError(f"`dtype` should be one of {', '.join(_DTYPES)}. Found {dtype}.")
+    return dtype
+
+
+def _quantize(vectors: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Returns the codes (and, for ``int8``, the scale of each row) of the ``float32`` vectors."""
+    if dtype != "int8":
+        return vectors.astype(dtype, copy=False), None
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def _dequantize(codes: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    vectors = np.asarray(codes, dtype=np.float32)
+    if scales is not None:
+        vectors *= scales[:, None]
+    return vectors
+
+
+def _to_numpy(vectors: Any) -> np.ndarray:
+    """Stack a batch (or a list) of embeddings into a ``float32`` array with a row per embedding."""
+    if isinstance(vectors, torch.Tensor):
+        vectors = vectors.detach().cpu().float().numpy()
+    elif isinstance(vectors, (list, tuple)) and vectors and isinstance(vectors[0], torch.Tensor):
+        vectors = torch.stack([vector.detach().cpu().float() for vector in vectors]).numpy()
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors.reshape(len(vectors), -1)
+
+
+class EmbeddingSink(PredictionSink):
+    """A :class:`~flash.core.data.io.prediction_sink.PredictionSink` which writes the embeddings predicted by an
+    ``Embedder`` (e.g. the :class:`~flash.image.ImageEmbedder` or the :class:`~flash.text.TextEmbedder`) to an
+    embeddings directory, to be read with the :class:`~flash.core.embedding_index.EmbeddingStore`. Each embedding is
+    flattened and written as soon as it is received.
+
+    Args:
+        output_dir: The directory to write the embeddings to (local or remote through ``fsspec``).
+        dtype: The type to store the embeddings as, either ``"float32"``, ``"float16"``, or ``"int8"``.
+        max_rows_per_file: The number of embeddings after which a new shard is started.
+        prefix: The prefix of the shards.
+
+    Examples
+    ________
+
+    .. doctest::
+
+        >>> import torch
+        >>> with EmbeddingSink("embeddings", dtype="int8") as sink:
+        ...     sink.write(torch.randn(10, 4))
+        >>> store = EmbeddingStore("embeddings")
+        >>> len(store), store.dim, store.dtype
+        (10, 4, 'int8')
+
+    .. testcleanup::
+
+        >>> import shutil
+        >>> shutil.rmtree("embeddings")
+    """
+
+    extension = "emb"
+
+    def __init__(
+        self,
+        output_dir: str,
+        dtype: str = "float16",
+        max_rows_per_file: int = 1_000_000,
+        prefix: str = "embeddings",
+    ):
+        super().__init__(output_dir, max_rows_per_file=max_rows_per_file, prefix=prefix)
+        self.dtype = _check_dtype(dtype)
+        self.dim: Optional[int] = None
+
+    def _stem(self) -> str:
+        return os.path.splitext(self._path)[0]
+
+    def open_file(self, path: str) -> None:
+        self._file = self.fs.open(path, "wb")
+        self._scales_file = self.fs.open(f"{self._stem()}.scales", "wb") if self.dtype == "int8" else None
+
+    def write(self, predictions: Any) -> None:
+        vectors = _to_numpy(predictions)
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"The embeddings should all have {self.dim} elements. Found {vectors.shape[1]}.")
+        super().write(vectors)
+
+    def write_rows(self, rows: np.ndarray) -> None:
+        codes, scales = _quantize(rows, self.dtype)
+        self._file.write(codes.tobytes())
+        if scales is not None:
+            self._scales_file.write(scales.tobytes())
+
+    def close_file(self) -> None:
+        self._file.close()
+        if self._scales_file is not None:
+            self._scales_file.close()
+        with self.fs.open(f"{self._stem()}.json", "w") as f:
+            json.dump(
+                {
+                    "format": EMBEDDINGS_FORMAT,
+                    "version": EMBEDDINGS_VERSION,
+                    "num_rows": self._num_rows,
+                    "dim": self.dim,
+                    "dtype": self.dtype,
+                },
+                f,
+            )
+
+
+class _EmbeddingShard:
+    """A shard of embeddings, read through a memory map (local files) or loaded in memory (remote files)."""
+
+    def __init__(self, stem: str, meta: Dict[str, Any], mmap: bool = True):
+        self.num_rows = meta["num_rows"]
+        self.dtype = meta["dtype"]
+        shape = (self.num_rows, meta["dim"])
+        self.codes = self._open(f"{stem}.emb", np.dtype(self.dtype), shape, mmap)
+        self.scales = self._open(f"{stem}.scales", np.dtype(np.float32), (self.num_rows,), mmap)
+        if self.dtype != "int8":
+            self.scales = None
+
+    @staticmethod
+    def _open(path: str, dtype: np.dtype, shape: Tuple[int, ...], mmap: bool) -> Optional[np.ndarray]:
+        fs, _ = fsspec.core.url_to_fs(path)
+        if not fs.exists(path):
+            return None
+        if mmap and is_local_path(path):
+            if shape[0] == 0:
+                return np.empty(shape, dtype=dtype)
+            return np.memmap(infer_storage_options(path)["path"], dtype=dtype, mode="r", shape=shape)
+        with fs.open(path, "rb") as f:
+            return np.frombuffer(f.read(), dtype=dtype).reshape(shape)
+
+    def read(self, start: int, stop: int) -> np.ndarray:
+        scales = None if self.scales is None else self.scales[start:stop]
+        return _dequantize(self.codes[start:stop], scales)
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        scales = None if self.scales is None else self.scales[indices]
+        return _dequantize(self.codes[indices], scales)
+
+
+class EmbeddingStore:
+    """The embeddings of an embeddings directory written with the
+    :class:`~flash.core.embedding_index.EmbeddingSink`. The rows of the shards are numbered in the order of the shard
+    names, so when predicting with a single process, the id of each embedding is its position in the predictions.
+
+    Args:
+        root: The embeddings directory.
+        mmap: Whether to read local shards through a memory map. Otherwise (and for remote shards), the shards are
+            loaded in memory.
+    """
+
+    def __init__(self, root: str, mmap: bool = True):
+        self.root = str(root)
+        fs, _ = fsspec.core.url_to_fs(self.root)
+        protocol = infer_storage_options(self.root)["protocol"]
+
+        self.shards: List[_EmbeddingShard] = []
+        for path in sorted(fs.glob(os.path.join(self.root, "*.json"))):
+            if protocol not in ("file", None) and "://" not in path:
+                path = f"{protocol}://{path}"
+            with fs.open(path, "r") as f:
+                meta = json.load(f)
+            if meta.get("format") != EMBEDDINGS_FORMAT:
+                continue
+            if meta["version"] > EMBEDDINGS_VERSION:
+                raise ValueError(
+                    f"The embeddings in {self.root} have version {meta['version']} which is newer than the supported "
+                    f"version ({EMBEDDINGS_VERSION}). Please upgrade Flash."
+                )
+            self.shards.append(_EmbeddingShard(os.path.splitext(path)[0], meta, mmap=mmap))
+
+        if not self.shards:
+            raise ValueError(f"{self.root} doesn't contain any {EMBEDDINGS_FORMAT} shards.")
+        if len({(shard.codes.shape[1], shard.dtype) for shard in self.shards}) > 1:
+            raise ValueError(f"The shards in {self.root} don't all have the same `dim` and `dtype`.")
+        self.dim = self.shards[0].codes.shape[1]
+        self.dtype = self.shards[0].dtype
+        self.offsets = np.cumsum([0] + [shard.num_rows for shard in self.shards])
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def iter_chunks(self, chunk_size: int = 65_536) -> Iterator[Tuple[int, np.ndarray]]:
+        """Iterate over the embeddings (as ``float32``) in order, ``chunk_size`` rows at a time.
+
+        Returns:
+            An iterator of ``(start, embeddings)`` tuples, ``start`` being the id of the first embedding of the chunk.
+        """
+        for offset, shard in zip(self.offsets, self.shards):
+            for start in range(0, shard.num_rows, chunk_size):
+                yield int(offset) + start, shard.read(start, start + chunk_size)
+
+    def take(self, ids: Union[np.ndarray, List[int]]) -> np.ndarray:
+        """Return the embeddings (as ``float32``) with the given ids, in this order."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) and (ids.min() < 0 or ids.max() >= len(self)):
+            raise IndexError(f"The ids should be in the range [0, {len(self)}).")
+        vectors = np.empty((len(ids), self.dim), dtype=np.float32)
+        shard_indices = np.searchsorted(self.offsets, ids, side="right") - 1
+        for shard_index in np.unique(shard_indices):
+            mask = shard_indices == shard_index
+            vectors[mask] = self.shards[shard_index].take(ids[mask] - self.offsets[shard_index])
+        return vectors
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.take(np.arange(*index.indices(len(self))))
+        return self.take([index])[0]
+
+
+class _ArrayEmbeddings:
+    """Embeddings held in memory, with the same ``iter_chunks`` and ``take`` interface as the ``EmbeddingStore``."""
+
+    def __init__(self, vectors: Any):
+        self.vectors = _to_numpy(vectors)
+        self.dim = self.vectors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def iter_chunks(self, chunk_size: int = 65_536) -> Iterator[Tuple[int, np.ndarray]]:
+        for start in range(0, len(self.vectors), chunk_size):
+            yield start, self.vectors[start : start + chunk_size]
+
+    def take(self, ids: Union[np.ndarray, List[int]]) -> np.ndarray:
+        return self.vectors[np.asarray(ids, dtype=np.int64)]
+
+
+def _as_embeddings(vectors: Any) -> Union[EmbeddingStore, _ArrayEmbeddings]:
+    if isinstance(vectors, (EmbeddingStore, _ArrayEmbeddings)):
+        return vectors
+    return _ArrayEmbeddings(vectors)
@@ -22,6 +22,7 @@ import flash
 from flash.core.adapter import Adapter
 from flash.core.data.io.input import DataKeys, InputBase
 from flash.core.data.io.input_transform import InputTransform, create_worker_input_transform_processor
+from flash.core.data.utilities.sampling import resolve_sampling
 from flash.core.integrations.icevision.transforms import (
     from_icevision_predictions,
     from_icevision_record,
@@ -135,13 +136,10 @@ class IceVisionAdapter(Adapter):
     ) -> DataLoader:
         data_loader = import_module(self.model_type).train_dl(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
             persistent_workers=persistent_workers,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -171,13 +169,10 @@ class IceVisionAdapter(Adapter):
     ) -> DataLoader:
         data_loader = import_module(self.model_type).valid_dl(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
             persistent_workers=persistent_workers,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -207,13 +202,10 @@ class IceVisionAdapter(Adapter):
     ) -> DataLoader:
         data_loader = import_module(self.model_type).valid_dl(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
             persistent_workers=persistent_workers,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -243,13 +235,10 @@ class IceVisionAdapter(Adapter):
     ) -> DataLoader:
         data_loader = import_module(self.model_type).infer_dl(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
             persistent_workers=persistent_workers,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
         )
 
         data_loader = self._update_collate_fn_dataloader(
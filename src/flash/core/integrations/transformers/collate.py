@@ -11,17 +11,41 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+import hashlib
+import os
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
 
 import torch
 
 from flash.core.data.io.input import DataKeys
-from flash.core.utilities.imports import _TRANSFORMERS_AVAILABLE
+from flash.core.utilities.imports import _TOPIC_TEXT_AVAILABLE, _TRANSFORMERS_AVAILABLE
 
 if _TRANSFORMERS_AVAILABLE:
     from transformers import AutoTokenizer
 
+if _TOPIC_TEXT_AVAILABLE:
+    import pyarrow as pa
+    from datasets import Dataset
+else:
+    Dataset = object
+
+
+def _dataset_fingerprint(hf_dataset: Dataset, batch_size: int = 10_000) -> str:
+    """A hash of the rows of a HuggingFace ``Dataset`` (in order, through any indices mapping from ``select`` or
+    ``shuffle``) computed from their Arrow IPC serialization, one batch of rows at a time."""
+    hasher = hashlib.sha1(repr(hf_dataset.features).encode())
+    arrow_dataset = hf_dataset.with_format("arrow")
+    for start in range(0, len(arrow_dataset), batch_size):
+        table = arrow_dataset[start : start + batch_size]
+        # Slices of a table can keep the buffers of the whole table, taking the rows gives buffers of just these rows
+        table = table.take(pa.array(range(table.num_rows)))
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        hasher.update(sink.getvalue())
+    return hasher.hexdigest()
+
 
 @dataclass(unsafe_hash=True)
 class TransformersCollate:
@@ -45,5 +69,55 @@ class TransformersCollate:
     def tokenize(self, sample):
         raise NotImplementedError
 
+    def tokenize_batch(self, batch: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """Tokenize a batch of (unpadded) inputs ahead of time. Override this hook to support
+        :meth:`~flash.core.integrations.transformers.collate.TransformersCollate.pretokenize`."""
+        raise NotImplementedError
+
+    def pad(self, samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pad a list of samples which have already been tokenized (with ``tokenize_batch``)."""
+        raise NotImplementedError
+
+    @property
+    def fingerprint(self) -> str:
+        """A hash of the tokenizer and of the collate arguments used to identify pre-tokenized datasets."""
+        hasher = hashlib.sha1(type(self).__qualname__.encode())
+        for collate_field in fields(self):
+            hasher.update(repr(getattr(self, collate_field.name)).encode())
+        return hasher.hexdigest()
+
+    def pretokenize(self, hf_dataset: Dataset, num_proc: Optional[int] = None, cache_dir: Optional[str] = None):
+        """Tokenize the input column of the given HuggingFace ``Dataset`` once with a batched (and optionally
+        multi-process) ``Dataset.map``. The result is written to an Arrow cache file which is reused for as long as
+        the data and the tokenizer settings don't change, so that the collate only has to pad the token ids. The cache
+        is keyed on a hash of the rows of the dataset and of the collate ``fingerprint``.
+
+        Args:
+            hf_dataset: The dataset to tokenize.
+            num_proc: The number of processes to use for tokenization.
+            cache_dir: The folder to write the cache file to if the dataset isn't already backed by a file. Defaults
+                to ``$FLASH_CACHE_DIR`` or the HuggingFace datasets cache.
+        """
+        fingerprint = hashlib.sha1(f"{_dataset_fingerprint(hf_dataset)}-{self.fingerprint}".encode()).hexdigest()
+
+        cache_file_name = None
+        if not hf_dataset.cache_files:
+            cache_dir = cache_dir or os.environ.get("FLASH_CACHE_DIR", None)
+            if cache_dir is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                cache_file_name = os.path.join(cache_dir, f"pretokenized-{fingerprint}.arrow")
+
+        return hf_dataset.map(
+            self.tokenize_batch,
+            batched=True,
+            num_proc=num_proc,
+            remove_columns=[DataKeys.INPUT],
+            cache_file_name=cache_file_name,
+            new_fingerprint=fingerprint,
+            desc="Tokenizing",
+        )
+
     def __call__(self, samples):
+        if "input_ids" in samples[0]:
+            return self.to_tensor(self.pad(samples))
         return self.to_tensor(self.tokenize({key: [sample[key] for sample in samples] for key in samples[0]}))
@@ -40,12 +40,15 @@ from flash.core.data.io.output import Output
 from flash.core.data.io.output_transform import OutputTransform
 from flash.core.data.output import BASE_OUTPUTS
 from flash.core.data.utilities.collate import default_collate
+from flash.core.data.utilities.sampling import resolve_sampling
 from flash.core.finetuning import _FINETUNING_STRATEGIES_REGISTRY
 from flash.core.hooks import FineTuningHooks
 from flash.core.optimizers.optimizers import _OPTIMIZERS_REGISTRY
 from flash.core.optimizers.schedulers import _SCHEDULERS_REGISTRY
 from flash.core.registry import FlashRegistry
+from flash.core.serve.cache import PredictionCache
 from flash.core.serve.composition import Composition
+from flash.core.serve.executor import ServeExecutor
 from flash.core.utilities.apply_func import get_callable_dict
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE, requires
 from flash.core.utilities.providers import _HUGGINGFACE
@@ -144,12 +147,9 @@ class DatasetProcessor:
 
         return DataLoader(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
         )
@@ -178,12 +178,9 @@ class DatasetProcessor:
 
         return DataLoader(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
         )
@@ -212,12 +209,9 @@ class DatasetProcessor:
 
         return DataLoader(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
         )
@@ -246,12 +240,9 @@ class DatasetProcessor:
 
         return DataLoader(
             dataset,
-            batch_size=batch_size,
             num_workers=num_workers,
             pin_memory=pin_memory,
-            shuffle=shuffle,
-            drop_last=drop_last,
-            sampler=sampler,
+            **resolve_sampling(dataset, batch_size, shuffle=shuffle, drop_last=drop_last, sampler=sampler),
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
         )
@@ -830,6 +821,7 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
             body = {"session": "UUID", "payload": {"inputs": {"data": input_str}}}
             resp = tc.post("http://0.0.0.0:8000/predict", json=body)
             print(f"Sanity check response: {resp.json()}")
+        comp.batcher.close()
 
     @requires("serve")
     def serve(
@@ -841,6 +833,11 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> "Composition":
         """Serve the ``Task``. Override this method to provide a default ``input_cls``, ``transform``, and
         ``transform_kwargs``.
@@ -852,6 +849,16 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
             input_cls: The ``ServeInput`` type to use.
             transform: The transform to use when serving.
             transform_kwargs: Keyword arguments used to instantiate the transform.
+            max_batch_size: The maximum number of concurrent requests to merge into a single call to ``predict_step``.
+                By default, each request is processed on its own.
+            max_wait_ms: The maximum time (in milliseconds) to wait for concurrent requests to fill a batch.
+            executor: An optional :class:`~flash.core.serve.ServeExecutor` to serve requests asynchronously, with
+                the (de)serialization and the model running in separate worker pools and a limit on the number of
+                requests in flight.
+            num_replicas: The number of processes to serve the ``Task`` with. The weights are shared between the
+                replicas and requests are sent to the replica with the fewest requests in flight.
+            cache: An optional :class:`~flash.core.serve.PredictionCache` to return the cached predictions of repeated
+                requests (keyed on the payload and the weights of the model).
         """
         from flash.core.serve.flash_components import build_flash_serve_model_component
 
@@ -867,7 +874,15 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         if sanity_check:
             self.run_serve_sanity_check(serve_input, transform, transform_kwargs, output)
 
-        comp = build_flash_serve_model_component(self, serve_input, output, transform, transform_kwargs)
+        comp = build_flash_serve_model_component(
+            self,
+            serve_input,
+            output,
+            transform,
+            transform_kwargs,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
         composition = Composition(predict=comp, TESTING=flash._IS_TESTING)
-        composition.serve(host=host, port=port)
+        composition.serve(host=host, port=port, executor=executor, num_replicas=num_replicas, cache=cache)
         return composition
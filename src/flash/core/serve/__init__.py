@@ -1,7 +1,9 @@
+from flash.core.serve.cache import PredictionCache
 from flash.core.serve.component import ModelComponent
 from flash.core.serve.composition import Composition
 from flash.core.serve.core import Endpoint, Servable
 from flash.core.serve.decorators import expose
+from flash.core.serve.executor import ServeExecutor
 
 __all__ = [
     "expose",
@@ -9,4 +11,6 @@ __all__ = [
     "Composition",
     "Endpoint",
     "Servable",
+    "ServeExecutor",
+    "PredictionCache",
 ]
@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Merge items submitted concurrently (e.g. by the threads handling HTTP requests) into batches.
+
+    A single background thread takes the first waiting item, then keeps collecting items until either
+    ``max_batch_size`` items have been gathered or ``max_wait_ms`` milliseconds have passed since the first one
+    arrived. The whole batch is passed to ``fn`` with one call and the results are handed back to the callers, which
+    block until their own result is ready.
+
+    If ``fn`` raises for a batch of more than one item, the items are retried one by one so that a single bad request
+    only fails itself.
+
+    Parameters
+    ----------
+    fn
+        Function which takes a list of items and returns a list with one result per item (in the same order).
+    max_batch_size
+        The maximum number of items in each batch. With ``max_batch_size=1`` the items are processed directly in the
+        calling thread.
+    max_wait_ms
+        The maximum time (in milliseconds) to wait for more items to fill a batch after the first one arrived.
+    name
+        Name given to the background thread.
+
+    Examples
+    --------
+    >>> batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_batch_size=4, max_wait_ms=1)
+    >>> batcher(21)
+    42
+    >>> batcher.close()
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        name: str = "MicroBatcher",
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"`max_batch_size` should be a positive integer. Found {max_batch_size}.")
+        if max_wait_ms < 0:
+            raise ValueError(f"`max_wait_ms` should be non-negative. Found {max_wait_ms}.")
+
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+
+        # Counters which can be used to check how well requests are being batched
+        self.num_batches = 0
+        self.num_items = 0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.num_items / self.num_batches if self.num_batches else 0.0
+
+    def submit(self, item: Any) -> Future:
+        """Queue the ``item`` for the next batch and return a ``Future`` for its result."""
+        future = Future()
+        if self.max_batch_size == 1:
+            if future.set_running_or_notify_cancel():
+                self._process([(item, future)])
+            return future
+
+        self._ensure_started()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item: Any) -> Any:
+        return self.submit(item).result()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread once the items which have already been submitted are processed."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    self._thread.start()
+
+    def _collect(self) -> Optional[List[Tuple[Any, Future]]]:
+        request = self._queue.get()
+        if request is _STOP:
+            return None
+
+        batch = [request]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                # Process what we have, then stop on the next call
+                self._queue.put(_STOP)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch: List[Tuple[Any, Future]], retry: bool = False) -> None:
+        if not retry:
+            self.num_batches += 1
+            self.num_items += len(batch)
+        try:
+            results = self.fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Expected {len(batch)} results from the batch function but got {len(results)}.")
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            for request in batch:
+                self._process([request], retry=True)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
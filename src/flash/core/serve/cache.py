@@ -0,0 +1,252 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+import numpy as np
+import torch
+from torch import nn
+
+from flash.core.serve.core import Servable
+from flash.core.utilities.imports import _PANDAS_AVAILABLE
+
+if _PANDAS_AVAILABLE:
+    import pandas as pd
+else:
+    pd = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flash.core.serve.composition import Composition
+
+# Returned by ``PredictionCache.get`` when there is no (valid) entry for a key
+MISSING = object()
+
+
+def _update_hash(h: "hashlib._Hash", obj: Any) -> None:
+    """Feed a canonical encoding of ``obj`` (a decoded request payload) to the hash ``h``."""
+    if isinstance(obj, dict):
+        h.update(b"d%d" % len(obj))
+        for key in sorted(obj, key=str):
+            _update_hash(h, key)
+            _update_hash(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"l%d" % len(obj))
+        for item in obj:
+            _update_hash(h, item)
+    elif isinstance(obj, str):
+        h.update(b"s%d:" % len(obj))
+        h.update(obj.encode("utf-8"))
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"b%d:" % len(obj))
+        h.update(obj)
+    elif isinstance(obj, torch.Tensor):
+        tensor = obj.detach().cpu()
+        if tensor.dtype == torch.bfloat16:
+            # NumPy has no bfloat16
+            tensor = tensor.float()
+        _update_hash(h, tensor.numpy())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"a{obj.dtype.str}{obj.shape}:".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif pd is not None and isinstance(obj, pd.DataFrame):
+        _update_hash(h, [str(column) for column in obj.columns])
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif obj is None or isinstance(obj, (bool, int, float)):
+        h.update(f"{type(obj).__name__}:{obj!r}".encode())
+    else:
+        h.update(pickle.dumps(obj, protocol=4))
+
+
+def model_version(composition: "Composition") -> str:
+    """Fingerprint of the models of a composition: the class of each component and the content of the weights (and
+    buffers) of its models.
+
+    The weights are hashed once, when the app is created. Pass an explicit ``version`` to the :class:`PredictionCache`
+    to skip it for very large models.
+    """
+    h = hashlib.sha256()
+    for name in sorted(composition.components):
+        component = composition.components[name]
+        h.update(f"{name}:{type(component).__module__}.{type(component).__qualname__}".encode())
+        models = component._flashserve_meta_.models
+        if isinstance(models, dict):
+            models = [models[key] for key in sorted(models)]
+        elif not isinstance(models, (list, tuple)):
+            models = [models]
+        for model in models:
+            if isinstance(model, Servable):
+                model = model.instance
+            if isinstance(model, nn.Module):
+                _update_hash(h, dict(model.state_dict()))
+            else:
+                h.update(type(model).__qualname__.encode())
+    return h.hexdigest()
+
+
+class PredictionCache:
+    """Cache of the results of the flash serve compute routes.
+
+    Entries are keyed on a hash of the decoded request payload (the JSON payload, raw bytes, multipart fields or NPY /
+    Arrow tensors), the route, and the version of the models. The session is not part of the key. The cache keeps the
+    ``max_size`` most recently used entries in memory and entries older than ``ttl`` seconds are discarded.
+
+    When a ``path`` is given, the entries are also written to a SQLite database at this location so that they survive
+    restarts of the server (and are shared between the replicas of a server). The least recently used entries of the
+    database are trimmed every few writes so that it stays at about ``max_size`` entries as well.
+
+    Parameters
+    ----------
+    max_size
+        Maximum number of entries.
+    ttl
+        Time to live (in seconds) of the entries. ``None`` keeps the entries until they are evicted.
+    path
+        Optional path of an on-disk store for the entries.
+    version
+        Version of the models, part of every key. By default, a fingerprint of the weights of the models is used so
+        that entries of a previous model are never returned after it is updated.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[Union[str, Path]] = None,
+        version: Optional[str] = None,
+    ):
+        if max_size < 1:
+            raise ValueError(f"`max_size` should be a positive integer. Found {max_size}.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"`ttl` should be a positive number or None. Found {ttl}.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self.version = version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid: Optional[int] = None
+        self._trim_every = max(1, max_size // 16)
+        self._num_puts = 0
+
+    def bind(self, composition: "Composition") -> "PredictionCache":
+        """Set the ``version`` of the cache from the models of the ``composition`` (unless it was given)."""
+        if self.version is None:
+            self.version = model_version(composition)
+        return self
+
+    def key(self, route: str, payload: Any) -> str:
+        h = hashlib.sha256()
+        h.update(f"{self.version}:{route}:".encode())
+        _update_hash(h, payload)
+        return h.hexdigest()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # SQLite connections can't be used across a fork, so each process opens its own
+        if self._db is None or self._db_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, created REAL, accessed REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._db.commit()
+            self._db_pid = os.getpid()
+        return self._db
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _get_from_disk(self, key: str) -> Any:
+        row = self.db.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return MISSING
+        value, created = row
+        if self._expired(created):
+            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.db.commit()
+            return MISSING
+        self.db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        self.db.commit()
+        self._put_in_memory(key, pickle.loads(value), created)
+        return self._entries[key][0]
+
+    def _put_in_memory(self, key: str, value: Any, created: float) -> None:
+        self._entries[key] = (value, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the cached result for ``key``, or ``default`` if there is no valid entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1]):
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                value = entry[0]
+            elif self.path is not None:
+                value = self._get_from_disk(key)
+            else:
+                value = MISSING
+
+            if value is MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        created = time.time()
+        with self._lock:
+            self._put_in_memory(key, value, created)
+            if self.path is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, pickle.dumps(value, protocol=4), created, created),
+                )
+                self._num_puts += 1
+                if self._num_puts % self._trim_every == 0:
+                    self.db.execute(
+                        "DELETE FROM entries WHERE key NOT IN (SELECT key FROM entries ORDER BY accessed DESC LIMIT ?)",
+                        (self.max_size,),
+                    )
+                self.db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                self.db.execute("DELETE FROM entries")
+                self.db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Counters of the cache, exposed on ``/flashserve/metrics``."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
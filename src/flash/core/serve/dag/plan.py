@@ -0,0 +1,225 @@
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+from flash.core.serve.dag.optimization import cull, fuse_linear
+from flash.core.serve.dag.task import ishashable, istask, toposort
+from flash.core.utilities.imports import _TOPIC_SERVE_AVAILABLE
+
+# Skip doctests if requirements aren't available
+if not _TOPIC_SERVE_AVAILABLE:
+    __doctest_skip__ = ["*"]
+
+
+class _Constant:
+    """A compiled argument which is always the same ``value``."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __call__(self, args: Sequence[Any]) -> Any:
+        return self.value
+
+
+class _List:
+    """A compiled list argument, made of the values of its compiled items."""
+
+    __slots__ = ("getters",)
+
+    def __init__(self, getters: List[Callable[[Sequence[Any]], Any]]):
+        self.getters = getters
+
+    def __call__(self, args: Sequence[Any]) -> List[Any]:
+        return [getter(args) for getter in self.getters]
+
+
+class _Call:
+    """A compiled (nested) task, which calls ``func`` with the values of its compiled arguments."""
+
+    __slots__ = ("func", "getters")
+
+    def __init__(self, func: Callable, getters: List[Callable[[Sequence[Any]], Any]]):
+        self.func = func
+        self.getters = getters
+
+    def __call__(self, args: Sequence[Any]) -> Any:
+        return self.func(*[getter(args) for getter in self.getters])
+
+
+class _Step:
+    """The function of a step whose task has nested tasks (e.g. fused chains), called with the values of the slots
+    the task refers to.
+
+    Like the compiled arguments, it is a plain object rather than a closure so that a step can be sent to a process
+    pool (as long as the functions of its task can be pickled).
+    """
+
+    __slots__ = ("call",)
+
+    def __init__(self, call: _Call):
+        self.call = call
+
+    def __call__(self, *args: Any) -> Any:
+        return self.call(args)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _compile_arg(arg: Any, slots: Dict[Any, int], refs: Dict[int, int]) -> Callable[[Sequence[Any]], Any]:
+    """Compile a (possibly nested) task argument into a function of the values of the slots it refers to.
+
+    The slots referred to are added to ``refs``, which maps them to their position in the values given to the
+    function.
+    """
+    if isinstance(arg, list):
+        return _List([_compile_arg(a, slots, refs) for a in arg])
+    if istask(arg):
+        return _Call(arg[0], [_compile_arg(a, slots, refs) for a in arg[1:]])
+    if ishashable(arg) and arg in slots:
+        return itemgetter(refs.setdefault(slots[arg], len(refs)))
+    return _Constant(arg)
+
+
+class ExecutionPlan:
+    """A task graph compiled into a flat list of steps.
+
+    Every key of the graph (and every input key) is given a slot index and every task becomes a step which calls its
+    function with the values of its argument slots and stores the result in its own slot. Running the plan is then a
+    single loop over the steps, with no graph introspection, key lookups, or recursion over the tasks.
+
+    Each step also has a ``kind`` (given by the ``kind`` function of :func:`compile_plan`, ``None`` for the steps
+    which only copy a value), which :meth:`run_async` uses to choose where to run it.
+
+    Use :func:`compile_plan` to build a plan from a task graph.
+
+    Examples
+    --------
+    >>> from operator import add, neg
+    >>> plan = compile_plan({'y': (neg, 'x'), 'z': (add, 'y', 10)}, ['z'], input_keys=['x'])
+    >>> plan({'x': 1})
+    (9,)
+    """
+
+    __slots__ = ("input_keys", "output_keys", "_input_slots", "_output_slots", "_template", "_steps", "_kinds")
+
+    def __init__(
+        self,
+        input_keys: Sequence[str],
+        output_keys: Sequence[str],
+        template: List[Any],
+        steps: List[Tuple[int, Callable, Tuple[int, ...]]],
+        output_slots: Sequence[int],
+        kinds: Optional[Sequence[Hashable]] = None,
+    ):
+        self.input_keys = tuple(input_keys)
+        self.output_keys = tuple(output_keys)
+        self._input_slots = tuple(enumerate(self.input_keys))
+        self._output_slots = tuple(output_slots)
+        self._template = template
+        self._steps = steps
+        self._kinds = tuple(kinds) if kinds is not None else (None,) * len(steps)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def _initial_values(self, inputs: Mapping[str, Any]) -> List[Any]:
+        values = self._template.copy()
+        for slot, key in self._input_slots:
+            values[slot] = inputs[key]
+        return values
+
+    def __call__(self, inputs: Mapping[str, Any]) -> Tuple[Any, ...]:
+        """Run the plan for the given ``inputs`` (a mapping with an entry for each of the ``input_keys``) and return
+        the values of the ``output_keys``."""
+        values = self._initial_values(inputs)
+        for slot, func, args in self._steps:
+            values[slot] = func(*[values[arg] for arg in args])
+        return tuple(values[slot] for slot in self._output_slots)
+
+    async def run_async(
+        self, inputs: Mapping[str, Any], run_step: Callable[[Hashable, Callable, List[Any]], Awaitable[Any]]
+    ) -> Tuple[Any, ...]:
+        """Run the plan like :meth:`__call__`, but with each step (which has a ``kind``) awaited through
+        ``run_step(kind, func, args)``, e.g. to run it in an executor. The steps without a ``kind`` are run
+        directly."""
+        values = self._initial_values(inputs)
+        for (slot, func, args), kind in zip(self._steps, self._kinds):
+            if kind is None:
+                values[slot] = func(*[values[arg] for arg in args])
+            else:
+                values[slot] = await run_step(kind, func, [values[arg] for arg in args])
+        return tuple(values[slot] for slot in self._output_slots)
+
+
+def compile_plan(
+    dsk: Dict[str, Any],
+    output_keys: Sequence[str],
+    input_keys: Sequence[str] = (),
+    fuse: bool = True,
+    kind: Optional[Callable[[Any], Hashable]] = None,
+) -> ExecutionPlan:
+    """Compile the task graph ``dsk`` into an :class:`ExecutionPlan`.
+
+    Parameters
+    ----------
+    dsk
+        task graph dict
+    output_keys
+        keys of the graph which are returned (in this order) by the plan
+    input_keys
+        keys which are not part of the graph but given as inputs each time the plan is run
+    fuse
+        if True, linear chains of tasks are fused together (with ``fuse_linear``) before compiling
+    kind
+        optional function giving the kind of each task (e.g. whether it is IO or compute), which is stored with its
+        step. Only tasks of the same kind are fused together.
+
+    Returns
+    -------
+    ExecutionPlan
+    """
+    output_keys = list(output_keys)
+    dsk, dependencies = cull(dsk, output_keys)
+
+    kinds = {}
+    if kind is not None:
+        kinds = {key: kind(task) for key, task in dsk.items() if istask(task)}
+    if fuse:
+        # Keep the tasks which have dependents of another kind, so that a fused step is only made of one kind
+        unfusible = {dep for key, deps in dependencies.items() for dep in deps if kinds.get(dep) != kinds.get(key)}
+        dsk, _ = fuse_linear(dsk, keys=output_keys + list(unfusible), dependencies=dependencies, rename_keys=False)
+
+    slots = {key: slot for slot, key in enumerate(input_keys)}
+    sortkeys = toposort(dsk)
+    for key in sortkeys:
+        slots[key] = len(slots)
+
+    template = [None] * len(slots)
+    steps, step_kinds = [], []
+    for key in sortkeys:
+        task = dsk[key]
+        if not istask(task):
+            # Constants are stored in the template, aliases of other keys are copied from their slot
+            if ishashable(task) and task in slots:
+                steps.append((slots[key], _identity, (slots[task],)))
+                step_kinds.append(None)
+            else:
+                template[slots[key]] = task
+            continue
+
+        func, args = task[0], task[1:]
+        if all(ishashable(arg) and arg in slots for arg in args):
+            # Fast path: every argument is the value of another slot
+            steps.append((slots[key], func, tuple(slots[arg] for arg in args)))
+        else:
+            refs = {}
+            call = _compile_arg(task, slots, refs)
+            steps.append((slots[key], _Step(call), tuple(refs)))
+        step_kinds.append(kinds.get(key))
+
+    return ExecutionPlan(
+        input_keys, output_keys, template, steps, [slots[key] for key in output_keys], kinds=step_kinds
+    )
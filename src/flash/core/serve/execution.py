@@ -4,9 +4,11 @@ from operator import attrgetter
 from typing import TYPE_CHECKING, Dict, List, Set, Tuple
 
 from flash.core.serve.dag.optimization import cull, functions_of, inline_functions
+from flash.core.serve.dag.plan import ExecutionPlan, compile_plan
 from flash.core.serve.dag.rewrite import RewriteRule, RuleSet
 from flash.core.serve.dag.task import flatten, get_deps, getcycle, isdag, toposort
 from flash.core.serve.dag.utils import funcname
+from flash.core.serve.executor import is_io_task
 from flash.core.utilities.imports import _CYTOOLZ_AVAILABLE, _PYDANTIC_AVAILABLE
 
 if _PYDANTIC_AVAILABLE:
@@ -67,6 +69,9 @@ class TaskComposition:
     pre_optimization_dsk
         Merged component `_dsk` subgraphs (without payload / result
         mapping or connections applied.)
+    plan
+        The optimized ``dsk`` compiled into a flat execution plan which
+        takes the request payload and returns the values of ``get_keys``
     """
 
     __slots__ = (
@@ -76,6 +81,7 @@ class TaskComposition:
         "ep_dsk_input_keys",
         "ep_dsk_output_keys",
         "pre_optimization_dsk",
+        "plan",
     )
 
     dsk: Dict[str, tuple]
@@ -84,6 +90,7 @@ class TaskComposition:
     ep_dsk_input_keys: Dict[str, str]
     ep_dsk_output_keys: Dict[str, str]
     pre_optimization_dsk: Dict[str, tuple]
+    plan: ExecutionPlan
 
 
 @dataclass
@@ -316,6 +323,17 @@ def build_composition(
     # recomputed upon every request.
     toposort_keys = toposort(inlined_culled_dsk)
 
+    # compile the graph (with linear chains of tasks fused together) into
+    # a flat plan so that a request doesn't need to walk the graph at all.
+    # IO and compute tasks are kept in separate steps, so that a
+    # ``ServeExecutor`` can run each step in the matching pool.
+    plan = compile_plan(
+        inlined_culled_dsk,
+        initial_task_dsk.output_keys,
+        input_keys=list(initial_task_dsk.payload_dsk_map),
+        kind=is_io_task,
+    )
+
     # construct results
     return TaskComposition(
         dsk=inlined_culled_dsk,
@@ -324,6 +342,7 @@ def build_composition(
         ep_dsk_input_keys=initial_task_dsk.payload_dsk_map,
         ep_dsk_output_keys=initial_task_dsk.result_dsk_map,
         pre_optimization_dsk=initial_task_dsk.merged_dsk,
+        plan=plan,
     )
 
 
@@ -0,0 +1,163 @@
+import asyncio
+import contextvars
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from flash.core.serve.dag.plan import ExecutionPlan
+from flash.core.serve.dag.task import _execute_task, flatten, istask, lists_to_tuples, toposort
+from flash.core.serve.metrics import SERVE_METRICS, Trace, tracing
+from flash.core.serve.types.base import BaseType
+
+_POOLS = ("thread", "process")
+
+
+def is_io_task(task: Any) -> bool:
+    """Is ``task`` a (CPU bound) serialize / deserialize step of a ``BaseType`` rather than model compute?"""
+    return istask(task) and isinstance(getattr(task[0], "__self__", None), BaseType)
+
+
+def _run_traced(func: Callable, *args: Any) -> Tuple[Any, Dict[str, float]]:
+    """Run ``func`` in a worker process and return its result with the stages it recorded.
+
+    The context variables (and so the trace of the request) aren't sent to a process pool, the stages are sent back
+    with the result instead.
+    """
+    trace = Trace()
+    with tracing(trace):
+        result = func(*args)
+    return result, trace.stages
+
+
+class ServeExecutor:
+    """Run the task graph of flash serve endpoints without blocking the server's event loop.
+
+    When a ``ServeExecutor`` is given to :meth:`~flash.core.serve.Composition.serve`, the endpoints are served by
+    ``async`` routes. The ``serialize`` / ``deserialize`` steps of the types (e.g. decoding base64 images) run in a pool
+    of ``io_workers`` threads or processes and the exposed component methods (the model compute) run in a dedicated
+    pool of ``compute_workers`` threads.
+
+    At most ``max_pending`` requests are processed at the same time, further requests are rejected with a
+    ``503 Service Unavailable`` response instead of queueing up behind them.
+
+    Parameters
+    ----------
+    io_workers
+        Number of workers used to serialize / deserialize payloads.
+    io_pool
+        Either ``"thread"`` or ``"process"``. A process pool avoids contention on the GIL but requires the types
+        to be picklable. The stages timed in the worker processes are sent back with the results, so they are still
+        added to the trace of the request and to the ``/metrics``.
+    compute_workers
+        Number of threads used to run the component methods. When the component batches concurrent requests (e.g.
+        ``Task.serve(max_batch_size=...)``) this should be at least the maximum batch size.
+    max_pending
+        Maximum number of requests in flight. ``None`` disables admission control.
+    """
+
+    def __init__(
+        self,
+        io_workers: int = 4,
+        io_pool: str = "thread",
+        compute_workers: int = 1,
+        max_pending: Optional[int] = 64,
+    ):
+        if io_pool not in _POOLS:
+            raise ValueError(f"`io_pool` should be one of {_POOLS}. Found {io_pool}.")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError(f"`max_pending` should be a positive integer or None. Found {max_pending}.")
+
+        self.io_workers = io_workers
+        self.io_pool = io_pool
+        self.compute_workers = compute_workers
+        self.max_pending = max_pending
+
+        self.pending = 0
+        self.num_rejected = 0
+        self._io_executor: Optional[Executor] = None
+        self._compute_executor: Optional[Executor] = None
+
+    @property
+    def io_executor(self) -> Executor:
+        if self._io_executor is None:
+            if self.io_pool == "process":
+                self._io_executor = ProcessPoolExecutor(max_workers=self.io_workers)
+            else:
+                self._io_executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="flash-serve-io")
+        return self._io_executor
+
+    @property
+    def compute_executor(self) -> Executor:
+        if self._compute_executor is None:
+            self._compute_executor = ThreadPoolExecutor(
+                max_workers=self.compute_workers, thread_name_prefix="flash-serve-compute"
+            )
+        return self._compute_executor
+
+    def try_acquire(self) -> bool:
+        """Admit a new request unless ``max_pending`` requests are already in flight.
+
+        Only called from the event loop, so no lock is needed.
+        """
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            self.num_rejected += 1
+            return False
+        self.pending += 1
+        return True
+
+    def release(self) -> None:
+        self.pending -= 1
+
+    async def get(self, dsk: dict, out: Sequence[str], cache: dict = None, sortkeys: List[str] = None):
+        """Asynchronous counterpart of :func:`~flash.core.serve.dag.task.get`.
+
+        The arguments of each task are resolved on the event loop (they are cache lookups or inlined cheap functions)
+        and the task itself runs in the executor matching its kind.
+        """
+        for k in flatten(out) if isinstance(out, list) else [out]:
+            if k not in dsk:
+                raise KeyError(f"{k} is not a key in the graph")
+        if cache is None:
+            cache = {}
+        if sortkeys is None:
+            sortkeys = toposort(dsk)
+
+        for key in sortkeys:
+            task = dsk[key]
+            if istask(task):
+                args = [_execute_task(arg, cache) for arg in task[1:]]
+                cache[key] = await self._run_step(is_io_task(task), task[0], args)
+            else:
+                cache[key] = _execute_task(task, cache)
+
+        result = _execute_task(out, cache)
+        if isinstance(out, list):
+            result = lists_to_tuples(result, out)
+        return result
+
+    async def run(self, plan: ExecutionPlan, inputs: Mapping[str, Any]) -> Tuple[Any, ...]:
+        """Run a compiled :class:`~flash.core.serve.dag.plan.ExecutionPlan` (with ``is_io_task`` as the ``kind`` of
+        its steps) for the given ``inputs``.
+
+        Each (fused) step of the plan runs in the executor matching its kind, so the graph isn't walked again for
+        every request.
+        """
+        return await plan.run_async(inputs, self._run_step)
+
+    async def _run_step(self, io: bool, func: Callable, args: Sequence[Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        executor = self.io_executor if io else self.compute_executor
+        if isinstance(executor, ThreadPoolExecutor):
+            # Run in a copy of the context so that the stages are recorded in the trace of the request
+            func = partial(contextvars.copy_context().run, func)
+            return await loop.run_in_executor(executor, partial(func, *args))
+        result, stages = await loop.run_in_executor(executor, partial(_run_traced, func, *args))
+        for stage, duration in stages.items():
+            SERVE_METRICS.observe_stage(stage, duration)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in (self._io_executor, self._compute_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        self._io_executor, self._compute_executor = None, None
@@ -1,5 +1,7 @@
 import inspect
-from typing import Any, Callable, Mapping
+import time
+from itertools import chain
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
 import torch
 from torch import Tensor
@@ -9,6 +11,8 @@ from flash.core.data.data_module import DataModule
 from flash.core.data.io.input import DataKeys
 from flash.core.data.io.output_transform import OutputTransform
 from flash.core.serve import ModelComponent, expose
+from flash.core.serve.batching import MicroBatcher
+from flash.core.serve.metrics import SERVE_METRICS, current_trace
 from flash.core.serve.types.base import BaseType
 from flash.core.trainer import Trainer
 from flash.core.utilities.stages import RunningStage
@@ -25,7 +29,8 @@ class FlashInputs(BaseType):
         return None
 
     def deserialize(self, data: str) -> Any:  # pragma: no cover
-        return self._deserializer(data)
+        with SERVE_METRICS.stage("deserialize"):
+            return self._deserializer(data)
 
 
 class FlashOutputs(BaseType):
@@ -36,6 +41,10 @@ class FlashOutputs(BaseType):
         self._output = output
 
     def serialize(self, outputs) -> Any:  # pragma: no cover
+        with SERVE_METRICS.stage("serialize"):
+            return self._serialize(outputs)
+
+    def _serialize(self, outputs) -> Any:
         results = []
         if isinstance(outputs, (list, Tensor)):
             for output in outputs:
@@ -53,7 +62,9 @@ class FlashOutputs(BaseType):
         return None
 
 
-def build_flash_serve_model_component(model, serve_input, output, transform, transform_kwargs):
+def build_flash_serve_model_component(
+    model, serve_input, output, transform, transform_kwargs, max_batch_size: int = 1, max_wait_ms: float = 5.0
+):
     # TODO: Resolve this hack
     data_module = DataModule(
         predict_input=serve_input,
@@ -75,31 +86,68 @@ def build_flash_serve_model_component(model, serve_input, output, transform, tra
     dataloader = data_module.predict_dataloader()
 
     collate_fn = dataloader.collate_fn
+    input_processor = _ServeInputProcessor(serve_input, collate_fn)
 
     class FlashServeModelComponent(ModelComponent):
         def __init__(self, model):
             self.model = model
             self.model.eval()
             self.serve_input = serve_input
+            self.collate_fn = collate_fn
             self.on_after_batch_transfer = data_module.on_after_batch_transfer
             self.output_transform = getattr(model, "_output_transform", None) or OutputTransform()
             # TODO (@tchaton) Remove this hack
             self.extra_arguments = len(inspect.signature(self.model.transfer_batch_to_device).parameters) == 3
             self.device = self.model.device
+            # Requests are deserialized into (uncollated) lists of samples which are merged across concurrent requests
+            self.batcher = MicroBatcher(
+                self._predict_batch,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                name=f"{type(model).__name__}Batcher",
+            )
+
+        def _predict_batch(self, batch: List[List[Any]]) -> List[Tuple[Any, Dict[str, float]]]:
+            samples = list(chain.from_iterable(batch))
+            SERVE_METRICS.observe_batch_size(len(samples))
+            timings = {}
+
+            def timed(stage: str, fn: Callable, *args) -> Any:
+                start = time.perf_counter()
+                result = fn(*args)
+                timings[stage] = time.perf_counter() - start
+                # The timings are added to the trace of each request of the batch by ``predict``
+                SERVE_METRICS.observe_stage(stage, timings[stage], trace=False)
+                return result
+
+            inputs = timed("collate", self.collate_fn, samples)
+            with torch.no_grad():
+                transfer_args = (inputs, self.device, 0) if self.extra_arguments else (inputs, self.device)
+                inputs = timed("transfer_batch_to_device", self.model.transfer_batch_to_device, *transfer_args)
+                inputs = timed("on_after_batch_transfer", self.on_after_batch_transfer, inputs, 0)
+                preds = timed("predict_step", self.model.predict_step, inputs, 0)
+                preds = timed("output_transform", self.output_transform, preds)
+
+            # Split the predictions back into one list per request, each with the timings of the whole batch
+            results, start = [], 0
+            for request_samples in batch:
+                results.append((preds[start : start + len(request_samples)], timings))
+                start += len(request_samples)
+            return results
 
         @expose(
-            inputs={"inputs": FlashInputs(_ServeInputProcessor(serve_input, collate_fn))},
+            inputs={"inputs": FlashInputs(input_processor.load)},
             outputs={"outputs": FlashOutputs(output)},
         )
         def predict(self, inputs):
-            with torch.no_grad():
-                if self.extra_arguments:
-                    inputs = self.model.transfer_batch_to_device(inputs, self.device, 0)
-                else:
-                    inputs = self.model.transfer_batch_to_device(inputs, self.device)
-                inputs = self.on_after_batch_transfer(inputs, 0)
-                preds = self.model.predict_step(inputs, 0)
-                preds = self.output_transform(preds)
-                return preds
+            start = time.perf_counter()
+            preds, timings = self.batcher(inputs)
+            # The time which isn't spent processing the batch is spent waiting for it to be processed
+            SERVE_METRICS.observe_stage("queue", max(time.perf_counter() - start - sum(timings.values()), 0.0))
+            trace = current_trace()
+            if trace is not None:
+                for stage, duration in timings.items():
+                    trace.add(stage, duration)
+            return preds
 
     return FlashServeModelComponent(model)
@@ -0,0 +1,152 @@
+"""Content negotiation for the compute routes of the flash serve HTTP app.
+
+JSON requests (``Content-Type: application/json``) are handled by the regular FastAPI route with the pydantic request
+model. Any other content type is read here, without going through JSON or base64:
+
+*  a raw body (e.g. ``image/jpeg``, ``application/octet-stream``, ``text/plain``, ``application/x-npy`` or
+   ``application/vnd.apache.arrow.stream``) is given to the only input of the endpoint.
+*  a ``multipart/form-data`` body gives each input with the form field of the same name. Types whose ``deserialize``
+   takes several arguments use fields named ``<input>.<argument>``. Repeated inputs take every field with their name.
+
+Raw bytes are passed as is to ``deserialize``, text is decoded to ``str``, NPY bodies are loaded as NumPy arrays, and
+Arrow IPC streams / files are loaded as pandas ``DataFrame``.
+
+The session can be given with the ``session`` query parameter (or form field). The response is JSON unless the
+``Accept`` header asks for ``application/x-npy``, in which case the result of the (single) output is returned as an
+NPY array with the session in the ``X-Session`` header.
+"""
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _MULTIPART_AVAILABLE, _PYARROW_AVAILABLE
+
+if _FASTAPI_AVAILABLE:
+    from fastapi import HTTPException, Request
+    from fastapi.responses import JSONResponse, Response
+else:
+    HTTPException, Request, JSONResponse, Response = Exception, object, object, object
+
+if _PYARROW_AVAILABLE:
+    import pyarrow as pa
+
+JSON_CONTENT_TYPE = "application/json"
+NPY_CONTENT_TYPE = "application/x-npy"
+MULTIPART_CONTENT_TYPE = "multipart/form-data"
+ARROW_STREAM_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_FILE_CONTENT_TYPE = "application/vnd.apache.arrow.file"
+
+SESSION_HEADER = "X-Session"
+
+
+def media_type(content_type: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """Split a ``Content-Type`` header into the (lower case) media type and its parameters.
+
+    Examples
+    --------
+    >>> media_type("text/plain; charset=latin-1")
+    ('text/plain', {'charset': 'latin-1'})
+    >>> media_type(None)
+    ('application/json', {})
+    """
+    if not content_type:
+        return JSON_CONTENT_TYPE, {}
+    kind, *params = content_type.split(";")
+    parameters = {}
+    for param in params:
+        key, _, value = param.strip().partition("=")
+        parameters[key.lower()] = value.strip('"')
+    return kind.strip().lower(), parameters
+
+
+def is_json(content_type: Optional[str]) -> bool:
+    kind, _ = media_type(content_type)
+    return kind == JSON_CONTENT_TYPE or kind.endswith("+json")
+
+
+def decode_body(body: bytes, content_type: Optional[str]) -> Any:
+    """Decode a raw (non JSON) request body or multipart part according to its content type."""
+    kind, parameters = media_type(content_type)
+    if kind in (ARROW_STREAM_CONTENT_TYPE, ARROW_FILE_CONTENT_TYPE) and not _PYARROW_AVAILABLE:
+        raise HTTPException(status_code=415, detail="Arrow payloads require `pyarrow` to be installed.")
+    try:
+        if kind == NPY_CONTENT_TYPE:
+            return np.load(BytesIO(body), allow_pickle=False)
+        if kind in (ARROW_STREAM_CONTENT_TYPE, ARROW_FILE_CONTENT_TYPE):
+            reader = pa.ipc.open_stream if kind == ARROW_STREAM_CONTENT_TYPE else pa.ipc.open_file
+            return reader(pa.BufferReader(body)).read_pandas()
+        if kind.startswith("text/"):
+            return body.decode(parameters.get("charset", "utf-8"))
+    except (ValueError, OSError, EOFError, LookupError) as e:
+        # Malformed NPY / Arrow bodies and undecodable text are client errors
+        raise HTTPException(status_code=400, detail=f"Invalid `{kind}` body: {e}")
+    return body
+
+
+def _pack(payload_name: str, arg_names: Tuple[str, ...], values: Dict[str, Any]) -> Dict[str, Any]:
+    if len(arg_names) == 1 and payload_name in values:
+        return {arg_names[0]: values[payload_name]}
+    try:
+        return {arg: values[f"{payload_name}.{arg}"] for arg in arg_names}
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Missing field {e} for the input `{payload_name}`.")
+
+
+async def read_payload(
+    request: Request, input_args: Dict[str, Tuple[Tuple[str, ...], bool]]
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Read the payload (mapping of input name -> ``deserialize`` keyword arguments) and the session of a non JSON
+    request."""
+    content_type = request.headers.get("content-type")
+    kind, _ = media_type(content_type)
+    session = request.query_params.get("session")
+
+    if kind == MULTIPART_CONTENT_TYPE:
+        if not _MULTIPART_AVAILABLE:
+            raise HTTPException(status_code=415, detail="Multipart payloads require `python-multipart` installed.")
+        form = await request.form()
+        fields: Dict[str, list] = {}
+        for name, value in form.multi_items():
+            if hasattr(value, "read"):
+                value = decode_body(await value.read(), value.content_type)
+            fields.setdefault(name, []).append(value)
+        session = (fields.pop("session", None) or [session])[0]
+
+        payload = {}
+        for payload_name, (arg_names, repeated) in input_args.items():
+            if repeated:
+                items = fields.get(payload_name, [])
+                payload[payload_name] = [_pack(payload_name, arg_names, {payload_name: item}) for item in items]
+            else:
+                payload[payload_name] = _pack(payload_name, arg_names, {k: v[0] for k, v in fields.items()})
+        return payload, session
+
+    if len(input_args) != 1:
+        raise HTTPException(
+            status_code=415,
+            detail=f"A raw `{kind}` body can only be sent to endpoints with one input. Use `multipart/form-data` or "
+            f"JSON to send the inputs: {list(input_args)}.",
+        )
+    payload_name, (arg_names, repeated) = next(iter(input_args.items()))
+    if len(arg_names) != 1:
+        raise HTTPException(
+            status_code=415,
+            detail=f"The input `{payload_name}` takes several arguments {list(arg_names)} and can't be sent as a raw "
+            "body. Use `multipart/form-data` or JSON.",
+        )
+    value = {arg_names[0]: decode_body(await request.body(), content_type)}
+    return {payload_name: [value] if repeated else value}, session
+
+
+def encode_response(results: Dict[str, Any], session: str, accept: Optional[str]) -> Response:
+    """Build the response for the results of a request, according to its ``Accept`` header."""
+    kinds = {media_type(kind)[0] for kind in (accept or JSON_CONTENT_TYPE).split(",")}
+    if NPY_CONTENT_TYPE in kinds and JSON_CONTENT_TYPE not in kinds:
+        if len(results) != 1:
+            raise HTTPException(status_code=406, detail="NPY responses are only available with a single output.")
+        (result,) = results.values()
+        buffer = BytesIO()
+        np.save(buffer, np.asarray(result), allow_pickle=False)
+        return Response(content=buffer.getvalue(), media_type=NPY_CONTENT_TYPE, headers={SESSION_HEADER: session})
+    return JSONResponse({"result": results, "session": session})
@@ -2,9 +2,9 @@ import base64
 import uuid
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple, Type
 
-from flash.core.serve.dag.task import get
+from flash.core.serve.cache import MISSING, PredictionCache
 from flash.core.serve.dag.visualize import visualize
 from flash.core.serve.execution import (
     ComponentJSON,
@@ -14,7 +14,10 @@ from flash.core.serve.execution import (
     component_dag_content,
     merged_dag_content,
 )
+from flash.core.serve.executor import ServeExecutor
+from flash.core.serve.interfaces.content import encode_response, is_json, read_payload
 from flash.core.serve.interfaces.models import Alive, EndpointProtocol
+from flash.core.serve.metrics import PROMETHEUS_CONTENT_TYPE, SERVE_METRICS
 from flash.core.utilities.imports import _CYTOOLZ_AVAILABLE, _FASTAPI_AVAILABLE
 
 if _CYTOOLZ_AVAILABLE:
@@ -23,11 +26,14 @@ else:
     first = None
 
 if _FASTAPI_AVAILABLE:
-    from fastapi import FastAPI, Request
-    from fastapi.responses import HTMLResponse
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.responses import HTMLResponse, Response
+    from fastapi.routing import APIRoute
     from fastapi.templating import Jinja2Templates
 else:
     FastAPI, Request, HTMLResponse, Jinja2Templates = object, object, object, object
+    HTTPException, Response, APIRoute, run_in_threadpool = Exception, object, object, None
 
 if TYPE_CHECKING:  # pragma: no cover
     from flash.core.serve.component import ModelComponent
@@ -43,19 +49,66 @@ except ImportError:
     ResponseModel = None
 
 
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+def _lookup(cache: Optional[PredictionCache], route: str, payload: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """Return the cache key of the ``payload`` and the cached results (or ``MISSING``)."""
+    if cache is None:
+        return None, MISSING
+    key = cache.key(route, payload)
+    return key, cache.get(key)
+
+
 def _build_endpoint(
     request_model: RequestModel,
     dsk_composition: TaskComposition,
     response_model: ResponseModel,
+    executor: Optional[ServeExecutor] = None,
+    cache: Optional[PredictionCache] = None,
+    route: str = "",
 ) -> Callable[[RequestModel], ResponseModel]:
-    def endpoint_fn(body: request_model):
+    if executor is not None:
+        return _build_async_endpoint(request_model, dsk_composition, response_model, executor, cache, route)
+
+    def endpoint_fn(body: request_model, response: Response):
         session = body.session if body.session else str(uuid.uuid4())
-        _res = get(
-            dsk_composition.dsk,
-            dsk_composition.get_keys,
-            cache=body.payload.dict(),
-            sortkeys=dsk_composition.sortkeys,
-        )
+        with SERVE_METRICS.request(route) as trace:
+            payload = body.payload.dict()
+            key, _res = _lookup(cache, route, payload)
+            if _res is MISSING:
+                _res = dsk_composition.plan(payload)
+                if key is not None:
+                    cache.put(key, _res)
+        response.headers[SERVER_TIMING_HEADER] = trace.server_timing()
+        return {
+            "result": dict(zip(dsk_composition.ep_dsk_output_keys, _res)),
+            "session": session,
+        }
+
+    endpoint_fn.__globals__["request_model"] = request_model
+    endpoint_fn.__globals__["response_model"] = response_model
+    return endpoint_fn
+
+
+def _build_async_endpoint(
+    request_model: RequestModel,
+    dsk_composition: TaskComposition,
+    response_model: ResponseModel,
+    executor: ServeExecutor,
+    cache: Optional[PredictionCache] = None,
+    route: str = "",
+) -> Callable[[RequestModel], ResponseModel]:
+    async def endpoint_fn(body: request_model, response: Response):
+        session = body.session if body.session else str(uuid.uuid4())
+        with SERVE_METRICS.request(route) as trace:
+            payload = body.payload.dict()
+            key, _res = _lookup(cache, route, payload)
+            if _res is MISSING:
+                _res = await _run_with_executor(executor, dsk_composition, payload)
+                if key is not None:
+                    cache.put(key, _res)
+        response.headers[SERVER_TIMING_HEADER] = trace.server_timing()
         return {
             "result": dict(zip(dsk_composition.ep_dsk_output_keys, _res)),
             "session": session,
@@ -66,6 +119,62 @@ def _build_endpoint(
     return endpoint_fn
 
 
+async def _run_with_executor(
+    executor: ServeExecutor, dsk_composition: TaskComposition, payload: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    if not executor.try_acquire():
+        raise HTTPException(status_code=503, detail="Too many requests in flight, try again later.")
+    try:
+        return await executor.run(dsk_composition.plan, payload)
+    finally:
+        executor.release()
+
+
+def _build_binary_endpoint(
+    input_args: Dict[str, Tuple[Tuple[str, ...], bool]],
+    dsk_composition: TaskComposition,
+    executor: Optional[ServeExecutor] = None,
+    cache: Optional[PredictionCache] = None,
+    route: str = "",
+) -> Callable[[Request], Awaitable[Response]]:
+    async def binary_endpoint_fn(request: Request) -> Response:
+        with SERVE_METRICS.request(route) as trace:
+            payload, session = await read_payload(request, input_args)
+            session = session or str(uuid.uuid4())
+            key, _res = _lookup(cache, route, payload)
+            if _res is MISSING:
+                if executor is None:
+                    _res = await run_in_threadpool(dsk_composition.plan, payload)
+                else:
+                    _res = await _run_with_executor(executor, dsk_composition, payload)
+                if key is not None:
+                    cache.put(key, _res)
+            results = dict(zip(dsk_composition.ep_dsk_output_keys, _res))
+            response = encode_response(results, session, request.headers.get("accept"))
+        response.headers[SERVER_TIMING_HEADER] = trace.server_timing()
+        return response
+
+    return binary_endpoint_fn
+
+
+def _build_content_negotiation_route(binary_endpoint: Callable[[Request], Awaitable[Response]]) -> Type[APIRoute]:
+    """Route class which hands JSON requests to the regular FastAPI handler and every other content type (raw
+    binary bodies, multipart uploads, NPY / Arrow tensors) to ``binary_endpoint``."""
+
+    class ContentNegotiationRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+            json_handler = super().get_route_handler()
+
+            async def route_handler(request: Request) -> Response:
+                if is_json(request.headers.get("content-type")):
+                    return await json_handler(request)
+                return await binary_endpoint(request)
+
+            return route_handler
+
+    return ContentNegotiationRoute
+
+
 def _build_meta(Body: RequestModel) -> Callable[[], Dict[str, Any]]:
     def meta() -> Dict[str, Any]:
         nonlocal Body
@@ -81,6 +190,22 @@ def _build_alive_check() -> Callable[[], Alive]:
     return alive
 
 
+def _build_metrics(cache: PredictionCache) -> Callable[[], Dict[str, Any]]:
+    def metrics() -> Dict[str, Any]:
+        return {"cache": cache.stats()}
+
+    return metrics
+
+
+def _build_prometheus_metrics(
+    cache: Optional[PredictionCache] = None, executor: Optional[ServeExecutor] = None
+) -> Callable[[], Response]:
+    def prometheus_metrics() -> Response:
+        return Response(content=SERVE_METRICS.render(cache, executor), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    return prometheus_metrics
+
+
 def _build_visualization(
     dsk_composition: TaskComposition,
     templates: Jinja2Templates,
@@ -118,7 +243,12 @@ def _build_dag_json(
     return dag_json
 
 
-def setup_http_app(composition: "Composition", debug: bool) -> "FastAPI":
+def setup_http_app(
+    composition: "Composition",
+    debug: bool,
+    executor: Optional[ServeExecutor] = None,
+    cache: Optional[PredictionCache] = None,
+) -> "FastAPI":
     from flash import __version__
 
     app = FastAPI(
@@ -126,6 +256,9 @@ def setup_http_app(composition: "Composition", debug: bool) -> "FastAPI":
         version=__version__,
         title="FlashServe",
     )
+    if executor is not None:
+        app.on_event("shutdown")(executor.shutdown)
+
     # Endpoint Route
     #   `/flashserve/alive`
     app.get(
@@ -135,6 +268,26 @@ def setup_http_app(composition: "Composition", debug: bool) -> "FastAPI":
         response_model=Alive,
     )(_build_alive_check())
 
+    # Endpoint Route
+    #   `/metrics`
+    app.get(
+        "/metrics",
+        name="prometheus metrics",
+        summary="Request, stage latency and batch size metrics in the Prometheus text format.",
+        response_class=Response,
+    )(_build_prometheus_metrics(cache, executor))
+
+    if cache is not None:
+        cache.bind(composition)
+
+        # Endpoint Route
+        #   `/flashserve/metrics`
+        app.get(
+            "/flashserve/metrics",
+            name="metrics",
+            summary="Hit / miss counters of the prediction cache.",
+        )(_build_metrics(cache))
+
     _no_optimization_dsk = build_composition(
         endpoint_protocol=first(composition.endpoint_protocols.values()),
         components=composition.components,
@@ -178,14 +331,23 @@ def setup_http_app(composition: "Composition", debug: bool) -> "FastAPI":
 
         # Endpoint Route
         #   `/{proto}
-        app.post(
+        app.router.add_api_route(
             f"{ep_proto.route}",
+            _build_endpoint(RequestModel, dsk, ResponseModel, executor, cache, ep_proto.route),
+            methods=["POST"],
             name=ep_name,
             tags=[ep_name],
             summary="Perform a Compution.",
-            description="Computes results of DAG defined by these components & endpoint.",
+            description=(
+                "Computes results of DAG defined by these components & endpoint. "
+                "Inputs can also be sent as a raw binary body, as multipart/form-data, "
+                "or as NPY / Arrow IPC tensors instead of JSON."
+            ),
             response_model=ResponseModel,
-        )(_build_endpoint(RequestModel, dsk, ResponseModel))
+            route_class_override=_build_content_negotiation_route(
+                _build_binary_endpoint(ep_proto.input_args, dsk, executor, cache, ep_proto.route)
+            ),
+        )
 
         # Endpoint Route:
         #   `/{proto}/meta`
@@ -64,6 +64,16 @@ class EndpointProtocol:
         """Map output key names -> dsk output key names."""
         return self._endpoint.outputs
 
+    @property
+    def input_args(self) -> Dict[str, Tuple[Tuple[str, ...], bool]]:
+        """Map of payload key name -> (names of the ``deserialize`` arguments, whether the input is ``Repeated``)."""
+        input_args = {}
+        for payload_name, component_and_input_key in self._endpoint.inputs.items():
+            component, _, key = component_and_input_key.split(".")
+            datatype = self._component[component].inputs[key].datatype
+            input_args[payload_name] = (tuple(datatype.type_hints["input_args"]), isinstance(datatype, Repeated))
+        return input_args
+
     @property
     def request_model(self) -> RequestModel:
         """Subclass of pydantic ``BaseModel`` specifying HTTP request body schema.
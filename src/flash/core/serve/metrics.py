@@ -0,0 +1,236 @@
+"""Prometheus style metrics and per-request latency tracing of the flash serve HTTP app.
+
+The metrics are kept in a process wide :class:`ServeMetrics` registry (``SERVE_METRICS``) and are served in the
+Prometheus text format on ``/metrics``. Each request also gets a :class:`Trace` (carried in a ``contextvars`` context
+variable) which collects the time spent in each stage and is returned in the ``Server-Timing`` header of the response.
+
+The stages recorded by the flash ``Task`` components are:
+
+*  ``deserialize``: the ``ServeInput`` loading the request payload (``FlashInputs``)
+*  ``queue``: the time waiting for the micro-batch to be processed (``Task.serve(max_batch_size=...)``)
+*  ``collate``, ``transfer_batch_to_device``, ``on_after_batch_transfer``, ``predict_step`` and ``output_transform``
+*  ``serialize``: the ``Output`` formatting the predictions (``FlashOutputs``)
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flash.core.serve.cache import PredictionCache
+    from flash.core.serve.executor import ServeExecutor
+
+# The responses add the ``charset=utf-8`` parameter
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Durations (in seconds) from 100 microseconds to 60 seconds
+DURATION_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+_current_trace: "ContextVar[Optional[Trace]]" = ContextVar("flash_serve_trace", default=None)
+
+
+class Histogram:
+    """A thread safe histogram with fixed (upper inclusive) bucket bounds, as in Prometheus."""
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        """``(le, count)`` pairs of the cumulative bucket counts, ending with the ``+Inf`` bucket."""
+        with self._lock:
+            counts = list(self.counts)
+        result, total = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+class Trace:
+    """Time spent in each stage of a single request."""
+
+    __slots__ = ("stages",)
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, duration: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def server_timing(self) -> str:
+        """Format the trace as a ``Server-Timing`` header (with durations in milliseconds).
+
+        Examples
+        --------
+        >>> trace = Trace()
+        >>> trace.add("predict_step", 0.0125)
+        >>> trace.server_timing()
+        'predict_step;dur=12.500'
+        """
+        return ", ".join(f"{stage};dur={duration * 1000:.3f}" for stage, duration in self.stages.items())
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace of the request being processed, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def tracing(trace: Trace) -> Iterator[Trace]:
+    """Record the stages observed in this context (and the contexts copied from it) into ``trace``."""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+class ServeMetrics:
+    """Registry of the flash serve metrics."""
+
+    def __init__(self):
+        self.request_duration: Dict[str, Histogram] = {}
+        self.requests: Dict[str, int] = {}
+        self.request_errors: Dict[str, int] = {}
+        self.in_flight = 0
+        self.stage_duration: Dict[str, Histogram] = {}
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self._lock = threading.Lock()
+
+    def _histogram(self, histograms: Dict[str, Histogram], name: str) -> Histogram:
+        histogram = histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.setdefault(name, Histogram())
+        return histogram
+
+    def observe_stage(self, stage: str, duration: float, trace: bool = True) -> None:
+        """Record the ``duration`` of a ``stage`` in the histograms and (if ``trace``) in the trace of the current
+        request."""
+        self._histogram(self.stage_duration, stage).observe(duration)
+        current = _current_trace.get() if trace else None
+        if current is not None:
+            current.add(stage, duration)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - start)
+
+    @contextmanager
+    def request(self, route: str) -> Iterator[Trace]:
+        """Count and time a request to ``route``, tracing its stages."""
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            self.in_flight += 1
+        trace = Trace()
+        start = time.perf_counter()
+        try:
+            with tracing(trace):
+                yield trace
+        except Exception:
+            with self._lock:
+                self.request_errors[route] = self.request_errors.get(route, 0) + 1
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            trace.add("total", duration)
+            self._histogram(self.request_duration, route).observe(duration)
+            with self._lock:
+                self.in_flight -= 1
+
+    def observe_batch_size(self, size: int) -> None:
+        self.batch_size.observe(size)
+
+    def render(self, cache: Optional["PredictionCache"] = None, executor: Optional["ServeExecutor"] = None) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_: str) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, value: Histogram, **labels: str) -> None:
+            for le, count in value.cumulative_counts():
+                lines.append(f"{name}_bucket{_labels(**labels, le=le)} {count}")
+            lines.append(f"{name}_sum{_labels(**labels)} {value.sum}")
+            lines.append(f"{name}_count{_labels(**labels)} {value.count}")
+
+        header("flash_serve_requests_total", "counter", "Number of requests to the compute routes.")
+        for route, count in sorted(self.requests.items()):
+            lines.append(f"flash_serve_requests_total{_labels(route=route)} {count}")
+        header("flash_serve_request_errors_total", "counter", "Number of requests which failed.")
+        for route, count in sorted(self.request_errors.items()):
+            lines.append(f"flash_serve_request_errors_total{_labels(route=route)} {count}")
+        header("flash_serve_requests_in_flight", "gauge", "Number of requests being processed.")
+        lines.append(f"flash_serve_requests_in_flight {self.in_flight}")
+
+        header("flash_serve_request_duration_seconds", "histogram", "Latency of the requests.")
+        for route, value in sorted(self.request_duration.items()):
+            histogram("flash_serve_request_duration_seconds", value, route=route)
+        header("flash_serve_stage_duration_seconds", "histogram", "Time spent in each stage of the requests.")
+        for stage, value in sorted(self.stage_duration.items()):
+            histogram("flash_serve_stage_duration_seconds", value, stage=stage)
+        header("flash_serve_batch_size", "histogram", "Number of samples given to each predict_step call.")
+        histogram("flash_serve_batch_size", self.batch_size)
+
+        if cache is not None:
+            stats = cache.stats()
+            for key in ("hits", "misses", "evictions"):
+                header(f"flash_serve_cache_{key}_total", "counter", f"Number of prediction cache {key}.")
+                lines.append(f"flash_serve_cache_{key}_total {stats[key]}")
+            header("flash_serve_cache_size", "gauge", "Number of entries in the prediction cache.")
+            lines.append(f"flash_serve_cache_size {stats['size']}")
+
+        if executor is not None:
+            header("flash_serve_executor_pending", "gauge", "Number of requests admitted by the executor.")
+            lines.append(f"flash_serve_executor_pending {executor.pending}")
+            header("flash_serve_executor_rejected_total", "counter", "Number of requests rejected by the executor.")
+            lines.append(f"flash_serve_executor_rejected_total {executor.num_rejected}")
+
+        return "\n".join(lines) + "\n"
+
+
+SERVE_METRICS = ServeMetrics()
@@ -0,0 +1,325 @@
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import torch
+from torch import nn
+
+from flash.core.serve.core import Servable
+from flash.core.serve.metrics import PROMETHEUS_CONTENT_TYPE
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _UVICORN_AVAILABLE
+
+if _UVICORN_AVAILABLE:
+    import uvicorn
+
+if _FASTAPI_AVAILABLE:
+    from fastapi import FastAPI, Request
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.responses import JSONResponse, Response
+else:
+    FastAPI, Request, JSONResponse, Response, run_in_threadpool = object, object, object, object, None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flash.core.serve.cache import PredictionCache
+    from flash.core.serve.composition import Composition
+    from flash.core.serve.executor import ServeExecutor
+
+# Headers which only apply to a single connection and must not be forwarded
+_HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "content-length",
+    "host",
+}
+
+
+def _add_label(sample: str, label: str) -> str:
+    name, brace, rest = sample.partition("{")
+    if brace:
+        return f"{name}{{{label},{rest}"
+    name, _, value = sample.partition(" ")
+    return f"{name}{{{label}}} {value}"
+
+
+def merge_prometheus_metrics(texts: Sequence[Optional[str]]) -> str:
+    """Merge the Prometheus text metrics of each replica, adding a ``replica`` label to every sample.
+
+    The samples of a metric are kept together (after its ``HELP`` / ``TYPE`` comments), as the format requires. A
+    ``flash_serve_replica_up`` gauge tells which replicas answered (a ``None`` text is a replica which didn't).
+
+    Examples
+    --------
+    >>> text = '# TYPE up gauge\\nup 1\\nup{route="/a"} 2\\n'
+    >>> print(merge_prometheus_metrics([text, None]), end="")
+    # TYPE up gauge
+    up{replica="0"} 1
+    up{replica="0",route="/a"} 2
+    # HELP flash_serve_replica_up Whether the replica answered the metrics request.
+    # TYPE flash_serve_replica_up gauge
+    flash_serve_replica_up{replica="0"} 1
+    flash_serve_replica_up{replica="1"} 0
+    """
+    families: Dict[str, Tuple[List[str], List[str]]] = {}
+    for index, text in enumerate(texts):
+        family = None
+        for line in (text or "").splitlines():
+            if not line.strip():
+                continue
+            if line.startswith("#"):
+                parts = line.split(maxsplit=3)
+                if len(parts) >= 3 and parts[1] in ("HELP", "TYPE"):
+                    family = parts[2]
+                    comments, _ = families.setdefault(family, ([], []))
+                    if line not in comments:
+                        comments.append(line)
+                continue
+            if family is None:
+                family = line.partition("{")[0].partition(" ")[0]
+            families.setdefault(family, ([], []))[1].append(_add_label(line, f'replica="{index}"'))
+
+    lines = []
+    for comments, samples in families.values():
+        lines.extend(comments)
+        lines.extend(samples)
+    lines.append("# HELP flash_serve_replica_up Whether the replica answered the metrics request.")
+    lines.append("# TYPE flash_serve_replica_up gauge")
+    for index, text in enumerate(texts):
+        lines.append(f'flash_serve_replica_up{{replica="{index}"}} {int(text is not None)}')
+    return "\n".join(lines) + "\n"
+
+
+def _iter_models(models: Any) -> Iterable[Any]:
+    if isinstance(models, dict):
+        return models.values()
+    if isinstance(models, (list, tuple)):
+        return models
+    return [models]
+
+
+def share_model_memory(composition: "Composition") -> None:
+    """Move the weights of every model of the ``composition`` to shared memory.
+
+    The tensors are then backed by memory mapped files (in ``/dev/shm``) which every replica process maps, rather than
+    holding one copy of the weights per process.
+    """
+    for component in composition.components.values():
+        for model in _iter_models(component._flashserve_meta_.models):
+            if isinstance(model, Servable):
+                model = model.instance
+            if isinstance(model, nn.Module):
+                model.share_memory()
+
+
+def _bind(host: str) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, 0))
+    sock.listen(128)
+    return sock
+
+
+def _run_replica(
+    composition: "Composition",
+    sock: socket.socket,
+    num_threads: int,
+    executor: Optional["ServeExecutor"],
+    cache: Optional["PredictionCache"],
+) -> None:  # pragma: no cover
+    torch.set_num_threads(num_threads)
+    app = composition.http_app(executor, cache)
+    config = uvicorn.Config(app, log_level="warning")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class ReplicaDispatcher:
+    """Forward requests to the replica with the fewest requests in flight.
+
+    Parameters
+    ----------
+    addresses
+        ``(host, port)`` of each replica.
+    timeout
+        timeout (in seconds) of the requests sent to the replicas.
+    """
+
+    def __init__(self, addresses: List[Tuple[str, int]], timeout: Optional[float] = None):
+        self.addresses = addresses
+        self.timeout = timeout
+        self.in_flight = [0] * len(addresses)
+        self.num_requests = [0] * len(addresses)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def acquire(self) -> int:
+        """Pick the replica with the fewest requests in flight (the shortest queue)."""
+        with self._lock:
+            index = min(range(len(self.in_flight)), key=self.in_flight.__getitem__)
+            self.in_flight[index] += 1
+            self.num_requests[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self.in_flight[index] -= 1
+
+    def _connection(self, index: int, fresh: bool = False) -> http.client.HTTPConnection:
+        # Connections are kept open per thread and replica to avoid a TCP handshake for every request
+        connections: Dict[int, http.client.HTTPConnection] = self._local.__dict__.setdefault("connections", {})
+        if fresh or index not in connections:
+            if index in connections:
+                connections[index].close()
+            host, port = self.addresses[index]
+            connections[index] = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return connections[index]
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection, method: str, url: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        connection.request(method, url, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.getheaders(), response.read()
+
+    def forward(
+        self, index: int, method: str, url: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Send the request to the replica ``index`` and return its status, headers and content."""
+        try:
+            return self._send(self._connection(index), method, url, headers, body)
+        except (http.client.HTTPException, ConnectionError):
+            # The kept-alive connection may have been closed by the replica, retry once with a new one
+            return self._send(self._connection(index, fresh=True), method, url, headers, body)
+
+
+class ReplicaSet:
+    """Run a composition in ``num_replicas`` processes behind a :class:`ReplicaDispatcher`.
+
+    The model weights are moved to shared memory before the replicas are forked from the current process so that
+    every replica serves the same copy of the weights. Each replica gets its own listening socket (on an ephemeral
+    port of ``127.0.0.1``) and ``num_threads`` torch threads (by default, the CPUs are split between the replicas).
+    Each replica has its own in-memory ``cache``, use an on-disk cache to share the entries between the replicas.
+
+    Replicas are forked, so this is only available on platforms which support the ``fork`` start method.
+    """
+
+    def __init__(
+        self,
+        composition: "Composition",
+        num_replicas: int,
+        num_threads: Optional[int] = None,
+        executor: Optional["ServeExecutor"] = None,
+        host: str = "127.0.0.1",
+        cache: Optional["PredictionCache"] = None,
+    ):
+        if num_replicas < 1:
+            raise ValueError(f"`num_replicas` should be a positive integer. Found {num_replicas}.")
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Serving with several replicas requires the `fork` start method.")
+
+        self.composition = composition
+        self.num_replicas = num_replicas
+        self.num_threads = num_threads or max(1, (os.cpu_count() or 1) // num_replicas)
+        self.executor = executor
+        self.host = host
+        self.cache = cache
+        self.processes: List[multiprocessing.Process] = []
+        self.dispatcher: Optional[ReplicaDispatcher] = None
+
+    def start(self) -> ReplicaDispatcher:
+        share_model_memory(self.composition)
+        if self.cache is not None:
+            # Compute the version of the models once rather than in every replica
+            self.cache.bind(self.composition)
+        context = multiprocessing.get_context("fork")
+        addresses = []
+        for _ in range(self.num_replicas):
+            sock = _bind(self.host)
+            process = context.Process(
+                target=_run_replica,
+                args=(self.composition, sock, self.num_threads, self.executor, self.cache),
+                daemon=True,
+            )
+            process.start()
+            # The replica has its own copy of the (listening) socket
+            addresses.append(sock.getsockname()[:2])
+            sock.close()
+            self.processes.append(process)
+        self.dispatcher = ReplicaDispatcher(addresses)
+        return self.dispatcher
+
+    def stop(self, timeout: float = 5.0) -> None:
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join(timeout)
+        self.processes = []
+
+    def http_app(self, debug: bool = False) -> "FastAPI":
+        """Create the front app which forwards every request to the replicas."""
+        from flash import __version__
+
+        dispatcher = self.dispatcher or self.start()
+        app = FastAPI(debug=debug, version=__version__, title="FlashServe")
+        app.on_event("shutdown")(self.stop)
+
+        @app.get("/flashserve/replicas", name="replicas", summary="Requests in flight for each replica.")
+        def replicas() -> Dict[str, List[int]]:
+            return {"in_flight": list(dispatcher.in_flight), "num_requests": list(dispatcher.num_requests)}
+
+        def scrape(path: str) -> List[Optional[Tuple[int, bytes]]]:
+            # The metrics are kept per process, so every replica is asked rather than only one of them
+            results = []
+            for index in range(len(dispatcher.addresses)):
+                try:
+                    status, _, content = dispatcher.forward(index, "GET", path, {}, b"")
+                    results.append((status, content))
+                except (OSError, http.client.HTTPException):
+                    results.append(None)
+            return results
+
+        @app.get("/metrics", name="prometheus metrics", include_in_schema=False)
+        async def prometheus_metrics() -> Response:
+            results = await run_in_threadpool(scrape, "/metrics")
+            texts = [None if r is None or r[0] != 200 else r[1].decode("utf-8") for r in results]
+            return Response(content=merge_prometheus_metrics(texts), media_type=PROMETHEUS_CONTENT_TYPE)
+
+        @app.get("/flashserve/metrics", name="metrics", include_in_schema=False)
+        async def metrics() -> Response:
+            results = await run_in_threadpool(scrape, "/flashserve/metrics")
+            replicas = [None if r is None or r[0] != 200 else json.loads(r[1])["cache"] for r in results]
+            if all(stats is None for stats in replicas):
+                return JSONResponse({"detail": "Not Found"}, status_code=404)
+            answered = [stats for stats in replicas if stats is not None]
+            total = {key: sum(stats[key] for stats in answered) for key in ("hits", "misses", "evictions", "size")}
+            lookups = total["hits"] + total["misses"]
+            total["hit_rate"] = total["hits"] / lookups if lookups else 0.0
+            return JSONResponse({"cache": total, "replicas": replicas})
+
+        async def proxy(request: Request) -> Response:
+            url = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+            headers = {k: v for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS}
+            body = await request.body()
+            index = dispatcher.acquire()
+            try:
+                status, response_headers, content = await run_in_threadpool(
+                    dispatcher.forward, index, request.method, url, headers, body
+                )
+            finally:
+                dispatcher.release(index)
+            response_headers = {k: v for k, v in response_headers if k.lower() not in _HOP_BY_HOP_HEADERS}
+            return Response(content=content, status_code=status, headers=response_headers)
+
+        app.add_api_route(
+            "/{path:path}", proxy, methods=["GET", "POST", "PUT", "DELETE", "PATCH"], include_in_schema=False
+        )
+        return app
@@ -1,6 +1,10 @@
 import os
+from typing import Optional
 
+from flash.core.serve.cache import PredictionCache
+from flash.core.serve.executor import ServeExecutor
 from flash.core.serve.interfaces.http import setup_http_app
+from flash.core.serve.replicas import ReplicaSet
 from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _UVICORN_AVAILABLE
 
 if _UVICORN_AVAILABLE:
@@ -25,10 +29,19 @@ class ServerMixin:
     DEBUG: bool
     TESTING: bool
 
-    def http_app(self) -> "FastAPI":
-        return setup_http_app(composition=self, debug=self.DEBUG)
+    def http_app(
+        self, executor: Optional[ServeExecutor] = None, cache: Optional[PredictionCache] = None
+    ) -> "FastAPI":
+        return setup_http_app(composition=self, debug=self.DEBUG, executor=executor, cache=cache)
 
-    def serve(self, host: str = "127.0.0.1", port: int = 8000):
+    def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
+    ):
         """Start a server to serve a composition.
 
         Parameters
@@ -37,11 +50,34 @@ class ServerMixin:
             host address to run the server on
         port
             port number to expose the running server on
+        executor
+            optional ``ServeExecutor``. If given, requests are served asynchronously with
+            the task graph running in its worker pools and admission control applied.
+            By default, each request runs synchronously in its own thread.
+        num_replicas
+            number of processes to serve the composition with. With more than
+            one replica, the models are moved to shared memory, the replicas
+            are forked, and requests are dispatched to the replica with the
+            fewest requests in flight. By default, 1.
+        cache
+            optional ``PredictionCache``. If given, the results of the compute
+            routes are cached, keyed on the payload and the version of the
+            models, and the cache counters are served on ``/flashserve/metrics``.
         """
         if FLASH_DISABLE_SERVE:
             return None
 
+        if num_replicas > 1:
+            replicas = ReplicaSet(self, num_replicas, executor=executor, cache=cache)
+            app = replicas.http_app(debug=self.DEBUG)
+            if not self.TESTING:  # pragma: no cover
+                try:
+                    uvicorn.run(app, host=host, port=port)
+                finally:
+                    replicas.stop()
+            return app
+
         if not self.TESTING:  # pragma: no cover
-            app = self.http_app()
+            app = self.http_app(executor, cache)
             uvicorn.run(app, host=host, port=port)
-        return self.http_app()
+        return self.http_app(executor, cache)
@@ -49,10 +49,16 @@ class Image(BaseType):
     channel_first: bool = False
 
     def deserialize(self, data: str) -> Tensor:
-        encoded_with_padding = (data + "===").encode("ascii")
-        img = base64.b64decode(encoded_with_padding)
-        buffer = BytesIO(img)
-        img = PILImage.open(buffer, mode="r")
+        """Decode a base64 encoded image. Raw image bytes and (``H x W x C``) NumPy arrays, which are sent
+        with binary payloads, are also accepted."""
+        if isinstance(data, np.ndarray):
+            if not (self.height and self.width):
+                return torch.from_numpy(data).unsqueeze(0)
+            img = PILImage.fromarray(data)
+        else:
+            if isinstance(data, str):
+                data = base64.b64decode((data + "===").encode("ascii"))
+            img = PILImage.open(BytesIO(data), mode="r")
         if self.height and self.width:
             img = img.resize((self.width, self.height))
         arr = np.array(img)
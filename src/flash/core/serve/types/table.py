@@ -63,7 +63,14 @@ class Table(BaseType):
         return df.to_dict()
 
     def deserialize(self, features: Dict[Union[int, str], Dict[int, Any]]):
-        df = pd.DataFrame.from_dict(features)
+        """Build the table from a dict of columns. A ``DataFrame`` (from an Arrow payload) or a 2D NumPy array (from an
+        NPY payload, with the columns in the order of ``column_names``) are also accepted."""
+        if isinstance(features, pd.DataFrame):
+            df = features
+        elif isinstance(features, np.ndarray):
+            df = pd.DataFrame(features, columns=self.column_names)
+        else:
+            df = pd.DataFrame.from_dict(features)
         if len(self.column_names) != len(df.columns) or not np.all(df.columns == self.column_names):
             raise RuntimeError(
                 f"Failed to validate column names. \nExpected: " f"{self.column_names}\nReceived: {list(df.columns)}"
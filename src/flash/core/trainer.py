@@ -28,7 +28,8 @@ from torch.utils.data import DataLoader
 import flash
 from flash.core.data.io.output import Output
 from flash.core.data.io.output_transform import OutputTransform
-from flash.core.data.io.transform_predictions import TransformPredictions
+from flash.core.data.io.prediction_sink import PredictionSink
+from flash.core.data.io.transform_predictions import TransformPredictions, WritePredictions
 from flash.core.model import Task
 from flash.core.registry import FlashRegistry
 
@@ -162,6 +163,7 @@ class Trainer(PlTrainer):
         model: Optional[LightningModule] = None,
         dataloaders: Optional[Union[DataLoader, LightningDataModule]] = None,
         output: Union[Output, str] = None,
+        sink: Optional[PredictionSink] = None,
         **kwargs,
     ):
         r"""Run inference on your data.
@@ -174,10 +176,14 @@ class Trainer(PlTrainer):
             dataloaders: A :class:`torch.utils.data.DataLoader` or a sequence of them,
                 or a :class:`~pytorch_lightning.core.datamodule.LightningDataModule` specifying prediction samples.
             output: The :class:`~flash.core.data.io.output.Output` to use to transform predict outputs.
+            sink: An optional :class:`~flash.core.data.io.prediction_sink.PredictionSink` to write the predictions of
+                each batch to as they are produced, rather than returning them (so that the memory used doesn't grow
+                with the number of predictions). Each process writes its own files.
             kwargs: Additional keyword arguments to pass to :meth:`~pytorch_lightning.Trainer.predict`.
 
         Returns:
             Returns a list of dictionaries, one for each provided dataloader containing their respective predictions.
+            If a ``sink`` is given, the list of the files written by this process is returned instead.
         """
         # Note: Prediction on TPU device with multi cores is not supported yet
         if isinstance(self.accelerator, TPUAccelerator) and self.num_devices > 1:
@@ -191,13 +197,20 @@ class Trainer(PlTrainer):
         if isinstance(output, str) and isinstance(model, Task):
             output = getattr(model, "outputs", FlashRegistry("outputs")).get(output).from_task(model)
 
+        callbacks = [TransformPredictions(output_transform, output)]
+        if sink is not None:
+            callbacks.append(WritePredictions(sink))
+            kwargs["return_predictions"] = False
+
         old_callbacks = self.callbacks
-        self.callbacks = self._merge_callbacks(self.callbacks, [TransformPredictions(output_transform, output)])
+        self.callbacks = self._merge_callbacks(self.callbacks, callbacks)
 
         result = super().predict(model, dataloaders, **kwargs)
 
         self.callbacks = old_callbacks
 
+        if sink is not None:
+            return callbacks[1].files
         return result
 
     def _resolve_callbacks(
@@ -14,122 +14,258 @@
 import functools
 import importlib
 import operator
+import sys
 import types
-from typing import List, Tuple, Union
-
-from lightning_utilities.core.imports import compare_version, module_available
-from pkg_resources import DistributionNotFound
-
-try:
-    from packaging.version import Version
-except (ModuleNotFoundError, DistributionNotFound):
-    Version = None
-
-
-_TORCH_AVAILABLE = module_available("torch")
-_PL_AVAILABLE = module_available("pytorch_lightning")
-_BOLTS_AVAILABLE = module_available("pl_bolts") and compare_version("torch", operator.lt, "1.9.0")
-_PANDAS_AVAILABLE = module_available("pandas")
-_SKLEARN_AVAILABLE = module_available("sklearn")
-_PYTORCHTABULAR_AVAILABLE = module_available("pytorch_tabular")
-_FORECASTING_AVAILABLE = module_available("pytorch_forecasting")
-_KORNIA_AVAILABLE = module_available("kornia")
-_COCO_AVAILABLE = module_available("pycocotools")
-_TIMM_AVAILABLE = module_available("timm")
-_TORCHVISION_AVAILABLE = module_available("torchvision")
-_PYTORCHVIDEO_AVAILABLE = module_available("pytorchvideo")
-_MATPLOTLIB_AVAILABLE = module_available("matplotlib")
-_TRANSFORMERS_AVAILABLE = module_available("transformers")
-_PYSTICHE_AVAILABLE = module_available("pystiche")
-_FIFTYONE_AVAILABLE = module_available("fiftyone")
-_FASTAPI_AVAILABLE = module_available("fastapi")
-_PYDANTIC_AVAILABLE = module_available("pydantic")
-_GRAPHVIZ_AVAILABLE = module_available("graphviz")
-_CYTOOLZ_AVAILABLE = module_available("cytoolz")
-_UVICORN_AVAILABLE = module_available("uvicorn")
-_PIL_AVAILABLE = module_available("PIL")
-_OPEN3D_AVAILABLE = module_available("open3d")
-_SEGMENTATION_MODELS_AVAILABLE = module_available("segmentation_models_pytorch")
-_FASTFACE_AVAILABLE = module_available("fastface") and compare_version("pytorch_lightning", operator.lt, "1.5.0")
-_LIBROSA_AVAILABLE = module_available("librosa")
-_TORCH_SCATTER_AVAILABLE = module_available("torch_scatter")
-_TORCH_SPARSE_AVAILABLE = module_available("torch_sparse")
-_TORCH_GEOMETRIC_AVAILABLE = module_available("torch_geometric")
-_NETWORKX_AVAILABLE = module_available("networkx")
-_TORCHAUDIO_AVAILABLE = module_available("torchaudio")
-_SENTENCEPIECE_AVAILABLE = module_available("sentencepiece")
-_DATASETS_AVAILABLE = module_available("datasets")
-_TM_TEXT_AVAILABLE: bool = module_available("torchmetrics.text")
-_ICEVISION_AVAILABLE = module_available("icevision")
-_ICEDATA_AVAILABLE = module_available("icedata")
-_LEARN2LEARN_AVAILABLE = module_available("learn2learn") and compare_version("learn2learn", operator.ge, "0.1.6")
-_TORCH_ORT_AVAILABLE = module_available("torch_ort")
-_VISSL_AVAILABLE = module_available("vissl") and module_available("classy_vision")
-_ALBUMENTATIONS_AVAILABLE = module_available("albumentations")
-_BAAL_AVAILABLE = module_available("baal")
-_TORCH_OPTIMIZER_AVAILABLE = module_available("torch_optimizer")
-_SENTENCE_TRANSFORMERS_AVAILABLE = module_available("sentence_transformers")
-_DEEPSPEED_AVAILABLE = module_available("deepspeed")
-_EFFDET_AVAILABLE = module_available("effdet")
-
-
-if _PIL_AVAILABLE:
-    from PIL import Image  # noqa: F401
-else:
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
+
+
+def module_available(module_path: str) -> bool:
+    """Returns whether the module can be imported (it is imported to check), see
+    :func:`lightning_utilities.core.imports.module_available`."""
+    from lightning_utilities.core.imports import module_available
+
+    return module_available(module_path)
+
+
+def compare_version(package: str, op: Callable, version: str) -> bool:
+    """Compares the version of the package (which is imported) with the given version, see
+    :func:`lightning_utilities.core.imports.compare_version`."""
+    from lightning_utilities.core.imports import compare_version
+
+    return compare_version(package, op, version)
+
+
+# The optional dependencies are only probed when their flag is first accessed (through the module ``__getattr__``,
+# see PEP 562) rather than when Flash is imported, as probing a module imports it. The annotations below only declare
+# the flags for type checkers, they don't define them.
+_MODULE_FLAGS: Dict[str, str] = {
+    "_PL_AVAILABLE": "pytorch_lightning",
+    "_PANDAS_AVAILABLE": "pandas",
+    "_PYARROW_AVAILABLE": "pyarrow",
+    "_SKLEARN_AVAILABLE": "sklearn",
+    "_PYTORCHTABULAR_AVAILABLE": "pytorch_tabular",
+    "_FORECASTING_AVAILABLE": "pytorch_forecasting",
+    "_KORNIA_AVAILABLE": "kornia",
+    "_COCO_AVAILABLE": "pycocotools",
+    "_TIMM_AVAILABLE": "timm",
+    "_TORCHVISION_AVAILABLE": "torchvision",
+    "_PYTORCHVIDEO_AVAILABLE": "pytorchvideo",
+    "_MATPLOTLIB_AVAILABLE": "matplotlib",
+    "_TRANSFORMERS_AVAILABLE": "transformers",
+    "_PYSTICHE_AVAILABLE": "pystiche",
+    "_FIFTYONE_AVAILABLE": "fiftyone",
+    "_FASTAPI_AVAILABLE": "fastapi",
+    "_PYDANTIC_AVAILABLE": "pydantic",
+    "_GRAPHVIZ_AVAILABLE": "graphviz",
+    "_CYTOOLZ_AVAILABLE": "cytoolz",
+    "_UVICORN_AVAILABLE": "uvicorn",
+    "_MULTIPART_AVAILABLE": "multipart",
+    "_PIL_AVAILABLE": "PIL",
+    "_OPEN3D_AVAILABLE": "open3d",
+    "_SEGMENTATION_MODELS_AVAILABLE": "segmentation_models_pytorch",
+    "_LIBROSA_AVAILABLE": "librosa",
+    "_TORCH_SCATTER_AVAILABLE": "torch_scatter",
+    "_TORCH_SPARSE_AVAILABLE": "torch_sparse",
+    "_TORCH_GEOMETRIC_AVAILABLE": "torch_geometric",
+    "_NETWORKX_AVAILABLE": "networkx",
+    "_TORCHAUDIO_AVAILABLE": "torchaudio",
+    "_SENTENCEPIECE_AVAILABLE": "sentencepiece",
+    "_DATASETS_AVAILABLE": "datasets",
+    "_TM_TEXT_AVAILABLE": "torchmetrics.text",
+    "_ICEVISION_AVAILABLE": "icevision",
+    "_ICEDATA_AVAILABLE": "icedata",
+    "_TORCH_ORT_AVAILABLE": "torch_ort",
+    "_ALBUMENTATIONS_AVAILABLE": "albumentations",
+    "_BAAL_AVAILABLE": "baal",
+    "_TORCH_OPTIMIZER_AVAILABLE": "torch_optimizer",
+    "_SENTENCE_TRANSFORMERS_AVAILABLE": "sentence_transformers",
+    "_DEEPSPEED_AVAILABLE": "deepspeed",
+    "_EFFDET_AVAILABLE": "effdet",
+    "_FAISS_AVAILABLE": "faiss",
+}
+
+_TOPIC_FLAGS: Dict[str, List[str]] = {
+    "_TOPIC_TEXT_AVAILABLE": [
+        "_TRANSFORMERS_AVAILABLE",
+        "_SENTENCEPIECE_AVAILABLE",
+        "_DATASETS_AVAILABLE",
+        "_TM_TEXT_AVAILABLE",
+        "_SENTENCE_TRANSFORMERS_AVAILABLE",
+    ],
+    "_TOPIC_TABULAR_AVAILABLE": ["_PANDAS_AVAILABLE", "_FORECASTING_AVAILABLE", "_PYTORCHTABULAR_AVAILABLE"],
+    "_TOPIC_VIDEO_AVAILABLE": [
+        "_TORCHVISION_AVAILABLE",
+        "_PIL_AVAILABLE",
+        "_PYTORCHVIDEO_AVAILABLE",
+        "_KORNIA_AVAILABLE",
+    ],
+    "_TOPIC_IMAGE_AVAILABLE": [
+        "_TORCHVISION_AVAILABLE",
+        "_TIMM_AVAILABLE",
+        "_PIL_AVAILABLE",
+        "_ALBUMENTATIONS_AVAILABLE",
+        "_PYSTICHE_AVAILABLE",
+    ],
+    "_TOPIC_SERVE_AVAILABLE": ["_FASTAPI_AVAILABLE", "_PYDANTIC_AVAILABLE", "_CYTOOLZ_AVAILABLE", "_UVICORN_AVAILABLE"],
+    "_TOPIC_POINTCLOUD_AVAILABLE": ["_OPEN3D_AVAILABLE", "_TORCHVISION_AVAILABLE"],
+    "_TOPIC_AUDIO_AVAILABLE": [
+        "_TORCHAUDIO_AVAILABLE",
+        "_TORCHVISION_AVAILABLE",
+        "_LIBROSA_AVAILABLE",
+        "_TRANSFORMERS_AVAILABLE",
+    ],
+    "_TOPIC_GRAPH_AVAILABLE": [
+        "_TORCH_SCATTER_AVAILABLE",
+        "_TORCH_SPARSE_AVAILABLE",
+        "_TORCH_GEOMETRIC_AVAILABLE",
+        "_NETWORKX_AVAILABLE",
+    ],
+    "_TOPIC_CORE_AVAILABLE": ["_TOPIC_IMAGE_AVAILABLE", "_TOPIC_TABULAR_AVAILABLE", "_TOPIC_TEXT_AVAILABLE"],
+}
+
+_EXTRAS_FLAGS: Dict[str, str] = {
+    "image": "_TOPIC_IMAGE_AVAILABLE",
+    "tabular": "_TOPIC_TABULAR_AVAILABLE",
+    "text": "_TOPIC_TEXT_AVAILABLE",
+    "video": "_TOPIC_VIDEO_AVAILABLE",
+    "pointcloud": "_TOPIC_POINTCLOUD_AVAILABLE",
+    "serve": "_TOPIC_SERVE_AVAILABLE",
+    "audio": "_TOPIC_AUDIO_AVAILABLE",
+    "graph": "_TOPIC_GRAPH_AVAILABLE",
+}
+
+
+def _pil_image() -> Any:
+    if _flag("_PIL_AVAILABLE"):
+        from PIL import Image
+
+        return Image
 
     class Image:
         Image = object
 
-
-if Version:
-    _TORCHVISION_GREATER_EQUAL_0_9 = compare_version("torchvision", operator.ge, "0.9.0")
-    _PL_GREATER_EQUAL_1_8_0 = compare_version("pytorch_lightning", operator.ge, "1.8.0")
-    _PANDAS_GREATER_EQUAL_1_3_0 = compare_version("pandas", operator.ge, "1.3.0")
-    _ICEVISION_GREATER_EQUAL_0_11_0 = compare_version("icevision", operator.ge, "0.11.0")
-    _TM_GREATER_EQUAL_0_10_0 = compare_version("torchmetrics", operator.ge, "0.10.0")
-    _BAAL_GREATER_EQUAL_1_5_2 = compare_version("baal", operator.ge, "1.5.2")
-
-_TOPIC_TEXT_AVAILABLE = all(
-    [
-        _TRANSFORMERS_AVAILABLE,
-        _SENTENCEPIECE_AVAILABLE,
-        _DATASETS_AVAILABLE,
-        _TM_TEXT_AVAILABLE,
-        _SENTENCE_TRANSFORMERS_AVAILABLE,
-    ]
-)
-_TOPIC_TABULAR_AVAILABLE = all([_PANDAS_AVAILABLE, _FORECASTING_AVAILABLE, _PYTORCHTABULAR_AVAILABLE])
-_TOPIC_VIDEO_AVAILABLE = all([_TORCHVISION_AVAILABLE, _PIL_AVAILABLE, _PYTORCHVIDEO_AVAILABLE, _KORNIA_AVAILABLE])
-_TOPIC_IMAGE_AVAILABLE = all(
-    [
-        _TORCHVISION_AVAILABLE,
-        _TIMM_AVAILABLE,
-        _PIL_AVAILABLE,
-        _ALBUMENTATIONS_AVAILABLE,
-        _PYSTICHE_AVAILABLE,
-    ]
-)
-_TOPIC_SERVE_AVAILABLE = all([_FASTAPI_AVAILABLE, _PYDANTIC_AVAILABLE, _CYTOOLZ_AVAILABLE, _UVICORN_AVAILABLE])
-_TOPIC_POINTCLOUD_AVAILABLE = all([_OPEN3D_AVAILABLE, _TORCHVISION_AVAILABLE])
-_TOPIC_AUDIO_AVAILABLE = all(
-    [_TORCHAUDIO_AVAILABLE, _TORCHVISION_AVAILABLE, _LIBROSA_AVAILABLE, _TRANSFORMERS_AVAILABLE]
-)
-_TOPIC_GRAPH_AVAILABLE = all(
-    [_TORCH_SCATTER_AVAILABLE, _TORCH_SPARSE_AVAILABLE, _TORCH_GEOMETRIC_AVAILABLE, _NETWORKX_AVAILABLE]
-)
-_TOPIC_CORE_AVAILABLE = _TOPIC_IMAGE_AVAILABLE and _TOPIC_TABULAR_AVAILABLE and _TOPIC_TEXT_AVAILABLE
-
-_EXTRAS_AVAILABLE = {
-    "image": _TOPIC_IMAGE_AVAILABLE,
-    "tabular": _TOPIC_TABULAR_AVAILABLE,
-    "text": _TOPIC_TEXT_AVAILABLE,
-    "video": _TOPIC_VIDEO_AVAILABLE,
-    "pointcloud": _TOPIC_POINTCLOUD_AVAILABLE,
-    "serve": _TOPIC_SERVE_AVAILABLE,
-    "audio": _TOPIC_AUDIO_AVAILABLE,
-    "graph": _TOPIC_GRAPH_AVAILABLE,
+    return Image
+
+
+_PROBES: Dict[str, Callable[[], Any]] = {
+    # PyTorch is only looked up (not imported) so that ``import flash`` stays fast
+    "_TORCH_AVAILABLE": lambda: find_spec("torch") is not None,
+    "_BOLTS_AVAILABLE": lambda: module_available("pl_bolts") and compare_version("torch", operator.lt, "1.9.0"),
+    "_FASTFACE_AVAILABLE": lambda: (
+        module_available("fastface") and compare_version("pytorch_lightning", operator.lt, "1.5.0")
+    ),
+    "_LEARN2LEARN_AVAILABLE": lambda: (
+        module_available("learn2learn") and compare_version("learn2learn", operator.ge, "0.1.6")
+    ),
+    "_VISSL_AVAILABLE": lambda: module_available("vissl") and module_available("classy_vision"),
+    "_TORCHVISION_GREATER_EQUAL_0_9": lambda: compare_version("torchvision", operator.ge, "0.9.0"),
+    "_PL_GREATER_EQUAL_1_8_0": lambda: compare_version("pytorch_lightning", operator.ge, "1.8.0"),
+    "_PANDAS_GREATER_EQUAL_1_3_0": lambda: compare_version("pandas", operator.ge, "1.3.0"),
+    "_ICEVISION_GREATER_EQUAL_0_11_0": lambda: compare_version("icevision", operator.ge, "0.11.0"),
+    "_TM_GREATER_EQUAL_0_10_0": lambda: compare_version("torchmetrics", operator.ge, "0.10.0"),
+    "_BAAL_GREATER_EQUAL_1_5_2": lambda: compare_version("baal", operator.ge, "1.5.2"),
+    "_EXTRAS_AVAILABLE": lambda: {extra: _flag(flag) for extra, flag in _EXTRAS_FLAGS.items()},
+    "Image": _pil_image,
 }
 
+if TYPE_CHECKING:
+    from PIL import Image  # noqa: F401
+
+_TORCH_AVAILABLE: bool
+_PL_AVAILABLE: bool
+_BOLTS_AVAILABLE: bool
+_PANDAS_AVAILABLE: bool
+_PYARROW_AVAILABLE: bool
+_SKLEARN_AVAILABLE: bool
+_PYTORCHTABULAR_AVAILABLE: bool
+_FORECASTING_AVAILABLE: bool
+_KORNIA_AVAILABLE: bool
+_COCO_AVAILABLE: bool
+_TIMM_AVAILABLE: bool
+_TORCHVISION_AVAILABLE: bool
+_PYTORCHVIDEO_AVAILABLE: bool
+_MATPLOTLIB_AVAILABLE: bool
+_TRANSFORMERS_AVAILABLE: bool
+_PYSTICHE_AVAILABLE: bool
+_FIFTYONE_AVAILABLE: bool
+_FASTAPI_AVAILABLE: bool
+_PYDANTIC_AVAILABLE: bool
+_GRAPHVIZ_AVAILABLE: bool
+_CYTOOLZ_AVAILABLE: bool
+_UVICORN_AVAILABLE: bool
+_MULTIPART_AVAILABLE: bool
+_PIL_AVAILABLE: bool
+_OPEN3D_AVAILABLE: bool
+_SEGMENTATION_MODELS_AVAILABLE: bool
+_FASTFACE_AVAILABLE: bool
+_LIBROSA_AVAILABLE: bool
+_TORCH_SCATTER_AVAILABLE: bool
+_TORCH_SPARSE_AVAILABLE: bool
+_TORCH_GEOMETRIC_AVAILABLE: bool
+_NETWORKX_AVAILABLE: bool
+_TORCHAUDIO_AVAILABLE: bool
+_SENTENCEPIECE_AVAILABLE: bool
+_DATASETS_AVAILABLE: bool
+_TM_TEXT_AVAILABLE: bool
+_ICEVISION_AVAILABLE: bool
+_ICEDATA_AVAILABLE: bool
+_LEARN2LEARN_AVAILABLE: bool
+_TORCH_ORT_AVAILABLE: bool
+_VISSL_AVAILABLE: bool
+_ALBUMENTATIONS_AVAILABLE: bool
+_BAAL_AVAILABLE: bool
+_TORCH_OPTIMIZER_AVAILABLE: bool
+_SENTENCE_TRANSFORMERS_AVAILABLE: bool
+_DEEPSPEED_AVAILABLE: bool
+_EFFDET_AVAILABLE: bool
+_FAISS_AVAILABLE: bool
+
+_TORCHVISION_GREATER_EQUAL_0_9: bool
+_PL_GREATER_EQUAL_1_8_0: bool
+_PANDAS_GREATER_EQUAL_1_3_0: bool
+_ICEVISION_GREATER_EQUAL_0_11_0: bool
+_TM_GREATER_EQUAL_0_10_0: bool
+_BAAL_GREATER_EQUAL_1_5_2: bool
+
+_TOPIC_TEXT_AVAILABLE: bool
+_TOPIC_TABULAR_AVAILABLE: bool
+_TOPIC_VIDEO_AVAILABLE: bool
+_TOPIC_IMAGE_AVAILABLE: bool
+_TOPIC_SERVE_AVAILABLE: bool
+_TOPIC_POINTCLOUD_AVAILABLE: bool
+_TOPIC_AUDIO_AVAILABLE: bool
+_TOPIC_GRAPH_AVAILABLE: bool
+_TOPIC_CORE_AVAILABLE: bool
+
+_EXTRAS_AVAILABLE: Dict[str, bool]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MODULE_FLAGS:
+        value = module_available(_MODULE_FLAGS[name])
+    elif name in _TOPIC_FLAGS:
+        value = all(_flag(flag) for flag in _TOPIC_FLAGS[name])
+    elif name in _PROBES:
+        value = _PROBES[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the value so that the module ``__getattr__`` isn't called again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULE_FLAGS) | set(_TOPIC_FLAGS) | set(_PROBES))
+
+
+def _flag(name: str) -> Any:
+    """Returns the value of a lazily probed flag from within this module (where the module ``__getattr__`` isn't
+    used to resolve global names)."""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
+
 
 def requires(*module_paths: Union[str, Tuple[bool, str]]):
     def decorator(func):
@@ -138,9 +274,9 @@ def requires(*module_paths: Union[str, Tuple[bool, str]]):
         modules = []
         for module_path in module_paths:
             if isinstance(module_path, str):
-                if module_path in _EXTRAS_AVAILABLE:
+                if module_path in _EXTRAS_FLAGS:
                     extras.append(module_path)
-                    if not _EXTRAS_AVAILABLE[module_path]:
+                    if not _flag(_EXTRAS_FLAGS[module_path]):
                         available = False
                 else:
                     modules.append(module_path)
@@ -234,3 +370,39 @@ class LazyModule(types.ModuleType):
         # Update this object's dict so that attribute references are efficient
         # (__getattr__ is only called on lookups that fail)
         self.__dict__.update(module.__dict__)
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns a module ``__getattr__`` and ``__dir__`` (see PEP 562) for a package whose public attributes are only
+    imported from their modules when they are first accessed. Subpackages and submodules of the package can also be
+    accessed as attributes without importing them first.
+
+    Example usage::
+
+        # In ``flash/image/__init__.py``, the image classification modules are imported by the first
+        # ``from flash.image import ImageClassifier`` (other image tasks aren't imported)
+        __getattr__, __dir__ = lazy_attributes(__name__, {"ImageClassifier": "flash.image.classification"})
+
+    Args:
+        package: The fully-qualified name of the package (``__name__``).
+        attributes: A mapping from the name of each attribute to the module it is imported from.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+        elif not name.startswith("__") and find_spec(f"{package}.{name}") is not None:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache the attribute so that the module ``__getattr__`` isn't called again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
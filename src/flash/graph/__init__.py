@@ -1,2 +1,22 @@
-from flash.graph.classification import GraphClassificationData, GraphClassifier  # noqa: F401
-from flash.graph.embedding import GraphEmbedder  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "GraphClassificationData": "flash.graph.classification",
+        "GraphClassifier": "flash.graph.classification",
+        "GraphEmbedder": "flash.graph.embedding",
+    },
+)
+
+__all__ = [
+    "GraphClassificationData",
+    "GraphClassifier",
+    "GraphEmbedder",
+]
+
+if TYPE_CHECKING:
+    from flash.graph.classification import GraphClassificationData, GraphClassifier  # noqa: F401
+    from flash.graph.embedding import GraphEmbedder  # noqa: F401
@@ -1,18 +1,70 @@
-from flash.image.classification import (  # noqa: F401
-    ImageClassificationData,
-    ImageClassificationInputTransform,
-    ImageClassifier,
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ImageClassificationData": "flash.image.classification",
+        "ImageClassificationInputTransform": "flash.image.classification",
+        "ImageClassifier": "flash.image.classification",
+        "IMAGE_CLASSIFIER_BACKBONES": "flash.image.classification.backbones",
+        "ObjectDetectionData": "flash.image.detection.data",
+        "ObjectDetector": "flash.image.detection.model",
+        "ImageEmbedder": "flash.image.embedding",
+        "FaceDetectionData": "flash.image.face_detection",
+        "FaceDetector": "flash.image.face_detection",
+        "InstanceSegmentation": "flash.image.instance_segmentation",
+        "InstanceSegmentationData": "flash.image.instance_segmentation",
+        "KeypointDetectionData": "flash.image.keypoint_detection",
+        "KeypointDetector": "flash.image.keypoint_detection",
+        "SemanticSegmentation": "flash.image.segmentation",
+        "SemanticSegmentationData": "flash.image.segmentation",
+        "SemanticSegmentationInputTransform": "flash.image.segmentation",
+        "StyleTransfer": "flash.image.style_transfer",
+        "StyleTransferData": "flash.image.style_transfer",
+        "StyleTransferInputTransform": "flash.image.style_transfer",
+    },
 )
-from flash.image.classification.backbones import IMAGE_CLASSIFIER_BACKBONES  # noqa: F401
-from flash.image.detection.data import ObjectDetectionData  # noqa: F401
-from flash.image.detection.model import ObjectDetector  # noqa: F401
-from flash.image.embedding import ImageEmbedder  # noqa: F401
-from flash.image.face_detection import FaceDetectionData, FaceDetector  # noqa: F401
-from flash.image.instance_segmentation import InstanceSegmentation, InstanceSegmentationData  # noqa: F401
-from flash.image.keypoint_detection import KeypointDetectionData, KeypointDetector  # noqa: F401
-from flash.image.segmentation import (  # noqa: F401
-    SemanticSegmentation,
-    SemanticSegmentationData,
-    SemanticSegmentationInputTransform,
-)
-from flash.image.style_transfer import StyleTransfer, StyleTransferData, StyleTransferInputTransform  # noqa: F401
+
+__all__ = [
+    "FaceDetectionData",
+    "FaceDetector",
+    "IMAGE_CLASSIFIER_BACKBONES",
+    "ImageClassificationData",
+    "ImageClassificationInputTransform",
+    "ImageClassifier",
+    "ImageEmbedder",
+    "InstanceSegmentation",
+    "InstanceSegmentationData",
+    "KeypointDetectionData",
+    "KeypointDetector",
+    "ObjectDetectionData",
+    "ObjectDetector",
+    "SemanticSegmentation",
+    "SemanticSegmentationData",
+    "SemanticSegmentationInputTransform",
+    "StyleTransfer",
+    "StyleTransferData",
+    "StyleTransferInputTransform",
+]
+
+if TYPE_CHECKING:
+    from flash.image.classification import (  # noqa: F401
+        ImageClassificationData,
+        ImageClassificationInputTransform,
+        ImageClassifier,
+    )
+    from flash.image.classification.backbones import IMAGE_CLASSIFIER_BACKBONES  # noqa: F401
+    from flash.image.detection.data import ObjectDetectionData  # noqa: F401
+    from flash.image.detection.model import ObjectDetector  # noqa: F401
+    from flash.image.embedding import ImageEmbedder  # noqa: F401
+    from flash.image.face_detection import FaceDetectionData, FaceDetector  # noqa: F401
+    from flash.image.instance_segmentation import InstanceSegmentation, InstanceSegmentationData  # noqa: F401
+    from flash.image.keypoint_detection import KeypointDetectionData, KeypointDetector  # noqa: F401
+    from flash.image.segmentation import (  # noqa: F401
+        SemanticSegmentation,
+        SemanticSegmentationData,
+        SemanticSegmentationInputTransform,
+    )
+    from flash.image.style_transfer import StyleTransfer, StyleTransferData, StyleTransferInputTransform  # noqa: F401
@@ -42,6 +42,7 @@ from flash.image.classification.input import (
     ImageClassificationFolderInput,
     ImageClassificationImageInput,
     ImageClassificationNumpyInput,
+    ImageClassificationRecordsInput,
     ImageClassificationTensorInput,
 )
 from flash.image.classification.input_transform import ImageClassificationInputTransform
@@ -60,6 +61,7 @@ if not _TOPIC_IMAGE_AVAILABLE:
         "ImageClassificationData",
         "ImageClassificationData.from_files",
         "ImageClassificationData.from_folders",
+        "ImageClassificationData.from_records",
         "ImageClassificationData.from_numpy",
         "ImageClassificationData.from_images",
         "ImageClassificationData.from_tensors",
@@ -86,6 +88,8 @@ class ImageClassificationData(DataModule):
         test_targets: Optional[Sequence[Any]] = None,
         predict_files: Optional[Sequence[str]] = None,
         target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
         input_cls: Type[Input] = ImageClassificationFilesInput,
         transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
         transform_kwargs: Optional[Dict] = None,
@@ -111,6 +115,10 @@ class ImageClassificationData(DataModule):
             predict_files: The list of image files to use when predicting.
             target_formatter: Optionally provide a :class:`~flash.core.data.utilities.classification.TargetFormatter` to
                 control how targets are handled. See :ref:`formatting_classification_targets` for more details.
+            decode: Either ``"pil"`` to decode the images to PIL images or ``"tensor"`` to decode them directly to
+                ``uint8`` tensors (with ``torchvision.io`` for JPEG and PNG images), skipping PIL.
+            draft_size: Optionally, the ``(height, width)`` the images will be resized to. JPEG images are then decoded
+                at a reduced scale which is still at least this size.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
             transform_kwargs: Dict of keyword arguments to be provided when instantiating the transforms.
@@ -161,6 +169,8 @@ class ImageClassificationData(DataModule):
         ds_kw = {
             "target_formatter": target_formatter,
         }
+        if decode != "pil" or draft_size is not None:
+            ds_kw.update(decode=decode, draft_size=draft_size)
 
         train_input = input_cls(RunningStage.TRAINING, train_files, train_targets, **ds_kw)
         ds_kw["target_formatter"] = getattr(train_input, "target_formatter", None)
@@ -183,6 +193,8 @@ class ImageClassificationData(DataModule):
         test_folder: Optional[str] = None,
         predict_folder: Optional[str] = None,
         target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
         input_cls: Type[Input] = ImageClassificationFolderInput,
         transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
         transform_kwargs: Optional[Dict] = None,
@@ -226,6 +238,10 @@ class ImageClassificationData(DataModule):
             predict_folder: The folder containing images to use when predicting.
             target_formatter: Optionally provide a :class:`~flash.core.data.utilities.classification.TargetFormatter` to
                 control how targets are handled. See :ref:`formatting_classification_targets` for more details.
+            decode: Either ``"pil"`` to decode the images to PIL images or ``"tensor"`` to decode them directly to
+                ``uint8`` tensors (with ``torchvision.io`` for JPEG and PNG images), skipping PIL.
+            draft_size: Optionally, the ``(height, width)`` the images will be resized to. JPEG images are then decoded
+                at a reduced scale which is still at least this size.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
             transform_kwargs: Dict of keyword arguments to be provided when instantiating the transforms.
@@ -281,6 +297,8 @@ class ImageClassificationData(DataModule):
         ds_kw = {
             "target_formatter": target_formatter,
         }
+        if decode != "pil" or draft_size is not None:
+            ds_kw.update(decode=decode, draft_size=draft_size)
 
         train_input = input_cls(RunningStage.TRAINING, train_folder, **ds_kw)
         ds_kw["target_formatter"] = getattr(train_input, "target_formatter", None)
@@ -295,6 +313,128 @@ class ImageClassificationData(DataModule):
             **data_module_kwargs,
         )
 
+    @classmethod
+    def from_records(
+        cls,
+        train_records: Optional[str] = None,
+        val_records: Optional[str] = None,
+        test_records: Optional[str] = None,
+        predict_records: Optional[str] = None,
+        target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
+        mmap: bool = True,
+        buffer_size: int = 1000,
+        input_cls: Type[Input] = ImageClassificationRecordsInput,
+        transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
+        transform_kwargs: Optional[Dict] = None,
+        **data_module_kwargs: Any,
+    ) -> "ImageClassificationData":
+        """Load the :class:`~flash.image.classification.data.ImageClassificationData` from records directories
+        written with :func:`~flash.image.data.write_image_records`.
+
+        The records pack the image files and their targets into a few large shard files, so that they are read with a
+        handful of large sequential (or memory mapped) reads rather than one open per image, which is much faster on
+        network file systems. The shards are split between the DataLoader workers and DDP processes, so the data sets
+        are iterable: aim for several shards per worker and process so that they all get about the same number of
+        images.
+        The targets can be in any of our
+        :ref:`supported classification target formats <formatting_classification_targets>`.
+        To learn how to customize the transforms applied for each stage, read our
+        :ref:`customizing transforms guide <customizing_transforms>`.
+
+        Args:
+            train_records: The records directory to use when training.
+            val_records: The records directory to use when validating.
+            test_records: The records directory to use when testing.
+            predict_records: The records directory to use when predicting.
+            target_formatter: Optionally provide a :class:`~flash.core.data.utilities.classification.TargetFormatter` to
+                control how targets are handled. See :ref:`formatting_classification_targets` for more details.
+            decode: Either ``"pil"`` to decode the images to PIL images or ``"tensor"`` to decode them directly to
+                ``uint8`` tensors (with ``torchvision.io`` for JPEG and PNG images), skipping PIL.
+            draft_size: Optionally, the ``(height, width)`` the images will be resized to. JPEG images are then decoded
+                at a reduced scale which is still at least this size.
+            mmap: Whether to read local shards through a memory map. Otherwise (and for remote shards), each shard is
+                read sequentially.
+            buffer_size: When training, the images of shards which are read sequentially are shuffled in a buffer of
+                this size.
+            input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
+            transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
+            transform_kwargs: Dict of keyword arguments to be provided when instantiating the transforms.
+            data_module_kwargs: Additional keyword arguments to provide to the
+                :class:`~flash.core.data.data_module.DataModule` constructor.
+
+        Returns:
+            The constructed :class:`~flash.image.classification.data.ImageClassificationData`.
+
+        Examples
+        ________
+
+        .. testsetup::
+
+            >>> from PIL import Image
+            >>> from flash.image.data import write_image_records
+            >>> rand_image = Image.fromarray(np.random.randint(0, 255, (64, 64, 3), dtype="uint8"))
+            >>> _ = [rand_image.save(f"image_{i}.png") for i in range(1, 4)]
+            >>> _ = [rand_image.save(f"predict_image_{i}.png") for i in range(1, 4)]
+            >>> _ = write_image_records(
+            ...     ["image_1.png", "image_2.png", "image_3.png"], "train_records", targets=["cat", "dog", "cat"]
+            ... )
+            >>> _ = write_image_records(
+            ...     ["predict_image_1.png", "predict_image_2.png", "predict_image_3.png"], "predict_records"
+            ... )
+
+        .. doctest::
+
+            >>> from flash import Trainer
+            >>> from flash.image import ImageClassifier, ImageClassificationData
+            >>> datamodule = ImageClassificationData.from_records(
+            ...     train_records="train_records",
+            ...     predict_records="predict_records",
+            ...     transform_kwargs=dict(image_size=(128, 128)),
+            ...     batch_size=2,
+            ... )
+            >>> datamodule.num_classes
+            2
+            >>> datamodule.labels
+            ['cat', 'dog']
+            >>> model = ImageClassifier(backbone="resnet18", num_classes=datamodule.num_classes)
+            >>> trainer = Trainer(fast_dev_run=True)
+            >>> trainer.fit(model, datamodule=datamodule)  # doctest: +ELLIPSIS +NORMALIZE_WHITESPACE
+            Training...
+            >>> trainer.predict(model, datamodule=datamodule)  # doctest: +ELLIPSIS +NORMALIZE_WHITESPACE
+            Predicting...
+
+        .. testcleanup::
+
+            >>> import os
+            >>> import shutil
+            >>> _ = [os.remove(f"image_{i}.png") for i in range(1, 4)]
+            >>> _ = [os.remove(f"predict_image_{i}.png") for i in range(1, 4)]
+            >>> shutil.rmtree("train_records")
+            >>> shutil.rmtree("predict_records")
+        """
+        ds_kw = {
+            "target_formatter": target_formatter,
+            "decode": decode,
+            "draft_size": draft_size,
+            "mmap": mmap,
+            "buffer_size": buffer_size,
+        }
+
+        train_input = input_cls(RunningStage.TRAINING, train_records, **ds_kw)
+        ds_kw["target_formatter"] = getattr(train_input, "target_formatter", None)
+
+        return cls(
+            train_input,
+            input_cls(RunningStage.VALIDATING, val_records, **ds_kw),
+            input_cls(RunningStage.TESTING, test_records, **ds_kw),
+            input_cls(RunningStage.PREDICTING, predict_records, **ds_kw),
+            transform=transform,
+            transform_kwargs=transform_kwargs,
+            **data_module_kwargs,
+        )
+
     @classmethod
     def from_numpy(
         cls,
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -22,6 +22,7 @@ from flash.core.data.utilities.classification import MultiBinaryTargetFormatter,
 from flash.core.data.utilities.data_frame import resolve_files, resolve_targets
 from flash.core.data.utilities.loading import load_data_frame
 from flash.core.data.utilities.paths import PATH_TYPE, filter_valid_files, make_dataset
+from flash.core.data.utilities.records import Records
 from flash.core.data.utilities.samples import to_samples
 from flash.core.integrations.fiftyone.utils import FiftyOneLabelUtilities
 from flash.core.utilities.imports import _FIFTYONE_AVAILABLE, lazy_import, requires
@@ -31,6 +32,7 @@ from flash.image.data import (
     ImageFilesInput,
     ImageInput,
     ImageNumpyInput,
+    ImageRecordsInput,
     ImageTensorInput,
 )
 
@@ -48,9 +50,12 @@ class ImageClassificationFilesInput(ClassificationInputMixin, ImageFilesInput):
         files: List[PATH_TYPE],
         targets: Optional[List[Any]] = None,
         target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
     ) -> List[Dict[str, Any]]:
         if targets is None:
-            return super().load_data(files)
+            return super().load_data(files, decode=decode, draft_size=draft_size)
+        self.set_decoding(decode, draft_size)
         files, targets = filter_valid_files(files, targets, valid_extensions=IMG_EXTENSIONS + NP_EXTENSIONS)
         self.load_target_metadata(targets, target_formatter=target_formatter)
         return to_samples(files, targets)
@@ -63,9 +68,48 @@ class ImageClassificationFilesInput(ClassificationInputMixin, ImageFilesInput):
 
 
 class ImageClassificationFolderInput(ImageClassificationFilesInput):
-    def load_data(self, folder: PATH_TYPE, target_formatter: Optional[TargetFormatter] = None) -> List[Dict[str, Any]]:
+    def load_data(
+        self,
+        folder: PATH_TYPE,
+        target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict[str, Any]]:
         files, targets = make_dataset(folder, extensions=IMG_EXTENSIONS + NP_EXTENSIONS)
-        return super().load_data(files, targets, target_formatter=target_formatter)
+        return super().load_data(
+            files, targets, target_formatter=target_formatter, decode=decode, draft_size=draft_size
+        )
+
+
+class ImageClassificationRecordsInput(ClassificationInputMixin, ImageRecordsInput):
+    def load_data(
+        self,
+        root: PATH_TYPE,
+        target_formatter: Optional[TargetFormatter] = None,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
+        mmap: bool = True,
+        buffer_size: int = 1000,
+    ) -> Records:
+        records = super().load_data(root, decode=decode, draft_size=draft_size, mmap=mmap, buffer_size=buffer_size)
+        if not self.predicting:
+            targets = None
+            if target_formatter is None:
+                # Only the unique targets are needed to infer the target format
+                unique_targets = dict.fromkeys(
+                    tuple(target) if isinstance(target, list) else target
+                    for target in records.targets
+                    if target is not None
+                )
+                targets = [list(target) if isinstance(target, tuple) else target for target in unique_targets] or None
+            self.load_target_metadata(targets, target_formatter=target_formatter)
+        return records
+
+    def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
+        sample = super().load_sample(sample)
+        if DataKeys.TARGET in sample:
+            sample[DataKeys.TARGET] = self.format_target(sample[DataKeys.TARGET])
+        return sample
 
 
 class ImageClassificationFiftyOneInput(ImageClassificationFilesInput):
@@ -94,6 +138,8 @@ class ImageClassificationFiftyOneInput(ImageClassificationFilesInput):
 
 
 class ImageClassificationTensorInput(ClassificationInputMixin, ImageTensorInput):
+    to_pil = False
+
     def load_data(
         self, tensor: Any, targets: Optional[List[Any]] = None, target_formatter: Optional[TargetFormatter] = None
     ) -> List[Dict[str, Any]]:
@@ -109,6 +155,8 @@ class ImageClassificationTensorInput(ClassificationInputMixin, ImageTensorInput)
 
 
 class ImageClassificationNumpyInput(ClassificationInputMixin, ImageNumpyInput):
+    to_pil = False
+
     def load_data(
         self, array: Any, targets: Optional[List[Any]] = None, target_formatter: Optional[TargetFormatter] = None
     ) -> List[Dict[str, Any]]:
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
-from typing import Tuple, Union
+from typing import Any, Callable, Tuple, Union
 
+import numpy as np
 import torch
-from torch import nn
+from torch import Tensor, nn
 
 from flash.core.data.io.input import DataKeys
 from flash.core.data.io.input_transform import InputTransform
@@ -24,6 +25,7 @@ from flash.core.utilities.imports import _ALBUMENTATIONS_AVAILABLE, _TORCHVISION
 
 if _TORCHVISION_AVAILABLE:
     from torchvision import transforms as T
+    from torchvision.transforms.functional import pil_to_tensor
 
 if _ALBUMENTATIONS_AVAILABLE:
     import albumentations
@@ -41,19 +43,49 @@ class AlbumentationsAdapter(nn.Module):
         return torch.from_numpy(self.transform(image=x.numpy())["image"])
 
 
+def image_to_tensor(image: Any) -> Tensor:
+    """Convert a PIL image or a ``(C, H, W)`` array to a ``(C, H, W)`` tensor, keeping its dtype (so ``uint8``
+    images can be resized before being converted to float)."""
+    if isinstance(image, Tensor):
+        return image
+    if isinstance(image, np.ndarray):
+        return torch.from_numpy(image)
+    return pil_to_tensor(image)
+
+
+def batch_random_horizontal_flip(images: Tensor, p: float = 0.5) -> Tensor:
+    """Flip each image of a ``(B, C, H, W)`` batch horizontally with probability ``p``."""
+    flip = torch.rand(images.shape[0], device=images.device) < p
+    return torch.where(flip[:, None, None, None], images.flip(-1), images)
+
+
 @dataclass
 class ImageClassificationInputTransform(InputTransform):
+    """The default transforms for image classification.
+
+    The images (PIL images, ``uint8`` tensors decoded with ``decode="tensor"``, or float tensors / arrays) are resized
+    before being converted to float, then normalized. With ``transforms_on_device=True``, only the resize runs per
+    sample (so ``uint8`` batches are transferred to the device) and the conversion to float, the normalization, and
+    the random horizontal flip (when training) run on the whole batch on device.
+    """
+
     image_size: Tuple[int, int] = (196, 196)
     mean: Union[float, Tuple[float, float, float]] = (0.485, 0.456, 0.406)
     std: Union[float, Tuple[float, float, float]] = (0.229, 0.224, 0.225)
+    transforms_on_device: bool = False
+
+    def _image_transforms(self, train: bool) -> Callable:
+        transforms = [image_to_tensor, T.Resize(self.image_size)]
+        if not self.transforms_on_device:
+            transforms += [T.ConvertImageDtype(torch.float), T.Normalize(self.mean, self.std)]
+            if train:
+                transforms.append(T.RandomHorizontalFlip())
+        return T.Compose(transforms)
 
     def per_sample_transform(self):
         return T.Compose(
             [
-                ApplyToKeys(
-                    DataKeys.INPUT,
-                    T.Compose([T.ToTensor(), T.Resize(self.image_size), T.Normalize(self.mean, self.std)]),
-                ),
+                ApplyToKeys(DataKeys.INPUT, self._image_transforms(train=False)),
                 ApplyToKeys(DataKeys.TARGET, torch.as_tensor),
             ]
         )
@@ -61,17 +93,22 @@ class ImageClassificationInputTransform(InputTransform):
     def train_per_sample_transform(self):
         return T.Compose(
             [
-                ApplyToKeys(
-                    DataKeys.INPUT,
-                    T.Compose(
-                        [
-                            T.ToTensor(),
-                            T.Resize(self.image_size),
-                            T.Normalize(self.mean, self.std),
-                            T.RandomHorizontalFlip(),
-                        ]
-                    ),
-                ),
+                ApplyToKeys(DataKeys.INPUT, self._image_transforms(train=True)),
                 ApplyToKeys(DataKeys.TARGET, torch.as_tensor),
             ]
         )
+
+    def per_batch_transform_on_device(self):
+        if self.transforms_on_device:
+            return ApplyToKeys(
+                DataKeys.INPUT, T.Compose([T.ConvertImageDtype(torch.float), T.Normalize(self.mean, self.std)])
+            )
+
+    def train_per_batch_transform_on_device(self):
+        if self.transforms_on_device:
+            return ApplyToKeys(
+                DataKeys.INPUT,
+                T.Compose(
+                    [T.ConvertImageDtype(torch.float), T.Normalize(self.mean, self.std), batch_random_horizontal_flip]
+                ),
+            )
@@ -20,7 +20,7 @@ from flash.core.classification import ClassificationAdapterTask
 from flash.core.data.io.input import ServeInput
 from flash.core.data.io.output import Output
 from flash.core.registry import FlashRegistry
-from flash.core.serve import Composition
+from flash.core.serve import Composition, PredictionCache, ServeExecutor
 from flash.core.utilities.imports import requires
 from flash.core.utilities.types import (
     INPUT_TRANSFORM_TYPE,
@@ -172,8 +172,26 @@ class ImageClassifier(ClassificationAdapterTask):
         transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(
+            host,
+            port,
+            sanity_check,
+            input_cls,
+            transform,
+            transform_kwargs,
+            output,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=executor,
+            num_replicas=num_replicas,
+            cache=cache,
+        )
 
     def _ci_benchmark_fn(self, history: List[Dict[str, Any]]):
         """This function is used only for debugging usage with CI."""
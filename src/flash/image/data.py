@@ -12,16 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import fsspec
+import numpy as np
 import torch
 
 import flash
-from flash.core.data.io.input import DataKeys, Input, ServeInput
-from flash.core.data.utilities.loading import IMG_EXTENSIONS, NP_EXTENSIONS, load_image
+from flash.core.data.io.input import DataKeys, Input, IterableInput, ServeInput
+from flash.core.data.utilities.loading import (
+    IMG_EXTENSIONS,
+    NP_EXTENSIONS,
+    escape_file_path,
+    load_image,
+    load_image_bytes,
+    load_image_tensor,
+)
 from flash.core.data.utilities.paths import PATH_TYPE, filter_valid_files
+from flash.core.data.utilities.records import Records, RecordWriter
+from flash.core.data.utilities.sampling import epoch_seed
 from flash.core.data.utilities.samples import to_samples
 from flash.core.utilities.imports import _TORCHVISION_AVAILABLE, Image, requires
 
@@ -32,10 +44,13 @@ if _TORCHVISION_AVAILABLE:
 class ImageDeserializer(ServeInput):
     @requires("image")
     def serve_load_sample(self, data: str) -> Dict:
-        encoded_with_padding = (data + "===").encode("ascii")
-        img = base64.b64decode(encoded_with_padding)
-        buffer = BytesIO(img)
-        img = Image.open(buffer, mode="r")
+        # Binary payloads give the raw image bytes or a decoded array instead of a base64 string
+        if isinstance(data, np.ndarray):
+            img = Image.fromarray(data)
+        else:
+            if isinstance(data, str):
+                data = base64.b64decode((data + "===").encode("ascii"))
+            img = Image.open(BytesIO(data), mode="r")
         w, h = img.size
         return {
             DataKeys.INPUT: img,
@@ -50,50 +65,181 @@ class ImageDeserializer(ServeInput):
             return base64.b64encode(f.read()).decode("UTF-8")
 
 
+def _add_image_metadata(sample: Dict[str, Any]) -> Dict[str, Any]:
+    image = sample[DataKeys.INPUT]
+    if isinstance(image, (torch.Tensor, np.ndarray)):
+        h, w = image.shape[-2:]  # C x H x W
+    else:
+        w, h = image.size  # W x H
+    if DataKeys.METADATA not in sample:
+        sample[DataKeys.METADATA] = {}
+    sample[DataKeys.METADATA].update(
+        {
+            "size": (h, w),
+            "height": h,
+            "width": w,
+        }
+    )
+    return sample
+
+
 class ImageInput(Input):
     @requires("image")
     def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
-        w, h = sample[DataKeys.INPUT].size  # W x H
-        if DataKeys.METADATA not in sample:
-            sample[DataKeys.METADATA] = {}
-        sample[DataKeys.METADATA].update(
-            {
-                "size": (h, w),
-                "height": h,
-                "width": w,
-            }
-        )
-        return sample
+        return _add_image_metadata(sample)
 
 
 class ImageFilesInput(ImageInput):
-    def load_data(self, files: List[PATH_TYPE]) -> List[Dict[str, Any]]:
+    """Load images from files.
+
+    By default, the images are decoded to PIL images. With ``decode="tensor"`` they are instead decoded directly to
+    ``uint8`` tensors of shape ``(3, height, width)`` (with ``torchvision.io`` for JPEG and PNG images). When a
+    ``draft_size`` is given, JPEG images are decoded at a reduced scale which is still at least this size.
+    """
+
+    decode: str = "pil"
+    draft_size: Optional[Tuple[int, int]] = None
+
+    def set_decoding(self, decode: str = "pil", draft_size: Optional[Tuple[int, int]] = None) -> None:
+        if decode not in ("pil", "tensor"):
+            raise ValueError(f"`decode` should be either 'pil' or 'tensor'. Found {decode}.")
+        self.decode = decode
+        self.draft_size = draft_size
+
+    def load_data(
+        self, files: List[PATH_TYPE], decode: str = "pil", draft_size: Optional[Tuple[int, int]] = None
+    ) -> List[Dict[str, Any]]:
+        self.set_decoding(decode, draft_size)
         files = filter_valid_files(files, valid_extensions=IMG_EXTENSIONS + NP_EXTENSIONS)
         return to_samples(files)
 
     def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
         filepath = sample[DataKeys.INPUT]
-        sample[DataKeys.INPUT] = load_image(filepath)
+        if self.decode == "tensor":
+            sample[DataKeys.INPUT] = load_image_tensor(filepath, draft_size=self.draft_size)
+        else:
+            sample[DataKeys.INPUT] = load_image(filepath, draft_size=self.draft_size)
         sample = super().load_sample(sample)
         sample[DataKeys.METADATA]["filepath"] = filepath
         return sample
 
 
 class ImageTensorInput(ImageInput):
+    # Set to ``False`` in subclasses whose transforms take ``(C, H, W)`` tensors to skip the conversion to PIL
+    to_pil: bool = True
+
     def load_data(self, tensor: Any) -> List[Dict[str, Any]]:
         return to_samples(tensor)
 
     def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
-        img = to_pil_image(sample[DataKeys.INPUT])
-        sample[DataKeys.INPUT] = img
+        if self.to_pil:
+            sample[DataKeys.INPUT] = to_pil_image(sample[DataKeys.INPUT])
         return super().load_sample(sample)
 
 
 class ImageNumpyInput(ImageInput):
+    # Set to ``False`` in subclasses whose transforms take ``(C, H, W)`` tensors to skip the conversion to PIL
+    to_pil: bool = True
+
     def load_data(self, array: Any) -> List[Dict[str, Any]]:
         return to_samples(array)
 
     def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
-        img = to_pil_image(torch.from_numpy(sample[DataKeys.INPUT]))
-        sample[DataKeys.INPUT] = img
+        img = torch.from_numpy(sample[DataKeys.INPUT])
+        sample[DataKeys.INPUT] = to_pil_image(img) if self.to_pil else img
         return super().load_sample(sample)
+
+
+class ImageRecordsInput(IterableInput):
+    """Stream images from a records directory written with
+    :func:`~flash.image.data.write_image_records` (see :mod:`flash.core.data.utilities.records`).
+
+    The images are split between the DataLoader workers and DDP processes in blocks of the same size (when training,
+    the blocks are padded with images from the start so that every process gets exactly the same number of images).
+    When training, the order of the shards and of the images in each shard is shuffled on every epoch (memory mapped
+    shards are read in a random order, other shards are shuffled in a buffer of ``buffer_size`` images).
+    """
+
+    decode: str = "pil"
+    draft_size: Optional[Tuple[int, int]] = None
+    buffer_size: int = 1000
+
+    def load_data(
+        self,
+        root: PATH_TYPE,
+        decode: str = "pil",
+        draft_size: Optional[Tuple[int, int]] = None,
+        mmap: bool = True,
+        buffer_size: int = 1000,
+    ) -> Records:
+        if decode not in ("pil", "tensor"):
+            raise ValueError(f"`decode` should be either 'pil' or 'tensor'. Found {decode}.")
+        self.decode = decode
+        self.draft_size = draft_size
+        self.buffer_size = buffer_size
+        return Records(root, mmap=mmap)
+
+    def _iter_samples(self) -> Iterator[Dict[str, Any]]:
+        for data, name, target in self.data.iter_records(
+            shuffle=self.training, seed=epoch_seed(), buffer_size=self.buffer_size, pad=self.training
+        ):
+            sample = {DataKeys.INPUT: data, DataKeys.METADATA: {"filepath": name}}
+            if target is not None and not self.predicting:
+                sample[DataKeys.TARGET] = target
+            yield sample
+
+    def __iter__(self):
+        self.data_iter = self._iter_samples()
+        return self
+
+    @requires("image")
+    def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
+        name = sample[DataKeys.METADATA]["filepath"]
+        sample[DataKeys.INPUT] = load_image_bytes(
+            sample[DataKeys.INPUT], name, decode=self.decode, draft_size=self.draft_size
+        )
+        return _add_image_metadata(sample)
+
+
+def write_image_records(
+    files: List[PATH_TYPE],
+    output_dir: PATH_TYPE,
+    targets: Optional[List[Any]] = None,
+    max_shard_size: int = 256 * 2**20,
+    num_threads: int = 8,
+) -> Dict[str, Any]:
+    """Pack image (or ``.npy``) files and their targets into a records directory which can be loaded with the
+    :class:`~flash.image.data.ImageRecordsInput` (e.g. through ``ImageClassificationData.from_records``).
+
+    The files are stored as they are (they aren't decoded or re-encoded) in shards of about ``max_shard_size`` bytes,
+    so that they can then be read with a few large sequential reads instead of one open per file.
+
+    Args:
+        files: The image files to pack.
+        output_dir: The directory to write the records to.
+        targets: Optionally, the (JSON serializable) target of each file.
+        max_shard_size: The size (in bytes) after which a new shard is started.
+        num_threads: The number of threads used to read the files.
+
+    Returns:
+        The index of the records.
+    """
+    if targets is None:
+        files = filter_valid_files(files, valid_extensions=IMG_EXTENSIONS + NP_EXTENSIONS)
+        targets = [None] * len(files)
+    else:
+        files, targets = filter_valid_files(files, targets, valid_extensions=IMG_EXTENSIONS + NP_EXTENSIONS)
+
+    def read(file: PATH_TYPE) -> bytes:
+        with fsspec.open(escape_file_path(file), "rb") as f:
+            return f.read()
+
+    writer = RecordWriter(str(output_dir), max_shard_size=max_shard_size)
+    # Read the files in bounded chunks so that at most a few files per thread are held in memory
+    chunk_size = 16 * num_threads
+    with ThreadPoolExecutor(num_threads) as executor:
+        for start in range(0, len(files), chunk_size):
+            chunk = files[start : start + chunk_size]
+            for file, target, data in zip(chunk, targets[start : start + chunk_size], executor.map(read, chunk)):
+                writer.write(data, target=target, name=str(file))
+    return writer.close()
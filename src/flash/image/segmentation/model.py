@@ -22,7 +22,7 @@ from flash.core.data.io.output import Output
 from flash.core.data.io.output_transform import OutputTransform
 from flash.core.model import Task
 from flash.core.registry import FlashRegistry
-from flash.core.serve import Composition
+from flash.core.serve import Composition, PredictionCache, ServeExecutor
 from flash.core.utilities.imports import (
     _TM_GREATER_EQUAL_0_10_0,
     _TORCHVISION_AVAILABLE,
@@ -204,8 +204,26 @@ class SemanticSegmentation(ClassificationTask):
         transform: INPUT_TRANSFORM_TYPE = SemanticSegmentationInputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(
+            host,
+            port,
+            sanity_check,
+            input_cls,
+            transform,
+            transform_kwargs,
+            output,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=executor,
+            num_replicas=num_replicas,
+            cache=cache,
+        )
 
     @staticmethod
     def _ci_benchmark_fn(history: List[Dict[str, Any]]):
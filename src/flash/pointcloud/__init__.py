@@ -1,2 +1,24 @@
-from flash.pointcloud.detection import PointCloudObjectDetector, PointCloudObjectDetectorData  # noqa: F401
-from flash.pointcloud.segmentation import PointCloudSegmentation, PointCloudSegmentationData  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "PointCloudObjectDetector": "flash.pointcloud.detection",
+        "PointCloudObjectDetectorData": "flash.pointcloud.detection",
+        "PointCloudSegmentation": "flash.pointcloud.segmentation",
+        "PointCloudSegmentationData": "flash.pointcloud.segmentation",
+    },
+)
+
+__all__ = [
+    "PointCloudObjectDetector",
+    "PointCloudObjectDetectorData",
+    "PointCloudSegmentation",
+    "PointCloudSegmentationData",
+]
+
+if TYPE_CHECKING:
+    from flash.pointcloud.detection import PointCloudObjectDetector, PointCloudObjectDetectorData  # noqa: F401
+    from flash.pointcloud.segmentation import PointCloudSegmentation, PointCloudSegmentationData  # noqa: F401
@@ -1,5 +1,33 @@
-from flash.tabular.classification import TabularClassificationData, TabularClassifier  # noqa: F401
-from flash.tabular.data import TabularData  # noqa: F401
-from flash.tabular.forecasting.data import TabularForecastingData  # noqa: F401
-from flash.tabular.forecasting.model import TabularForecaster  # noqa: F401
-from flash.tabular.regression import TabularRegressionData, TabularRegressor  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TabularClassificationData": "flash.tabular.classification",
+        "TabularClassifier": "flash.tabular.classification",
+        "TabularData": "flash.tabular.data",
+        "TabularForecastingData": "flash.tabular.forecasting.data",
+        "TabularForecaster": "flash.tabular.forecasting.model",
+        "TabularRegressionData": "flash.tabular.regression",
+        "TabularRegressor": "flash.tabular.regression",
+    },
+)
+
+__all__ = [
+    "TabularClassificationData",
+    "TabularClassifier",
+    "TabularData",
+    "TabularForecaster",
+    "TabularForecastingData",
+    "TabularRegressionData",
+    "TabularRegressor",
+]
+
+if TYPE_CHECKING:
+    from flash.tabular.classification import TabularClassificationData, TabularClassifier  # noqa: F401
+    from flash.tabular.data import TabularData  # noqa: F401
+    from flash.tabular.forecasting.data import TabularForecastingData  # noqa: F401
+    from flash.tabular.forecasting.model import TabularForecaster  # noqa: F401
+    from flash.tabular.regression import TabularRegressionData, TabularRegressor  # noqa: F401
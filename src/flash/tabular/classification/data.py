@@ -206,6 +206,12 @@ class TabularClassificationData(TabularData):
             :attr:`~flash.tabular.data.TabularData.parameters` attribute of the
             :class:`~flash.tabular.data.TabularData` object that contains your training data.
 
+        .. note::
+
+            To train on files which don't fit in memory, pass ``input_cls=TabularClassificationStreamingInput``.
+            The files (which can also be parquet files or a glob pattern matching several files) are then streamed in
+            chunks.
+
         The targets will be extracted from the ``target_fields`` columns in the CSV files and can be in any of our
         :ref:`supported classification target formats <formatting_classification_targets>`.
         To learn how to customize the transforms applied for each stage, read our
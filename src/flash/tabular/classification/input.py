@@ -11,15 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from flash.core.data.io.classification_input import ClassificationInputMixin
 from flash.core.data.io.input import DataKeys
 from flash.core.data.utilities.classification import TargetFormatter
 from flash.core.data.utilities.data_frame import resolve_targets
-from flash.core.data.utilities.loading import load_data_frame
+from flash.core.data.utilities.loading import load_data_frame_chunks
 from flash.core.utilities.imports import _PANDAS_AVAILABLE
-from flash.tabular.input import TabularDataFrameInput
+from flash.tabular.input import TabularDataFrameInput, TabularFiles, TabularSamples, TabularStreamingInput
 
 if _PANDAS_AVAILABLE:
     from pandas.core.frame import DataFrame
@@ -37,14 +38,27 @@ class TabularClassificationDataFrameInput(TabularDataFrameInput, ClassificationI
         parameters: Dict[str, Any] = None,
         target_formatter: Optional[TargetFormatter] = None,
     ):
-        cat_vars, num_vars = self.preprocess(data_frame, categorical_fields, numerical_fields, parameters)
+        return self._load_chunks(
+            [data_frame], categorical_fields, numerical_fields, target_fields, parameters, target_formatter
+        )
+
+    def _load_chunks(
+        self,
+        chunks: Iterable[DataFrame],
+        categorical_fields: Optional[Union[str, List[str]]] = None,
+        numerical_fields: Optional[Union[str, List[str]]] = None,
+        target_fields: Optional[Union[str, List[str]]] = None,
+        parameters: Dict[str, Any] = None,
+        target_formatter: Optional[TargetFormatter] = None,
+    ) -> TabularSamples:
+        targets_resolver = None if self.predicting else partial(resolve_targets, target_keys=target_fields)
+        cat_vars, num_vars, targets = self.preprocess_chunks(
+            chunks, categorical_fields, numerical_fields, parameters, resolve_targets=targets_resolver
+        )
 
         if not self.predicting:
-            targets = resolve_targets(data_frame, target_fields)
             self.load_target_metadata(targets, target_formatter=target_formatter)
-            return [{DataKeys.INPUT: (c, n), DataKeys.TARGET: t} for c, n, t in zip(cat_vars, num_vars, targets)]
-
-        return [{DataKeys.INPUT: (c, n)} for c, n in zip(cat_vars, num_vars)]
+        return TabularSamples(cat_vars, num_vars, targets)
 
     def load_sample(self, sample: Dict[str, Any]) -> Any:
         if DataKeys.TARGET in sample:
@@ -63,8 +77,13 @@ class TabularClassificationCSVInput(TabularClassificationDataFrameInput):
         target_formatter: Optional[TargetFormatter] = None,
     ):
         if file is not None:
-            return super().load_data(
-                load_data_frame(file), categorical_fields, numerical_fields, target_fields, parameters, target_formatter
+            return self._load_chunks(
+                load_data_frame_chunks(file),
+                categorical_fields,
+                numerical_fields,
+                target_fields,
+                parameters,
+                target_formatter,
             )
         return None
 
@@ -103,3 +122,50 @@ class TabularClassificationListInput(TabularClassificationDataFrameInput):
         return super().load_data(
             data_frame, categorical_fields, numerical_fields, target_fields, parameters, target_formatter
         )
+
+
+class TabularClassificationStreamingInput(TabularStreamingInput, ClassificationInputMixin):
+    """Streams tabular classification data from one or many CSV, TSV, or parquet files, so that data sets which
+    don't fit in memory can be used for training. See :class:`~flash.tabular.input.TabularStreamingInput`."""
+
+    def load_data(
+        self,
+        files: Optional[Union[str, List[str]]],
+        categorical_fields: Optional[Union[str, List[str]]] = None,
+        numerical_fields: Optional[Union[str, List[str]]] = None,
+        target_fields: Optional[Union[str, List[str]]] = None,
+        parameters: Dict[str, Any] = None,
+        target_formatter: Optional[TargetFormatter] = None,
+        chunk_size: int = 100_000,
+    ) -> TabularFiles:
+        self.target_fields = target_fields
+
+        # Only the unique targets are needed to infer the target format
+        unique_targets = {}
+
+        def collect_targets(chunk: DataFrame) -> None:
+            for target in resolve_targets(chunk, target_fields):
+                unique_targets.setdefault(tuple(target) if isinstance(target, list) else target, None)
+
+        collect = not self.predicting and target_formatter is None
+        files = self._load_files(
+            files,
+            categorical_fields,
+            numerical_fields,
+            parameters,
+            chunk_size=chunk_size,
+            on_chunk=collect_targets if collect else None,
+        )
+
+        if not self.predicting:
+            targets = [list(target) if isinstance(target, tuple) else target for target in unique_targets]
+            self.load_target_metadata(targets or None, target_formatter=target_formatter)
+        return files
+
+    def resolve_targets(self, chunk: DataFrame) -> List[Any]:
+        return resolve_targets(chunk, self.target_fields)
+
+    def load_sample(self, sample: Dict[str, Any]) -> Any:
+        if DataKeys.TARGET in sample:
+            sample[DataKeys.TARGET] = self.format_target(sample[DataKeys.TARGET])
+        return sample
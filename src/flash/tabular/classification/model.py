@@ -22,7 +22,7 @@ from flash.core.data.io.input_transform import InputTransform
 from flash.core.data.io.output import Output
 from flash.core.integrations.pytorch_tabular.backbones import PYTORCH_TABULAR_BACKBONES
 from flash.core.registry import FlashRegistry
-from flash.core.serve import Composition
+from flash.core.serve import Composition, PredictionCache, ServeExecutor
 from flash.core.utilities.imports import _TOPIC_TABULAR_AVAILABLE, requires
 from flash.core.utilities.types import INPUT_TRANSFORM_TYPE, LR_SCHEDULER_TYPE, METRICS_TYPE, OPTIMIZER_TYPE
 from flash.tabular.input import TabularDeserializer
@@ -160,8 +160,24 @@ class TabularClassifier(ClassificationAdapterTask):
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
         parameters: Optional[Dict[str, Any]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> Composition:
         parameters = parameters or self._data_parameters
         return super().serve(
-            host, port, sanity_check, partial(input_cls, parameters=parameters), transform, transform_kwargs, output
+            host,
+            port,
+            sanity_check,
+            partial(input_cls, parameters=parameters),
+            transform,
+            transform_kwargs,
+            output,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=executor,
+            num_replicas=num_replicas,
+            cache=cache,
         )
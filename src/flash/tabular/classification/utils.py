@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
 import logging
-from typing import Dict, List, Tuple
+import warnings
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -32,14 +34,18 @@ def _impute(df: DataFrame, num_cols: List) -> DataFrame:
     return df
 
 
-def _compute_normalization(df: DataFrame, num_cols: List) -> Tuple:
-    df_mean = {c: np.nanmean(df[c], dtype=float) for c in num_cols}
-    df_std = {c: np.nanstd(df[c], dtype=float) for c in num_cols}
-    zero_std = [c for c in num_cols if df_std[c] == 0]
+def _warn_zero_std(num_cols: List, std: Dict) -> None:
+    zero_std = [c for c in num_cols if std[c] == 0]
     if zero_std:
         logging.warning(
             f"Following numerical columns {zero_std} have zero STD which may lead to NaN in normalized dataset."
         )
+
+
+def _compute_normalization(df: DataFrame, num_cols: List) -> Tuple:
+    df_mean = {c: np.nanmean(df[c], dtype=float) for c in num_cols}
+    df_std = {c: np.nanstd(df[c], dtype=float) for c in num_cols}
+    _warn_zero_std(num_cols, df_std)
     return df_mean, df_std
 
 
@@ -51,12 +57,8 @@ def _normalize(df: DataFrame, num_cols: List, mean: Dict, std: Dict) -> DataFram
 
 
 def _generate_codes(df: DataFrame, cat_cols: List) -> dict:
-    tmp = df.copy()
-    for col in cat_cols:
-        tmp[col] = tmp[col].astype("category").cat.as_ordered()
-
-    # list of categories for each column (always a column for None)
-    return {col: list(tmp[col].cat.categories) for col in cat_cols}
+    # list of categories for each column (always a column for None), only the categorical columns are converted
+    return {col: list(df[col].astype("category").cat.categories) for col in cat_cols}
 
 
 def _categorize(df: DataFrame, cat_cols: List, codes) -> DataFrame:
@@ -90,3 +92,185 @@ def _to_cat_vars_numpy(df: DataFrame, cat_cols: List[str]) -> list:
 
 def _to_num_vars_numpy(df: DataFrame, num_cols: List[str]) -> list:
     return [c.to_numpy().astype(np.float32) for n, c in df[num_cols].items()]
+
+
+def _encode_categorical(values: Any, categories: Sequence) -> np.ndarray:
+    """Encode the values of a categorical column given the list of categories from the train data. Unknown values and
+    Nones are encoded as 0, the categories are encoded from 1."""
+    return pd.Index(categories).get_indexer(values).astype(np.int64) + 1
+
+
+class _CategoricalVocabulary:
+    """Collects the categories of a categorical column over several chunks of data. Values are assigned temporary ids
+    in order of appearance which are mapped to the final (sorted) codes with :meth:`finalize`."""
+
+    def __init__(self):
+        self.index = pd.Index([])
+
+    def update(self, values: Any) -> np.ndarray:
+        ids = self.index.get_indexer(values)
+        unseen = ids == -1
+        if unseen.any():
+            new_values = pd.unique(np.asarray(values, dtype=object)[unseen])
+            new_values = [value for value in new_values if not pd.isna(value)]
+            if new_values:
+                self.index = self.index.append(pd.Index(new_values))
+                ids[unseen] = self.index.get_indexer(np.asarray(values, dtype=object)[unseen])
+        return ids.astype(np.int64)
+
+    def finalize(self) -> Tuple[List[Any], np.ndarray]:
+        """Returns the list of categories (sorted if possible, as ``astype("category")`` does) and a lookup table
+        which maps ``temporary id + 1`` to the final code."""
+        categories = pd.Series(self.index, dtype=object).astype("category").cat.categories
+        lookup = np.zeros(len(self.index) + 1, dtype=np.int64)
+        if len(self.index):
+            lookup[1:] = categories.get_indexer(self.index) + 1
+        return list(categories), lookup
+
+
+def _impute_and_normalize(column: np.ndarray, mean: float, std: float) -> None:
+    """Replace the missing values in a numerical column with the column median, then normalize it (inplace)."""
+    missing = np.isnan(column)
+    if missing.any() and not missing.all():
+        column[missing] = np.nanmedian(column)
+    column -= mean
+    column /= std
+
+
+def _preprocess_chunks(
+    chunks: Iterable[DataFrame],
+    num_cols: List[str],
+    cat_cols: List[str],
+    parameters: Optional[Dict[str, Any]] = None,
+    resolve_targets: Optional[Callable[[DataFrame], Sequence]] = None,
+) -> Tuple[np.ndarray, np.ndarray, Optional[Sequence], Dict[str, Any]]:
+    """Encode an iterable of data frame chunks into contiguous ``int64`` (categorical) and ``float32`` (numerical)
+    matrices in a single pass. Categorical columns are encoded with the ``codes`` and numerical columns are imputed
+    with the median and normalized with the ``mean`` and ``std`` from the ``parameters``. If no ``parameters`` are
+    given, they are computed from the data (as ``TabularDataFrameInput.compute_parameters`` would). The numerical
+    columns are read as ``float32`` and normalized inplace, the statistics are accumulated in ``float64``.
+
+    Args:
+        chunks: The data frames to encode (e.g. a single data frame or the chunks of a CSV file).
+        num_cols: The numerical columns.
+        cat_cols: The categorical columns.
+        parameters: The parameters from the train data or ``None`` to compute them.
+        resolve_targets: An optional function to get the targets from each chunk.
+
+    Returns:
+        The categorical matrix, the numerical matrix, the targets (or ``None``), and the parameters.
+    """
+    vocabularies = {col: _CategoricalVocabulary() for col in cat_cols} if parameters is None else None
+
+    cat_chunks, num_chunks, target_chunks = [], [], []
+    for df in chunks:
+        cat_vars = np.empty((len(df), len(cat_cols)), dtype=np.int64)
+        for i, col in enumerate(cat_cols):
+            if vocabularies is not None:
+                cat_vars[:, i] = vocabularies[col].update(df[col])
+            else:
+                cat_vars[:, i] = _encode_categorical(df[col], parameters["codes"][col])
+        cat_chunks.append(cat_vars)
+
+        num_chunks.append(df[num_cols].to_numpy(dtype=np.float32, na_value=np.nan).reshape(len(df), len(num_cols)))
+
+        if resolve_targets is not None:
+            target_chunks.append(resolve_targets(df))
+
+    cat_vars = np.concatenate(cat_chunks) if cat_chunks else np.zeros((0, len(cat_cols)), dtype=np.int64)
+    num_vars = np.concatenate(num_chunks) if num_chunks else np.zeros((0, len(num_cols)), dtype=np.float32)
+    del cat_chunks, num_chunks
+
+    if parameters is None:
+        codes = {}
+        for i, col in enumerate(cat_cols):
+            codes[col], lookup = vocabularies[col].finalize()
+            cat_vars[:, i] = lookup[cat_vars[:, i] + 1]
+
+        mean = {col: np.nanmean(num_vars[:, i], dtype=float) for i, col in enumerate(num_cols)}
+        std = {col: np.nanstd(num_vars[:, i], dtype=float) for i, col in enumerate(num_cols)}
+        _warn_zero_std(num_cols, std)
+
+        parameters = {
+            "mean": mean,
+            "std": std,
+            "codes": codes,
+            "numerical_fields": num_cols,
+            "categorical_fields": cat_cols,
+        }
+
+    for i, col in enumerate(num_cols):
+        _impute_and_normalize(num_vars[:, i], parameters["mean"][col], parameters["std"][col])
+
+    targets = None
+    if resolve_targets is not None:
+        if target_chunks and all(isinstance(t, np.ndarray) for t in target_chunks):
+            targets = np.concatenate(target_chunks)
+        else:
+            targets = list(itertools.chain.from_iterable(target_chunks))
+
+    return cat_vars, num_vars, targets, parameters
+
+
+class _StreamingStatistics:
+    """Mergeable statistics of the numerical (count, mean, and sum of squared deviations) and categorical (the set of
+    categories) columns of a data set which is read in chunks. Statistics computed on separate chunks or files can be
+    combined with :meth:`merge` (using the parallel variance algorithm of Chan et al.)."""
+
+    def __init__(self, num_cols: List[str], cat_cols: List[str]):
+        self.num_cols = num_cols
+        self.cat_cols = cat_cols
+        self.count = np.zeros(len(num_cols), dtype=np.int64)
+        self.mean = np.zeros(len(num_cols), dtype=np.float64)
+        self.m2 = np.zeros(len(num_cols), dtype=np.float64)
+        self.categories = {col: {} for col in cat_cols}
+        self.num_rows = 0
+
+    def _merge_moments(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0.0)
+            self.m2 = np.where(total > 0, self.m2 + m2 + delta**2 * self.count * count / total, 0.0)
+        self.count = total
+
+    def update(self, df: DataFrame) -> "_StreamingStatistics":
+        self.num_rows += len(df)
+
+        values = df[self.num_cols].to_numpy(dtype=np.float64, na_value=np.nan).reshape(len(df), len(self.num_cols))
+        count = np.sum(~np.isnan(values), axis=0)
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.where(count > 0, np.nanmean(values, axis=0), 0.0)
+            m2 = np.where(count > 0, np.nansum((values - mean) ** 2, axis=0), 0.0)
+        self._merge_moments(count, mean, m2)
+
+        for col in self.cat_cols:
+            for value in pd.unique(df[col]):
+                if not pd.isna(value):
+                    self.categories[col].setdefault(value, None)
+        return self
+
+    def merge(self, other: "_StreamingStatistics") -> "_StreamingStatistics":
+        self.num_rows += other.num_rows
+        self._merge_moments(other.count, other.mean, other.m2)
+        for col in self.cat_cols:
+            self.categories[col].update(other.categories[col])
+        return self
+
+    def to_parameters(self) -> Dict[str, Any]:
+        """Returns the ``parameters`` dictionary (as computed by ``TabularDataFrameInput.compute_parameters``)."""
+        std = np.sqrt(np.where(self.count > 0, self.m2 / np.maximum(self.count, 1), np.nan))
+        mean = np.where(self.count > 0, self.mean, np.nan)
+        std = {col: float(std[i]) for i, col in enumerate(self.num_cols)}
+        _warn_zero_std(self.num_cols, std)
+        return {
+            "mean": {col: float(mean[i]) for i, col in enumerate(self.num_cols)},
+            "std": std,
+            "codes": {
+                col: list(pd.Series(list(categories), dtype=object).astype("category").cat.categories)
+                for col, categories in self.categories.items()
+            },
+            "numerical_fields": self.num_cols,
+            "categorical_fields": self.cat_cols,
+        }
@@ -11,19 +11,23 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 from io import StringIO
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import fsspec
 import numpy as np
 
-from flash.core.data.io.input import DataKeys, Input, ServeInput
+from flash.core.data.io.input import DataKeys, Input, IterableInput, ServeInput
+from flash.core.data.utilities.loading import load_data_frame_chunks
+from flash.core.data.utilities.sampling import epoch_seed, shard_info, shard_ranges
+from flash.core.data.utils import _STAGES_PREFIX
 from flash.core.utilities.imports import _PANDAS_AVAILABLE
 from flash.tabular.classification.utils import (
     _compute_normalization,
     _generate_codes,
-    _pre_transform,
-    _to_cat_vars_numpy,
-    _to_num_vars_numpy,
+    _preprocess_chunks,
+    _StreamingStatistics,
 )
 
 if _PANDAS_AVAILABLE:
@@ -33,6 +37,43 @@ else:
     DataFrame = object
 
 
+class TabularSamples(Sequence):
+    """A lazy sequence of tabular samples backed by contiguous categorical (``int64``) and numerical (``float32``)
+    matrices. Samples are only materialized as dictionaries when they are accessed.
+
+    Args:
+        cat_vars: The ``(num_samples, num_categorical_fields)`` matrix of categorical codes.
+        num_vars: The ``(num_samples, num_numerical_fields)`` matrix of normalized numerical values.
+        targets: The optional targets (a list or an array with one entry per sample).
+    """
+
+    def __init__(self, cat_vars: np.ndarray, num_vars: np.ndarray, targets: Optional[Sequence] = None):
+        self.cat_vars = cat_vars
+        self.num_vars = num_vars
+        self.targets = targets
+
+    def __len__(self) -> int:
+        return len(self.cat_vars)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        sample = {DataKeys.INPUT: (self.cat_vars[index], self.num_vars[index])}
+        if self.targets is not None:
+            sample[DataKeys.TARGET] = self.targets[index]
+        return sample
+
+    def take(self, indices: List[int]) -> List[Dict[str, Any]]:
+        """Gather the samples at the given indices with a single fancy-indexing call per matrix."""
+        cat_vars = self.cat_vars[indices]
+        num_vars = self.num_vars[indices]
+        if self.targets is None:
+            return [{DataKeys.INPUT: (c, n)} for c, n in zip(cat_vars, num_vars)]
+        if isinstance(self.targets, np.ndarray):
+            targets = self.targets[indices]
+        else:
+            targets = [self.targets[index] for index in indices]
+        return [{DataKeys.INPUT: (c, n), DataKeys.TARGET: t} for c, n, t in zip(cat_vars, num_vars, targets)]
+
+
 class TabularDataFrameInput(Input):
     parameters: dict
 
@@ -79,36 +120,199 @@ class TabularDataFrameInput(Input):
         numerical_fields: Optional[List[str]] = None,
         parameters: Dict[str, Any] = None,
     ):
+        cat_vars, num_vars, _ = self.preprocess_chunks([df], categorical_fields, numerical_fields, parameters)
+        return cat_vars, num_vars
+
+    def preprocess_chunks(
+        self,
+        chunks: Iterable[DataFrame],
+        categorical_fields: Optional[List[str]] = None,
+        numerical_fields: Optional[List[str]] = None,
+        parameters: Dict[str, Any] = None,
+        resolve_targets: Optional[Callable[[DataFrame], Sequence]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[Sequence]]:
+        """Impute, normalize, and encode an iterable of data frame chunks (e.g. from
+        :func:`~flash.core.data.utilities.loading.load_data_frame_chunks`) into contiguous matrices in a single pass.
+        When training, the parameters are computed from the chunks as they are read.
+
+        Returns:
+            The categorical (``int64``) matrix, the numerical (``float32``) matrix, and the targets (if
+            ``resolve_targets`` is given).
+        """
         if self.training:
             categorical_fields, numerical_fields = self._sanetize_fields(categorical_fields, numerical_fields)
-            parameters = self.compute_parameters(df, numerical_fields, categorical_fields)
+            parameters = None
         elif parameters is None:
             raise ValueError(
                 "Loading tabular data for evaluation or inference requires parameters from the train data. Either "
                 "construct the train data at the same time as evaluation and inference or provide the train "
                 "`datamodule.parameters` in the `parameters` argument."
             )
+        else:
+            categorical_fields = parameters["categorical_fields"]
+            numerical_fields = parameters["numerical_fields"]
+
+        cat_vars, num_vars, targets, self.parameters = _preprocess_chunks(
+            chunks, numerical_fields, categorical_fields, parameters=parameters, resolve_targets=resolve_targets
+        )
+        return cat_vars, num_vars, targets
+
+    def load_batch(self, indices: List[int]) -> List[Any]:
+        if not isinstance(self.data, TabularSamples):
+            return super().load_batch(indices)
+        load_sample = getattr(self, f"{_STAGES_PREFIX[self.running_stage]}_load_sample")
+        return [load_sample(sample) for sample in self.data.take(indices)]
+
+
+def _resolve_data_files(files: Union[str, List[str]]) -> List[str]:
+    """Expand a file, a glob pattern (e.g. ``"s3://bucket/data/*.parquet"``), or a list of them into a sorted list of
+    fully qualified paths which can be opened with ``fsspec``."""
+    if isinstance(files, (str, os.PathLike)):
+        files = [files]
+    resolved = []
+    for file in files:
+        for open_file in fsspec.open_files(str(file)):
+            resolved.append(open_file.fs.unstrip_protocol(open_file.path))
+    if not resolved:
+        raise FileNotFoundError(f"No files found matching: {files}.")
+    return sorted(resolved)
+
+
+class TabularFiles:
+    """An iterable over the files of a :class:`~flash.tabular.input.TabularStreamingInput` and, when a pass was made
+    over them, their number of rows (the number of samples isn't known up front so it intentionally doesn't define
+    ``len``)."""
+
+    def __init__(self, files: List[str], num_rows: Optional[List[int]] = None):
+        self.files = files
+        self.num_rows = num_rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.files)
+
+
+class TabularStreamingInput(IterableInput):
+    """The ``TabularStreamingInput`` is an :class:`~flash.core.data.io.input.IterableInput` which streams samples from
+    one or many CSV, TSV, or parquet files (local or remote through ``fsspec``) without ever loading a whole file into
+    memory.
+
+    When training, the ``parameters`` are computed in a single streaming pass over the files with mergeable statistics.
+    Missing numerical values are imputed with the train mean (rather than the median used by
+    :class:`~flash.tabular.input.TabularDataFrameInput`, which cannot be computed in a single pass). The rows are
+    split across DataLoader workers and DDP processes in contiguous blocks of the same size (when training, the blocks
+    are padded with rows from the start so that every process gets exactly the same number of rows). When no pass is
+    made over the data (e.g. when predicting), the number of rows isn't known so the chunks are split instead.
+    """
+
+    parameters: dict
+
+    def _load_files(
+        self,
+        files: Union[str, List[str]],
+        categorical_fields: Optional[Union[str, List[str]]] = None,
+        numerical_fields: Optional[Union[str, List[str]]] = None,
+        parameters: Dict[str, Any] = None,
+        chunk_size: int = 100_000,
+        on_chunk: Optional[Callable[[DataFrame], None]] = None,
+    ) -> TabularFiles:
+        """Resolve the files and (when training) compute the ``parameters`` in a single pass over the chunks.
+
+        Args:
+            files: A file, a glob pattern, or a list of them.
+            categorical_fields: The categorical fields.
+            numerical_fields: The numerical fields.
+            parameters: The parameters from the train data (required when not training).
+            chunk_size: The maximum number of rows to hold in memory at once.
+            on_chunk: An optional function which is called with each chunk in the pass over the data (e.g. to collect
+                the target metadata). If given, the pass is also made when not training.
+        """
+        self.chunk_size = chunk_size
+        files = _resolve_data_files(files)
+        num_rows = None
+
+        if self.training:
+            categorical_fields, numerical_fields = TabularDataFrameInput._sanetize_fields(
+                categorical_fields, numerical_fields
+            )
+            statistics = _StreamingStatistics(numerical_fields, categorical_fields)
+            num_rows = []
+            for file in files:
+                file_statistics = _StreamingStatistics(numerical_fields, categorical_fields)
+                for chunk in load_data_frame_chunks(file, chunk_size=chunk_size):
+                    file_statistics.update(chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk)
+                statistics.merge(file_statistics)
+                num_rows.append(file_statistics.num_rows)
+            parameters = statistics.to_parameters()
+        elif on_chunk is not None:
+            num_rows = []
+            for file in files:
+                num_rows.append(0)
+                for chunk in load_data_frame_chunks(file, chunk_size=chunk_size):
+                    on_chunk(chunk)
+                    num_rows[-1] += len(chunk)
+
+        if parameters is None:
+            raise ValueError(
+                "Loading tabular data for evaluation or inference requires parameters from the train data. Either "
+                "construct the train data at the same time as evaluation and inference or provide the train "
+                "`datamodule.parameters` in the `parameters` argument."
+            )
 
         self.parameters = parameters
+        return TabularFiles(files, num_rows=num_rows)
 
-        # impute and normalize data
-        df = _pre_transform(
-            df,
-            parameters["numerical_fields"],
-            parameters["categorical_fields"],
-            parameters["codes"],
-            parameters["mean"],
-            parameters["std"],
-        )
+    def _iter_rows(self, file: str, first: int, last: int) -> Iterator[DataFrame]:
+        """Iterate over the chunks of the rows ``first`` to ``last`` (excluded) of the ``file``."""
+        position = 0
+        for chunk in load_data_frame_chunks(file, chunk_size=self.chunk_size):
+            if position + len(chunk) > first:
+                yield chunk.iloc[max(first - position, 0) : last - position]
+            position += len(chunk)
+            if position >= last:
+                break
+
+    def _iter_chunks(self) -> Iterator[DataFrame]:
+        shard, num_shards = shard_info()
+        files, num_rows = list(self.data.files), self.data.num_rows
+        order = list(range(len(files)))
+        if self.training:
+            # Every worker and process shuffles the files in the same order so that the shards don't overlap
+            np.random.RandomState(epoch_seed()).shuffle(order)
 
-        cat_vars = _to_cat_vars_numpy(df, parameters["categorical_fields"])
-        num_vars = _to_num_vars_numpy(df, parameters["numerical_fields"])
+        if num_rows is not None:
+            sizes = [num_rows[i] for i in order]
+            for part, first, last in shard_ranges(sizes, shard, num_shards, pad=self.training):
+                yield from self._iter_rows(files[order[part]], first, last)
+        else:
+            chunk_index = 0
+            for i in order:
+                for chunk in load_data_frame_chunks(files[i], chunk_size=self.chunk_size):
+                    if chunk_index % num_shards == shard:
+                        yield chunk
+                    chunk_index += 1
 
-        num_samples = len(df)
-        cat_vars = np.stack(cat_vars, 1) if len(cat_vars) else np.zeros((num_samples, 0), dtype=np.int64)
-        num_vars = np.stack(num_vars, 1) if len(num_vars) else np.zeros((num_samples, 0), dtype=np.float32)
+    def resolve_targets(self, chunk: DataFrame) -> Optional[Sequence]:
+        """Override this to return the targets from a chunk of data (or ``None`` if there are no targets)."""
+        return None
 
-        return cat_vars, num_vars
+    def _iter_samples(self) -> Iterator[Dict[str, Any]]:
+        parameters = self.parameters
+        for chunk in self._iter_chunks():
+            chunk = chunk.fillna(parameters["mean"])
+            cat_vars, num_vars, _, _ = _preprocess_chunks(
+                [chunk], parameters["numerical_fields"], parameters["categorical_fields"], parameters=parameters
+            )
+            targets = None if self.predicting else self.resolve_targets(chunk)
+            samples = TabularSamples(cat_vars, num_vars, targets)
+            order = np.random.permutation(len(samples)) if self.training else range(len(samples))
+            for index in order:
+                yield samples[index]
+
+    def __iter__(self):
+        self.data_iter = self._iter_samples()
+        return self
 
 
 class TabularDeserializer(ServeInput):
@@ -119,22 +323,17 @@ class TabularDeserializer(ServeInput):
     def serve_load_sample(self, data: str) -> Any:
         parameters = self._parameters
 
-        df = pd.read_csv(StringIO(data))
-        df = _pre_transform(
-            df,
-            parameters["numerical_fields"],
-            parameters["categorical_fields"],
-            parameters["codes"],
-            parameters["mean"],
-            parameters["std"],
+        # Binary payloads give the CSV as bytes or an Arrow table as a ``DataFrame``
+        if isinstance(data, DataFrame):
+            df = data
+        else:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            df = pd.read_csv(StringIO(data))
+        cat_vars, num_vars, _, _ = _preprocess_chunks(
+            [df], parameters["numerical_fields"], parameters["categorical_fields"], parameters=parameters
         )
 
-        cat_vars = _to_cat_vars_numpy(df, parameters["categorical_fields"])
-        num_vars = _to_num_vars_numpy(df, parameters["numerical_fields"])
-
-        cat_vars = np.stack(cat_vars, 1)
-        num_vars = np.stack(num_vars, 1)
-
         return [{DataKeys.INPUT: [c, n]} for c, n in zip(cat_vars, num_vars)]
 
     @property
@@ -192,6 +192,12 @@ class TabularRegressionData(TabularData):
             :attr:`~flash.tabular.data.TabularData.parameters` attribute of the
             :class:`~flash.tabular.data.TabularData` object that contains your training data.
 
+        .. note::
+
+            To train on files which don't fit in memory, pass ``input_cls=TabularRegressionStreamingInput``.
+            The files (which can also be parquet files or a glob pattern matching several files) are then streamed in
+            chunks.
+
         The targets will be extracted from the ``target_field`` in the CSV files.
         To learn how to customize the transforms applied for each stage, read our
         :ref:`customizing transforms guide <customizing_transforms>`.
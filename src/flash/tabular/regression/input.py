@@ -11,14 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 
-from flash.core.data.io.input import DataKeys
-from flash.core.data.utilities.loading import load_data_frame
+from flash.core.data.utilities.loading import load_data_frame_chunks
 from flash.core.utilities.imports import _PANDAS_AVAILABLE
-from flash.tabular.input import TabularDataFrameInput
+from flash.tabular.input import TabularDataFrameInput, TabularFiles, TabularSamples, TabularStreamingInput
 
 if _PANDAS_AVAILABLE:
     from pandas.core.frame import DataFrame
@@ -35,13 +34,27 @@ class TabularRegressionDataFrameInput(TabularDataFrameInput):
         target_field: Optional[str] = None,
         parameters: Dict[str, Any] = None,
     ):
-        cat_vars, num_vars = self.preprocess(data_frame, categorical_fields, numerical_fields, parameters)
+        return self._load_chunks([data_frame], categorical_fields, numerical_fields, target_field, parameters)
 
-        if not self.predicting:
-            targets = data_frame[target_field].to_numpy().astype(np.float32)
-            return [{DataKeys.INPUT: (c, n), DataKeys.TARGET: t} for c, n, t in zip(cat_vars, num_vars, targets)]
+    def _load_chunks(
+        self,
+        chunks: Iterable[DataFrame],
+        categorical_fields: Optional[Union[str, List[str]]] = None,
+        numerical_fields: Optional[Union[str, List[str]]] = None,
+        target_field: Optional[str] = None,
+        parameters: Dict[str, Any] = None,
+    ) -> TabularSamples:
+        def resolve_targets(data_frame: DataFrame) -> np.ndarray:
+            return data_frame[target_field].to_numpy().astype(np.float32)
 
-        return [{DataKeys.INPUT: (c, n)} for c, n in zip(cat_vars, num_vars)]
+        cat_vars, num_vars, targets = self.preprocess_chunks(
+            chunks,
+            categorical_fields,
+            numerical_fields,
+            parameters,
+            resolve_targets=None if self.predicting else resolve_targets,
+        )
+        return TabularSamples(cat_vars, num_vars, targets)
 
 
 class TabularRegressionCSVInput(TabularRegressionDataFrameInput):
@@ -54,8 +67,8 @@ class TabularRegressionCSVInput(TabularRegressionDataFrameInput):
         parameters: Dict[str, Any] = None,
     ):
         if file is not None:
-            return super().load_data(
-                load_data_frame(file), categorical_fields, numerical_fields, target_field, parameters
+            return self._load_chunks(
+                load_data_frame_chunks(file), categorical_fields, numerical_fields, target_field, parameters
             )
         return None
 
@@ -86,3 +99,23 @@ class TabularRegressionListInput(TabularRegressionDataFrameInput):
         data_frame = DataFrame.from_records(data)
 
         return super().load_data(data_frame, categorical_fields, numerical_fields, target_field, parameters)
+
+
+class TabularRegressionStreamingInput(TabularStreamingInput):
+    """Streams tabular regression data from one or many CSV, TSV, or parquet files, so that data sets which don't fit
+    in memory can be used for training. See :class:`~flash.tabular.input.TabularStreamingInput`."""
+
+    def load_data(
+        self,
+        files: Optional[Union[str, List[str]]],
+        categorical_fields: Optional[Union[str, List[str]]] = None,
+        numerical_fields: Optional[Union[str, List[str]]] = None,
+        target_field: Optional[str] = None,
+        parameters: Dict[str, Any] = None,
+        chunk_size: int = 100_000,
+    ) -> TabularFiles:
+        self.target_field = target_field
+        return self._load_files(files, categorical_fields, numerical_fields, parameters, chunk_size=chunk_size)
+
+    def resolve_targets(self, chunk: DataFrame) -> np.ndarray:
+        return chunk[self.target_field].to_numpy().astype(np.float32)
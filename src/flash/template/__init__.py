@@ -1 +1,19 @@
-from flash.template.classification import TemplateData, TemplateSKLearnClassifier  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TemplateData": "flash.template.classification",
+        "TemplateSKLearnClassifier": "flash.template.classification",
+    },
+)
+
+__all__ = [
+    "TemplateData",
+    "TemplateSKLearnClassifier",
+]
+
+if TYPE_CHECKING:
+    from flash.template.classification import TemplateData, TemplateSKLearnClassifier  # noqa: F401
@@ -1,10 +1,44 @@
-from flash.text.classification import TextClassificationData, TextClassifier  # noqa: F401
-from flash.text.embedding import TextEmbedder  # noqa: F401
-from flash.text.question_answering import QuestionAnsweringData, QuestionAnsweringTask  # noqa: F401
-from flash.text.seq2seq import (  # noqa: F401
-    Seq2SeqTask,
-    SummarizationData,
-    SummarizationTask,
-    TranslationData,
-    TranslationTask,
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TextClassificationData": "flash.text.classification",
+        "TextClassifier": "flash.text.classification",
+        "TextEmbedder": "flash.text.embedding",
+        "QuestionAnsweringData": "flash.text.question_answering",
+        "QuestionAnsweringTask": "flash.text.question_answering",
+        "Seq2SeqTask": "flash.text.seq2seq",
+        "SummarizationData": "flash.text.seq2seq",
+        "SummarizationTask": "flash.text.seq2seq",
+        "TranslationData": "flash.text.seq2seq",
+        "TranslationTask": "flash.text.seq2seq",
+    },
 )
+
+__all__ = [
+    "QuestionAnsweringData",
+    "QuestionAnsweringTask",
+    "Seq2SeqTask",
+    "SummarizationData",
+    "SummarizationTask",
+    "TextClassificationData",
+    "TextClassifier",
+    "TextEmbedder",
+    "TranslationData",
+    "TranslationTask",
+]
+
+if TYPE_CHECKING:
+    from flash.text.classification import TextClassificationData, TextClassifier  # noqa: F401
+    from flash.text.embedding import TextEmbedder  # noqa: F401
+    from flash.text.question_answering import QuestionAnsweringData, QuestionAnsweringTask  # noqa: F401
+    from flash.text.seq2seq import (  # noqa: F401
+        Seq2SeqTask,
+        SummarizationData,
+        SummarizationTask,
+        TranslationData,
+        TranslationTask,
+    )
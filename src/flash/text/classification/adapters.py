@@ -15,25 +15,40 @@ import os
 import warnings
 from dataclasses import dataclass
 from types import FunctionType
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional, Union
 
 import torch
+from pytorch_lightning.utilities import rank_zero_warn
 from torch import Tensor
+from torch.utils.data import DataLoader
 
 from flash.core.adapter import Adapter, AdapterTask
 from flash.core.data.io.input import DataKeys
 from flash.core.heads import CLASSIFIER_HEADS
 from flash.core.model import Task
 from flash.core.registry import FlashRegistry
-from flash.core.utilities.imports import _TRANSFORMERS_AVAILABLE
+from flash.core.utilities.imports import _TOPIC_TEXT_AVAILABLE, _TRANSFORMERS_AVAILABLE
 from flash.text.classification.collate import TextClassificationCollate
 
 if _TRANSFORMERS_AVAILABLE:
     from transformers.modeling_outputs import Seq2SeqSequenceClassifierOutput, SequenceClassifierOutput
 
+if _TOPIC_TEXT_AVAILABLE:
+    from datasets import Dataset
+else:
+    Dataset = object
+
 
 class HuggingFaceAdapter(Adapter):
-    def __init__(self, backbone, num_classes: int, max_length: int = 128):
+    def __init__(
+        self,
+        backbone,
+        num_classes: int,
+        max_length: int = 128,
+        padding: Union[str, bool] = "max_length",
+        pretokenize: bool = False,
+        pretokenize_num_proc: Optional[int] = None,
+    ):
         super().__init__()
 
         os.environ["TOKENIZERS_PARALLELISM"] = "TRUE"
@@ -43,7 +58,9 @@ class HuggingFaceAdapter(Adapter):
         os.environ["PYTHONWARNINGS"] = "ignore"
 
         self.model, tokenizer = backbone(num_classes)
-        self.collate_fn = TextClassificationCollate(tokenizer, max_length=max_length)
+        self.collate_fn = TextClassificationCollate(tokenizer, max_length=max_length, padding=padding)
+        self.pretokenize = pretokenize
+        self.pretokenize_num_proc = pretokenize_num_proc
 
     @classmethod
     def from_task(
@@ -85,6 +102,29 @@ class HuggingFaceAdapter(Adapter):
     def predict_step(self, batch: Any, batch_idx: int, dataloader_idx: int = 0) -> Any:
         return self(batch)
 
+    def _pretokenize(self, dataset: Any) -> None:
+        # Datasets created with a ``val_split`` wrap the original input
+        input = getattr(dataset, "dataset", dataset)
+        data = getattr(input, "data", None)
+        if self.pretokenize and isinstance(data, Dataset) and "input_ids" not in data.column_names:
+            input.data = self.collate_fn.pretokenize(data, num_proc=self.pretokenize_num_proc)
+
+    def process_train_dataset(self, dataset: Any, *args, **kwargs) -> DataLoader:
+        self._pretokenize(dataset)
+        return super().process_train_dataset(dataset, *args, **kwargs)
+
+    def process_val_dataset(self, dataset: Any, *args, **kwargs) -> DataLoader:
+        self._pretokenize(dataset)
+        return super().process_val_dataset(dataset, *args, **kwargs)
+
+    def process_test_dataset(self, dataset: Any, *args, **kwargs) -> DataLoader:
+        self._pretokenize(dataset)
+        return super().process_test_dataset(dataset, *args, **kwargs)
+
+    def process_predict_dataset(self, dataset: Any, *args, **kwargs) -> DataLoader:
+        self._pretokenize(dataset)
+        return super().process_predict_dataset(dataset, *args, **kwargs)
+
 
 @dataclass
 class GenericCollate:
@@ -111,9 +151,25 @@ class GenericCollate:
 class GenericAdapter(Adapter):
     heads: FlashRegistry = CLASSIFIER_HEADS
 
-    def __init__(self, backbone, num_classes: int, max_length: int = 128, head="linear"):
+    def __init__(
+        self,
+        backbone,
+        num_classes: int,
+        max_length: int = 128,
+        padding: Union[str, bool] = "max_length",
+        pretokenize: bool = False,
+        pretokenize_num_proc: Optional[int] = None,
+        head="linear",
+    ):
         super().__init__()
 
+        if padding != "max_length" or pretokenize:
+            rank_zero_warn(
+                "The `padding` and `pretokenize` arguments are only supported by Hugging Face backbones. This backbone "
+                "uses its own tokenizer, so they will be ignored.",
+                category=UserWarning,
+            )
+
         self.backbone, tokenizer, num_features = backbone()
 
         self.collate_fn = GenericCollate(tokenizer)
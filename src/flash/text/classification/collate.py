@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
+from typing import Any, Dict, List, Union
 
 from flash.core.data.io.input import DataKeys
 from flash.core.integrations.transformers.collate import TransformersCollate
@@ -20,12 +21,27 @@ from flash.core.integrations.transformers.collate import TransformersCollate
 @dataclass(unsafe_hash=True)
 class TextClassificationCollate(TransformersCollate):
     max_length: int = 128
+    padding: Union[str, bool] = "max_length"
 
     def tokenize(self, sample):
         tokenized_sample = self.tokenizer(
-            sample[DataKeys.INPUT], max_length=self.max_length, truncation=True, padding="max_length"
+            sample[DataKeys.INPUT], max_length=self.max_length, truncation=True, padding=self.padding
         )
         tokenized_sample = tokenized_sample.data
         if DataKeys.TARGET in sample:
             tokenized_sample[DataKeys.TARGET] = sample[DataKeys.TARGET]
         return tokenized_sample
+
+    def tokenize_batch(self, batch: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        return self.tokenizer(batch[DataKeys.INPUT], max_length=self.max_length, truncation=True).data
+
+    def pad(self, samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        model_input_names = self.tokenizer.model_input_names
+        padded_sample = self.tokenizer.pad(
+            [{key: sample[key] for key in model_input_names if key in sample} for sample in samples],
+            padding=self.padding,
+            max_length=self.max_length,
+        ).data
+        if DataKeys.TARGET in samples[0]:
+            padded_sample[DataKeys.TARGET] = [sample[DataKeys.TARGET] for sample in samples]
+        return padded_sample
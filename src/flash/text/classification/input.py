@@ -70,6 +70,16 @@ class TextClassificationInput(Input, ClassificationInputMixin):
             sample[DataKeys.TARGET] = self.format_target(sample[DataKeys.TARGET])
         return sample
 
+    def load_batch(self, indices: List[int]) -> List[Dict[str, Any]]:
+        # Gather all of the rows with a single (columnar) query to the HuggingFace dataset
+        columns = self.data[indices]
+        keys = list(columns.keys())
+        samples = [dict(zip(keys, values)) for values in zip(*columns.values())]
+        if DataKeys.TARGET in columns:
+            for sample in samples:
+                sample[DataKeys.TARGET] = self.format_target(sample[DataKeys.TARGET])
+        return samples
+
 
 class TextClassificationCSVInput(TextClassificationInput):
     @requires("text")
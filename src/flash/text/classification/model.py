@@ -20,7 +20,7 @@ from flash.core.data.io.input import ServeInput
 from flash.core.data.io.input_transform import InputTransform
 from flash.core.data.io.output import Output
 from flash.core.registry import FlashRegistry
-from flash.core.serve import Composition
+from flash.core.serve import Composition, PredictionCache, ServeExecutor
 from flash.core.utilities.imports import requires
 from flash.core.utilities.types import (
     INPUT_TRANSFORM_TYPE,
@@ -43,6 +43,14 @@ class TextClassifier(ClassificationAdapterTask):
         num_classes: Number of classes to classify.
         backbone: A model to use to compute text features can be any BERT model from HuggingFace/transformersimage.
         max_length: The maximum length to pad / truncate sequences to.
+        padding: The type of padding to apply. One of: ``"max_length"`` to pad every sequence to ``max_length``, or
+            ``"longest"`` (or ``True``) to pad to the longest sequence in each batch. Padding to the longest sequence
+            is much cheaper for short texts, especially when combined with the
+            :class:`~flash.text.samplers.LengthBucketBatchSampler`. Only supported by HuggingFace backbones.
+        pretokenize: If ``True``, the texts are tokenized once (with a batched ``Dataset.map`` which is cached to
+            disk) before the first epoch rather than in every batch, so that the collate only needs to pad the token
+            ids. Only supported by HuggingFace backbones.
+        pretokenize_num_proc: The number of processes to use when pre-tokenizing.
         optimizer: Optimizer to use for training.
         lr_scheduler: The LR scheduler to use during training.
         metrics: Metrics to compute for training and evaluation. Can either be an metric from the `torchmetrics`
@@ -64,6 +72,9 @@ class TextClassifier(ClassificationAdapterTask):
         labels: Optional[List[str]] = None,
         backbone: str = "prajjwal1/bert-medium",
         max_length: int = 128,
+        padding: Union[str, bool] = "max_length",
+        pretokenize: bool = False,
+        pretokenize_num_proc: Optional[int] = None,
         loss_fn: LOSS_FN_TYPE = None,
         optimizer: OPTIMIZER_TYPE = "Adam",
         lr_scheduler: LR_SCHEDULER_TYPE = None,
@@ -84,6 +95,9 @@ class TextClassifier(ClassificationAdapterTask):
             backbone=metadata["fn"],
             num_classes=num_classes,
             max_length=max_length,
+            padding=padding,
+            pretokenize=pretokenize,
+            pretokenize_num_proc=pretokenize_num_proc,
             **kwargs,
         )
 
@@ -125,5 +139,23 @@ class TextClassifier(ClassificationAdapterTask):
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ServeExecutor] = None,
+        num_replicas: int = 1,
+        cache: Optional[PredictionCache] = None,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(
+            host,
+            port,
+            sanity_check,
+            input_cls,
+            transform,
+            transform_kwargs,
+            output,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=executor,
+            num_replicas=num_replicas,
+            cache=cache,
+        )
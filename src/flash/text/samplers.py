@@ -0,0 +1,178 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import torch
+from torch.utils.data import BatchSampler, SequentialSampler
+
+
+def _text_length(sample: Any) -> int:
+    """Estimate the length of a sample as the number of whitespace separated words in its string values."""
+    if isinstance(sample, str):
+        return len(sample.split())
+    if isinstance(sample, dict):
+        return sum(len(value.split()) for value in sample.values() if isinstance(value, str))
+    return 0
+
+
+def _estimate_lengths(data_source: Any, length_fn: Optional[Callable[[Any], int]] = None) -> np.ndarray:
+    data = getattr(data_source, "data", data_source)
+
+    # HuggingFace datasets can be read column by column, which is much faster than iterating the rows
+    if length_fn is None and hasattr(data, "column_names"):
+        lengths = np.zeros(len(data), dtype=np.int64)
+        for column in data.column_names:
+            values = data[column]
+            if len(values) and isinstance(values[0], str):
+                lengths += np.fromiter((len(value.split()) for value in values), dtype=np.int64, count=len(values))
+        return lengths
+
+    length_fn = length_fn or _text_length
+    return np.fromiter((length_fn(sample) for sample in data), dtype=np.int64, count=len(data))
+
+
+class LengthBucketBatchSampler(BatchSampler):
+    """The ``LengthBucketBatchSampler`` groups samples of similar length into the same batch so that little compute
+    is spent on pad tokens when the collate pads to the longest sequence in the batch (``padding="longest"``).
+
+    Each epoch, the (shuffled) indices are split into buckets of ``bucket_size`` samples, each bucket is sorted by
+    length and cut into batches, and the order of the batches is shuffled. Batches either have a fixed ``batch_size``
+    or are filled up to a budget of ``max_tokens`` (the number of samples times the longest length in the batch).
+
+    Pass it to the ``sampler`` argument of a text ``DataModule`` (e.g. ``TextClassificationData``) as a function of
+    the dataset:
+
+    .. code-block:: python
+
+        from functools import partial
+
+        from flash.text import TextClassificationData
+        from flash.text.samplers import LengthBucketBatchSampler
+
+        datamodule = TextClassificationData.from_csv(
+            "review",
+            "sentiment",
+            train_file="train.csv",
+            sampler=partial(LengthBucketBatchSampler, max_tokens=4096),
+        )
+
+    When training with DDP, the batches are sharded across processes by the sampler itself so the trainer should be
+    created with ``replace_sampler_ddp=False``.
+
+    Args:
+        data_source: The dataset (or a sequence of samples) to sample from.
+        batch_size: The number of samples in each batch. Ignored if ``max_tokens`` is given.
+        max_tokens: The maximum number of (padded) tokens in each batch.
+        lengths: The length of each sample. If not given, the lengths are estimated with ``length_fn``.
+        length_fn: A function which returns the length of a sample. Defaults to the number of whitespace separated
+            words in the string fields of the sample. Pass a function which tokenizes the sample for exact lengths.
+        bucket_size: The number of samples in each bucket. Defaults to ``100`` times the batch size.
+        shuffle: If ``True``, the samples and the batches are shuffled each epoch.
+        drop_last: If ``True``, incomplete batches (with fewer than ``batch_size`` samples) are dropped.
+        seed: The random seed (must be the same on all processes when training with DDP).
+        num_replicas: The number of processes to shard the batches across. Defaults to the world size.
+        rank: The rank of the current process. Defaults to the global rank.
+    """
+
+    def __init__(
+        self,
+        data_source: Any,
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        lengths: Optional[Sequence[int]] = None,
+        length_fn: Optional[Callable[[Any], int]] = None,
+        bucket_size: Optional[int] = None,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        seed: int = 0,
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+    ):
+        if batch_size is None and max_tokens is None:
+            raise ValueError("Either `batch_size` or `max_tokens` should be provided.")
+        if max_tokens is not None and max_tokens <= 0:
+            raise ValueError(f"`max_tokens` should be a positive integer. Found {max_tokens}.")
+
+        lengths = np.asarray(lengths if lengths is not None else _estimate_lengths(data_source, length_fn))
+        super().__init__(SequentialSampler(range(len(lengths))), batch_size or 1, drop_last)
+
+        distributed = torch.distributed.is_available() and torch.distributed.is_initialized()
+        if num_replicas is None:
+            num_replicas = torch.distributed.get_world_size() if distributed else 1
+        if rank is None:
+            rank = torch.distributed.get_rank() if distributed else 0
+
+        self.lengths = np.maximum(lengths, 1)
+        self.max_tokens = max_tokens
+        self.bucket_size = bucket_size or 100 * (batch_size or max(1, max_tokens // max(int(self.lengths.mean()), 1)))
+        self.shuffle = shuffle
+        self.seed = seed
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.epoch = 0
+        self._batches: Optional[List[List[int]]] = None
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+        self._batches = None
+
+    def _split(self, indices: np.ndarray) -> List[List[int]]:
+        if self.max_tokens is None:
+            batches = [indices[i : i + self.batch_size].tolist() for i in range(0, len(indices), self.batch_size)]
+            if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+                batches = batches[:-1]
+            return batches
+
+        batches, batch, longest = [], [], 0
+        for index in indices.tolist():
+            length = self.lengths[index]
+            if batch and max(longest, length) * (len(batch) + 1) > self.max_tokens:
+                batches.append(batch)
+                batch, longest = [], 0
+            batch.append(index)
+            longest = max(longest, length)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _generate(self) -> List[List[int]]:
+        rng = np.random.default_rng(self.seed + self.epoch)
+        indices = rng.permutation(len(self.lengths)) if self.shuffle else np.arange(len(self.lengths))
+
+        batches = []
+        for start in range(0, len(indices), self.bucket_size):
+            bucket = indices[start : start + self.bucket_size]
+            batches.extend(self._split(bucket[np.argsort(self.lengths[bucket], kind="stable")]))
+
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        if self.num_replicas > 1 and batches:
+            # Every process should get the same number of batches so some are repeated
+            num_batches = -(-len(batches) // self.num_replicas) * self.num_replicas
+            batches = [batches[i % len(batches)] for i in range(self.rank, num_batches, self.num_replicas)]
+        return batches
+
+    def __iter__(self) -> Iterator[List[int]]:
+        if self._batches is None:
+            self._batches = self._generate()
+        batches, self._batches = self._batches, None
+        self.epoch += 1
+        yield from batches
+
+    def __len__(self) -> int:
+        if self._batches is None:
+            self._batches = self._generate()
+        return len(self._batches)
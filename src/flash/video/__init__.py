@@ -1,2 +1,20 @@
-from flash.video.classification.data import VideoClassificationData  # noqa: F401
-from flash.video.classification.model import VideoClassifier  # noqa: F401
+from typing import TYPE_CHECKING
+
+from flash.core.utilities.imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "VideoClassificationData": "flash.video.classification.data",
+        "VideoClassifier": "flash.video.classification.model",
+    },
+)
+
+__all__ = [
+    "VideoClassificationData",
+    "VideoClassifier",
+]
+
+if TYPE_CHECKING:
+    from flash.video.classification.data import VideoClassificationData  # noqa: F401
+    from flash.video.classification.model import VideoClassifier  # noqa: F401
@@ -25,6 +25,7 @@ from flash.core.data.utilities.paths import PATH_TYPE
 from flash.core.integrations.labelstudio.input import LabelStudioVideoClassificationInput, _parse_labelstudio_arguments
 from flash.core.utilities.imports import _FIFTYONE_AVAILABLE, _PYTORCHVIDEO_AVAILABLE, _TOPIC_VIDEO_AVAILABLE, requires
 from flash.core.utilities.stages import RunningStage
+from flash.video.classification.decoding import VideoCache
 from flash.video.classification.input import (
     VideoClassificationCSVInput,
     VideoClassificationCSVPredictInput,
@@ -35,6 +36,7 @@ from flash.video.classification.input import (
     VideoClassificationFilesInput,
     VideoClassificationFoldersInput,
     VideoClassificationPathsPredictInput,
+    VideoClassificationSlidingWindowPredictInput,
     VideoClassificationTensorsInput,
     VideoClassificationTensorsPredictInput,
 )
@@ -58,6 +60,7 @@ if not _TOPIC_VIDEO_AVAILABLE:
         "VideoClassificationData.from_csv",
         "VideoClassificationData.from_tensors",
         "VideoClassificationData.from_fiftyone",
+        "VideoClassificationData.from_sliding_windows",
     ]
 
 
@@ -84,6 +87,8 @@ class VideoClassificationData(DataModule):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         input_cls: Type[Input] = VideoClassificationFilesInput,
         predict_input_cls: Type[Input] = VideoClassificationPathsPredictInput,
         transform: INPUT_TRANSFORM_TYPE = VideoClassificationInputTransform,
@@ -117,6 +122,11 @@ class VideoClassificationData(DataModule):
             decode_audio: If True, also decode audio from video.
             decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``. Not used for frame
                 videos.
+            video_cache: Optionally, a :class:`~flash.video.classification.decoding.VideoCache` to keep videos open and
+                reuse decoded clips (or to decode the frames of each video only once, with ``frame_cache=True``).
+            clips_per_decode: The number of clips to cut out of each decoded span of video when loading the
+                training, validation, and testing data. See
+                :class:`~flash.video.classification.decoding.CachedLabeledVideoDataset` for details.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
@@ -172,6 +182,7 @@ class VideoClassificationData(DataModule):
             "clip_sampler_kwargs": clip_sampler_kwargs,
             "decode_audio": decode_audio,
             "decoder": decoder,
+            "video_cache": video_cache,
         }
 
         train_input = input_cls(
@@ -180,6 +191,7 @@ class VideoClassificationData(DataModule):
             train_targets,
             video_sampler=video_sampler,
             target_formatter=target_formatter,
+            clips_per_decode=clips_per_decode,
             **ds_kw,
         )
         target_formatter = getattr(train_input, "target_formatter", None)
@@ -192,6 +204,7 @@ class VideoClassificationData(DataModule):
                 val_targets,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             input_cls(
@@ -200,6 +213,7 @@ class VideoClassificationData(DataModule):
                 test_targets,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             predict_input_cls(RunningStage.PREDICTING, predict_files, **ds_kw),
@@ -222,6 +236,8 @@ class VideoClassificationData(DataModule):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         input_cls: Type[Input] = VideoClassificationFoldersInput,
         predict_input_cls: Type[Input] = VideoClassificationPathsPredictInput,
         transform: INPUT_TRANSFORM_TYPE = VideoClassificationInputTransform,
@@ -273,6 +289,11 @@ class VideoClassificationData(DataModule):
             decode_audio: If True, also decode audio from video.
             decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``. Not used for frame
                 videos.
+            video_cache: Optionally, a :class:`~flash.video.classification.decoding.VideoCache` to keep videos open and
+                reuse decoded clips (or to decode the frames of each video only once, with ``frame_cache=True``).
+            clips_per_decode: The number of clips to cut out of each decoded span of video when loading the
+                training, validation, and testing data. See
+                :class:`~flash.video.classification.decoding.CachedLabeledVideoDataset` for details.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
@@ -337,6 +358,7 @@ class VideoClassificationData(DataModule):
             "clip_sampler_kwargs": clip_sampler_kwargs,
             "decode_audio": decode_audio,
             "decoder": decoder,
+            "video_cache": video_cache,
         }
 
         train_input = input_cls(
@@ -344,6 +366,7 @@ class VideoClassificationData(DataModule):
             train_folder,
             video_sampler=video_sampler,
             target_formatter=target_formatter,
+            clips_per_decode=clips_per_decode,
             **ds_kw,
         )
         target_formatter = getattr(train_input, "target_formatter", None)
@@ -355,6 +378,7 @@ class VideoClassificationData(DataModule):
                 val_folder,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             input_cls(
@@ -362,6 +386,7 @@ class VideoClassificationData(DataModule):
                 test_folder,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             predict_input_cls(RunningStage.PREDICTING, predict_folder, **ds_kw),
@@ -393,6 +418,8 @@ class VideoClassificationData(DataModule):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         input_cls: Type[Input] = VideoClassificationDataFrameInput,
         predict_input_cls: Type[Input] = VideoClassificationDataFramePredictInput,
         target_formatter: Optional[TargetFormatter] = None,
@@ -439,6 +466,11 @@ class VideoClassificationData(DataModule):
             decode_audio: If True, also decode audio from video.
             decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``. Not used for frame
                 videos.
+            video_cache: Optionally, a :class:`~flash.video.classification.decoding.VideoCache` to keep videos open and
+                reuse decoded clips (or to decode the frames of each video only once, with ``frame_cache=True``).
+            clips_per_decode: The number of clips to cut out of each decoded span of video when loading the
+                training, validation, and testing data. See
+                :class:`~flash.video.classification.decoding.CachedLabeledVideoDataset` for details.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
@@ -520,6 +552,7 @@ class VideoClassificationData(DataModule):
             "clip_sampler_kwargs": clip_sampler_kwargs,
             "decode_audio": decode_audio,
             "decoder": decoder,
+            "video_cache": video_cache,
         }
 
         train_data = (train_data_frame, input_field, target_fields, train_videos_root, train_resolver)
@@ -532,6 +565,7 @@ class VideoClassificationData(DataModule):
             *train_data,
             video_sampler=video_sampler,
             target_formatter=target_formatter,
+            clips_per_decode=clips_per_decode,
             **ds_kw,
         )
         target_formatter = getattr(train_input, "target_formatter", None)
@@ -543,6 +577,7 @@ class VideoClassificationData(DataModule):
                 *val_data,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             input_cls(
@@ -550,6 +585,7 @@ class VideoClassificationData(DataModule):
                 *test_data,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             predict_input_cls(RunningStage.PREDICTING, *predict_data, **ds_kw),
@@ -698,6 +734,8 @@ class VideoClassificationData(DataModule):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         input_cls: Type[Input] = VideoClassificationCSVInput,
         predict_input_cls: Type[Input] = VideoClassificationCSVPredictInput,
         transform: INPUT_TRANSFORM_TYPE = VideoClassificationInputTransform,
@@ -743,6 +781,11 @@ class VideoClassificationData(DataModule):
             decode_audio: If True, also decode audio from video.
             decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``. Not used for frame
                 videos.
+            video_cache: Optionally, a :class:`~flash.video.classification.decoding.VideoCache` to keep videos open and
+                reuse decoded clips (or to decode the frames of each video only once, with ``frame_cache=True``).
+            clips_per_decode: The number of clips to cut out of each decoded span of video when loading the
+                training, validation, and testing data. See
+                :class:`~flash.video.classification.decoding.CachedLabeledVideoDataset` for details.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
@@ -918,6 +961,7 @@ class VideoClassificationData(DataModule):
             "clip_sampler_kwargs": clip_sampler_kwargs,
             "decode_audio": decode_audio,
             "decoder": decoder,
+            "video_cache": video_cache,
         }
 
         train_data = (train_file, input_field, target_fields, train_videos_root, train_resolver)
@@ -930,6 +974,7 @@ class VideoClassificationData(DataModule):
             *train_data,
             video_sampler=video_sampler,
             target_formatter=target_formatter,
+            clips_per_decode=clips_per_decode,
             **ds_kw,
         )
         target_formatter = getattr(train_input, "target_formatter", None)
@@ -941,6 +986,7 @@ class VideoClassificationData(DataModule):
                 *val_data,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             input_cls(
@@ -948,6 +994,7 @@ class VideoClassificationData(DataModule):
                 *test_data,
                 video_sampler=video_sampler,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             predict_input_cls(RunningStage.PREDICTING, *predict_data, **ds_kw),
@@ -971,6 +1018,8 @@ class VideoClassificationData(DataModule):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         label_field: str = "ground_truth",
         input_cls: Type[Input] = VideoClassificationFiftyOneInput,
         predict_input_cls: Type[Input] = VideoClassificationFiftyOnePredictInput,
@@ -1003,6 +1052,11 @@ class VideoClassificationData(DataModule):
             decode_audio: If True, also decode audio from video.
             decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``. Not used for frame
                 videos.
+            video_cache: Optionally, a :class:`~flash.video.classification.decoding.VideoCache` to keep videos open and
+                reuse decoded clips (or to decode the frames of each video only once, with ``frame_cache=True``).
+            clips_per_decode: The number of clips to cut out of each decoded span of video when loading the
+                training, validation, and testing data. See
+                :class:`~flash.video.classification.decoding.CachedLabeledVideoDataset` for details.
             input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the data.
             predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
             transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
@@ -1075,6 +1129,7 @@ class VideoClassificationData(DataModule):
             "clip_sampler_kwargs": clip_sampler_kwargs,
             "decode_audio": decode_audio,
             "decoder": decoder,
+            "video_cache": video_cache,
         }
 
         train_input = input_cls(
@@ -1083,6 +1138,7 @@ class VideoClassificationData(DataModule):
             video_sampler=video_sampler,
             label_field=label_field,
             target_formatter=target_formatter,
+            clips_per_decode=clips_per_decode,
             **ds_kw,
         )
         target_formatter = getattr(train_input, "target_formatter", None)
@@ -1095,6 +1151,7 @@ class VideoClassificationData(DataModule):
                 video_sampler=video_sampler,
                 label_field=label_field,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             input_cls(
@@ -1103,6 +1160,7 @@ class VideoClassificationData(DataModule):
                 video_sampler=video_sampler,
                 label_field=label_field,
                 target_formatter=target_formatter,
+                clips_per_decode=clips_per_decode,
                 **ds_kw,
             ),
             predict_input_cls(RunningStage.PREDICTING, predict_dataset, **ds_kw),
@@ -1111,6 +1169,96 @@ class VideoClassificationData(DataModule):
             **data_module_kwargs,
         )
 
+    @classmethod
+    def from_sliding_windows(
+        cls,
+        predict_files: Sequence[str],
+        clip_duration: float = 2,
+        clip_stride: Optional[float] = None,
+        short_side_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        predict_input_cls: Type[Input] = VideoClassificationSlidingWindowPredictInput,
+        transform: INPUT_TRANSFORM_TYPE = VideoClassificationInputTransform,
+        transform_kwargs: Optional[Dict] = None,
+        **data_module_kwargs: Any,
+    ) -> "VideoClassificationData":
+        """Load the :class:`~flash.video.classification.data.VideoClassificationData` to predict on every window of
+        a list of (long) videos.
+
+        Each video is decoded only once, from start to end, and the (possibly overlapping) windows of
+        ``clip_duration`` seconds starting every ``clip_stride`` seconds are predicted in order. The windows of
+        consecutive videos are batched together, up to ``batch_size`` windows and (if given) ``max_batch_bytes`` of
+        decoded clips per batch. Use ``output="windows"`` when predicting to get the logits of each window with its
+        position in the video, and :func:`~flash.video.classification.output.aggregate_windows` to gather them into
+        per-video or per-segment predictions.
+
+        The supported file extensions are: ``.mp4``, and ``.avi``.
+        To learn how to customize the transforms applied for each stage, read our
+        :ref:`customizing transforms guide <customizing_transforms>`.
+
+        Args:
+            predict_files: The list of video files to predict on.
+            clip_duration: The duration of each window (in seconds).
+            clip_stride: The time between the starts of consecutive windows. Defaults to ``clip_duration``.
+            short_side_size: Optionally, resize the shorter side of the frames to this size while decoding.
+            max_batch_bytes: Optionally, the maximum number of bytes of decoded (``float32``) clips in a batch.
+            predict_input_cls: The :class:`~flash.core.data.io.input.Input` type to use for loading the prediction data.
+            transform: The :class:`~flash.core.data.io.input_transform.InputTransform` type to use.
+            transform_kwargs: Dict of keyword arguments to be provided when instantiating the transforms.
+            data_module_kwargs: Additional keyword arguments to provide to the
+                :class:`~flash.core.data.data_module.DataModule` constructor.
+
+        Returns:
+            The constructed :class:`~flash.video.classification.data.VideoClassificationData`.
+
+        Examples
+        ________
+
+        .. testsetup::
+
+            >>> import torch
+            >>> from torchvision import io
+            >>> data = torch.randint(255, (20, 64, 64, 3))
+            >>> _ = [io.write_video(f"predict_video_{i}.mp4", data, 5, "libx264rgb", {"crf": "0"}) for i in range(1, 3)]
+
+        .. doctest::
+
+            >>> from flash import Trainer
+            >>> from flash.video import VideoClassifier, VideoClassificationData
+            >>> from flash.video.classification.output import aggregate_windows
+            >>> datamodule = VideoClassificationData.from_sliding_windows(
+            ...     predict_files=["predict_video_1.mp4", "predict_video_2.mp4"],
+            ...     clip_duration=1,
+            ...     clip_stride=0.5,
+            ...     transform_kwargs=dict(image_size=(244, 244)),
+            ...     batch_size=4,
+            ... )
+            >>> model = VideoClassifier(backbone="x3d_xs", num_classes=2)
+            >>> trainer = Trainer()
+            >>> predictions = trainer.predict(model, datamodule=datamodule, output="windows")  # doctest: +ELLIPSIS
+            Predicting...
+            >>> [video["num_windows"] for video in aggregate_windows(predictions)]
+            [7, 7]
+
+        .. testcleanup::
+
+            >>> import os
+            >>> _ = [os.remove(f"predict_video_{i}.mp4") for i in range(1, 3)]
+        """
+        return cls(
+            predict_input=predict_input_cls(
+                RunningStage.PREDICTING,
+                predict_files,
+                clip_duration=clip_duration,
+                clip_stride=clip_stride,
+                short_side_size=short_side_size,
+                max_batch_bytes=max_batch_bytes,
+            ),
+            transform=transform,
+            transform_kwargs=transform_kwargs,
+            **data_module_kwargs,
+        )
+
     @classmethod
     def from_labelstudio(
         cls,
@@ -0,0 +1,521 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Video decoding with a per-worker cache of open videos and decoded clips, and an optional cache of pre-extracted
+frames.
+
+Opening a video with ``EncodedVideo.from_path`` reads the whole file and parses the container, and decoding a clip
+seeks to the previous key frame and decodes the full GOP. The :class:`VideoCache` keeps the last opened videos (and,
+for deterministic clip samplers, the last decoded clips) so that this work isn't repeated. With ``frame_cache=True``,
+the frames of each video are decoded once into an uncompressed ``uint8`` file which is then read through a memory map,
+so repeated epochs don't decode at all.
+"""
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Type
+
+import fsspec
+import numpy as np
+import torch
+from torch.utils.data import get_worker_info
+
+from flash.core.data.utilities.loading import escape_file_path, is_local_path
+from flash.core.utilities.imports import _PYTORCHVIDEO_AVAILABLE
+
+if _PYTORCHVIDEO_AVAILABLE:
+    import av
+    from pytorchvideo.data.clip_sampling import ClipInfo, ClipSampler, RandomClipSampler
+    from pytorchvideo.data.encoded_video import EncodedVideo
+    from pytorchvideo.data.utils import MultiProcessSampler
+else:
+    av, ClipInfo, ClipSampler, RandomClipSampler, EncodedVideo, MultiProcessSampler = None, None, None, None, None, None
+
+logger = logging.getLogger(__name__)
+
+_FRAME_CACHE_VERSION = 1
+
+
+def _frame_cache_key(path: str, short_side_size: Optional[int]) -> str:
+    parts = [path, short_side_size, _FRAME_CACHE_VERSION]
+    if is_local_path(path):
+        # Extract the frames again if the video changes
+        stat = os.stat(path)
+        parts = [os.path.abspath(path), stat.st_size, stat.st_mtime_ns] + parts[1:]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _resized_shape(height: int, width: int, short_side_size: Optional[int]) -> Tuple[int, int]:
+    if short_side_size is None or min(height, width) <= short_side_size:
+        return height, width
+    if height < width:
+        return short_side_size, max(1, round(width * short_side_size / height))
+    return max(1, round(height * short_side_size / width)), short_side_size
+
+
+def _stream_duration(container: "av.container.InputContainer", stream: "av.video.stream.VideoStream", default: float):
+    if stream.duration is not None:
+        return stream.duration * float(stream.time_base)
+    if container.duration is not None:
+        return container.duration / av.time_base
+    return default
+
+
+def extract_frames(path: str, output_prefix: str, short_side_size: Optional[int] = None) -> Dict[str, Any]:
+    """Decode all the frames of the video at ``path`` into ``<output_prefix>.frames`` (raw ``uint8`` frames of shape
+    ``(time, height, width, 3)``) and write their shape and timestamps to ``<output_prefix>.json``. Returns the
+    metadata.
+
+    Args:
+        path: The video file to decode.
+        output_prefix: The path of the output files, without extension.
+        short_side_size: Optionally, the size to resize the shorter side of the frames to (only frames which are larger
+            are resized).
+    """
+    output_dir = os.path.dirname(output_prefix)
+    os.makedirs(output_dir, exist_ok=True)
+    timestamps = []
+    shape = None
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out, fsspec.open(escape_file_path(path), "rb") as f:
+            container = av.open(f)
+            try:
+                stream = container.streams.video[0]
+                stream.thread_type = "AUTO"
+                time_base = float(stream.time_base)
+                start_pts = stream.start_time or 0
+                for frame in container.decode(video=0):
+                    if shape is None:
+                        shape = _resized_shape(frame.height, frame.width, short_side_size)
+                    out.write(frame.to_ndarray(height=shape[0], width=shape[1], format="rgb24").tobytes())
+                    timestamps.append((frame.pts - start_pts) * time_base)
+                duration = _stream_duration(container, stream, timestamps[-1] if timestamps else 0.0)
+            finally:
+                container.close()
+        if shape is None:
+            raise ValueError(f"The video {path} doesn't contain any frames.")
+        os.replace(tmp_path, f"{output_prefix}.frames")
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    meta = {
+        "version": _FRAME_CACHE_VERSION,
+        "name": os.path.basename(path),
+        "shape": [len(timestamps), shape[0], shape[1], 3],
+        "timestamps": timestamps,
+        "duration": duration,
+    }
+    # The metadata is written last (and atomically) so that its presence means the frames are complete
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, f"{output_prefix}.json")
+    return meta
+
+
+def iter_video_windows(
+    path: str, clip_duration: float, clip_stride: Optional[float] = None, short_side_size: Optional[int] = None
+) -> Iterator[Tuple[float, float, np.ndarray]]:
+    """Decode the video at ``path`` once, from start to end, and yield its (possibly overlapping) windows in order.
+
+    The windows start every ``clip_stride`` seconds and each one holds the frames with a timestamp in ``[start, start +
+    clip_duration]``, as a ``uint8`` array of shape ``(time, height, width, 3)``. Only the frames of the current window
+    are kept in memory. As with the ``"uniform"`` clip sampler, the last frames are dropped if they don't fill a whole
+    window (a video shorter than ``clip_duration`` gives a single window).
+
+    Args:
+        path: The video file to decode.
+        clip_duration: The duration of each window (in seconds).
+        clip_stride: The time between the starts of consecutive windows. Defaults to ``clip_duration`` (no overlap).
+        short_side_size: Optionally, the size to resize the shorter side of the frames to (only frames which are larger
+            are resized).
+
+    Yields:
+        The ``(start, end, frames)`` of each window.
+    """
+    clip_stride = clip_stride or clip_duration
+    if clip_duration <= 0 or clip_stride <= 0:
+        raise ValueError(f"`clip_duration` and `clip_stride` should be positive. Found {clip_duration}, {clip_stride}.")
+
+    frames: Deque[Tuple[float, np.ndarray]] = deque()
+    window_index, num_windows, shape = 0, 0, None
+    # The frame timestamps are compared to the window bounds with a tolerance for floating point errors
+    eps = 1e-6
+
+    def start_of(index: int) -> float:
+        return round(index * clip_stride, 9)
+
+    def window() -> Tuple[float, float, np.ndarray]:
+        start = start_of(window_index)
+        return start, start + clip_duration, np.stack([array for _, array in frames])
+
+    def next_window() -> None:
+        nonlocal window_index
+        window_index += 1
+        while frames and frames[0][0] < start_of(window_index) - eps:
+            frames.popleft()
+
+    with fsspec.open(escape_file_path(path), "rb") as f:
+        container = av.open(f)
+        try:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            time_base = float(stream.time_base)
+            start_pts = stream.start_time or 0
+            timestamp = 0.0
+            for frame in container.decode(video=0):
+                timestamp = (frame.pts - start_pts) * time_base
+                # The window is complete once a frame after its end is decoded
+                while timestamp > start_of(window_index) + clip_duration + eps:
+                    if frames:
+                        yield window()
+                        num_windows += 1
+                    next_window()
+                if timestamp >= start_of(window_index) - eps:
+                    if shape is None:
+                        shape = _resized_shape(frame.height, frame.width, short_side_size)
+                    frames.append((timestamp, frame.to_ndarray(height=shape[0], width=shape[1], format="rgb24")))
+            duration = _stream_duration(container, stream, timestamp)
+        finally:
+            container.close()
+
+    while frames and (num_windows == 0 or start_of(window_index) + clip_duration <= duration + eps):
+        yield window()
+        num_windows += 1
+        next_window()
+
+
+class VideoFrames:
+    """A video whose frames were extracted with :func:`extract_frames`, read through a memory map.
+
+    It has the same ``name``, ``duration``, ``get_clip``, and ``close`` interface as the ``EncodedVideo`` of
+    PyTorchVideo, without audio.
+    """
+
+    def __init__(self, output_prefix: str, meta: Dict[str, Any]):
+        self._frames = np.memmap(f"{output_prefix}.frames", dtype=np.uint8, mode="r", shape=tuple(meta["shape"]))
+        self._timestamps = np.asarray(meta["timestamps"], dtype=np.float64)
+        self._duration = meta["duration"]
+        self._name = meta["name"]
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def duration(self) -> float:
+        return self._duration
+
+    def get_clip(self, start_sec: float, end_sec: float) -> Dict[str, Optional[torch.Tensor]]:
+        """Return the frames with a timestamp in ``[start_sec, end_sec]`` as a ``float32`` tensor of shape
+        ``(channels, time, height, width)`` (or ``None`` if there are none)."""
+        start = np.searchsorted(self._timestamps, start_sec, side="left")
+        end = np.searchsorted(self._timestamps, end_sec, side="right")
+        video = None
+        if end > start:
+            video = torch.from_numpy(np.array(self._frames[start:end])).to(torch.float32).permute(3, 0, 1, 2)
+        return {"video": video, "audio": None}
+
+    def close(self) -> None:
+        self._frames = None
+
+
+def _clip_num_bytes(clip: Dict[str, Optional[torch.Tensor]]) -> int:
+    return sum(value.numel() * value.element_size() for value in clip.values() if value is not None)
+
+
+class VideoCache:
+    """The ``VideoCache`` keeps the last opened videos and decoded clips of each DataLoader worker.
+
+    Args:
+        max_open_videos: The maximum number of videos to keep open. Each open video holds its (encoded) file in
+            memory.
+        max_cached_bytes: The maximum number of bytes of decoded clips to keep. Clips are stored as ``uint8`` so they
+            take a quarter of the memory of the decoded ``float32`` clips. Set to ``0`` to disable.
+        frame_cache: If ``True``, the frames of each video are decoded once into ``frame_cache_dir`` and read through a
+            memory map afterwards (audio is not supported). The frames are stored uncompressed, so this takes about
+            ``height * width * 3`` bytes per frame of disk space.
+        frame_cache_dir: The folder to extract the frames to. Defaults to ``$FLASH_CACHE_DIR`` or a
+            ``flash_video_frames`` folder in the temporary directory.
+        short_side_size: Optionally, the size to resize the shorter side of the extracted frames to. This makes the
+            frame cache much smaller when the transforms crop smaller images anyway.
+    """
+
+    def __init__(
+        self,
+        max_open_videos: int = 4,
+        max_cached_bytes: int = 512 * 2**20,
+        frame_cache: bool = False,
+        frame_cache_dir: Optional[str] = None,
+        short_side_size: Optional[int] = None,
+    ):
+        if max_open_videos < 1:
+            raise ValueError(f"`max_open_videos` should be a positive integer. Found {max_open_videos}.")
+        if frame_cache_dir is None:
+            frame_cache_dir = os.environ.get(
+                "FLASH_CACHE_DIR", os.path.join(tempfile.gettempdir(), "flash_video_frames")
+            )
+        self.max_open_videos = max_open_videos
+        self.max_cached_bytes = max_cached_bytes
+        self.frame_cache = frame_cache
+        self.frame_cache_dir = str(frame_cache_dir)
+        self.short_side_size = short_side_size
+
+        self._videos: "OrderedDict[Tuple[str, bool, str], Any]" = OrderedDict()
+        self._clips: "OrderedDict[Tuple[Any, ...], Dict[str, Optional[torch.Tensor]]]" = OrderedDict()
+        self._num_bytes = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Each DataLoader worker opens its own videos
+        state = self.__dict__.copy()
+        state["_videos"] = OrderedDict()
+        state["_clips"] = OrderedDict()
+        state["_num_bytes"] = 0
+        return state
+
+    def _open_frames(self, path: str) -> VideoFrames:
+        output_prefix = os.path.join(self.frame_cache_dir, _frame_cache_key(path, self.short_side_size))
+        try:
+            with open(f"{output_prefix}.json") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = extract_frames(path, output_prefix, short_side_size=self.short_side_size)
+        return VideoFrames(output_prefix, meta)
+
+    def open(self, path: str, decode_audio: bool = False, decoder: str = "pyav") -> Any:
+        """Return the video at ``path``, opening it if it isn't open already."""
+        key = (path, decode_audio, decoder)
+        video = self._videos.get(key, None)
+        if video is not None:
+            self._videos.move_to_end(key)
+            return video
+
+        if self.frame_cache:
+            if decode_audio:
+                raise ValueError("The frame cache doesn't support audio, set `decode_audio=False`.")
+            video = self._open_frames(path)
+        else:
+            video = EncodedVideo.from_path(path, decode_audio=decode_audio, decoder=decoder)
+        self._videos[key] = video
+        while len(self._videos) > self.max_open_videos:
+            _, evicted = self._videos.popitem(last=False)
+            evicted.close()
+        return video
+
+    def get_clip(
+        self, path: str, start_sec: float, end_sec: float, decode_audio: bool = False, decoder: str = "pyav"
+    ) -> Dict[str, Optional[torch.Tensor]]:
+        """Return the ``{"video": ..., "audio": ...}`` clip of the video at ``path`` between ``start_sec`` and
+        ``end_sec``, from the decoded clips cache when possible."""
+        video = self.open(path, decode_audio=decode_audio, decoder=decoder)
+        if isinstance(video, VideoFrames) or self.max_cached_bytes <= 0:
+            return video.get_clip(start_sec, end_sec)
+
+        key = (path, decode_audio, decoder, float(start_sec), float(end_sec))
+        clip = self._clips.get(key, None)
+        if clip is None:
+            clip = video.get_clip(start_sec, end_sec)
+            if clip["video"] is not None:
+                self._put_clip(key, clip)
+            return clip
+        self._clips.move_to_end(key)
+        return {"video": clip["video"].to(torch.float32), "audio": clip["audio"]}
+
+    def _put_clip(self, key: Tuple[Any, ...], clip: Dict[str, Optional[torch.Tensor]]) -> None:
+        # The decoded frames are integers in [0, 255] so they can be stored as uint8
+        clip = {"video": clip["video"].to(torch.uint8), "audio": clip["audio"]}
+        num_bytes = _clip_num_bytes(clip)
+        if num_bytes > self.max_cached_bytes:
+            return
+        self._clips[key] = clip
+        self._num_bytes += num_bytes
+        while self._num_bytes > self.max_cached_bytes:
+            _, evicted = self._clips.popitem(last=False)
+            self._num_bytes -= _clip_num_bytes(evicted)
+
+    def close(self) -> None:
+        """Close all the open videos and drop the decoded clips."""
+        for video in self._videos.values():
+            video.close()
+        self._videos.clear()
+        self._clips.clear()
+        self._num_bytes = 0
+
+
+def _slice_clip(
+    clip: Dict[str, Optional[torch.Tensor]], span_start: float, span_end: float, start: float, end: float
+) -> Dict[str, Optional[torch.Tensor]]:
+    """Cut the clip between ``start`` and ``end`` out of a clip decoded between ``span_start`` and ``span_end``.
+
+    The clip doesn't hold the timestamps of its frames, so the frames (and audio samples) are assumed to be evenly
+    spaced over the span: the cut is accurate to a frame for constant frame rate videos, but may be off by a few frames
+    for variable frame rate videos (use ``clips_per_decode=1`` to decode each clip on its own for those).
+    """
+    if start <= span_start and end >= span_end:
+        return clip
+    span = max(span_end - span_start, 1e-6)
+
+    def cut(value: Optional[torch.Tensor], dim: int) -> Optional[torch.Tensor]:
+        if value is None:
+            return None
+        length = value.shape[dim]
+        first = min(max(int(round((start - span_start) / span * length)), 0), length - 1)
+        last = max(min(int(round((end - span_start) / span * length)), length), first + 1)
+        return value.narrow(dim, first, last - first)
+
+    return {"video": cut(clip["video"], 1), "audio": cut(clip["audio"], 0)}
+
+
+class CachedLabeledVideoDataset(torch.utils.data.IterableDataset):
+    """An iterable dataset of clips of labeled videos, like the ``LabeledVideoDataset`` of PyTorchVideo, which
+    decodes through a :class:`~flash.video.classification.decoding.VideoCache` and can cut several clips out of each
+    decoded span of video.
+
+    Args:
+        labeled_video_paths: The ``(path, info_dict)`` of each video (e.g. a ``LabeledVideoPaths``).
+        clip_sampler: The clip sampler which defines the clips to sample from each video.
+        video_sampler: Sampler for the order of the videos.
+        decode_audio: If True, also decode audio from video.
+        decoder: The decoder to use to decode videos. One of: ``"pyav"``, ``"torchvision"``.
+        video_cache: The cache of open videos and decoded clips.
+        clips_per_decode: The number of clips to cut out of each decoded span of video. With the ``"random"`` clip
+            sampler, the clips are drawn at random from a random span of twice the clip duration (so a span costs
+            about two clip decodes for ``clips_per_decode`` clips, a single clip is decoded on its own). With other
+            clip samplers, up to ``clips_per_decode`` consecutive clips are decoded at once. The clips are cut out of
+            the spans assuming a constant frame rate.
+    """
+
+    def __init__(
+        self,
+        labeled_video_paths: Any,
+        clip_sampler: "ClipSampler",
+        video_sampler: Type[torch.utils.data.Sampler] = torch.utils.data.RandomSampler,
+        decode_audio: bool = False,
+        decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
+    ):
+        if clips_per_decode < 1:
+            raise ValueError(f"`clips_per_decode` should be a positive integer. Found {clips_per_decode}.")
+        self._labeled_videos = labeled_video_paths
+        self._clip_sampler = clip_sampler
+        self._decode_audio = decode_audio
+        self._decoder = decoder
+        self.video_cache = video_cache or VideoCache()
+        self.clips_per_decode = clips_per_decode
+
+        # If a RandomSampler is used we need to pass in a custom random generator that
+        # ensures all PyTorch multiprocess workers have the same random seed.
+        self._video_random_generator = None
+        if video_sampler == torch.utils.data.RandomSampler:
+            self._video_random_generator = torch.Generator()
+            self._video_sampler = video_sampler(self._labeled_videos, generator=self._video_random_generator)
+        else:
+            self._video_sampler = video_sampler(self._labeled_videos)
+
+    @property
+    def video_sampler(self) -> torch.utils.data.Sampler:
+        return self._video_sampler
+
+    @property
+    def num_videos(self) -> int:
+        return len(self.video_sampler)
+
+    def _clip_groups(self, duration: float, info_dict: Dict[str, Any]) -> Iterator[List["ClipInfo"]]:
+        """Yield the clips to sample from a video, grouped by the span of video which is decoded for them."""
+        if isinstance(self._clip_sampler, RandomClipSampler):
+            clip_duration = float(self._clip_sampler._clip_duration)
+            # A single clip is drawn from the whole video, as with the ``RandomClipSampler`` itself
+            span = clip_duration if self.clips_per_decode == 1 else min(2 * clip_duration, max(duration, clip_duration))
+            span_start = random.uniform(0, max(duration - span, 0))
+            group = []
+            for _ in range(self.clips_per_decode):
+                clip_start = span_start + random.uniform(0, span - clip_duration)
+                group.append(ClipInfo(clip_start, clip_start + clip_duration, 0, 0, True))
+            yield group
+            return
+
+        if hasattr(self._clip_sampler, "reset"):
+            self._clip_sampler.reset()
+        group, next_clip_start = [], 0.0
+        while True:
+            clip_info = self._clip_sampler(next_clip_start, duration, info_dict)
+            next_clip_start = clip_info.clip_end_sec
+            group.append(clip_info)
+            if clip_info.is_last_clip or len(group) == self.clips_per_decode:
+                yield group
+                group = []
+            if clip_info.is_last_clip:
+                return
+
+    def _iter_video(self, video_index: int) -> Iterator[Dict[str, Any]]:
+        video_path, info_dict = self._labeled_videos[video_index]
+        try:
+            video = self.video_cache.open(video_path, decode_audio=self._decode_audio, decoder=self._decoder)
+        except Exception as e:
+            logger.debug(f"Failed to load video {video_path} with error: {e}")
+            return
+
+        # Clips of random samplers are never decoded twice so there is no point in caching them
+        cache_clips = not isinstance(self._clip_sampler, RandomClipSampler)
+        for group in self._clip_groups(video.duration, info_dict):
+            span_start = min(clip_info.clip_start_sec for clip_info in group)
+            span_end = max(clip_info.clip_end_sec for clip_info in group)
+            if isinstance(video, VideoFrames):
+                clips = [video.get_clip(clip_info.clip_start_sec, clip_info.clip_end_sec) for clip_info in group]
+            else:
+                if cache_clips:
+                    span_clip = self.video_cache.get_clip(
+                        video_path, span_start, span_end, decode_audio=self._decode_audio, decoder=self._decoder
+                    )
+                else:
+                    span_clip = video.get_clip(span_start, span_end)
+                if span_clip is None or span_clip["video"] is None:
+                    logger.debug(f"Failed to load clip {video.name} between {span_start} and {span_end}")
+                    continue
+                clips = [
+                    _slice_clip(span_clip, span_start, span_end, clip_info.clip_start_sec, clip_info.clip_end_sec)
+                    for clip_info in group
+                ]
+
+            for clip_info, clip in zip(group, clips):
+                if clip["video"] is None:
+                    continue
+                yield {
+                    "video": clip["video"],
+                    "video_name": video.name,
+                    "video_index": video_index,
+                    "clip_index": clip_info.clip_index,
+                    "aug_index": clip_info.aug_index,
+                    **info_dict,
+                    **({"audio": clip["audio"]} if clip["audio"] is not None else {}),
+                }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # If we're in a PyTorch DataLoader multiprocessing context, we need to use the
+        # same seed for each worker's RandomSampler generator. The workers at each
+        # __iter__ call are created from the unique value: worker_info.seed - worker_info.id,
+        # which we can use for this seed.
+        worker_info = get_worker_info()
+        if self._video_random_generator is not None and worker_info is not None:
+            self._video_random_generator.manual_seed(worker_info.seed - worker_info.id)
+
+        for video_index in MultiProcessSampler(self._video_sampler):
+            yield from self._iter_video(video_index)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from typing import Any, Callable, Collection, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Type, Union
 
 import pandas as pd
 import torch
@@ -24,8 +24,10 @@ from flash.core.data.utilities.classification import MultiBinaryTargetFormatter,
 from flash.core.data.utilities.data_frame import resolve_files, resolve_targets
 from flash.core.data.utilities.loading import load_data_frame
 from flash.core.data.utilities.paths import PATH_TYPE, list_valid_files, make_dataset
+from flash.core.data.utilities.sampling import shard_info
 from flash.core.integrations.fiftyone.utils import FiftyOneLabelUtilities
 from flash.core.utilities.imports import _FIFTYONE_AVAILABLE, _PYTORCHVIDEO_AVAILABLE, lazy_import, requires
+from flash.video.classification.decoding import CachedLabeledVideoDataset, VideoCache, iter_video_windows
 
 if _FIFTYONE_AVAILABLE:
     fol = lazy_import("fiftyone.core.labels")
@@ -73,15 +75,30 @@ class VideoClassificationInput(IterableInput, ClassificationInputMixin):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         target_formatter: Optional[TargetFormatter] = None,
-    ) -> "LabeledVideoDataset":
-        dataset = LabeledVideoDataset(
-            LabeledVideoPaths(list(zip(files, targets))),
-            _make_clip_sampler(clip_sampler, clip_duration, clip_sampler_kwargs),
-            video_sampler=video_sampler,
-            decode_audio=decode_audio,
-            decoder=decoder,
-        )
+    ) -> Union["LabeledVideoDataset", CachedLabeledVideoDataset]:
+        labeled_video_paths = LabeledVideoPaths(list(zip(files, targets)))
+        clip_sampler = _make_clip_sampler(clip_sampler, clip_duration, clip_sampler_kwargs)
+        if video_cache is None and clips_per_decode == 1:
+            dataset = LabeledVideoDataset(
+                labeled_video_paths,
+                clip_sampler,
+                video_sampler=video_sampler,
+                decode_audio=decode_audio,
+                decoder=decoder,
+            )
+        else:
+            dataset = CachedLabeledVideoDataset(
+                labeled_video_paths,
+                clip_sampler,
+                video_sampler=video_sampler,
+                decode_audio=decode_audio,
+                decoder=decoder,
+                video_cache=video_cache,
+                clips_per_decode=clips_per_decode,
+            )
         if not self.predicting:
             self.load_target_metadata(
                 [sample[1] for sample in dataset._labeled_videos._paths_and_labels], target_formatter=target_formatter
@@ -142,6 +159,8 @@ class VideoClassificationFoldersInput(VideoClassificationInput):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         target_formatter: Optional[TargetFormatter] = None,
     ) -> "LabeledVideoDataset":
         return super().load_data(
@@ -152,6 +171,8 @@ class VideoClassificationFoldersInput(VideoClassificationInput):
             video_sampler=video_sampler,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+            clips_per_decode=clips_per_decode,
             target_formatter=target_formatter,
         )
 
@@ -167,6 +188,8 @@ class VideoClassificationFilesInput(VideoClassificationInput):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         target_formatter: Optional[TargetFormatter] = None,
     ) -> "LabeledVideoDataset":
         return super().load_data(
@@ -178,6 +201,8 @@ class VideoClassificationFilesInput(VideoClassificationInput):
             video_sampler=video_sampler,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+            clips_per_decode=clips_per_decode,
             target_formatter=target_formatter,
         )
 
@@ -198,6 +223,8 @@ class VideoClassificationDataFrameInput(VideoClassificationInput):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         target_formatter: Optional[TargetFormatter] = None,
     ) -> "LabeledVideoDataset":
         result = super().load_data(
@@ -209,6 +236,8 @@ class VideoClassificationDataFrameInput(VideoClassificationInput):
             video_sampler=video_sampler,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+            clips_per_decode=clips_per_decode,
             target_formatter=target_formatter,
         )
 
@@ -265,6 +294,8 @@ class VideoClassificationCSVInput(VideoClassificationDataFrameInput):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         target_formatter: Optional[TargetFormatter] = None,
     ) -> "LabeledVideoDataset":
         data_frame = load_data_frame(csv_file)
@@ -282,6 +313,8 @@ class VideoClassificationCSVInput(VideoClassificationDataFrameInput):
             video_sampler=video_sampler,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+            clips_per_decode=clips_per_decode,
             target_formatter=target_formatter,
         )
 
@@ -297,6 +330,8 @@ class VideoClassificationFiftyOneInput(VideoClassificationInput):
         video_sampler: Type[Sampler] = torch.utils.data.RandomSampler,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
+        clips_per_decode: int = 1,
         label_field: str = "ground_truth",
         target_formatter: Optional[TargetFormatter] = None,
     ) -> "LabeledVideoDataset":
@@ -312,6 +347,8 @@ class VideoClassificationFiftyOneInput(VideoClassificationInput):
             video_sampler=video_sampler,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+            clips_per_decode=clips_per_decode,
             target_formatter=target_formatter,
         )
 
@@ -325,15 +362,22 @@ class VideoClassificationPathsPredictInput(Input):
         clip_sampler_kwargs: Dict[str, Any] = None,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
     ) -> List[str]:
         paths = list_valid_files(paths, valid_extensions=("mp4", "avi"))
         self._clip_sampler = _make_clip_sampler(clip_sampler, clip_duration, clip_sampler_kwargs)
         self._decode_audio = decode_audio
         self._decoder = decoder
+        self._video_cache = video_cache
         return paths
 
+    def _open_video(self, path: str) -> Any:
+        if self._video_cache is not None:
+            return self._video_cache.open(path, decode_audio=self._decode_audio, decoder=self._decoder)
+        return EncodedVideo.from_path(path, decode_audio=self._decode_audio, decoder=self._decoder)
+
     def predict_load_sample(self, sample: str) -> Dict[str, Any]:
-        video = EncodedVideo.from_path(sample, decode_audio=self._decode_audio, decoder=self._decoder)
+        video = self._open_video(sample)
         (
             clip_start,
             clip_end,
@@ -378,6 +422,7 @@ class VideoClassificationDataFramePredictInput(VideoClassificationPathsPredictIn
         clip_sampler_kwargs: Dict[str, Any] = None,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
     ) -> List[str]:
         return super().predict_load_data(
             resolve_files(data_frame, input_key, root, resolver),
@@ -386,6 +431,7 @@ class VideoClassificationDataFramePredictInput(VideoClassificationPathsPredictIn
             clip_sampler_kwargs=clip_sampler_kwargs,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
         )
 
 
@@ -423,6 +469,7 @@ class VideoClassificationCSVPredictInput(VideoClassificationDataFramePredictInpu
         clip_sampler_kwargs: Dict[str, Any] = None,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
     ) -> List[str]:
         data_frame = load_data_frame(csv_file)
         if root is None:
@@ -437,6 +484,7 @@ class VideoClassificationCSVPredictInput(VideoClassificationDataFramePredictInpu
             clip_sampler_kwargs=clip_sampler_kwargs,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
         )
 
 
@@ -450,6 +498,7 @@ class VideoClassificationFiftyOnePredictInput(VideoClassificationPathsPredictInp
         clip_sampler_kwargs: Dict[str, Any] = None,
         decode_audio: bool = False,
         decoder: str = "pyav",
+        video_cache: Optional[VideoCache] = None,
     ) -> List[str]:
         return super().predict_load_data(
             data.values("filepath"),
@@ -458,4 +507,91 @@ class VideoClassificationFiftyOnePredictInput(VideoClassificationPathsPredictInp
             clip_sampler_kwargs=clip_sampler_kwargs,
             decode_audio=decode_audio,
             decoder=decoder,
+            video_cache=video_cache,
+        )
+
+
+class VideoWindows:
+    """An iterable over the windows of a list of videos (see
+    :func:`~flash.video.classification.decoding.iter_video_windows`), decoded lazily as they're iterated over. The
+    videos are split between the DataLoader workers and DDP processes. The number of windows isn't known until the
+    videos are decoded so it intentionally doesn't define ``len``."""
+
+    def __init__(
+        self,
+        paths: List[str],
+        clip_duration: float = 2,
+        clip_stride: Optional[float] = None,
+        short_side_size: Optional[int] = None,
+    ):
+        self.paths = paths
+        self.clip_duration = clip_duration
+        self.clip_stride = clip_stride
+        self.short_side_size = short_side_size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        shard, num_shards = shard_info()
+        for video_index in range(shard, len(self.paths), num_shards):
+            path = self.paths[video_index]
+            windows = iter_video_windows(path, self.clip_duration, self.clip_stride, self.short_side_size)
+            for window_index, (start, end, frames) in enumerate(windows):
+                yield {
+                    DataKeys.INPUT: torch.from_numpy(frames).to(torch.float32).permute(3, 0, 1, 2),
+                    "video_index": video_index,
+                    DataKeys.METADATA: {"filepath": path, "window_index": window_index, "start": start, "end": end},
+                }
+
+
+class VideoClassificationSlidingWindowPredictInput(IterableInput):
+    """Stream the (possibly overlapping) windows of a list of videos for prediction, in order.
+
+    Each video is decoded only once (see :func:`~flash.video.classification.decoding.iter_video_windows`). The
+    windows are grouped into batches across videos, a batch is complete once it holds ``batch_size`` windows or when
+    adding the next window would exceed ``max_batch_bytes`` (counting the decoded ``float32`` clips). The videos are
+    split between the DataLoader workers and DDP processes. The predictions can be gathered back into per-video (or
+    per-segment) predictions with :func:`~flash.video.classification.output.aggregate_windows`.
+    """
+
+    yields_batches: bool = True
+    batch_size: int = 1
+    max_batch_bytes: Optional[int] = None
+
+    def predict_load_data(
+        self,
+        paths: List[str],
+        clip_duration: float = 2,
+        clip_stride: Optional[float] = None,
+        short_side_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+    ) -> VideoWindows:
+        self.max_batch_bytes = max_batch_bytes
+        paths = list_valid_files(paths, valid_extensions=("mp4", "avi"))
+        return VideoWindows(
+            paths, clip_duration=clip_duration, clip_stride=clip_stride, short_side_size=short_side_size
         )
+
+    def _iter_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        batch, num_bytes = [], 0
+        for sample in self.data:
+            sample_bytes = sample[DataKeys.INPUT].numel() * sample[DataKeys.INPUT].element_size()
+            if batch and self.max_batch_bytes is not None and num_bytes + sample_bytes > self.max_batch_bytes:
+                yield batch
+                batch, num_bytes = [], 0
+            batch.append(sample)
+            num_bytes += sample_bytes
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch, num_bytes = [], 0
+        if batch:
+            yield batch
+
+    def __iter__(self):
+        self.data_iter = self._iter_batches()
+        return self
+
+    def __next__(self) -> List[Any]:
+        batch = next(self.data_iter)
+        if self.profiler is not None:
+            with self.profiler.time("load_sample", self.running_stage):
+                return [self._call_load_sample(sample) for sample in batch]
+        return [self._call_load_sample(sample) for sample in batch]
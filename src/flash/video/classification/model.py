@@ -28,6 +28,7 @@ from flash.core.utilities.compatibility import accelerator_connector
 from flash.core.utilities.imports import _PYTORCHVIDEO_AVAILABLE
 from flash.core.utilities.providers import _PYTORCHVIDEO
 from flash.core.utilities.types import LOSS_FN_TYPE, LR_SCHEDULER_TYPE, METRICS_TYPE, OPTIMIZER_TYPE
+from flash.video.classification.output import VIDEO_CLASSIFICATION_OUTPUTS
 
 _VIDEO_CLASSIFIER_BACKBONES = FlashRegistry("backbones")
 
@@ -65,6 +66,7 @@ class VideoClassifier(ClassificationTask):
     """
 
     backbones: FlashRegistry = _VIDEO_CLASSIFIER_BACKBONES
+    outputs: FlashRegistry = ClassificationTask.outputs + VIDEO_CLASSIFICATION_OUTPUTS
 
     required_extras = "video"
 
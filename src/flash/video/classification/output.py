@@ -0,0 +1,111 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import torch
+
+from flash.core.classification import PredsClassificationOutput
+from flash.core.data.io.input import DataKeys
+from flash.core.registry import FlashRegistry
+
+VIDEO_CLASSIFICATION_OUTPUTS = FlashRegistry("outputs")
+
+
+@VIDEO_CLASSIFICATION_OUTPUTS(name="windows")
+class WindowsOutput(PredsClassificationOutput):
+    """A :class:`.Output` which returns the logits of a window of a video (from the
+    :class:`~flash.video.classification.input.VideoClassificationSlidingWindowPredictInput`) together with its
+    ``filepath``, ``window_index``, ``start``, and ``end``. The input clip isn't returned so that the predictions of
+    long videos can be kept in memory and aggregated with :func:`~flash.video.classification.output.aggregate_windows`.
+    """
+
+    def transform(self, sample: Any) -> Dict[str, Any]:
+        metadata = sample.get(DataKeys.METADATA, {})
+        return {
+            "filepath": metadata.get("filepath", None),
+            "window_index": metadata.get("window_index", 0),
+            "start": metadata.get("start", None),
+            "end": metadata.get("end", None),
+            "logits": super().transform(sample).tolist(),
+        }
+
+
+def _flatten(predictions: List[Any]) -> List[Dict[str, Any]]:
+    flat = []
+    for prediction in predictions:
+        if isinstance(prediction, dict):
+            flat.append(prediction)
+        else:
+            flat.extend(_flatten(prediction))
+    return flat
+
+
+def _reduce(logits: List[List[float]], reduction: str) -> List[float]:
+    logits = torch.tensor(logits)
+    if reduction == "mean":
+        return logits.mean(0).tolist()
+    return logits.max(0).values.tolist()
+
+
+def aggregate_windows(
+    predictions: List[Any], segment_duration: Optional[float] = None, reduction: str = "mean"
+) -> List[Dict[str, Any]]:
+    """Aggregate the per-window predictions of the ``"windows"`` output into per-video (and optionally per-segment)
+    predictions.
+
+    Args:
+        predictions: The predictions returned by ``Trainer.predict`` with ``output="windows"`` (a list of batches of
+            windows, or a flat list of windows).
+        segment_duration: If given, the windows of each video are also grouped into segments of this duration (in
+            seconds), each window is assigned to the segment which contains its centre.
+        reduction: How to reduce the logits of the windows, either ``"mean"`` or ``"max"``.
+
+    Returns:
+        A list with a dictionary for each video (in order of first appearance) with its ``filepath``, ``num_windows``,
+        the reduced ``logits``, and (if ``segment_duration`` is given) the ``segments``, each with its ``start``,
+        ``end``, and reduced ``logits``.
+    """
+    if reduction not in ("mean", "max"):
+        raise ValueError(f"`reduction` should be either 'mean' or 'max'. Found {reduction}.")
+    if segment_duration is not None and segment_duration <= 0:
+        raise ValueError(f"`segment_duration` should be positive. Found {segment_duration}.")
+
+    videos = defaultdict(list)
+    for window in _flatten(predictions):
+        videos[window["filepath"]].append(window)
+
+    results = []
+    for filepath, windows in videos.items():
+        windows = sorted(windows, key=lambda window: window["window_index"])
+        result = {
+            "filepath": filepath,
+            "num_windows": len(windows),
+            "logits": _reduce([window["logits"] for window in windows], reduction),
+        }
+        if segment_duration is not None:
+            segments = defaultdict(list)
+            for window in windows:
+                centre = (window["start"] + window["end"]) / 2
+                segments[int(centre // segment_duration)].append(window["logits"])
+            result["segments"] = [
+                {
+                    "start": index * segment_duration,
+                    "end": (index + 1) * segment_duration,
+                    "logits": _reduce(logits, reduction),
+                }
+                for index, logits in sorted(segments.items())
+            ]
+        results.append(result)
+    return results
@@ -11,9 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
+from collections.abc import Mapping
+from enum import Enum
+
+import numpy as np
 import pytest
 
-from flash.core.data.io.input import Input, IterableInput, ServeInput
+from flash.core.data.io.input import DataKeys, Input, IterableInput, Sample, ServeInput
+from flash.core.data.utilities.collate import default_collate
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
 from flash.core.utilities.stages import RunningStage
 
@@ -83,3 +89,122 @@ def test_serve_input():
 
     serve_input = CustomServeInput2()
     assert serve_input._call_load_sample(1) == 2
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_input_load_batch():
+    class DefaultInput(Input):
+        def load_sample(self, sample):
+            return {DataKeys.INPUT: sample}
+
+    default_input = DefaultInput(RunningStage.TRAINING, [1, 2, 3])
+    assert not default_input.supports_load_batch
+    assert default_input[[0, 2]] == [{"input": 1}, {"input": 3}]
+
+    class BatchInput(Input):
+        def load_data(self, data):
+            return np.asarray(data)
+
+        def load_batch(self, indices):
+            return [{DataKeys.INPUT: x} for x in self.data[indices] * 2]
+
+    batch_input = BatchInput(RunningStage.TRAINING, [1, 2, 3])
+    assert batch_input.supports_load_batch
+    assert batch_input[[0, 2]] == [{"input": 2}, {"input": 6}]
+
+    class PredictBatchInput(DefaultInput):
+        def predict_load_batch(self, indices):
+            return [{DataKeys.INPUT: -self.data[index]} for index in indices]
+
+    assert not PredictBatchInput(RunningStage.TRAINING, [1, 2, 3]).supports_load_batch
+    predict_input = PredictBatchInput(RunningStage.PREDICTING, [1, 2, 3])
+    assert predict_input.supports_load_batch
+    assert predict_input[[1]] == [{"input": -2}]
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_sample():
+    sample = Sample(input=1, target=2)
+    assert DataKeys.INPUT in sample
+    assert DataKeys.METADATA not in sample
+    assert sample[DataKeys.TARGET] == sample["target"] == 2
+    assert list(sample) == ["input", "target"]
+
+    sample[DataKeys.METADATA] = {"size": 3}
+    sample["extra"] = 4
+    assert dict(sample) == {"input": 1, "target": 2, "metadata": {"size": 3}, "extra": 4}
+
+    copied = sample.copy()
+    copied[DataKeys.INPUT] = 5
+    assert sample[DataKeys.INPUT] == 1
+    assert pickle.loads(pickle.dumps(sample)) == sample
+
+    assert sample.pop(DataKeys.METADATA) == {"size": 3}
+    assert len(sample) == 3
+
+    batch = default_collate([Sample(input=np.float32(1), target=0), Sample(input=np.float32(2), target=1)])
+    assert isinstance(batch, Mapping)
+    assert batch[DataKeys.TARGET].tolist() == [0, 1]
+
+    # The metadata is kept (as a list) in the collated batch
+    batch = default_collate([Sample(input=np.float32(i), metadata={"index": i}) for i in range(2)])
+    assert batch[DataKeys.METADATA] == [{"index": 0}, {"index": 1}]
+
+
+class _LegacyInput(Input):
+    """An ``Input`` which loads samples in the same way as flash <= 0.8.1 did."""
+
+    def _call_load_sample(self, sample):
+        sample_output = self.load_sample(dict(sample.items()) if isinstance(sample, dict) else sample)
+        if isinstance(sample_output, dict):
+            output_dict = {}
+            for key, val in sample_output.items():
+                if isinstance(key, Enum) and hasattr(key, "value"):
+                    output_dict[key.value] = val
+                else:
+                    output_dict[key] = val
+            return output_dict
+        return sample_output
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize(
+    "make_sample",
+    [
+        # image: a file path and a class index
+        pytest.param(lambda i, cls: cls(input=f"images/{i}.jpg", target=i % 10), id="image"),
+        # tabular: categorical and numerical arrays and a class index
+        pytest.param(
+            lambda i, cls: cls(input=(np.zeros(4, dtype=np.int64), np.zeros(8, dtype=np.float32)), target=i % 2),
+            id="tabular",
+        ),
+        # text: a string and a class index
+        pytest.param(lambda i, cls: cls(input=f"some text number {i}", target=i % 3), id="text"),
+    ],
+)
+def test_call_load_sample(make_sample):
+    num_samples = 10
+
+    def to_dict(**kwargs):
+        return {getattr(DataKeys, key.upper()): value for key, value in kwargs.items()}
+
+    class FormatTargetMixin:
+        def load_sample(self, sample):
+            sample[DataKeys.TARGET] = int(sample[DataKeys.TARGET])
+            return sample
+
+    class LegacyInput(FormatTargetMixin, _LegacyInput):
+        pass
+
+    class NewInput(FormatTargetMixin, Input):
+        pass
+
+    legacy_input = LegacyInput(RunningStage.TRAINING, [make_sample(i, to_dict) for i in range(num_samples)])
+    dict_input = NewInput(RunningStage.TRAINING, [make_sample(i, to_dict) for i in range(num_samples)])
+    sample_input = NewInput(RunningStage.TRAINING, [make_sample(i, Sample) for i in range(num_samples)])
+
+    # The samples are loaded in the same way as before, with string keys
+    for index in range(num_samples):
+        assert all(type(key) is str for key in dict_input[index])
+        np.testing.assert_equal(dict_input[index], legacy_input[index])
+        np.testing.assert_equal(dict(sample_input[index]), legacy_input[index])
@@ -14,8 +14,11 @@
 from unittest.mock import Mock
 
 import pytest
+import torch
 
 from flash.core.data.io.output import Output
+from flash.core.data.io.output_transform import OutputTransform
+from flash.core.data.io.transform_predictions import TransformPredictions
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
 
 
@@ -29,3 +32,30 @@ def test_output():
     my_output.transform = Mock()
     my_output("test")
     my_output.transform.assert_called_once()
+
+
+class DoubleOutput(Output):
+    def transform(self, sample):
+        return sample * 2
+
+
+class ReversedOutputTransform(OutputTransform):
+    @staticmethod
+    def uncollate(batch):
+        return list(reversed(batch))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_output_transform_batch():
+    batch = torch.arange(3)
+    assert DoubleOutput().transform_batch(batch) == [torch.tensor(0), torch.tensor(2), torch.tensor(4)]
+
+    output = DoubleOutput()
+    output.transform_batch = Mock(wraps=output.transform_batch)
+    assert TransformPredictions(OutputTransform(), output).transform(batch) == [0, 2, 4]
+    output.transform_batch.assert_called_once()
+
+    # Custom uncollation is still applied before the output
+    transform_predictions = TransformPredictions(ReversedOutputTransform(), output)
+    assert not transform_predictions.transform_batches
+    assert transform_predictions.transform(batch) == [4, 2, 0]
@@ -0,0 +1,71 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+
+import numpy as np
+import pytest
+import torch
+
+from flash.core.data.io.prediction_sink import JSONLinesSink, NumpySink, ParquetSink
+from flash.core.utilities.imports import _PYARROW_AVAILABLE, _TOPIC_CORE_AVAILABLE
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_jsonlines_sink(tmpdir):
+    sink = JSONLinesSink(str(tmpdir), max_rows_per_file=4)
+    sink.rank = 1
+    for i in range(5):
+        sink.write([{"index": 2 * i, "logits": torch.tensor([0.5, 1.5])}, {"index": 2 * i + 1, "logits": None}])
+    files = sink.close()
+
+    # The predictions are split into files of at most 4 rows, named with the rank of the process
+    assert [os.path.basename(file) for file in files] == [
+        "predictions-rank001-00000.jsonl",
+        "predictions-rank001-00001.jsonl",
+        "predictions-rank001-00002.jsonl",
+    ]
+    rows = [json.loads(line) for file in files for line in open(file)]
+    assert [row["index"] for row in rows] == list(range(10))
+    assert rows[0]["logits"] == [0.5, 1.5]
+
+    with pytest.raises(ValueError, match="positive integer"):
+        JSONLinesSink(str(tmpdir), max_rows_per_file=0)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_numpy_sink(tmpdir):
+    with NumpySink(str(tmpdir), max_rows_per_file=3) as sink:
+        sink.write(list(torch.arange(8, dtype=torch.float32).view(4, 2)))
+    assert len(sink.files) == 2
+    assert np.array_equal(np.concatenate([np.load(file) for file in sink.files]), np.arange(8).reshape(4, 2))
+
+    with pytest.raises(ValueError, match="JSONLinesSink"), NumpySink(str(tmpdir)) as sink:
+        sink.write([{"logits": [0.5]}])
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.skipif(not _PYARROW_AVAILABLE, reason="pyarrow isn't installed.")
+def test_parquet_sink(tmpdir):
+    import pyarrow.parquet as pq
+
+    with ParquetSink(str(tmpdir), max_rows_per_file=5, row_group_size=2) as sink:
+        for i in range(7):
+            sink.write([{"label": str(i), "logits": torch.tensor([float(i)])}])
+    assert len(sink.files) == 2
+
+    table = pq.ParquetFile(sink.files[0])
+    assert table.metadata.num_row_groups == 3
+    assert table.read().to_pydict()["label"] == ["0", "1", "2", "3", "4"]
+    assert pq.read_table(sink.files[1]).to_pydict()["logits"] == [[5.0], [6.0]]
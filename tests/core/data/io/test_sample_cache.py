@@ -0,0 +1,206 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from flash.core.data.data_module import DataModule
+from flash.core.data.io.input import Input
+from flash.core.data.io.sample_cache import DiskSampleCache, MemorySampleCache, create_sample_cache
+from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
+from flash.core.utilities.stages import RunningStage
+
+
+class CountingInput(Input):
+    num_loads = 0
+
+    def load_sample(self, sample):
+        CountingInput.num_loads += 1
+        return {"input": sample * 2}
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("sample_cache", ["memory", "disk"])
+def test_sample_cache_input(tmpdir, sample_cache):
+    CountingInput.num_loads = 0
+    train_input = CountingInput(RunningStage.TRAINING, list(range(10)))
+    datamodule = DataModule(train_input, batch_size=2, sample_cache=sample_cache, cache_dir=str(tmpdir))
+    assert train_input.sample_cache is datamodule.sample_cache
+
+    for _ in range(3):
+        assert [train_input[i]["input"] for i in range(10)] == [i * 2 for i in range(10)]
+
+    assert CountingInput.num_loads == 10
+    assert datamodule.sample_cache.hits == 20
+    assert datamodule.sample_cache.misses == 10
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_sample_cache_fingerprint():
+    input_1 = CountingInput(RunningStage.TRAINING, [1, 2, 3])
+    input_2 = CountingInput(RunningStage.TRAINING, [1, 2, 3])
+    input_3 = CountingInput(RunningStage.VALIDATING, [1, 2, 3])
+    input_4 = CountingInput(RunningStage.TRAINING, [3, 2, 1])
+
+    assert input_1.fingerprint == input_2.fingerprint
+    assert input_1.fingerprint != input_3.fingerprint
+    assert input_1.fingerprint != input_4.fingerprint
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_sample_cache_fingerprint_parameters():
+    class ParameterInput(CountingInput):
+        def load_data(self, data, scale=1):
+            self.scale = scale
+            return data
+
+    class OtherCodeInput(CountingInput):
+        def load_sample(self, sample):
+            return {"input": sample * 3}
+
+    class VersionedInput(CountingInput):
+        sample_cache_version = 1
+
+    fingerprint = ParameterInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint
+
+    # The parameters of the input, the code of ``load_sample``, and the version are part of the fingerprint
+    assert ParameterInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint == fingerprint
+    assert ParameterInput(RunningStage.TRAINING, [1, 2, 3], scale=2).fingerprint != fingerprint
+    assert (
+        OtherCodeInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint
+        != CountingInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint
+    )
+    assert (
+        VersionedInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint
+        != CountingInput(RunningStage.TRAINING, [1, 2, 3]).fingerprint
+    )
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_sample_cache_fingerprint_files(tmpdir, monkeypatch):
+    paths = [os.path.join(tmpdir, f"{i}.txt") for i in range(3)]
+    for path in paths:
+        with open(path, "w") as f:
+            f.write("a")
+
+    class FileInput(CountingInput):
+        def load_sample(self, sample):
+            CountingInput.num_loads += 1
+            with open(sample) as f:
+                return {"input": f.read()}
+
+    # Files are identified by their path when the data is fingerprinted (without looking them up)
+    fingerprint = FileInput(RunningStage.TRAINING, paths).fingerprint
+    with monkeypatch.context() as m:
+        m.setattr(os, "stat", None)
+        assert FileInput(RunningStage.TRAINING, paths).fingerprint == fingerprint
+
+    # The files of each sample are checked when it is read from the disk cache
+    CountingInput.num_loads = 0
+    file_input = FileInput(RunningStage.TRAINING, paths)
+    DataModule(file_input, batch_size=2, sample_cache="disk", cache_dir=str(tmpdir / "cache"))
+    assert [file_input[i]["input"] for i in range(3)] == ["a"] * 3
+    with open(paths[1], "w") as f:
+        f.write("ab")
+    assert [file_input[i]["input"] for i in range(3)] == ["a", "ab", "a"]
+    assert CountingInput.num_loads == 4
+
+    # Arrays are compared by value
+    assert (
+        CountingInput(RunningStage.TRAINING, np.arange(3)).fingerprint
+        == CountingInput(RunningStage.TRAINING, np.arange(3)).fingerprint
+    )
+
+
+class Opaque:
+    def __init__(self, value):
+        self.value = value
+
+
+class OpaqueInput(Input):
+    def load_sample(self, sample):
+        return {"input": sample.value}
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_sample_cache_without_fingerprint(tmpdir):
+    input_1 = OpaqueInput(RunningStage.TRAINING, [Opaque(1), Opaque(2)])
+    input_2 = OpaqueInput(RunningStage.VALIDATING, [Opaque(3), Opaque(4)])
+    assert input_1.fingerprint is None
+
+    # The samples of data which can't be fingerprinted aren't stored in the disk cache, where they could collide
+    with pytest.warns(UserWarning, match="can't be fingerprinted"):
+        DataModule(input_1, batch_size=2, sample_cache="disk", cache_dir=str(tmpdir))
+    assert input_1[0]["input"] == 1
+    assert len(input_1.sample_cache) == 0
+
+    # They are still cached in memory, with a different key for each input
+    datamodule = DataModule(input_1, input_2, batch_size=2, sample_cache="memory")
+    assert [input_1[0]["input"], input_2[0]["input"]] == [1, 3]
+    assert len(datamodule.sample_cache) == 2
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_memory_sample_cache_lru():
+    entry_size = len(pickle.dumps(b"x" * 100, protocol=pickle.HIGHEST_PROTOCOL))
+    cache = MemorySampleCache(max_bytes=2 * entry_size)
+
+    cache.put(("a", 0), b"x" * 100)
+    cache.put(("a", 1), b"x" * 100)
+    assert cache.get(("a", 0)) is not None
+    cache.put(("a", 2), b"x" * 100)
+
+    assert len(cache) == 2
+    assert cache.get(("a", 1)) is None
+    assert cache.get(("a", 0)) == b"x" * 100
+
+    cache = pickle.loads(pickle.dumps(cache))
+    assert len(cache) == 2
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_disk_sample_cache_eviction(tmpdir):
+    cache = DiskSampleCache(cache_dir=str(tmpdir), max_bytes=2048)
+
+    for i in range(32):
+        cache.put(("a", i), b"x" * 256)
+
+    assert 0 < len(cache) < 32
+    assert cache.get(("a", 31)) == b"x" * 256
+
+    # Entries are only returned for the same stamp
+    cache.put(("b", 0), b"x", stamp=(("file", 1, 1),))
+    assert cache.get(("b", 0), "missing", stamp=(("file", 1, 2),)) == "missing"
+    assert cache.get(("b", 0), stamp=(("file", 1, 1),)) == b"x"
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(("a", 31), "missing") == "missing"
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_create_sample_cache():
+    assert create_sample_cache(None) is None
+    assert isinstance(create_sample_cache("memory"), MemorySampleCache)
+
+    cache = MemorySampleCache()
+    assert create_sample_cache(cache) is cache
+
+    with pytest.raises(ValueError, match="should be one of"):
+        create_sample_cache("gpu")
+
+    with pytest.raises(ValueError, match="positive integer"):
+        create_sample_cache("memory", cache_max_bytes=0)
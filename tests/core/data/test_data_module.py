@@ -19,11 +19,11 @@ import numpy as np
 import pytest
 import torch
 from pytorch_lightning import seed_everything
-from torch.utils.data import Dataset
+from torch.utils.data import BatchSampler, Dataset
 
 from flash import Task, Trainer
 from flash.core.data.data_module import DataModule, DatasetInput
-from flash.core.data.io.input import Input
+from flash.core.data.io.input import DataKeys, Input
 from flash.core.data.io.input_transform import InputTransform
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE, _TOPIC_IMAGE_AVAILABLE, _TORCHVISION_AVAILABLE
 from flash.core.utilities.stages import RunningStage
@@ -466,3 +466,34 @@ def test_val_split():
 
     assert len(datamodule.train_dataset) == 80
     assert len(datamodule.val_dataset) == 20
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("val_split", [None, 0.2])
+def test_dataloaders_with_load_batch(val_split):
+    class BatchInput(Input):
+        num_calls = 0
+
+        def load_data(self, data):
+            return np.asarray(data, dtype=np.float32)
+
+        def load_batch(self, indices):
+            BatchInput.num_calls += 1
+            return [{DataKeys.INPUT: x} for x in self.data[indices]]
+
+    datamodule = DataModule(
+        BatchInput(RunningStage.TRAINING, np.arange(20)),
+        predict_input=BatchInput(RunningStage.PREDICTING, np.arange(10)),
+        batch_size=4,
+        num_workers=0,
+        val_split=val_split,
+    )
+
+    train_dataloader = datamodule.train_dataloader()
+    assert isinstance(train_dataloader.sampler, BatchSampler)
+    batches = list(train_dataloader)
+    assert all(batch[DataKeys.INPUT].shape == (4,) for batch in batches)
+    assert BatchInput.num_calls == len(batches)
+
+    predict_batches = list(datamodule.predict_dataloader())
+    assert torch.cat([batch[DataKeys.INPUT] for batch in predict_batches]).tolist() == list(range(10))
@@ -0,0 +1,97 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+
+from flash import DataKeys
+from flash.core.data.data_module import DataModule, DatasetInput
+from flash.core.data.io.input_transform import InputTransform
+from flash.core.data.profiler import DataPipelineProfiler, _Histogram
+from flash.core.model import Task
+from flash.core.trainer import Trainer
+from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
+from flash.core.utilities.stages import RunningStage
+
+
+class CustomModel(Task):
+    def __init__(self):
+        super().__init__(model=torch.nn.Linear(1, 1), loss_fn=torch.nn.MSELoss())
+
+    def training_step(self, batch, batch_idx):
+        batch = (batch[DataKeys.INPUT], batch[DataKeys.TARGET])
+        return super().training_step(batch, batch_idx)
+
+    def validation_step(self, batch, batch_idx):
+        batch = (batch[DataKeys.INPUT], batch[DataKeys.TARGET])
+        return super().validation_step(batch, batch_idx)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_histogram():
+    histogram = _Histogram()
+    for duration in [1e-3] * 90 + [1e-1] * 10:
+        histogram.add(duration)
+
+    assert histogram.count == 100
+    assert histogram.mean == pytest.approx(0.0109)
+    assert 1e-3 <= histogram.quantile(0.5) < 2e-3
+    assert 1e-1 <= histogram.quantile(0.95) <= histogram.max
+
+    other = _Histogram()
+    other.add(1.0)
+    histogram.merge(other)
+    assert histogram.count == 101
+    assert histogram.max == 1.0
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_data_pipeline_profiler(tmpdir, num_workers):
+    inputs = [(torch.rand(1), torch.rand(1)) for _ in range(8)]
+    datamodule = DataModule(
+        DatasetInput(RunningStage.TRAINING, inputs),
+        DatasetInput(RunningStage.VALIDATING, inputs),
+        transform=InputTransform(),
+        batch_size=2,
+        num_workers=num_workers,
+    )
+
+    profiler = DataPipelineProfiler()
+    trainer = Trainer(
+        default_root_dir=tmpdir, max_epochs=1, limit_train_batches=4, limit_val_batches=2, callbacks=[profiler]
+    )
+    trainer.fit(CustomModel(), datamodule=datamodule)
+
+    histograms = profiler._merged()
+    for name in ["load_sample", "per_sample_transform", "collate", "per_batch_transform", "host_to_device"]:
+        assert histograms[("train", name)].count > 0
+    assert histograms[("train", "per_batch_transform_on_device")].count > 0
+    assert histograms[("val", "load_sample")].count > 0
+
+    workers = {worker for (_, name, worker) in profiler.histograms if name == "load_sample"}
+    assert workers == ({"main"} if num_workers == 0 else {"0", "1"})
+
+    assert profiler.step_time.count == 4
+    assert 0 <= profiler.stall_fraction <= 1
+
+    metrics = profiler.metrics()
+    assert "data_pipeline/train/load_sample_mean_ms" in metrics
+    assert "data_pipeline/train/stall_fraction" in metrics
+    assert "Data stall fraction" in profiler.summary()
+
+    # The workers' timings are also collected outside of training
+    profiler.reset()
+    trainer.validate(CustomModel(), datamodule=datamodule)
+    assert profiler._merged()[("val", "load_sample")].count > 0
+    assert profiler.step_time.count == 0
@@ -13,6 +13,7 @@
 # limitations under the License.
 import time
 from collections import namedtuple
+from functools import reduce
 
 import numpy as np
 import pytest
@@ -28,6 +29,10 @@ from flash.core.data.utilities.classification import (
     SingleLabelTargetFormatter,
     SingleNumericTargetFormatter,
     SpaceDelimitedTargetFormatter,
+    _get_target_details,
+    _get_target_formatter_type,
+    _infer_targets,
+    _resolve_target_formatter,
     get_target_formatter,
 )
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
@@ -148,6 +153,41 @@ def test_case(case):
     assert formatter.labels == case.labels
     assert formatter.num_classes == case.num_classes
     assert [formatter(t) for t in case.target] == case.formatted_target
+    assert np.allclose(formatter.format_batch(case.target), np.asarray(case.formatted_target))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("case", cases)
+def test_infer_targets(case):
+    inferred = _infer_targets(case.target)
+    if inferred is None:
+        pytest.skip("Targets are inferred one at a time.")
+
+    # Inferring in bulk gives the same result as inferring one target at a time
+    targets = case.target.tolist() if torch.is_tensor(case.target) else list(case.target)
+    target_formatter_type = reduce(_resolve_target_formatter, [_get_target_formatter_type(t) for t in targets])
+    assert inferred == (target_formatter_type, *_get_target_details(targets, target_formatter_type))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize(
+    "targets, target_formatter_type",
+    [
+        ([[0], [1, 0], [1, 1]], MultiBinaryTargetFormatter),
+        ([[0], [1, 0], [1, 1], [2]], None),
+        ([[1, 0], [0, 1], [0.5, 0.5]], MultiSoftTargetFormatter),
+        ([[1, 0], [2, 3], [0.5, 0.5]], None),
+        (["blue", "blue, green", "red"], CommaDelimitedMultiLabelTargetFormatter),
+        (["blue green", "blue,green"], None),
+    ],
+)
+def test_inconsistent_targets(targets, target_formatter_type):
+    # The result of the reduction depends on the order of the targets
+    if target_formatter_type is None:
+        with pytest.raises(ValueError, match="inconsistent target formats"):
+            get_target_formatter(targets)
+    else:
+        assert isinstance(get_target_formatter(targets), target_formatter_type)
 
 
 @pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
@@ -173,3 +213,9 @@ def test_speed(case):
     end = time.perf_counter()
 
     assert (end - start) / len(targets) < 5e-4  # 0.1ms per target
+
+    start = time.perf_counter()
+    _ = formatter.format_batch(targets)
+    end = time.perf_counter()
+
+    assert (end - start) / len(targets) < 5e-5
@@ -25,6 +25,7 @@ from flash.core.data.utilities.loading import (
     load_audio,
     load_data_frame,
     load_image,
+    load_image_tensor,
     load_spectrogram,
 )
 from flash.core.utilities.imports import (
@@ -35,6 +36,9 @@ from flash.core.utilities.imports import (
     Image,
 )
 
+if _TOPIC_IMAGE_AVAILABLE:
+    import torch
+
 if _TOPIC_AUDIO_AVAILABLE:
     import soundfile as sf
 
@@ -98,6 +102,33 @@ def test_load_image(tmpdir, extension, write):
     assert image.mode == "RGB"
 
 
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+@pytest.mark.parametrize(
+    ("extension", "write"),
+    [(extension, write_image) for extension in IMG_EXTENSIONS]
+    + [(extension, write_numpy) for extension in NP_EXTENSIONS],
+)
+def test_load_image_tensor(tmpdir, extension, write):
+    file_path = os.path.join(tmpdir, f"test{extension}")
+    write(file_path)
+
+    image = load_image_tensor(file_path)
+
+    assert isinstance(image, torch.Tensor)
+    assert image.dtype == torch.uint8
+    assert image.shape == (3, 64, 64)
+
+
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+def test_load_image_draft(tmpdir):
+    file_path = os.path.join(tmpdir, "test.jpg")
+    Image.fromarray(np.random.randint(0, 255, (256, 256, 3), dtype="uint8")).save(file_path)
+
+    assert load_image(file_path).size == (256, 256)
+    assert load_image(file_path, draft_size=(64, 64)).size == (64, 64)
+    assert load_image_tensor(file_path, draft_size=(100, 100)).shape == (3, 128, 128)
+
+
 @pytest.mark.skipif(not _TOPIC_AUDIO_AVAILABLE, reason="audio libraries aren't installed.")
 @pytest.mark.parametrize(
     ("extension", "write"),
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import stat
 import warnings
 from string import ascii_lowercase
 from typing import List
@@ -20,7 +21,13 @@ import pytest
 from numpy import random
 
 from flash.core.data.utilities.loading import AUDIO_EXTENSIONS, IMG_EXTENSIONS, NP_EXTENSIONS
-from flash.core.data.utilities.paths import PATH_TYPE, filter_valid_files
+from flash.core.data.utilities.paths import (
+    PATH_TYPE,
+    _load_scan_manifest,
+    filter_valid_files,
+    make_dataset,
+    scan_directories,
+)
 
 
 def _make_mock_dir(root, mock_files: List) -> List[PATH_TYPE]:
@@ -104,3 +111,82 @@ def test_filter_valid_files_no_invalid_with_additional_list(tmpdir):
         filtered_files, filtered_additional = filter_valid_files(mockdir, mockdir, valid_extensions=valid_extensions)
     assert len(filtered_files) == len(mockdir)
     assert len(filtered_additional) == len(mockdir)
+
+
+def _walk_dataset(directory, extensions):
+    # The serial ``os.walk`` implementation which the parallel scan replaces
+    files, targets = [], []
+    for target_class in sorted(os.listdir(directory)):
+        for root, _, fnames in sorted(os.walk(os.path.join(directory, target_class), followlinks=True)):
+            for fname in sorted(fnames):
+                if fname.lower().endswith(extensions):
+                    files.append(os.path.join(root, fname))
+                    targets.append(target_class)
+    return files, targets
+
+
+def _make_tree(root):
+    for target_class in ("cat", "dog"):
+        for subdir in ("", "a", os.path.join("a", "b"), "c"):
+            os.makedirs(os.path.join(root, target_class, subdir), exist_ok=True)
+            for name in ("1.png", "2.jpg", "3.txt"):
+                open(os.path.join(root, target_class, subdir, name), "w").close()
+    # Manifests are only written for folders which haven't changed in the last seconds
+    for path, _, _ in os.walk(root):
+        os.utime(path, (1e9, 1e9))
+
+
+def test_scan_directories(tmpdir):
+    root = str(tmpdir / "data")
+    _make_tree(root)
+
+    (scan,) = scan_directories([os.path.join(root, "cat")], (".png",), num_threads=2)
+    directory = os.path.join(root, "cat")
+    subdirs = [os.path.join(directory, subdir) for subdir in ("a", os.path.join("a", "b"), "c")]
+    assert sorted(scan) == [directory] + subdirs
+    assert all(file_names == ["1.png"] for _, file_names in scan.values())
+
+
+def test_make_dataset(tmpdir):
+    root = str(tmpdir / "data")
+    cache_dir = str(tmpdir / "cache")
+    _make_tree(root)
+    extensions = (".png", ".jpg")
+
+    expected = _walk_dataset(root, extensions)
+    assert make_dataset(root, extensions=extensions, cache_dir=cache_dir) == expected
+    assert len(os.listdir(cache_dir)) == 1
+
+    # The manifest is reused, and discarded when a folder changes
+    assert make_dataset(root, extensions=extensions, cache_dir=cache_dir) == expected
+    open(os.path.join(root, "dog", "a", "b", "4.png"), "w").close()
+    expected = _walk_dataset(root, extensions)
+    assert make_dataset(root, extensions=extensions, cache_dir=cache_dir) == expected
+    assert make_dataset(root, extensions=extensions, use_cache=False) == expected
+
+    files, targets = make_dataset(root, is_valid_file=lambda path: path.endswith(".txt"))
+    assert len(files) == 8
+    assert targets == ["cat"] * 4 + ["dog"] * 4
+
+    with pytest.raises(ValueError, match="Both extensions and is_valid_file"):
+        make_dataset(root)
+
+
+def test_make_dataset_default_cache_dir(tmpdir, monkeypatch):
+    root = str(tmpdir / "data")
+    _make_tree(root)
+    monkeypatch.delenv("FLASH_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir / "user_cache"))
+
+    # The manifests are written to a private folder of the user cache
+    expected = _walk_dataset(root, (".png",))
+    assert make_dataset(root, extensions=(".png",)) == expected
+    cache_dir = str(tmpdir / "user_cache" / "flash" / "scan")
+    assert len(os.listdir(cache_dir)) == 1
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+
+        # Manifests of other users are ignored
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(cache_dir).st_uid + 1)
+        manifest_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        assert _load_scan_manifest(manifest_path, root, None) is None
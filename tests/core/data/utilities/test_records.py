@@ -0,0 +1,82 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from flash.core.data.utilities.records import Records, RecordWriter
+
+
+def _write_records(root, num_records: int = 10, max_shard_size: int = 8):
+    with RecordWriter(root, max_shard_size=max_shard_size) as writer:
+        for i in range(num_records):
+            writer.write(f"record {i}".encode(), target=np.int64(i % 3), name=f"{i}.png")
+
+
+def test_records_roundtrip(tmpdir):
+    root = os.path.join(tmpdir, "records")
+    _write_records(root)
+
+    # Each record is bigger than the max shard size so each record gets its own shard
+    records = Records(root)
+    assert records.num_records == 10
+    assert len(records.shards) == 10
+    assert records.targets == [i % 3 for i in range(10)]
+
+    samples = list(records.iter_records(shard=(0, 1)))
+    assert samples == [(f"record {i}".encode(), f"{i}.png", i % 3) for i in range(10)]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("max_shard_size", [8, 1000])
+def test_records_sharding(tmpdir, mmap, max_shard_size):
+    root = os.path.join(tmpdir, "records")
+    _write_records(root, num_records=20, max_shard_size=max_shard_size)
+    records = Records(root, mmap=mmap)
+
+    expected = sorted(f"record {i}".encode() for i in range(20))
+    for shuffle in (False, True):
+        # The records are split evenly across workers, whatever the sizes of the shards
+        names = []
+        for shard in range(3):
+            names.append([data for data, _, _ in records.iter_records(shuffle=shuffle, seed=1, shard=(shard, 3))])
+        assert sorted(sum(names, [])) == expected
+        assert [len(shard_names) for shard_names in names] == [6, 7, 7]
+
+        # When padding, they all get exactly the same number of records
+        names = []
+        for shard in range(3):
+            iterator = records.iter_records(shuffle=shuffle, seed=1, shard=(shard, 3), pad=True)
+            names.append([data for data, _, _ in iterator])
+        assert [len(shard_names) for shard_names in names] == [7, 7, 7]
+        assert sorted(set(sum(names, []))) == expected
+
+    shuffled = [data for data, _, _ in records.iter_records(shuffle=True, seed=2, buffer_size=4, shard=(0, 1))]
+    assert sorted(shuffled) == expected
+
+    # The memory maps aren't pickled to the DataLoader workers
+    next(records.iter_records(shard=(0, 1)))
+    assert sorted(data for data, _, _ in pickle.loads(pickle.dumps(records)).iter_records(shard=(0, 1))) == expected
+
+
+def test_records_errors(tmpdir):
+    with pytest.raises(ValueError, match="max_shard_size"):
+        RecordWriter(os.path.join(tmpdir, "records"), max_shard_size=0)
+
+    with open(os.path.join(tmpdir, "index.json"), "w") as f:
+        f.write('{"format": "other"}')
+    with pytest.raises(ValueError, match="flash-records"):
+        Records(str(tmpdir))
@@ -0,0 +1,195 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+from torch.utils.data import DataLoader
+
+from flash import Trainer
+from flash.core.embedding_index import EmbeddingIndex, EmbeddingSink, EmbeddingStore, FaissIndex, IVFIndex, search_exact
+from flash.core.embedding_index.index import INDEX_META
+from flash.core.utilities.embedder import Embedder
+from flash.core.utilities.imports import _FAISS_AVAILABLE, _TOPIC_CORE_AVAILABLE, _TOPIC_SERVE_AVAILABLE
+from tests.core.utilities.test_embedder import EmbedderTestModel
+
+
+def _clustered(num_vectors: int = 5000, num_queries: int = 50, dim: int = 32):
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(50, dim))
+    vectors = centres[rng.integers(0, 50, num_vectors)] + 0.5 * rng.normal(size=(num_vectors, dim))
+    queries = vectors[:num_queries] + 0.1 * rng.normal(size=(num_queries, dim))
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def _recall(ids: np.ndarray, expected_ids: np.ndarray) -> float:
+    return np.mean([len(set(row) & set(expected_row)) / len(row) for row, expected_row in zip(ids, expected_ids)])
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+def test_search_exact(metric):
+    vectors, queries = _clustered(500, 5)
+    scores, ids = search_exact(torch.from_numpy(vectors), queries, k=7, metric=metric, chunk_size=64)
+
+    if metric == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    expected = ((queries[:, None] - vectors[None]) ** 2).sum(-1) if metric == "l2" else -(queries @ vectors.T)
+    assert np.array_equal(ids, np.argsort(expected, axis=1)[:, :7])
+    assert np.allclose(np.abs(scores), np.abs(np.sort(expected, axis=1)[:, :7]), rtol=1e-4, atol=1e-4)
+
+    # The results are padded when there are fewer than ``k`` embeddings
+    scores, ids = search_exact(vectors[:3], queries, k=5, metric=metric)
+    assert np.all(ids[:, 3:] == -1)
+    assert np.all(ids[:, :3] >= 0)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_ivf_index(metric, dtype):
+    vectors, queries = _clustered()
+    expected_scores, expected_ids = search_exact(vectors, queries, k=10, metric=metric)
+
+    index = IVFIndex(num_lists=64, nprobe=8, metric=metric, dtype=dtype).build(vectors, chunk_size=1000)
+    assert index.offsets[-1] == len(vectors)
+    assert np.array_equal(np.sort(index.ids), np.arange(len(vectors)))
+
+    scores, ids = index.search(queries, k=10)
+    assert scores.shape == ids.shape == (50, 10)
+    assert _recall(ids, expected_ids) > 0.9
+
+    # Probing every list is (up to the quantization) an exact search
+    scores, ids = index.search(queries, k=10, nprobe=64)
+    assert _recall(ids, expected_ids) > (0.99 if dtype == "float32" else 0.9)
+    if dtype == "float32":
+        assert np.allclose(scores, expected_scores, rtol=1e-4, atol=1e-3)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_ivf_index_store(tmpdir):
+    vectors, queries = _clustered()
+    with EmbeddingSink(str(tmpdir / "embeddings"), dtype="int8", max_rows_per_file=1500) as sink:
+        sink.write(vectors)
+    store = EmbeddingStore(str(tmpdir / "embeddings"))
+
+    # The index is built in (and can be loaded from) the output directory, with the embeddings memory mapped
+    index = IVFIndex(num_lists=32, nprobe=4, dtype="int8", num_iters=5, seed=1).build(
+        store, output_dir=str(tmpdir / "index")
+    )
+    loaded = EmbeddingIndex.load(str(tmpdir / "index"))
+    assert isinstance(loaded, IVFIndex)
+    assert isinstance(loaded.codes, np.memmap)
+    assert (loaded.metric, loaded.nprobe, loaded.size) == ("cosine", 4, len(vectors))
+    assert (loaded.num_train, loaded.num_iters, loaded.seed) == (None, 5, 1)
+
+    scores, ids = index.search(queries, k=5)
+    loaded_scores, loaded_ids = loaded.search(queries, k=5)
+    assert np.array_equal(ids, loaded_ids)
+    assert np.allclose(scores, loaded_scores)
+    assert _recall(ids, search_exact(vectors, queries, k=5)[1]) > 0.9
+
+    # Saving it elsewhere copies it
+    loaded.save(str(tmpdir / "copy"))
+    assert np.array_equal(IVFIndex.load(str(tmpdir / "copy"), mmap=False).search(queries, k=5)[1], ids)
+
+    with pytest.raises(ValueError, match="32 elements"):
+        index.search(np.zeros((1, 16)))
+    with pytest.raises(RuntimeError, match="build"):
+        IVFIndex().search(queries)
+    with pytest.raises(ValueError, match="at least `num_lists`"):
+        IVFIndex(num_lists=32, num_train=16)
+
+    # Fewer embeddings than lists (or than ``num_train``) are clamped
+    assert IVFIndex(num_lists=32, num_train=64).build(vectors[:20]).offsets[-1] == 20
+
+    # Indexes saved without the k-means parameters fall back to the defaults, unknown index types are rejected
+    meta_path = os.path.join(str(tmpdir / "copy"), INDEX_META)
+    with open(meta_path) as f:
+        meta = json.load(f)
+    with open(meta_path, "w") as f:
+        json.dump({key: value for key, value in meta.items() if key not in ("num_train", "num_iters", "seed")}, f)
+    loaded = EmbeddingIndex.load(str(tmpdir / "copy"))
+    assert (loaded.num_train, loaded.num_iters, loaded.seed) == (None, 20, 42)
+
+    with open(meta_path, "w") as f:
+        json.dump({**meta, "type": "unknown"}, f)
+    with pytest.raises(ValueError, match="unknown type unknown"):
+        EmbeddingIndex.load(str(tmpdir / "copy"))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_ivf_index_predictions(tmpdir):
+    embedder = Embedder(EmbedderTestModel(nn.Sequential(nn.Linear(10, 20), nn.Linear(20, 30))), "backbone.0")
+    inputs = torch.rand(200, 10)
+    trainer = Trainer(fast_dev_run=False, default_root_dir=tmpdir, logger=False)
+
+    # The embeddings predicted to the store are indexed (and searched) with their position in the predictions as id
+    trainer.predict(embedder, DataLoader(inputs, batch_size=32), sink=EmbeddingSink(str(tmpdir / "embeddings")))
+    store = EmbeddingStore(str(tmpdir / "embeddings"))
+    index = IVFIndex(num_lists=4, nprobe=4).build(store, output_dir=str(tmpdir / "index"))
+    assert index.size == len(inputs)
+
+    queries = embedder.model.backbone[0](inputs[:5]).detach()
+    _, ids = EmbeddingIndex.load(str(tmpdir / "index")).search(queries, k=1)
+    assert ids[:, 0].tolist() == list(range(5))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.skipif(not _FAISS_AVAILABLE, reason="faiss isn't installed.")
+def test_faiss_index(tmpdir):
+    vectors, queries = _clustered()
+    index = FaissIndex("IVF64,Flat", metric="l2", nprobe=64).build(vectors)
+
+    expected_scores, expected_ids = search_exact(vectors, queries, k=10, metric="l2")
+    scores, ids = index.search(queries, k=10)
+    assert _recall(ids, expected_ids) > 0.99
+    assert np.allclose(scores, expected_scores, rtol=1e-3, atol=1e-3)
+
+    index.save(str(tmpdir))
+    loaded = EmbeddingIndex.load(str(tmpdir))
+    assert isinstance(loaded, FaissIndex)
+    assert np.array_equal(loaded.search(queries, k=10)[1], ids)
+    assert (loaded.nprobe, loaded.num_train, loaded.seed) == (64, None, 42)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_index_serve():
+    from fastapi.testclient import TestClient
+
+    vectors, queries = _clustered(500, 2)
+    index = IVFIndex(num_lists=8, nprobe=8).build(vectors)
+    expected_scores, expected_ids = index.search(queries, k=3)
+
+    with TestClient(index.http_app(k=3)) as tc:
+        response = tc.post("/search", json={"queries": queries.tolist()})
+        assert response.status_code == 200
+        assert response.json()["ids"] == expected_ids.tolist()
+        assert np.allclose(response.json()["scores"], expected_scores)
+
+        # The results which aren't found are left out
+        response = tc.post("/search", json={"queries": queries[:1].tolist(), "k": 600})
+        assert len(response.json()["ids"][0]) == 500
+
+        assert tc.post("/search", json={"k": 3}).status_code == 422
+        assert tc.post("/search", content=b"not json").status_code == 422
+
+    # Searching an index which wasn't built is a client error too
+    with TestClient(IVFIndex().http_app()) as tc:
+        assert tc.post("/search", json={"queries": queries.tolist()}).status_code == 422
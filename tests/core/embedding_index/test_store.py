@@ -0,0 +1,87 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+from torch.utils.data import DataLoader
+
+from flash import Trainer
+from flash.core.embedding_index import EmbeddingSink, EmbeddingStore
+from flash.core.utilities.embedder import Embedder
+from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
+from tests.core.utilities.test_embedder import EmbedderTestModel
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("dtype, tolerance", [("float32", 0), ("float16", 1e-2), ("int8", 2e-2)])
+def test_embedding_store(tmpdir, dtype, tolerance):
+    vectors = np.random.default_rng(0).normal(size=(25, 8)).astype(np.float32)
+    vectors[3] = 0
+
+    with EmbeddingSink(str(tmpdir), dtype=dtype, max_rows_per_file=10) as sink:
+        sink.write(torch.from_numpy(vectors[:7]))
+        sink.write(list(torch.from_numpy(vectors[7:])))
+    assert len(sink.files) == 3
+
+    store = EmbeddingStore(str(tmpdir))
+    assert (len(store), store.dim, store.dtype) == (25, 8, dtype)
+    assert os.path.getsize(sink.files[0]) == 10 * 8 * np.dtype(dtype).itemsize
+
+    # The embeddings are read back in order, across the shards
+    assert np.allclose(np.concatenate([chunk for _, chunk in store.iter_chunks(4)]), vectors, atol=tolerance * 4)
+    assert [start for start, _ in store.iter_chunks(4)] == [0, 4, 8, 10, 14, 18, 20, 24]
+    assert np.allclose(store.take([24, 3, 9]), vectors[[24, 3, 9]], atol=tolerance * 4)
+    assert np.allclose(store[12], vectors[12], atol=tolerance * 4)
+    assert np.allclose(store[5:15], vectors[5:15], atol=tolerance * 4)
+
+    # The directions of the embeddings are kept
+    cosine = np.sum(store[:] * vectors, axis=1) / np.maximum(
+        np.linalg.norm(store[:], axis=1) * np.linalg.norm(vectors, axis=1), 1e-12
+    )
+    assert np.all(cosine[vectors.any(axis=1)] > 1 - tolerance - 1e-6)
+
+    with pytest.raises(IndexError, match="range"):
+        store.take([25])
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_embedding_store_errors(tmpdir):
+    with pytest.raises(ValueError, match="dtype"):
+        EmbeddingSink(str(tmpdir), dtype="int4")
+
+    with pytest.raises(ValueError, match="8 elements"), EmbeddingSink(str(tmpdir)) as sink:
+        sink.write(torch.rand(2, 8))
+        sink.write(torch.rand(2, 4))
+
+    with pytest.raises(ValueError, match="doesn't contain"):
+        EmbeddingStore(str(tmpdir / "empty"))
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_embedding_sink_predict(tmpdir):
+    embedder = Embedder(EmbedderTestModel(nn.Sequential(nn.Linear(10, 20), nn.Linear(20, 30))), "backbone.0")
+    inputs = torch.rand(50, 10)
+    trainer = Trainer(fast_dev_run=False, default_root_dir=tmpdir, logger=False)
+
+    # The embeddings are streamed to the store while predicting
+    files = trainer.predict(embedder, DataLoader(inputs, batch_size=8), sink=EmbeddingSink(str(tmpdir / "embeddings")))
+    assert len(files) == 1
+
+    store = EmbeddingStore(str(tmpdir / "embeddings"))
+    assert (len(store), store.dim) == (50, 20)
+    expected = embedder.model.backbone[0](inputs).detach().numpy()
+    assert np.allclose(store[:], expected, atol=1e-2)
@@ -0,0 +1,37 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from flash.core.integrations.transformers.collate import _dataset_fingerprint
+from flash.core.utilities.imports import _TOPIC_TEXT_AVAILABLE
+
+if _TOPIC_TEXT_AVAILABLE:
+    from datasets import Dataset
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_dataset_fingerprint():
+    data = {"input": ["a", "bb", "ccc", "dddd", "eeeee"], "target": [0, 1, 0, 1, 0]}
+    dataset = Dataset.from_dict(data)
+    fingerprint = _dataset_fingerprint(dataset, batch_size=2)
+
+    # The same rows give the same fingerprint, whichever dataset object they come from
+    assert _dataset_fingerprint(Dataset.from_dict(data), batch_size=2) == fingerprint
+
+    # Any change to the rows (including their order or a selection of them) changes it
+    assert _dataset_fingerprint(Dataset.from_dict({**data, "target": [0, 1, 0, 1, 1]}), batch_size=2) != fingerprint
+    assert _dataset_fingerprint(dataset.select([4, 3, 2, 1, 0]), batch_size=2) != fingerprint
+
+    head = Dataset.from_dict({key: values[:4] for key, values in data.items()})
+    assert _dataset_fingerprint(dataset.select([0, 1, 2, 3])) == _dataset_fingerprint(head)
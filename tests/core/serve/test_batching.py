@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from flash.core.serve.batching import MicroBatcher
+from flash.core.utilities.imports import _TOPIC_SERVE_AVAILABLE
+
+
+def _run_concurrently(batcher, items):
+    results = {}
+
+    def _call(item):
+        try:
+            results[item] = batcher(item)
+        except Exception as e:
+            results[item] = e
+
+    threads = [threading.Thread(target=_call, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_micro_batcher_merges_concurrent_requests():
+    batch_sizes = []
+
+    def fn(items):
+        batch_sizes.append(len(items))
+        time.sleep(0.01)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(fn, max_batch_size=4, max_wait_ms=50)
+    results = _run_concurrently(batcher, list(range(8)))
+    batcher.close()
+
+    assert results == {item: item * 2 for item in range(8)}
+    assert max(batch_sizes) <= 4
+    assert len(batch_sizes) < 8
+    assert batcher.num_items == 8
+    assert batcher.mean_batch_size > 1
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_micro_batcher_isolates_failures():
+    def fn(items):
+        if "bad" in items:
+            raise ValueError("bad request")
+        return [item.upper() for item in items]
+
+    batcher = MicroBatcher(fn, max_batch_size=8, max_wait_ms=50)
+    results = _run_concurrently(batcher, ["a", "b", "bad"])
+    batcher.close()
+
+    assert results["a"] == "A"
+    assert results["b"] == "B"
+    assert isinstance(results["bad"], ValueError)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_micro_batcher_single():
+    batcher = MicroBatcher(lambda items: [item + 1 for item in items], max_batch_size=1)
+    assert batcher(1) == 2
+    assert batcher._thread is None
+
+    with pytest.raises(ValueError, match="positive integer"):
+        MicroBatcher(lambda items: items, max_batch_size=0)
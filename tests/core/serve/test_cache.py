@@ -0,0 +1,80 @@
+import base64
+import time
+
+import numpy as np
+import pytest
+
+from flash.core.serve import Composition, PredictionCache
+from flash.core.serve.cache import MISSING, model_version
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _TOPIC_SERVE_AVAILABLE
+
+if _FASTAPI_AVAILABLE:
+    from fastapi.testclient import TestClient
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_cache_keys():
+    cache = PredictionCache(version="1")
+    assert cache.key("/a", {"x": {"data": "abc"}, "y": 1}) == cache.key("/a", {"y": 1, "x": {"data": "abc"}})
+    assert cache.key("/a", {"x": "1"}) != cache.key("/a", {"x": 1})
+    assert cache.key("/a", {"x": 1}) != cache.key("/b", {"x": 1})
+    assert cache.key("/a", {"x": np.zeros(3)}) != cache.key("/a", {"x": np.zeros(3, dtype=np.float32)})
+    assert cache.key("/a", {"x": b"abc"}) != PredictionCache(version="2").key("/a", {"x": b"abc"})
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_cache_eviction():
+    cache = PredictionCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+    cache = PredictionCache(ttl=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert cache.get("a", None) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(ValueError, match="max_size"):
+        PredictionCache(max_size=0)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_cache_on_disk(tmpdir):
+    path = tmpdir / "cache" / "predictions.db"
+    cache = PredictionCache(path=path)
+    cache.put("a", ({"label": "goldfish"},))
+
+    cache = PredictionCache(path=path)
+    assert cache.get("a") == ({"label": "goldfish"},)
+    assert len(cache) == 1
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_cached_endpoint(session_global_datadir, lightning_squeezenet1_1_obj):
+    from tests.core.serve.models import ClassificationInference
+
+    comp = ClassificationInference(lightning_squeezenet1_1_obj)
+    composit = Composition(comp=comp, TESTING=True, DEBUG=True)
+    cache = PredictionCache(max_size=8)
+    app = composit.serve(host="0.0.0.0", port=8000, cache=cache)
+    assert cache.version == model_version(composit)
+
+    with (session_global_datadir / "fish.jpg").open("rb") as f:
+        imgstr = base64.b64encode(f.read()).decode("UTF-8")
+
+    with TestClient(app) as tc:
+        for session in ("1", "2"):
+            body = {"session": session, "payload": {"img": {"data": imgstr}}}
+            resp = tc.post("http://127.0.0.1:8000/classify", json=body)
+            assert resp.json() == {"session": session, "result": {"prediction": "goldfish, Carassius auratus"}}
+
+        resp = tc.get("http://127.0.0.1:8000/flashserve/metrics")
+        assert resp.status_code == 200
+        stats = resp.json()["cache"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
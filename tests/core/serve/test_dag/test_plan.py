@@ -0,0 +1,67 @@
+import asyncio
+import pickle
+
+import pytest
+
+from flash.core.serve.dag.plan import compile_plan
+from flash.core.serve.dag.task import get
+from flash.core.serve.dag.utils_test import add, inc, mul
+from flash.core.utilities.imports import _TOPIC_SERVE_AVAILABLE
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="Not testing serve.")
+@pytest.mark.parametrize("fuse", [True, False])
+def test_compile_plan(fuse):
+    dsk = {
+        "a": (inc, "x"),
+        "b": (add, "a", (mul, "y", 2)),
+        "c": (inc, "b"),
+        "d": (inc, "c"),
+        "e": (add, "a", "k"),
+        "k": 10,
+        "alias": "d",
+        "unused": (inc, "missing"),
+    }
+    out = ["alias", "e"]
+    plan = compile_plan(dsk, out, input_keys=["x", "y"], fuse=fuse)
+
+    inputs = {"x": 1, "y": 3}
+    used = {key: task for key, task in dsk.items() if key != "unused"}
+    assert plan(inputs) == get(used, out, cache=dict(inputs)) == (10, 12)
+    assert plan({"x": 0, "y": 0}) == (3, 11)
+    assert plan.output_keys == ("alias", "e")
+
+    with pytest.raises(KeyError):
+        plan({"x": 1})
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="Not testing serve.")
+def test_compile_plan_fuses_linear_chains():
+    dsk = {"a": (inc, "x"), "b": (inc, "a"), "c": (inc, "b")}
+    assert len(compile_plan(dsk, ["c"], input_keys=["x"], fuse=False)) == 3
+    fused = compile_plan(dsk, ["c"], input_keys=["x"])
+    assert len(fused) == 1
+    assert fused({"x": 0}) == (3,)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="Not testing serve.")
+def test_compile_plan_kinds():
+    dsk = {"a": (inc, "x"), "b": (inc, "a"), "c": (mul, "b", 2), "d": (inc, (inc, "c")), "alias": "d"}
+    plan = compile_plan(dsk, ["alias"], input_keys=["x"], kind=lambda task: task[0] is mul)
+
+    # Only the tasks of the same kind are fused together
+    assert len(plan) == 4
+    assert plan._kinds == (False, True, False, None)
+    assert plan({"x": 0}) == (6,)
+
+    async def run_step(kind, func, args):
+        kinds.append(kind)
+        return func(*args)
+
+    kinds = []
+    assert asyncio.run(plan.run_async({"x": 0}, run_step)) == (6,)
+    assert kinds == [False, True, False]
+
+    # The steps can be sent to a process pool
+    for _, func, _ in plan._steps:
+        pickle.loads(pickle.dumps(func))
@@ -0,0 +1,114 @@
+import asyncio
+import base64
+
+import pytest
+
+from flash.core.serve import Composition, ServeExecutor
+from flash.core.serve.dag.plan import compile_plan
+from flash.core.serve.executor import is_io_task
+from flash.core.serve.metrics import SERVE_METRICS, Trace, tracing
+from flash.core.serve.types.base import BaseType
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _TOPIC_SERVE_AVAILABLE
+
+if _FASTAPI_AVAILABLE:
+    from fastapi.testclient import TestClient
+
+
+def inc(x):
+    return x + 1
+
+
+def add(x, y):
+    return x + y
+
+
+class Increment(BaseType):
+    def serialize(self, data: int) -> int:
+        return data
+
+    def deserialize(self, data: int) -> int:
+        with SERVE_METRICS.stage("deserialize"):
+            return data + 1
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_executor_get():
+    executor = ServeExecutor(io_workers=1, compute_workers=1)
+    dsk = {"x": 1, "y": (inc, "x"), "z": (add, "y", (inc, "x"))}
+    assert asyncio.run(executor.get(dsk, "z")) == 4
+    assert asyncio.run(executor.get(dsk, ["y", "z"], sortkeys=["x", "y", "z"])) == (2, 4)
+
+    with pytest.raises(KeyError):
+        asyncio.run(executor.get(dsk, "missing"))
+    executor.shutdown()
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+@pytest.mark.parametrize("io_pool", ["thread", "process"])
+def test_executor_traces_stages(io_pool):
+    executor = ServeExecutor(io_workers=1, io_pool=io_pool)
+    dsk = {"x": 1, "y": (Increment().deserialize, "x")}
+    assert is_io_task(dsk["y"])
+
+    # The stages timed in a worker (thread or process) are added to the trace of the request
+    trace = Trace()
+    with tracing(trace):
+        assert asyncio.run(executor.get(dsk, "y")) == 2
+    assert list(trace.stages) == ["deserialize"]
+    executor.shutdown()
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+@pytest.mark.parametrize("io_pool", ["thread", "process"])
+def test_executor_run_plan(io_pool):
+    executor = ServeExecutor(io_workers=1, io_pool=io_pool)
+    increment = Increment()
+    dsk = {"y": (increment.deserialize, (increment.deserialize, "x")), "z": (add, "y", (inc, "y"))}
+    plan = compile_plan(dsk, ["z"], input_keys=["x"], kind=is_io_task)
+
+    # The (fused) steps of the plan run in the pool matching their kind, and their stages are traced
+    trace = Trace()
+    with tracing(trace):
+        assert asyncio.run(executor.run(plan, {"x": 1})) == (7,)
+    assert list(trace.stages) == ["deserialize"]
+    executor.shutdown()
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_executor_admission():
+    executor = ServeExecutor(max_pending=2)
+    assert executor.try_acquire()
+    assert executor.try_acquire()
+    assert not executor.try_acquire()
+    assert executor.num_rejected == 1
+    executor.release()
+    assert executor.try_acquire()
+
+    with pytest.raises(ValueError, match="io_pool"):
+        ServeExecutor(io_pool="fiber")
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_async_endpoint(session_global_datadir, lightning_squeezenet1_1_obj):
+    from tests.core.serve.models import ClassificationInference
+
+    comp = ClassificationInference(lightning_squeezenet1_1_obj)
+    assert is_io_task(comp._flashserve_meta_.dsk[f"{comp.uid}.inputs.img"])
+    assert not is_io_task(comp._flashserve_meta_.dsk[f"{comp.uid}.funcout"])
+
+    composit = Composition(comp=comp, TESTING=True, DEBUG=True)
+    executor = ServeExecutor(io_workers=2, compute_workers=1, max_pending=4)
+    app = composit.serve(host="0.0.0.0", port=8000, executor=executor)
+
+    with (session_global_datadir / "fish.jpg").open("rb") as f:
+        imgstr = base64.b64encode(f.read()).decode("UTF-8")
+    body = {"session": "UUID", "payload": {"img": {"data": imgstr}}}
+
+    with TestClient(app) as tc:
+        resp = tc.post("http://127.0.0.1:8000/classify", json=body)
+        assert resp.json() == {"session": "UUID", "result": {"prediction": "goldfish, Carassius auratus"}}
+        assert executor.pending == 0
+
+        executor.pending = executor.max_pending
+        resp = tc.post("http://127.0.0.1:8000/classify", json=body)
+        assert resp.status_code == 503
@@ -1,5 +1,7 @@
 import base64
+from io import BytesIO
 
+import numpy as np
 import pytest
 
 from flash.core.serve import Composition, Endpoint
@@ -471,3 +473,49 @@ def test_composition_from_url_torchscript_servable(tmp_path):
             "result": {"ep_out": 1.0},
             "session": "UUID",
         }
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_binary_payloads(session_global_datadir, lightning_squeezenet1_1_obj):
+    from tests.core.serve.models import ClassificationInference
+
+    comp = ClassificationInference(lightning_squeezenet1_1_obj)
+    composit = Composition(comp=comp, TESTING=True, DEBUG=True)
+    app = composit.serve(host="0.0.0.0", port=8000)
+
+    with (session_global_datadir / "fish.jpg").open("rb") as f:
+        img_bytes = f.read()
+    expected = {"session": "UUID", "result": {"prediction": "goldfish, Carassius auratus"}}
+
+    with TestClient(app) as tc:
+        resp = tc.post(
+            "http://127.0.0.1:8000/classify?session=UUID", data=img_bytes, headers={"content-type": "image/jpeg"}
+        )
+        assert resp.status_code == 200
+        assert resp.json() == expected
+
+        resp = tc.post(
+            "http://127.0.0.1:8000/classify",
+            data={"session": "UUID"},
+            files={"img": ("fish.jpg", img_bytes, "image/jpeg")},
+        )
+        assert resp.json() == expected
+
+        resp = tc.post(
+            "http://127.0.0.1:8000/classify?session=UUID",
+            data=img_bytes,
+            headers={"content-type": "application/octet-stream", "accept": "application/x-npy"},
+        )
+        assert resp.headers["content-type"] == "application/x-npy"
+        assert resp.headers["x-session"] == "UUID"
+        assert np.load(BytesIO(resp.content)).item() == "goldfish, Carassius auratus"
+
+        # Malformed bodies are rejected as bad requests
+        resp = tc.post(
+            "http://127.0.0.1:8000/classify", data=b"not an array", headers={"content-type": "application/x-npy"}
+        )
+        assert resp.status_code == 400
+
+        # JSON requests are unchanged
+        body = {"session": "UUID", "payload": {"img": {"data": base64.b64encode(img_bytes).decode("UTF-8")}}}
+        assert tc.post("http://127.0.0.1:8000/classify", json=body).json() == expected
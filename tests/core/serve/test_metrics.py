@@ -0,0 +1,68 @@
+import base64
+
+import pytest
+
+from flash.core.serve import Composition
+from flash.core.serve.metrics import SERVE_METRICS, Histogram, ServeMetrics, current_trace
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _TOPIC_SERVE_AVAILABLE
+
+if _FASTAPI_AVAILABLE:
+    from fastapi.testclient import TestClient
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_histogram():
+    histogram = Histogram([1, 2, 4])
+    for value in (1, 2, 3, 10):
+        histogram.observe(value)
+    assert histogram.cumulative_counts() == [("1", 1), ("2", 2), ("4", 3), ("+Inf", 4)]
+    assert (histogram.count, histogram.sum) == (4, 16)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_serve_metrics():
+    metrics = ServeMetrics()
+    with metrics.request("/predict") as trace:
+        assert current_trace() is trace
+        with metrics.stage("predict_step"):
+            pass
+        metrics.observe_stage("deserialize", 0.5, trace=False)
+        metrics.observe_batch_size(3)
+    assert current_trace() is None
+    assert list(trace.stages) == ["predict_step", "total"]
+    assert trace.server_timing().startswith("predict_step;dur=")
+
+    with pytest.raises(RuntimeError), metrics.request("/predict"):
+        raise RuntimeError
+
+    text = metrics.render()
+    assert 'flash_serve_requests_total{route="/predict"} 2' in text
+    assert 'flash_serve_request_errors_total{route="/predict"} 1' in text
+    assert "flash_serve_requests_in_flight 0" in text
+    assert 'flash_serve_stage_duration_seconds_count{stage="deserialize"} 1' in text
+    assert 'flash_serve_batch_size_bucket{le="4"} 1' in text
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_metrics_endpoint(session_global_datadir, lightning_squeezenet1_1_obj):
+    from tests.core.serve.models import ClassificationInference
+
+    comp = ClassificationInference(lightning_squeezenet1_1_obj)
+    composit = Composition(comp=comp, TESTING=True, DEBUG=True)
+    app = composit.serve(host="0.0.0.0", port=8000)
+
+    with (session_global_datadir / "fish.jpg").open("rb") as f:
+        imgstr = base64.b64encode(f.read()).decode("UTF-8")
+    body = {"session": "UUID", "payload": {"img": {"data": imgstr}}}
+
+    num_requests = SERVE_METRICS.requests.get("/classify", 0)
+    with TestClient(app) as tc:
+        resp = tc.post("http://127.0.0.1:8000/classify", json=body)
+        assert resp.status_code == 200
+        assert "total;dur=" in resp.headers["Server-Timing"]
+
+        resp = tc.get("http://127.0.0.1:8000/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert f'flash_serve_requests_total{{route="/classify"}} {num_requests + 1}' in resp.text
+        assert 'flash_serve_request_duration_seconds_bucket{route="/classify",le="+Inf"}' in resp.text
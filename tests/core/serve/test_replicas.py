@@ -0,0 +1,83 @@
+import base64
+
+import pytest
+
+from flash.core.serve import Composition
+from flash.core.serve.replicas import ReplicaDispatcher, ReplicaSet, merge_prometheus_metrics
+from flash.core.utilities.imports import _FASTAPI_AVAILABLE, _TOPIC_SERVE_AVAILABLE
+
+if _FASTAPI_AVAILABLE:
+    from fastapi.testclient import TestClient
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_dispatcher_balances_in_flight():
+    dispatcher = ReplicaDispatcher([("127.0.0.1", 1), ("127.0.0.1", 2), ("127.0.0.1", 3)])
+    assert [dispatcher.acquire() for _ in range(3)] == [0, 1, 2]
+
+    dispatcher.release(1)
+    assert dispatcher.acquire() == 1
+    assert dispatcher.in_flight == [1, 1, 1]
+    assert dispatcher.num_requests == [1, 2, 1]
+
+    with pytest.raises(ValueError, match="num_replicas"):
+        ReplicaSet(None, num_replicas=0)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_merge_prometheus_metrics():
+    def replica_metrics(count):
+        return (
+            "# HELP requests_total Number of requests.\n"
+            "# TYPE requests_total counter\n"
+            f'requests_total{{route="/predict"}} {count}\n'
+            "# TYPE latency histogram\n"
+            f'latency_bucket{{le="+Inf"}} {count}\n'
+            f"latency_count {count}\n"
+        )
+
+    lines = merge_prometheus_metrics([replica_metrics(3), replica_metrics(5)]).splitlines()
+    # The samples of each metric are grouped under a single header
+    assert lines[:6] == [
+        "# HELP requests_total Number of requests.",
+        "# TYPE requests_total counter",
+        'requests_total{replica="0",route="/predict"} 3',
+        'requests_total{replica="1",route="/predict"} 5',
+        "# TYPE latency histogram",
+        'latency_bucket{replica="0",le="+Inf"} 3',
+    ]
+    assert lines[6:8] == ['latency_count{replica="0"} 3', 'latency_bucket{replica="1",le="+Inf"} 5']
+    assert lines[-2:] == ['flash_serve_replica_up{replica="0"} 1', 'flash_serve_replica_up{replica="1"} 1']
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="serve libraries aren't installed.")
+def test_replicas(session_global_datadir, lightning_squeezenet1_1_obj):
+    from tests.core.serve.models import ClassificationInference
+
+    comp = ClassificationInference(lightning_squeezenet1_1_obj)
+    composit = Composition(comp=comp, TESTING=True, DEBUG=True)
+    app = composit.serve(host="0.0.0.0", port=8000, num_replicas=2)
+
+    with (session_global_datadir / "fish.jpg").open("rb") as f:
+        imgstr = base64.b64encode(f.read()).decode("UTF-8")
+    body = {"session": "UUID", "payload": {"img": {"data": imgstr}}}
+
+    with TestClient(app) as tc:
+        # The replicas listen before they are forked, so requests wait in the backlog until they are up
+        assert tc.get("http://127.0.0.1:8000/flashserve/alive").status_code == 200
+
+        for _ in range(2):
+            resp = tc.post("http://127.0.0.1:8000/classify", json=body)
+            assert resp.status_code == 200
+            assert resp.json() == {"session": "UUID", "result": {"prediction": "goldfish, Carassius auratus"}}
+
+        resp = tc.get("http://127.0.0.1:8000/flashserve/replicas")
+        assert resp.json()["in_flight"] == [0, 0]
+        assert sum(resp.json()["num_requests"]) >= 3
+
+        # Every replica is scraped for its metrics
+        resp = tc.get("http://127.0.0.1:8000/metrics")
+        assert resp.status_code == 200
+        assert 'flash_serve_replica_up{replica="0"} 1' in resp.text
+        assert 'flash_serve_replica_up{replica="1"} 1' in resp.text
+        assert 'flash_serve_requests_in_flight{replica="1"}' in resp.text
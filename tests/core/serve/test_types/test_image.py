@@ -25,3 +25,18 @@ def test_deserialize_serialize(session_global_datadir):
     assert isinstance(reconstructed, Tensor)
     assert np.allclose(ten.shape, reconstructed.shape)
     assert ten.dtype == reconstructed.dtype
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="Not testing serve.")
+@pytest.mark.skipif(not _PIL_AVAILABLE, reason="library PIL is not installed.")
+def test_deserialize_binary(session_global_datadir):
+    with (session_global_datadir / "cat.jpg").open("rb") as f:
+        img_bytes = f.read()
+
+    image_type = Image()
+    ten = image_type.deserialize(img_bytes)
+    assert np.allclose(ten.numpy(), image_type.deserialize(base64.b64encode(img_bytes).decode("UTF-8")).numpy())
+
+    arr = ten.squeeze(0).numpy()
+    assert np.array_equal(image_type.deserialize(arr).numpy(), ten.numpy())
+    assert Image(height=8, width=12).deserialize(arr).shape == (1, 8, 12, 3)
@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 import torch
 
@@ -90,3 +91,10 @@ def test_deserialize_column_names_failures():
         # not allowed types
         d = {"t1": {0: 100}, "t2": {0: "dummy string"}}
         table.deserialize(d)
+
+
+@pytest.mark.skipif(not _TOPIC_SERVE_AVAILABLE, reason="Not testing serve.")
+def test_deserialize_binary():
+    table = Table(column_names=feature_names)
+    assert torch.equal(table.deserialize(data.numpy()), data)
+    assert torch.equal(table.deserialize(pd.DataFrame(data.numpy(), columns=feature_names)), data)
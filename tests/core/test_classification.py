@@ -52,6 +52,34 @@ def test_classification_outputs_multi_label():
     assert LabelsOutput(labels, multi_label=True).transform(example_output) == ["class_2", "class_3"]
 
 
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("multi_label", [False, True])
+@pytest.mark.parametrize(
+    "output_cls, output_kwargs",
+    [
+        (LogitsOutput, {}),
+        (ProbabilitiesOutput, {}),
+        (ClassesOutput, {}),
+        (ClassesOutput, {"threshold": 0.9}),
+        (LabelsOutput, {"labels": ["class_1", "class_2", "class_3"]}),
+        (LabelsOutput, {"labels": None}),
+    ],
+)
+def test_classification_outputs_transform_batch(output_cls, output_kwargs, multi_label):
+    output = output_cls(multi_label=multi_label, **output_kwargs)
+    preds = torch.randn(16, 3)
+    preds[0] = -10  # No class above the threshold
+
+    # Transforming the whole batch gives the same outputs as transforming each sample
+    expected = [output.transform(sample) for sample in preds]
+    for batch in (preds, {DataKeys.PREDS: preds, DataKeys.INPUT: torch.zeros(16, 2)}, list(preds)):
+        result = output.transform_batch(batch)
+        if output_cls is ProbabilitiesOutput:
+            assert torch.allclose(torch.tensor(result), torch.tensor(expected))
+        else:
+            assert result == expected
+
+
 @pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
 @pytest.mark.skipif(not _FIFTYONE_AVAILABLE, reason="fiftyone is not installed for testing")
 def test_classification_outputs_fiftyone():
@@ -27,6 +27,7 @@ from pytorch_lightning.callbacks import Callback
 from torch import Tensor, nn
 from torch.nn import functional as F
 from torch.utils.data import DataLoader
+from torch.utils.data.sampler import BatchSampler
 from torchmetrics import Accuracy
 
 import flash
@@ -34,6 +35,7 @@ from flash import Task
 from flash.audio import SpeechRecognition
 from flash.core.adapter import Adapter
 from flash.core.classification import ClassificationTask
+from flash.core.data.io.input import DataKeys, Input
 from flash.core.data.io.input_transform import InputTransform
 from flash.core.data.io.output_transform import OutputTransform
 from flash.core.utilities.embedder import Embedder
@@ -50,6 +52,7 @@ from flash.core.utilities.imports import (
     _TORCH_OPTIMIZER_AVAILABLE,
     _TRANSFORMERS_AVAILABLE,
 )
+from flash.core.utilities.stages import RunningStage
 from flash.graph import GraphClassifier, GraphEmbedder
 from flash.image import ImageClassifier, SemanticSegmentation
 from flash.tabular import TabularClassifier
@@ -556,3 +559,19 @@ def test_loss_fn_buffer():
 
     assert len(state_dict) == 1
     assert torch.allclose(state_dict["loss_fn.crossentropyloss.weight"], weight)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.parametrize("task", [Parent, AdapterParent])
+def test_process_dataset_load_batch(task):
+    class BatchInput(Input):
+        def load_data(self, data):
+            return torch.arange(data, dtype=torch.float32)
+
+        def load_batch(self, indices):
+            return [{DataKeys.INPUT: x} for x in self.data[indices]]
+
+    model = task(ClassificationTask(nn.Linear(1, 2)))
+    dataloader = model.process_train_dataset(BatchInput(RunningStage.TRAINING, 10), 4, drop_last=False)
+    assert isinstance(dataloader.sampler, BatchSampler)
+    assert sorted(torch.cat([batch[DataKeys.INPUT] for batch in dataloader]).tolist()) == list(range(10))
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 from argparse import ArgumentParser
 from typing import Any, Tuple, Union
 
@@ -26,6 +27,7 @@ from torch.utils.data import DataLoader
 
 from flash import Trainer
 from flash.core.classification import ClassificationTask
+from flash.core.data.io.prediction_sink import JSONLinesSink
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
 
 
@@ -93,6 +95,22 @@ def test_trainer_finetune(tmpdir):
     trainer.finetune(task, train_dl, val_dl, strategy=NoFreeze())
 
 
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_trainer_predict_sink(tmpdir):
+    model = ClassificationTask(DummyClassifier())
+    predict_dl = DataLoader(DummyDataset(predict=True), batch_size=8)
+    trainer = Trainer(fast_dev_run=False, default_root_dir=tmpdir, logger=False)
+
+    sink = JSONLinesSink(str(tmpdir / "predictions"), max_rows_per_file=30)
+    files = trainer.predict(model, predict_dl, output="classes", sink=sink)
+
+    # The predictions are written to the sink instead of being returned
+    assert len(files) == 4
+    predictions = [json.loads(line) for file in files for line in open(file)]
+    assert len(predictions) == 100
+    assert all(isinstance(prediction, int) for prediction in predictions)
+
+
 @pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
 def test_resolve_callbacks_invalid_strategy(tmpdir):
     model = DummyClassifier()
@@ -0,0 +1,112 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import flash
+from flash.core.utilities.imports import _TOPIC_IMAGE_AVAILABLE
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    """Runs Python in a new interpreter (which imports this copy of Flash, without the testing seed)."""
+    env = {key: value for key, value in os.environ.items() if key != "FLASH_TESTING"}
+    env["PYTHONPATH"] = os.pathsep.join([os.path.dirname(flash._PACKAGE_ROOT), env.get("PYTHONPATH", "")])
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Runs the code with ``python -X importtime`` and returns the cumulative import time (in microseconds) of each
+    module it imported."""
+    times = {}
+    for line in _run("-X", "importtime", "-c", code).stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            _, cumulative, module = line.split("|")
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def _slowest(times: Dict[str, int], n: int = 10) -> str:
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:n]
+    return ", ".join(f"{module}: {time / 1000:.1f}ms" for module, time in slowest)
+
+
+def test_import_flash():
+    times = _import_times("import flash")
+
+    # Neither PyTorch nor any optional dependency is imported (probing a dependency imports it)
+    heavy = {"torch", "numpy", "pytorch_lightning", "lightning_utilities", "pkg_resources", "PIL"}
+    assert not heavy.intersection(module.split(".")[0] for module in times), _slowest(times)
+    assert "flash.core.model" not in times
+
+
+def test_import_flash_cli():
+    # Only the CLI module of the task which is run gets imported
+    times = _import_times("import flash.__main__")
+    assert not [module for module in times if module.endswith(".cli")], _slowest(times)
+
+
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+def test_import_flash_image():
+    times = _import_times("from flash.image import ImageClassifier")
+    assert "flash.image.classification.model" in times
+
+    # The other image tasks (and their dependencies) aren't imported
+    for module in ("flash.image.detection", "flash.image.embedding", "flash.image.style_transfer", "icevision"):
+        assert module not in times, _slowest(times)
+
+
+def test_availability_flags_are_lazy():
+    code = (
+        "import flash.core.utilities.imports as imports\n"
+        "print(sorted(name for name in vars(imports) if name.endswith('_AVAILABLE')))\n"
+        "assert isinstance(imports._TOPIC_IMAGE_AVAILABLE, bool)\n"
+        "assert '_TOPIC_IMAGE_AVAILABLE' in vars(imports) and '_PIL_AVAILABLE' in dir(imports)\n"
+    )
+    assert _run("-c", code).stdout.strip() == "['_TORCH_AVAILABLE']"
+
+
+def test_lazy_attributes(tmpdir, monkeypatch):
+    package = os.path.join(tmpdir, "lazy_package")
+    os.makedirs(package)
+    with open(os.path.join(package, "__init__.py"), "w") as f:
+        f.write(
+            "from flash.core.utilities.imports import lazy_attributes\n"
+            "__getattr__, __dir__ = lazy_attributes(__name__, {'value': 'lazy_package.values'})\n"
+        )
+    with open(os.path.join(package, "values.py"), "w") as f:
+        f.write("value = 42\n")
+    with open(os.path.join(package, "other.py"), "w") as f:
+        f.write("other = 0\n")
+    monkeypatch.syspath_prepend(str(tmpdir))
+
+    import lazy_package
+
+    try:
+        assert "lazy_package.values" not in sys.modules
+        assert "value" in dir(lazy_package)
+        assert lazy_package.value == 42
+        assert "lazy_package.values" in sys.modules
+
+        # Submodules can be accessed without importing them first
+        assert lazy_package.other.other == 0
+
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            lazy_package.missing
+    finally:
+        for module in ("lazy_package", "lazy_package.values", "lazy_package.other"):
+            sys.modules.pop(module, None)
@@ -31,6 +31,7 @@ from flash.core.utilities.imports import (
     _TORCHVISION_AVAILABLE,
 )
 from flash.image import ImageClassificationData, ImageClassificationInputTransform
+from flash.image.data import write_image_records
 
 if _TORCHVISION_AVAILABLE:
     from torchvision.datasets import FakeData
@@ -78,6 +79,102 @@ def test_from_filepaths_smoke(tmpdir):
     assert sorted(labels.numpy()) == [1, 2]
 
 
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+def test_from_filepaths_tensor_decode(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    _rand_image((128, 128)).save(tmpdir / "a_1.jpg")
+    _rand_image((128, 128)).save(tmpdir / "b_1.png")
+
+    img_data = ImageClassificationData.from_files(
+        train_files=[str(tmpdir / "a_1.jpg"), str(tmpdir / "b_1.png")],
+        train_targets=[1, 2],
+        decode="tensor",
+        draft_size=(64, 64),
+        transform_kwargs=dict(image_size=(64, 64), transforms_on_device=True),
+        batch_size=2,
+        num_workers=0,
+    )
+
+    # The images are only resized in the workers, so the batches are still ``uint8``
+    data = next(iter(img_data.train_dataloader()))
+    imgs, labels = data["input"], data["target"]
+    assert imgs.dtype == torch.uint8
+    assert imgs.shape == (2, 3, 64, 64)
+    assert sorted(labels.numpy()) == [1, 2]
+
+    transform = ImageClassificationInputTransform(image_size=(64, 64), transforms_on_device=True)
+    imgs = transform.train_per_batch_transform_on_device()({DataKeys.INPUT: imgs})[DataKeys.INPUT]
+    assert imgs.dtype == torch.float32
+    assert imgs.shape == (2, 3, 64, 64)
+
+    with pytest.raises(ValueError, match="decode"):
+        ImageClassificationData.from_files(train_files=[str(tmpdir / "a_1.jpg")], train_targets=[1], decode="cv2")
+
+
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+def test_from_records(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    files = []
+    for i in range(4):
+        _rand_image((64, 64)).save(tmpdir / f"image_{i}.jpg")
+        files.append(str(tmpdir / f"image_{i}.jpg"))
+    np.save(tmpdir / "image_4.npy", np.random.randint(0, 255, (64, 64, 3), dtype="uint8"))
+    files.append(str(tmpdir / "image_4.npy"))
+
+    index = write_image_records(files, tmpdir / "train", targets=["a", "b", "a", "b", "a"], max_shard_size=1)
+    assert (index["num_records"], len(index["shards"])) == (5, 5)
+    write_image_records(files, tmpdir / "predict")
+
+    img_data = ImageClassificationData.from_records(
+        train_records=str(tmpdir / "train"),
+        predict_records=str(tmpdir / "predict"),
+        decode="tensor",
+        transform_kwargs={"image_size": (32, 32)},
+        batch_size=5,
+        num_workers=0,
+    )
+    assert img_data.num_classes == 2
+    assert img_data.labels == ["a", "b"]
+
+    data = next(iter(img_data.train_dataloader()))
+    imgs, labels = data["input"], data["target"]
+    assert imgs.shape == (5, 3, 32, 32)
+    assert sorted(labels.tolist()) == [0, 0, 0, 1, 1]
+
+    data = next(iter(img_data.predict_dataloader()))
+    assert data["input"].shape == (5, 3, 32, 32)
+    assert data["metadata"][0]["filepath"] == files[0]
+
+
+@pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_from_records_epoch(tmpdir, num_workers):
+    tmpdir = Path(tmpdir)
+
+    files = []
+    for i in range(6):
+        _rand_image((16, 16)).save(tmpdir / f"image_{i}.png")
+        files.append(str(tmpdir / f"image_{i}.png"))
+    write_image_records(files, tmpdir / "train", targets=[i % 2 for i in range(6)], max_shard_size=1)
+
+    img_data = ImageClassificationData.from_records(
+        train_records=str(tmpdir / "train"),
+        decode="tensor",
+        transform_kwargs={"image_size": (8, 8)},
+        batch_size=2,
+        num_workers=num_workers,
+    )
+
+    # Every record is seen exactly once per epoch, whichever worker reads it
+    for _ in range(2):
+        batches = list(img_data.train_dataloader())
+        assert all(batch["input"].shape[1:] == (3, 8, 8) for batch in batches)
+        filepaths = [metadata["filepath"] for batch in batches for metadata in batch["metadata"]]
+        assert sorted(filepaths) == files
+
+
 @pytest.mark.skipif(not _TOPIC_IMAGE_AVAILABLE, reason="image libraries aren't installed.")
 def test_from_data_frame_smoke(tmpdir):
     tmpdir = Path(tmpdir)
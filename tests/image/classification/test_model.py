@@ -155,3 +155,4 @@ def test_serve():
     model = ImageClassifier(2)
     model.eval()
     model.serve()
+    model.serve(max_batch_size=4, max_wait_ms=1)
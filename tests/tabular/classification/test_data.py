@@ -24,7 +24,16 @@ if _TOPIC_TABULAR_AVAILABLE:
     import pandas as pd
 
     from flash.tabular import TabularClassificationData
-    from flash.tabular.classification.utils import _categorize, _compute_normalization, _generate_codes, _normalize
+    from flash.tabular.classification.input import TabularClassificationStreamingInput
+    from flash.tabular.classification.utils import (
+        _categorize,
+        _compute_normalization,
+        _generate_codes,
+        _normalize,
+        _preprocess_chunks,
+        _StreamingStatistics,
+    )
+    from flash.tabular.input import TabularSamples
 
     TEST_DICT_1 = {
         "category": ["a", "b", "c", "a", None, "c"],
@@ -64,10 +73,10 @@ def test_categorize():
     codes = _generate_codes(TEST_DF_1, ["category"])
     assert codes == {"category": ["a", "b", "c"]}
 
-    df = _categorize(TEST_DF_1, ["category"], codes)
+    df = _categorize(TEST_DF_1.copy(), ["category"], codes)
     assert list(df["category"]) == [1, 2, 3, 1, 0, 3]
 
-    df = _categorize(TEST_DF_2, ["category"], codes)
+    df = _categorize(TEST_DF_2.copy(), ["category"], codes)
     assert list(df["category"]) == [0, 0, 0]
 
 
@@ -75,7 +84,7 @@ def test_categorize():
 def test_normalize():
     num_input = ["scalar_a", "scalar_b"]
     mean, std = _compute_normalization(TEST_DF_1, num_input)
-    df = _normalize(TEST_DF_1, num_input, mean, std)
+    df = _normalize(TEST_DF_1.copy(), num_input, mean, std)
     assert np.allclose(df[num_input].mean(), 0.0)
 
 
@@ -90,6 +99,103 @@ def test_normalize_large_array_dtype_fp16():
     assert np.allclose(df[col_name].mean(), 0.0)
 
 
+@pytest.mark.skipif(not _TOPIC_TABULAR_AVAILABLE, reason="tabular dependencies are required")
+def test_preprocess_chunks():
+    num_input = ["scalar_a", "scalar_b"]
+    chunks = [TEST_DF_1.iloc[:4], TEST_DF_1.iloc[4:]]
+    cat_vars, num_vars, targets, parameters = _preprocess_chunks(
+        chunks, num_input, ["category"], resolve_targets=lambda df: df["label"].tolist()
+    )
+
+    assert parameters["codes"] == _generate_codes(TEST_DF_1, ["category"])
+    assert parameters["mean"] == pytest.approx(_compute_normalization(TEST_DF_1, num_input)[0])
+    assert cat_vars.dtype == np.int64
+    assert num_vars.dtype == np.float32
+    assert cat_vars[:, 0].tolist() == [1, 2, 3, 1, 0, 3]
+    assert not np.isnan(num_vars).any()
+    assert targets == TEST_DICT_1["label"]
+
+    # Parameters from the train data are used to encode new data, unknown categories are encoded as 0
+    cat_vars, num_vars, targets, _ = _preprocess_chunks([TEST_DF_2], num_input, ["category"], parameters=parameters)
+    assert cat_vars[:, 0].tolist() == [0, 0, 0]
+    assert num_vars.shape == (3, 2)
+    assert targets is None
+
+
+@pytest.mark.skipif(not _TOPIC_TABULAR_AVAILABLE, reason="tabular dependencies are required")
+def test_tabular_samples():
+    cat_vars = np.arange(5, dtype=np.int64).reshape(5, 1)
+    num_vars = np.arange(10, dtype=np.float32).reshape(5, 2)
+    samples = TabularSamples(cat_vars, num_vars, np.arange(5, dtype=np.float32))
+
+    assert len(samples) == 5
+    assert samples[1][DataKeys.TARGET] == 1
+    batch = samples.take([3, 1])
+    assert [sample[DataKeys.INPUT][0].tolist() for sample in batch] == [[3], [1]]
+    assert [sample[DataKeys.TARGET] for sample in batch] == [3, 1]
+    assert DataKeys.TARGET not in TabularSamples(cat_vars, num_vars).take([0])[0]
+
+
+@pytest.mark.skipif(not _TOPIC_TABULAR_AVAILABLE, reason="tabular dependencies are required")
+def test_streaming_statistics():
+    num_input = ["scalar_a", "scalar_b"]
+    statistics = _StreamingStatistics(num_input, ["category"]).update(TEST_DF_1.iloc[:3])
+    statistics.merge(_StreamingStatistics(num_input, ["category"]).update(TEST_DF_1.iloc[3:]))
+    parameters = statistics.to_parameters()
+
+    mean, std = _compute_normalization(TEST_DF_1, num_input)
+    assert parameters["mean"] == pytest.approx(mean)
+    assert parameters["std"] == pytest.approx(std)
+    assert parameters["codes"] == _generate_codes(TEST_DF_1, ["category"])
+    assert statistics.num_rows == 6
+
+
+@pytest.mark.skipif(not _TOPIC_TABULAR_AVAILABLE, reason="tabular dependencies are required")
+def test_from_csv_streaming(tmpdir, monkeypatch):
+    for i in range(3):
+        # The (unique) index of the rows is written to the files to tell them apart
+        pd.DataFrame(data=TEST_DICT_1, index=range(6 * i, 6 * (i + 1))).to_csv(Path(tmpdir) / f"train_{i}.csv")
+    val_csv = Path(tmpdir) / "valid.csv"
+    pd.DataFrame(data=TEST_DICT_2).to_csv(val_csv)
+
+    dm = TabularClassificationData.from_csv(
+        categorical_fields=["category"],
+        numerical_fields=["scalar_a", "scalar_b"],
+        target_fields="label",
+        train_file=str(Path(tmpdir) / "train_*.csv"),
+        val_file=str(val_csv),
+        input_cls=TabularClassificationStreamingInput,
+        num_workers=0,
+        batch_size=4,
+    )
+    assert dm.parameters["codes"] == {"category": ["a", "b", "c"]}
+    assert dm.num_classes == 2
+
+    num_samples = 0
+    for batch in dm.train_dataloader():
+        (cat, num) = batch[DataKeys.INPUT]
+        assert cat.shape[1] == 1
+        assert num.shape[1] == 2
+        assert not num.isnan().any()
+        num_samples += len(batch[DataKeys.TARGET])
+    assert num_samples == 18
+
+    batch = next(iter(dm.val_dataloader()))
+    assert batch[DataKeys.INPUT][0].tolist() == [[0], [0], [0]]
+
+    # The rows are split evenly between the shards, whatever the state of their global random generator. When
+    # training, the shards are padded to the same number of rows
+    monkeypatch.setattr("flash.tabular.input.epoch_seed", lambda: 42)
+    for num_shards, expected_sizes in ((2, [9, 9]), (4, [5, 5, 5, 5])):
+        shards = []
+        for shard in range(num_shards):
+            np.random.seed(shard)
+            monkeypatch.setattr("flash.tabular.input.shard_info", lambda shard=shard: (shard, num_shards))
+            shards.append([index for chunk in dm.train_dataset._iter_chunks() for index in chunk["Unnamed: 0"]])
+        assert [len(rows) for rows in shards] == expected_sizes
+        assert sorted(set(sum(shards, []))) == list(range(18))
+
+
 @pytest.mark.skipif(not _TOPIC_TABULAR_AVAILABLE, reason="tabular dependencies are required")
 def test_embedding_sizes():
     self = Mock()
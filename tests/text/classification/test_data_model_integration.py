@@ -16,6 +16,7 @@ from pathlib import Path
 
 import pytest
 
+from flash.core.data.io.input import DataKeys
 from flash.core.trainer import Trainer
 from flash.core.utilities.imports import _TOPIC_TEXT_AVAILABLE
 from flash.text import TextClassificationData, TextClassifier
@@ -50,3 +51,27 @@ def test_classification(tmpdir):
     model = TextClassifier(2, TEST_BACKBONE)
     trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
     trainer.fit(model, datamodule=data)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Huggingface timing out on Windows")
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_classification_pretokenize(tmpdir):
+    csv_path = csv_data(tmpdir)
+
+    data = TextClassificationData.from_csv(
+        "sentence",
+        "label",
+        train_file=csv_path,
+        num_workers=0,
+        batch_size=2,
+    )
+    model = TextClassifier(2, TEST_BACKBONE, padding="longest", pretokenize=True)
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
+    trainer.fit(model, datamodule=data)
+
+    assert "input_ids" in data.train_dataset.data.column_names
+
+    batch = model.adapter.collate_fn([data.train_dataset[0], data.train_dataset[1]])
+    assert batch["input_ids"].shape == batch["attention_mask"].shape
+    assert batch["input_ids"].shape[1] < 128
+    assert batch[DataKeys.TARGET].tolist() == [0, 1]
@@ -22,6 +22,7 @@ import flash
 from flash.core.data.io.input import DataKeys
 from flash.core.utilities.imports import _TOPIC_SERVE_AVAILABLE, _TOPIC_TEXT_AVAILABLE, _TORCH_ORT_AVAILABLE
 from flash.text import TextClassifier
+from flash.text.classification.adapters import GenericAdapter
 from flash.text.ort_callback import ORTCallback
 from tests.helpers.boring_model import BoringModel
 from tests.helpers.task_tester import StaticDataset, TaskTester
@@ -112,3 +113,13 @@ def test_serve():
     model = TextClassifier(2, backbone=TEST_BACKBONE)
     model.eval()
     model.serve()
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+@pytest.mark.parametrize("kwargs", [{"padding": "longest"}, {"pretokenize": True}])
+def test_generic_adapter_warns_unsupported_arguments(kwargs):
+    def backbone():
+        return torch.nn.Identity(), lambda texts: [[len(text)] for text in texts], 1
+
+    with pytest.warns(UserWarning, match="only supported by Hugging Face backbones"):
+        GenericAdapter(backbone, num_classes=2, **kwargs)
@@ -0,0 +1,84 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from functools import partial
+
+import numpy as np
+import pytest
+
+from flash.core.data.data_module import DataModule
+from flash.core.data.io.input import DataKeys, Input
+from flash.core.utilities.imports import _TOPIC_TEXT_AVAILABLE
+from flash.core.utilities.stages import RunningStage
+from flash.text.samplers import LengthBucketBatchSampler
+
+TEXTS = [" ".join(["word"] * length) for length in np.random.RandomState(0).randint(1, 64, size=500)]
+
+
+class TextInput(Input):
+    def load_data(self, texts):
+        return [{DataKeys.INPUT: text} for text in texts]
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_length_bucket_batch_sampler_batch_size():
+    sampler = LengthBucketBatchSampler(TextInput(RunningStage.TRAINING, TEXTS), batch_size=16, bucket_size=256)
+    batches = list(sampler)
+
+    assert sorted(index for batch in batches for index in batch) == list(range(len(TEXTS)))
+    assert all(len(batch) <= 16 for batch in batches)
+
+    # Samples of similar lengths are grouped so there is much less padding than with random batches
+    padded = sum(sampler.lengths[batch].max() * len(batch) for batch in batches)
+    assert padded < 1.25 * sampler.lengths.sum()
+
+    # A new order each epoch
+    assert list(sampler) != batches
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_length_bucket_batch_sampler_max_tokens():
+    sampler = LengthBucketBatchSampler(TEXTS, max_tokens=256)
+    batches = list(sampler)
+
+    assert sorted(index for batch in batches for index in batch) == list(range(len(TEXTS)))
+    assert all(sampler.lengths[batch].max() * len(batch) <= 256 for batch in batches)
+    assert len({len(batch) for batch in batches}) > 1
+
+    with pytest.raises(ValueError, match="Either `batch_size` or `max_tokens`"):
+        LengthBucketBatchSampler(TEXTS)
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_length_bucket_batch_sampler_replicas():
+    shards = [list(LengthBucketBatchSampler(TEXTS, batch_size=16, num_replicas=3, rank=rank)) for rank in range(3)]
+
+    assert len({len(shard) for shard in shards}) == 1
+    indices = {index for shard in shards for batch in shard for index in batch}
+    assert indices == set(range(len(TEXTS)))
+
+
+@pytest.mark.skipif(not _TOPIC_TEXT_AVAILABLE, reason="text libraries aren't installed.")
+def test_length_bucket_batch_sampler_data_module():
+    datamodule = DataModule(
+        TextInput(RunningStage.TRAINING, TEXTS),
+        sampler=partial(LengthBucketBatchSampler, batch_size=8),
+        batch_size=8,
+        num_workers=0,
+    )
+
+    dataloader = datamodule.train_dataloader()
+    assert isinstance(dataloader.batch_sampler, LengthBucketBatchSampler)
+    batch = next(iter(dataloader))
+    lengths = [len(text.split()) for text in batch[DataKeys.INPUT]]
+    assert max(lengths) - min(lengths) < 16
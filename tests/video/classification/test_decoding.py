@@ -0,0 +1,195 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import pytest
+import torch
+from torch.utils.data import SequentialSampler
+
+from flash.core.data.io.input import DataKeys
+from flash.core.data.utilities.sampling import resolve_sampling
+from flash.core.utilities.imports import _TOPIC_VIDEO_AVAILABLE
+from flash.core.utilities.stages import RunningStage
+from flash.video import VideoClassificationData
+from flash.video.classification.decoding import CachedLabeledVideoDataset, VideoCache, VideoFrames, iter_video_windows
+from flash.video.classification.input import VideoClassificationSlidingWindowPredictInput
+from tests.video.classification.test_model import mock_video_data_frame, temp_encoded_video
+
+if _TOPIC_VIDEO_AVAILABLE:
+    from pytorchvideo.data.clip_sampling import make_clip_sampler
+    from pytorchvideo.data.encoded_video import EncodedVideo
+    from pytorchvideo.data.labeled_video_dataset import LabeledVideoDataset
+    from pytorchvideo.data.labeled_video_paths import LabeledVideoPaths
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+def test_video_cache(tmpdir):
+    with temp_encoded_video(num_frames=10, fps=5) as (path, expected), temp_encoded_video(
+        num_frames=10, fps=5
+    ) as (other_path, _):
+        cache = VideoCache(max_open_videos=1)
+        video = cache.open(path)
+        assert cache.open(path) is video
+
+        clip = cache.get_clip(path, 0, 1)
+        assert len(cache._clips) == 1
+        assert torch.equal(cache.get_clip(path, 0, 1)["video"], clip["video"])
+
+        # Opening another video closes the least recently used one
+        cache.open(other_path)
+        assert len(cache._videos) == 1
+
+        # The open videos and decoded clips aren't sent to the DataLoader workers
+        cache = pickle.loads(pickle.dumps(cache))
+        assert len(cache._videos) == 0
+        assert len(cache._clips) == 0
+
+        frame_cache = VideoCache(frame_cache=True, frame_cache_dir=os.path.join(tmpdir, "frames"))
+        video = frame_cache.open(path)
+        assert isinstance(video, VideoFrames)
+        assert torch.equal(video.get_clip(0, video.duration)["video"], expected)
+
+        # Resized frames are extracted to separate files
+        frame_cache = VideoCache(frame_cache=True, frame_cache_dir=os.path.join(tmpdir, "frames"), short_side_size=5)
+        assert frame_cache.open(path).get_clip(0, 1)["video"].shape[2:] == (5, 5)
+        assert len(os.listdir(os.path.join(tmpdir, "frames"))) == 4
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+@pytest.mark.parametrize("clip_sampler, clip_sampler_args", [("uniform", ()), ("constant_clips_per_video", (3,))])
+@pytest.mark.parametrize("frame_cache", [False, True])
+@pytest.mark.parametrize("clips_per_decode", [1, 2, 4])
+def test_cached_labeled_video_dataset(tmpdir, clip_sampler, clip_sampler_args, frame_cache, clips_per_decode):
+    with mock_video_data_frame() as (mock_data_frame, total_duration):
+        labeled_video_paths = LabeledVideoPaths(list(zip(mock_data_frame["file"], mock_data_frame["target"])))
+        clip_duration = total_duration / 2 - 1e-9
+
+        expected = LabeledVideoDataset(
+            labeled_video_paths,
+            make_clip_sampler(clip_sampler, clip_duration, *clip_sampler_args),
+            video_sampler=SequentialSampler,
+            decode_audio=False,
+        )
+        dataset = CachedLabeledVideoDataset(
+            labeled_video_paths,
+            make_clip_sampler(clip_sampler, clip_duration, *clip_sampler_args),
+            video_sampler=SequentialSampler,
+            video_cache=VideoCache(frame_cache=frame_cache, frame_cache_dir=str(tmpdir)),
+            clips_per_decode=clips_per_decode,
+        )
+
+        # Cutting the clips out of larger decoded spans gives the same clips
+        samples, expected_samples = list(dataset), list(expected)
+        assert len(samples) == len(expected_samples)
+        for sample, expected_sample in zip(samples, expected_samples):
+            assert sample["label"] == expected_sample["label"]
+            assert sample["clip_index"] == expected_sample["clip_index"]
+            assert torch.equal(sample["video"], expected_sample["video"])
+
+        dataset = CachedLabeledVideoDataset(
+            labeled_video_paths,
+            make_clip_sampler("random", clip_duration),
+            video_sampler=SequentialSampler,
+            clips_per_decode=clips_per_decode,
+        )
+        assert len(list(dataset)) == clips_per_decode * len(mock_data_frame)
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+@pytest.mark.parametrize("clips_per_decode, span", [(1, 1), (3, 2)])
+def test_random_clip_groups(monkeypatch, clips_per_decode, span):
+    dataset = CachedLabeledVideoDataset(
+        [("video.mp4", {})], make_clip_sampler("random", 1), clips_per_decode=clips_per_decode
+    )
+
+    # A single clip is drawn from the whole video, several clips are drawn from a span of twice the clip duration
+    monkeypatch.setattr("flash.video.classification.decoding.random.uniform", lambda low, high: high)
+    (group,) = dataset._clip_groups(10, {})
+    assert len(group) == clips_per_decode
+    assert all(clip_info.clip_start_sec == 9 for clip_info in group)
+    assert all(clip_info.clip_end_sec == 10 for clip_info in group)
+
+    calls = []
+    monkeypatch.setattr("flash.video.classification.decoding.random.uniform", lambda *args: calls.append(args) or 0)
+    list(dataset._clip_groups(10, {}))
+    assert calls[0] == (0, 10 - span)
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+def test_from_files_video_cache(tmpdir):
+    with mock_video_data_frame() as (mock_data_frame, total_duration):
+        datamodule = VideoClassificationData.from_files(
+            train_files=mock_data_frame["file"].tolist(),
+            train_targets=mock_data_frame["target"].tolist(),
+            predict_files=mock_data_frame["file"].tolist(),
+            clip_sampler="uniform",
+            clip_duration=total_duration / 2 - 1e-9,
+            video_sampler=SequentialSampler,
+            video_cache=VideoCache(frame_cache=True, frame_cache_dir=str(tmpdir)),
+            clips_per_decode=2,
+            batch_size=1,
+        )
+        assert isinstance(datamodule.train_dataset.data, CachedLabeledVideoDataset)
+        for sample in datamodule.train_dataset.data:
+            assert sample["video"].shape[1] == 5
+
+        assert datamodule.predict_dataset[0][DataKeys.INPUT].shape[0] == 3
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+@pytest.mark.parametrize(
+    "num_frames, clip_duration, clip_stride, num_windows",
+    [(10, 1, None, 2), (10, 0.8, 0.4, 4), (23, 1, 0.3, 13), (10, 5, None, 1)],
+)
+def test_iter_video_windows(num_frames, clip_duration, clip_stride, num_windows):
+    with temp_encoded_video(num_frames=num_frames, fps=5) as (path, _):
+        video = EncodedVideo.from_path(path, decode_audio=False)
+        windows = list(iter_video_windows(path, clip_duration, clip_stride))
+        assert len(windows) == num_windows
+
+        # The windows hold the same frames as clips decoded separately (up to floating point errors on the bounds)
+        for start, end, frames in windows:
+            expected = video.get_clip(start - 1e-6, end + 1e-6)["video"]
+            assert torch.equal(torch.from_numpy(frames).to(torch.float32).permute(3, 0, 1, 2), expected)
+
+    with pytest.raises(ValueError, match="positive"):
+        next(iter_video_windows("video.mp4", 0))
+
+
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+def test_sliding_window_predict_input():
+    with mock_video_data_frame() as (mock_data_frame, _):
+        # Each video gives 3 windows of 6 frames
+        window_bytes = 3 * 6 * 10 * 10 * 4
+        predict_input = VideoClassificationSlidingWindowPredictInput(
+            RunningStage.PREDICTING,
+            list(mock_data_frame["file"]),
+            clip_duration=1,
+            clip_stride=0.5,
+            max_batch_bytes=3 * window_bytes,
+        )
+        assert resolve_sampling(predict_input, 4) == {"batch_size": None}
+        assert predict_input.batch_size == 4
+
+        # The batches span several videos and are limited by the memory budget
+        batches = list(predict_input)
+        assert [len(batch) for batch in batches] == [3, 3, 3, 3]
+        windows = [sample[DataKeys.METADATA] for batch in batches for sample in batch]
+        assert [window["window_index"] for window in windows] == [0, 1, 2] * 4
+        assert [window["start"] for window in windows[:3]] == [0, 0.5, 1.0]
+        assert batches[0][0][DataKeys.INPUT].shape == (3, 6, 10, 10)
+
+        predict_input.max_batch_bytes = None
+        assert [len(batch) for batch in predict_input] == [4, 4, 4]
@@ -27,6 +27,7 @@ import flash
 from flash.core.data.io.input import DataKeys
 from flash.core.utilities.imports import _FIFTYONE_AVAILABLE, _TOPIC_VIDEO_AVAILABLE
 from flash.video import VideoClassificationData, VideoClassifier
+from flash.video.classification.output import aggregate_windows
 from tests.helpers.task_tester import TaskTester
 from tests.video.classification.test_data import create_dummy_video_frames, temp_encoded_tensors
 
@@ -265,6 +266,29 @@ def test_video_classifier_predict_from_tensors(tmpdir):
     assert predictions[0][0] in datamodule.labels
 
 
+@pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
+def test_video_classifier_predict_sliding_windows(tmpdir):
+    with mock_video_data_frame() as (mock_data_frame, _):
+        datamodule = VideoClassificationData.from_sliding_windows(
+            predict_files=mock_data_frame["file"].tolist(),
+            clip_duration=1,
+            clip_stride=0.5,
+            batch_size=4,
+        )
+
+        model = VideoClassifier(num_classes=2, pretrained=False, backbone="slow_r50")
+        trainer = flash.Trainer(default_root_dir=tmpdir, gpus=torch.cuda.device_count())
+        predictions = trainer.predict(model, datamodule=datamodule, output="windows")
+
+        assert [len(batch) for batch in predictions] == [4, 4, 4]
+        assert set(predictions[0][0].keys()) == {"filepath", "window_index", "start", "end", "logits"}
+
+        videos = aggregate_windows(predictions, segment_duration=1)
+        assert [video["num_windows"] for video in videos] == [6, 6]
+        assert len(videos[0]["logits"]) == 2
+        assert [segment["start"] for segment in videos[0]["segments"]] == [0, 1]
+
+
 @pytest.mark.skipif(not _TOPIC_VIDEO_AVAILABLE, reason="PyTorchVideo isn't installed.")
 def test_video_classifier_finetune_from_csv(tmpdir):
     with mock_video_csv_file(tmpdir) as (mock_csv, total_duration):
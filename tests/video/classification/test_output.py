@@ -0,0 +1,64 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+
+from flash.core.data.io.input import DataKeys
+from flash.video.classification.output import WindowsOutput, aggregate_windows
+
+
+def _window(filepath, window_index, logits, stride=0.5, duration=1):
+    start = window_index * stride
+    return {
+        "filepath": filepath,
+        "window_index": window_index,
+        "start": start,
+        "end": start + duration,
+        "logits": logits,
+    }
+
+
+def test_windows_output():
+    sample = {
+        DataKeys.INPUT: torch.rand(3, 2, 4, 4),
+        DataKeys.PREDS: torch.tensor([0.5, 1.5]),
+        DataKeys.METADATA: {"filepath": "video.mp4", "window_index": 2, "start": 1.0, "end": 2.0},
+    }
+    assert WindowsOutput()(sample) == _window("video.mp4", 2, [0.5, 1.5])
+
+
+def test_aggregate_windows():
+    # Batches of windows can span several videos and come in any order
+    predictions = [
+        [_window("a.mp4", 1, [2.0, 0.0]), _window("a.mp4", 0, [0.0, 0.0])],
+        [_window("a.mp4", 2, [1.0, 3.0]), _window("b.mp4", 0, [1.0, 1.0])],
+    ]
+
+    videos = aggregate_windows(predictions)
+    assert [(video["filepath"], video["num_windows"]) for video in videos] == [("a.mp4", 3), ("b.mp4", 1)]
+    assert videos[0]["logits"] == [1.0, 1.0]
+    assert "segments" not in videos[0]
+
+    # The windows are assigned to segments by their centre (0.5, 1.0, and 1.5 seconds)
+    videos = aggregate_windows(predictions, segment_duration=1, reduction="max")
+    assert videos[0]["logits"] == [2.0, 3.0]
+    assert videos[0]["segments"] == [
+        {"start": 0, "end": 1, "logits": [0.0, 0.0]},
+        {"start": 1, "end": 2, "logits": [2.0, 3.0]},
+    ]
+
+    with pytest.raises(ValueError, match="reduction"):
+        aggregate_windows(predictions, reduction="median")
+    with pytest.raises(ValueError, match="segment_duration"):
+        aggregate_windows(predictions, segment_duration=0)